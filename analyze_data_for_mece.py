@@ -1,49 +1,29 @@
-import pandas as pd
-from collections import Counter
-import re
+def analyze_data(input_path='input/input.xlsx'):
+    """
+    Ground Truth 도메인별 질문 수 / 상위 키워드 / 샘플 질문 분석
 
-def analyze_data():
-    # 엑셀 파일 로드
+    입력 파일을 한 번만 읽으며 모든 도메인을 동시에 집계 (도메인별 재필터링 없음)
+
+    Args:
+        input_path: 입력 파일 경로 (.xlsx/.csv/.jsonl/.parquet)
+    """
+    from src.ngram_mining import NGramMiner, iter_corpus
+
+    # 도메인별 키워드만 필요하므로 전체 n-gram / 글자 n-gram 집계는 생략
+    miner = NGramMiner(capacity=0)
     try:
-        df = pd.read_excel('input/input.xlsx')
+        miner.add_many(iter_corpus(input_path))
     except Exception as e:
         print(f"파일 로드 실패: {e}")
         return
 
-    # 컬럼명 매핑
-    col_q = 'Question'
-    col_gt = '도메인 Ground Truth'
-    
-    # 21개 도메인별 질문 그룹화
-    domains = df[col_gt].unique()
-    
-    print(f"\n총 {len(domains)}개 Ground Truth 도메인 발견")
-    
-    domain_analysis = {}
+    domain_analysis = miner.group_summary(top=5)
 
-    for domain in domains:
-        questions = df[df[col_gt] == domain][col_q].tolist()
-        
-        # 키워드 추출 (간단하게 명사형 단어 위주로 2글자 이상)
-        words = []
-        for q in questions:
-            if not isinstance(q, str): continue
-            # 특수문자 제거 및 공백 기준 분리
-            w_list = re.sub(r'[^\w\s]', '', q).split()
-            words.extend([w for w in w_list if len(w) >= 2])
-            
-        common_words = Counter(words).most_common(5)
-        
-        domain_analysis[domain] = {
-            'count': len(questions),
-            'samples': questions[:8],  # 8개 샘플 확인
-            'keywords': common_words
-        }
+    print(f"\n총 {len(domain_analysis)}개 Ground Truth 도메인 발견")
 
     # 분석 결과 출력 (도메인 이름순 정렬)
     print("="*80)
-    for domain in sorted(domain_analysis.keys()):
-        info = domain_analysis[domain]
+    for domain, info in domain_analysis.items():
         print(f"\n[{domain}] (총 {info['count']}건)")
         print(f"  Top Keywords: {', '.join([f'{w}({c})' for w, c in info['keywords']])}")
         print("  Sample Questions:")
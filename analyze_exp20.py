@@ -1,12 +1,16 @@
 #!/usr/bin/env python3
 """실험 20 결과 분석 스크립트"""
 
-import json
+import os
+import sys
 from collections import defaultdict
 
-# result.json 읽기
-with open('result/result.json', 'r', encoding='utf-8') as f:
-    results = json.load(f)
+# src 패키지 import를 위한 경로 추가 (프로젝트 루트)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from src.result_sink import load_results
+
+# result.json 읽기 (행 단위 result.jsonl도 지원)
+results = load_results(sys.argv[1] if len(sys.argv) > 1 else 'result/result.json')
 
 total = len(results)
 print(f"총 테스트 케이스: {total}개\n")
@@ -4,20 +4,19 @@
 프롬프트 개선을 위한 도메인별 성공/실패 사례 분석
 """
 
-import json
 from collections import defaultdict
 import sys
 import os
 
-# src 모듈 import를 위한 경로 추가
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-from llm_classifier import map_to_hierarchical_domain
+# src 패키지 import를 위한 경로 추가 (프로젝트 루트)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from src.llm_classifier import map_to_hierarchical_domain
+from src.result_sink import load_results
 
 
 def analyze_json_results(json_path):
     """JSON 결과 파일 분석"""
-    with open(json_path, encoding='utf-8') as f:
-        data = json.load(f)
+    data = load_results(json_path)
 
     # 전체 정확도
     total = len(data)
@@ -66,8 +65,7 @@ def analyze_json_results(json_path):
 
 def analyze_hierarchical_results(json_path):
     """13개 LLM 친화적 도메인 레벨에서의 결과 분석"""
-    with open(json_path, encoding='utf-8') as f:
-        data = json.load(f)
+    data = load_results(json_path)
 
     # 21개 도메인을 13개 도메인으로 변환
     hierarchical_data = []
@@ -150,8 +148,7 @@ def analyze_hierarchical_results(json_path):
 
 def extract_success_examples(json_path, output_path='domain_success_examples.txt'):
     """도메인별 성공 사례 추출"""
-    with open(json_path, encoding='utf-8') as f:
-        data = json.load(f)
+    data = load_results(json_path)
 
     # 도메인별 성공 사례 그룹화
     success_by_domain = defaultdict(list)
@@ -184,8 +181,7 @@ def extract_success_examples(json_path, output_path='domain_success_examples.txt
 
 def extract_failure_examples(json_path, output_path='domain_failure_examples.txt'):
     """도메인별 실패 사례 추출 (혼동 패턴 분석용)"""
-    with open(json_path, encoding='utf-8') as f:
-        data = json.load(f)
+    data = load_results(json_path)
 
     # Ground Truth → 잘못 분류된 도메인별 그룹화
     failures = defaultdict(lambda: defaultdict(list))
@@ -221,9 +217,13 @@ def extract_failure_examples(json_path, output_path='domain_failure_examples.txt
     return failures
 
 
-if __name__ == '__main__':
-    json_path = 'result/result.json'
+def main(json_path='result/result.json'):
+    """
+    결과 분석 실행
 
+    Args:
+        json_path: 결과 파일 경로 (result.json 또는 행 단위 result.jsonl)
+    """
     print("\n" + "=" * 80)
     print("도메인 분류 결과 분석")
     print("=" * 80 + "\n")
@@ -251,3 +251,7 @@ if __name__ == '__main__':
     print("  - domain_success_examples.txt: 도메인별 성공 사례")
     print("  - domain_failure_examples.txt: 도메인별 실패 사례 (혼동 패턴)")
     print(f"\n💡 13개 LLM 친화적 도메인 레벨 정확도: {hier_accuracy:.2f}%")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1] if len(sys.argv) > 1 else 'result/result.json')
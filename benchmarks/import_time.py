@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+CLI 진입점 import 시간(cold start) 벤치마크
+
+각 진입점 모듈을 새 프로세스에서 `python -X importtime`으로 import하여
+모듈별 누적 import 시간을 측정합니다. 기준값 파일과 비교하여 허용 범위를 넘으면 종료 코드 1을 반환합니다.
+
+Usage:
+    python benchmarks/import_time.py                           # 측정 결과 출력
+    python benchmarks/import_time.py --save benchmarks/import_baseline.json
+    python benchmarks/import_time.py --baseline benchmarks/import_baseline.json --tolerance 0.3
+
+Options:
+    -r, --runs NUMBER       모듈별 반복 측정 횟수 (최솟값 사용, 기본: 5)
+    --top NUMBER            모듈별 가장 느린 하위 import 출력 개수 (기본: 5)
+    --baseline PATH         비교할 기준값 JSON 파일
+    --tolerance RATIO       기준값 대비 허용 증가율 (기본: 0.3 → 30%)
+    --save PATH             측정 결과를 기준값 JSON으로 저장
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 측정 대상 진입점 모듈 (CLI 하위 명령이 import하는 모듈)
+ENTRY_MODULES = [
+    'src.__main__',
+    'main',
+    'shard_runner',
+    'run_experiments',
+    'token_report',
+    'reparse',
+    'discover_intents',
+    'update_ground_truth',
+    'analyze_results',
+    'analyze_data_for_mece',
+    'extract_micro_intents',
+]
+
+
+def measure_import(module, runs=5):
+    """
+    모듈 import 시간 측정
+
+    Args:
+        module: 모듈 이름
+        runs: 반복 측정 횟수
+
+    Returns:
+        (누적 import 시간 [us], 직접 하위 import별 누적 시간 {모듈: us}) - 가장 빠른 측정값 기준
+    """
+    best_total = None
+    best_breakdown = {}
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+            cwd=PROJECT_ROOT, capture_output=True, text=True
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(f"{module} import 실패:\n{proc.stderr[-2000:]}")
+
+        # 형식: "import time: self [us] | cumulative | imported package"
+        # 하위 import는 상위 모듈 줄보다 먼저, 들여쓰기(2칸/단계)가 한 단계 깊게 출력됨
+        breakdown = {}
+        pending_children = {}
+        for line in proc.stderr.splitlines():
+            if not line.startswith('import time:') or 'cumulative' in line:
+                continue
+            _, _, cumulative_us, raw_name = line.replace('import time:', '|', 1).split('|')
+            name = raw_name.strip()
+            level = (len(raw_name) - len(raw_name.lstrip()) - 1) // 2
+            if level == 0:
+                if name == module:
+                    breakdown = dict(pending_children)
+                    breakdown[module] = int(cumulative_us)
+                pending_children = {}
+            elif level == 1:
+                pending_children[name] = int(cumulative_us)
+
+        total = breakdown.get(module, 0)
+        if best_total is None or total < best_total:
+            best_total = total
+            best_breakdown = breakdown
+
+    return best_total, best_breakdown
+
+
+def measure_cli_startup(runs=5):
+    """
+    `python -m src --help` 실행 시간 측정 (인터프리터 시작 포함)
+
+    Args:
+        runs: 반복 측정 횟수
+
+    Returns:
+        가장 빠른 실행 시간 [us]
+    """
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-m', 'src', '--help'], cwd=PROJECT_ROOT,
+                       capture_output=True, check=True)
+        elapsed = int((time.perf_counter() - start) * 1e6)
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='CLI 진입점 import 시간 벤치마크')
+    parser.add_argument('-r', '--runs', type=int, default=5, help='모듈별 반복 측정 횟수 (기본: 5)')
+    parser.add_argument('--top', type=int, default=5, help='가장 느린 하위 import 출력 개수 (기본: 5)')
+    parser.add_argument('--baseline', help='비교할 기준값 JSON 파일')
+    parser.add_argument('--tolerance', type=float, default=0.3, help='허용 증가율 (기본: 0.3)')
+    parser.add_argument('--save', help='측정 결과를 기준값 JSON으로 저장')
+    args = parser.parse_args()
+
+    results = {}
+    print(f"{'모듈':<25} {'import 시간':>12}   가장 느린 하위 import")
+    print("-" * 80)
+    for module in ENTRY_MODULES:
+        total, breakdown = measure_import(module, args.runs)
+        results[module] = total
+        children = sorted(
+            ((name, us) for name, us in breakdown.items() if name != module),
+            key=lambda x: x[1], reverse=True
+        )[:args.top]
+        slowest = ', '.join(f"{name}({us / 1000:.1f}ms)" for name, us in children)
+        print(f"{module:<25} {total / 1000:>10.1f}ms   {slowest}")
+
+    results['cli_startup'] = measure_cli_startup(args.runs)
+    print("-" * 80)
+    print(f"{'python -m src --help':<25} {results['cli_startup'] / 1000:>10.1f}ms   (인터프리터 시작 포함)")
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n기준값이 {args.save}에 저장되었습니다.")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+        regressions = []
+        for name, value in results.items():
+            base = baseline.get(name)
+            if base and value > base * (1 + args.tolerance):
+                regressions.append(f"{name}: {base / 1000:.1f}ms → {value / 1000:.1f}ms")
+
+        if regressions:
+            print(f"\n기준값 대비 {args.tolerance * 100:.0f}% 이상 느려진 항목:")
+            for line in regressions:
+                print(f"  - {line}")
+            sys.exit(1)
+        print("\n기준값 대비 회귀 없음")
+
+
+if __name__ == '__main__':
+    main()
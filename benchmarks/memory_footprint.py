@@ -0,0 +1,454 @@
+#!/usr/bin/env python3
+"""
+메모리 사용량 회귀 벤치마크 (tracemalloc)
+
+고정된 합성 입력(benchmarks/synthetic_data.py)과 로컬 모의 LLM 서버(benchmarks/mock_llm.py)로
+main.py 파이프라인 전체를 같은 프로세스에서 실행하고, 실행 구간(load, setup, classify, save, report)별
+tracemalloc 최대 추가 메모리와 할당 위치 상위 N개를 기록합니다. 기준값 파일과 비교하여 10,000행당
+메모리가 허용 범위를 넘게 늘어난 구간이 있으면 종료 코드 1을 반환합니다.
+
+시나리오:
+    xlsx    엑셀 입력 → 엑셀 출력 (워크북 + result.json)
+    jsonl   JSONL 입력 → JSONL 출력 (스트리밍 모드)
+
+Usage:
+    python benchmarks/memory_footprint.py                                  # 측정 결과 출력
+    python benchmarks/memory_footprint.py -n 1000 --save benchmarks/memory_baseline.json
+    python benchmarks/memory_footprint.py -n 1000 --baseline benchmarks/memory_baseline.json --tolerance 0.2
+
+기준값(benchmarks/memory_baseline.json)은 -n 1000으로 저장되어 있으며, tests/test_memory_footprint.py가
+같은 행 수로 비교합니다. 10,000행당 값으로 환산하더라도 고정 오버헤드 비율이 행 수에 따라 달라지므로
+기준값과 같은 행 수로 비교해야 합니다. 기준값에는 측정 환경(Python 버전, 주요 라이브러리 버전)이 함께
+저장되며, 현재 환경과 다르면 할당 크기 자체가 달라지므로 비교를 건너뜁니다.
+
+Options:
+    -n, --rows NUMBER       합성 입력 행 수 (기본: 10000)
+    --scenarios LIST        실행할 시나리오 (쉼표 구분, 기본: xlsx,jsonl)
+    --latency SECONDS       모의 LLM 평균 응답 지연 (기본: 0.002)
+    --concurrency NUMBER    동시 요청 수 (MAX_CONCURRENT_REQUESTS, 기본: 8)
+    --top NUMBER            구간별 할당 위치 상위 개수 (기본: 10)
+    --frames NUMBER         할당 위치 추적 스택 깊이 (기본: 1, 늘리면 느려짐)
+    --baseline PATH         비교할 기준값 JSON 파일
+    --tolerance RATIO       기준값 대비 허용 증가율 (기본: 0.2 → 20%)
+    --min-increase BYTES    회귀로 보기 위한 최소 증가량 (10,000행당, 기본: 1MB)
+    --ignore-environment    Python/라이브러리 버전이 기준값과 달라도 비교 (기본: 비교 건너뜀)
+    --save PATH             측정 결과를 기준값 JSON으로 저장
+    --workdir PATH          작업 디렉토리 (기본: 임시 디렉토리, 종료 시 삭제)
+"""
+
+import argparse
+import contextlib
+import gc
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional, Tuple
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, PROJECT_ROOT)
+sys.path.insert(0, BENCHMARK_DIR)
+
+from synthetic_data import generate_dataset, load_catalogue  # noqa: E402
+
+# 시나리오별 (입력 파일, 출력 파일)
+SCENARIOS = {
+    'xlsx': ('input.xlsx', os.path.join('result', 'result.xlsx')),
+    'jsonl': ('input.jsonl', os.path.join('result', 'result.jsonl')),
+}
+
+# 10,000행 기준으로 정규화
+ROWS_UNIT = 10000
+
+# 할당 크기에 영향을 주는 라이브러리 (버전이 다르면 기준값 비교를 건너뜀)
+TRACKED_PACKAGES = ('openpyxl', 'pandas', 'numpy', 'requests', 'urllib3')
+
+
+def module_path(filename: str) -> str:
+    """
+    할당 위치 파일 경로를 모듈 기준 상대 경로로 변환 (기준값이 설치 경로에 따라 달라지지 않도록)
+
+    프로젝트 파일은 프로젝트 루트 기준, 표준 라이브러리와 설치된 패키지는 sys.path 항목 기준
+    (예: logging/__init__.py, openpyxl/cell/cell.py)
+
+    Args:
+        filename: tracemalloc 프레임 파일 경로
+
+    Returns:
+        상대 경로 (해당하는 기준 경로가 없으면 원래 경로)
+    """
+    if not os.path.isabs(filename):
+        return filename
+    roots = [PROJECT_ROOT] + [os.path.abspath(entry) for entry in sys.path if entry]
+    matches = [root for root in roots if filename.startswith(root.rstrip(os.sep) + os.sep)]
+    if not matches:
+        return filename
+    # 가장 긴 기준 경로 사용 (lib/python3.11보다 lib/python3.11/site-packages 우선)
+    return os.path.relpath(filename, max(matches, key=len))
+
+
+def environment() -> Dict[str, Optional[str]]:
+    """
+    측정 환경 (Python 버전과 주요 라이브러리 버전)
+
+    Returns:
+        {'python': 'major.minor', 패키지 이름: 버전 (미설치면 None)}
+    """
+    from importlib import metadata
+
+    info = {'python': f"{sys.version_info.major}.{sys.version_info.minor}"}
+    for name in TRACKED_PACKAGES:
+        try:
+            info[name] = metadata.version(name)
+        except metadata.PackageNotFoundError:
+            info[name] = None
+    return info
+
+
+class PhaseMemoryRecorder:
+    """
+    실행 구간별 tracemalloc 기록기 (profiling.mark_phase 리스너)
+
+    구간이 바뀔 때마다 직전 구간의 최대 추가 메모리(구간 시작 시점 대비), 남은 메모리,
+    스냅샷 비교로 구한 할당 위치 상위 N개를 기록하고 최댓값을 초기화한다.
+    """
+
+    def __init__(self, top: int = 10, frames: int = 1):
+        """
+        Args:
+            top: 구간별 할당 위치 상위 개수
+            frames: 할당 위치 추적 스택 깊이
+        """
+        self.top = top
+        self.frames = frames
+        self.phases = []
+        self.total_peak = 0
+        self._name = None
+        self._base = 0
+        self._phase_start = 0
+        self._snapshot = None
+
+    def _take_snapshot(self):
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+            tracemalloc.Filter(False, '<unknown>'),
+        ))
+
+    def _open(self, name: str):
+        gc.collect()
+        self._name = name
+        self._snapshot = self._take_snapshot()
+        self._phase_start = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+    def _close(self):
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = self._take_snapshot()
+        key_type = 'traceback' if self.frames > 1 else 'lineno'
+        sites = []
+        for stat in snapshot.compare_to(self._snapshot, key_type)[:self.top]:
+            if stat.size_diff <= 0:
+                break
+            sites.append({
+                'site': ' <- '.join(f"{module_path(frame.filename)}:{frame.lineno}" for frame in stat.traceback),
+                'size_diff': stat.size_diff,
+                'count_diff': stat.count_diff,
+            })
+        self.phases.append({
+            'phase': self._name,
+            'peak_bytes': peak - self._phase_start,
+            'retained_bytes': current - self._phase_start,
+            'top_sites': sites,
+        })
+        self.total_peak = max(self.total_peak, peak - self._base)
+        self._snapshot = None
+
+    def start(self):
+        """추적 시작 ('startup' 구간으로 시작)"""
+        tracemalloc.start(self.frames)
+        self._base = tracemalloc.get_traced_memory()[0]
+        self._open('startup')
+
+    def __call__(self, name: str):
+        self._close()
+        self._open(name)
+
+    def stop(self):
+        """마지막 구간을 닫고 추적 종료"""
+        if self._snapshot is not None:
+            self._close()
+        tracemalloc.stop()
+
+
+def start_mock_server(latency: float, catalogue_path: str, log_file) -> Tuple[subprocess.Popen, int]:
+    """
+    모의 LLM 서버를 별도 프로세스로 시작 (서버 메모리가 측정에 섞이지 않도록)
+
+    Args:
+        latency: 평균 응답 지연 (초)
+        catalogue_path: 의도 카탈로그 경로
+        log_file: 서버 stderr 기록 파일
+
+    Returns:
+        (프로세스, 포트)
+    """
+    proc = subprocess.Popen(
+        [sys.executable, os.path.join(BENCHMARK_DIR, 'mock_llm.py'), '--port', '0',
+         '--latency', str(latency), '--catalogue', catalogue_path],
+        stdout=subprocess.PIPE, stderr=log_file, text=True
+    )
+    line = proc.stdout.readline()
+    if not line.startswith('PORT '):
+        proc.kill()
+        raise RuntimeError("모의 LLM 서버 시작 실패")
+    return proc, int(line.split()[1])
+
+
+def prepare_inputs(workdir: str, rows: int, scenarios: List[str]) -> str:
+    """
+    합성 입력과 카탈로그 파일 생성 (항상 같은 시드)
+
+    Args:
+        workdir: 작업 디렉토리
+        rows: 행 수
+        scenarios: 시나리오 목록
+
+    Returns:
+        카탈로그 JSON 경로
+    """
+    catalogue = load_catalogue()
+    catalogue_path = os.path.join(workdir, 'micro_intents.json')
+    with open(catalogue_path, 'w', encoding='utf-8') as f:
+        json.dump(catalogue, f, ensure_ascii=False, indent=2)
+
+    os.environ['DOMAINS'] = ','.join(dict.fromkeys(info.get('gt', '') for info in catalogue.values()))
+    for scenario in scenarios:
+        input_name, _ = SCENARIOS[scenario]
+        generate_dataset(os.path.join(workdir, input_name), rows, seed=42, catalogue=catalogue)
+    return catalogue_path
+
+
+def run_pipeline(input_path: str, output_path: str, cwd: str):
+    """
+    main.py 파이프라인을 같은 프로세스에서 실행 (로그 출력은 호출자가 돌려 둔 스트림으로)
+
+    Args:
+        input_path: 입력 파일
+        output_path: 출력 파일
+        cwd: 실행 디렉토리 (log/, result/ 생성 위치)
+    """
+    import main as pipeline
+
+    previous = os.getcwd()
+    os.chdir(cwd)
+    try:
+        pipeline.main(['-i', input_path, '-o', output_path])
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            raise RuntimeError(f"파이프라인 비정상 종료 (종료 코드 {e.code}) - {cwd}/log 확인")
+    finally:
+        os.chdir(previous)
+
+
+def measure_scenario(scenario: str, workdir: str, rows: int, args, log_stream) -> Dict[str, Any]:
+    """
+    시나리오 1개 실행 및 구간별 메모리 측정
+
+    Args:
+        scenario: 시나리오 이름
+        workdir: 작업 디렉토리 (입력 파일 위치)
+        rows: 입력 행 수
+        args: 명령행 인자
+        log_stream: 파이프라인 로그 출력 스트림
+
+    Returns:
+        {'rows', 'seconds', 'total_peak_bytes', 'phases': [...]}
+    """
+    from src.profiling import add_phase_listener, remove_phase_listener
+
+    input_name, output_name = SCENARIOS[scenario]
+    run_dir = os.path.join(workdir, scenario)
+    os.makedirs(run_dir, exist_ok=True)
+
+    recorder = PhaseMemoryRecorder(top=args.top, frames=args.frames)
+    gc.collect()
+    add_phase_listener(recorder)
+    recorder.start()
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(log_stream), contextlib.redirect_stderr(log_stream):
+            run_pipeline(os.path.join(workdir, input_name), output_name, run_dir)
+    finally:
+        seconds = time.perf_counter() - start
+        recorder.stop()
+        remove_phase_listener(recorder)
+
+    return {'rows': rows, 'seconds': round(seconds, 2), 'total_peak_bytes': recorder.total_peak,
+            'phases': recorder.phases}
+
+
+def per_unit(value: int, rows: int) -> float:
+    """10,000행당 바이트"""
+    return value * ROWS_UNIT / rows
+
+
+def flatten(results: Dict[str, Dict[str, Any]]) -> Dict[str, float]:
+    """
+    기준값 비교용 지표 ({시나리오}.{구간} / {시나리오}.total → 10,000행당 최대 메모리)
+
+    Args:
+        results: 시나리오별 측정 결과
+
+    Returns:
+        {지표 이름: 10,000행당 바이트}
+    """
+    metrics = {}
+    for scenario, result in results.items():
+        rows = result['rows']
+        metrics[f"{scenario}.total"] = per_unit(result['total_peak_bytes'], rows)
+        for phase in result['phases']:
+            metrics[f"{scenario}.{phase['phase']}"] = per_unit(phase['peak_bytes'], rows)
+    return metrics
+
+
+def _mb(value: float) -> str:
+    return f"{value / (1 << 20):.1f}MB"
+
+
+def print_report(results: Dict[str, Dict[str, Any]], show_sites: int = 5):
+    """시나리오별 구간 메모리와 할당 위치 상위 항목 출력"""
+    for scenario, result in results.items():
+        rows = result['rows']
+        print(f"=== {scenario} ({rows:,}행, {result['seconds']}초, 전체 최대 {_mb(result['total_peak_bytes'])}, "
+              f"10,000행당 {_mb(per_unit(result['total_peak_bytes'], rows))}) ===")
+        print(f"{'구간':<10}{'최대 추가':>12}{'10,000행당':>12}{'남은 메모리':>14}")
+        for phase in result['phases']:
+            print(f"{phase['phase']:<10}{_mb(phase['peak_bytes']):>12}{_mb(per_unit(phase['peak_bytes'], rows)):>12}"
+                  f"{_mb(phase['retained_bytes']):>14}")
+        for phase in result['phases']:
+            sites = phase['top_sites'][:show_sites]
+            if not sites:
+                continue
+            print(f"\n  [{phase['phase']}] 할당 위치 상위 {len(sites)} (구간 동안 늘어난 메모리)")
+            for site in sites:
+                print(f"  {_mb(site['size_diff']):>10} {site['count_diff']:>+10,}개  {site['site']}")
+        print()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='메모리 사용량 회귀 벤치마크')
+    parser.add_argument('-n', '--rows', type=int, default=10000, help='합성 입력 행 수 (기본: 10000)')
+    parser.add_argument('--scenarios', default='xlsx,jsonl', help='실행할 시나리오 (기본: xlsx,jsonl)')
+    parser.add_argument('--latency', type=float, default=0.002, help='모의 LLM 평균 응답 지연 (기본: 0.002)')
+    parser.add_argument('--concurrency', type=int, default=8, help='동시 요청 수 (기본: 8)')
+    parser.add_argument('--top', type=int, default=10, help='구간별 할당 위치 상위 개수 (기본: 10)')
+    parser.add_argument('--frames', type=int, default=1, help='할당 위치 추적 스택 깊이 (기본: 1)')
+    parser.add_argument('--baseline', help='비교할 기준값 JSON 파일')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='허용 증가율 (기본: 0.2)')
+    parser.add_argument('--min-increase', type=int, default=1 << 20,
+                        help='회귀로 보기 위한 최소 증가량 (10,000행당 바이트, 기본: 1MB)')
+    parser.add_argument('--ignore-environment', action='store_true',
+                        help='Python/라이브러리 버전이 기준값과 달라도 비교')
+    parser.add_argument('--save', help='측정 결과를 기준값 JSON으로 저장')
+    parser.add_argument('--workdir', help='작업 디렉토리 (기본: 임시 디렉토리)')
+    args = parser.parse_args(argv)
+
+    scenarios = [name.strip() for name in args.scenarios.split(',') if name.strip()]
+    unknown = [name for name in scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"알 수 없는 시나리오: {', '.join(unknown)} (지원: {', '.join(SCENARIOS)})")
+
+    temp_dir = None
+    if args.workdir:
+        workdir = os.path.abspath(args.workdir)
+        os.makedirs(workdir, exist_ok=True)
+    else:
+        temp_dir = tempfile.TemporaryDirectory(prefix='memory_footprint_')
+        workdir = temp_dir.name
+
+    # 파이프라인 설정 (모의 서버, 대기 없음, 상태 줄 없음)
+    catalogue_path = prepare_inputs(workdir, args.rows, scenarios)
+    os.environ.update({
+        'LLM_PROVIDER': 'qwen3', 'QWEN3_HOST': '127.0.0.1', 'QWEN3_HOSTS': '', 'THINKING_TIME': '0',
+        'MAX_CONCURRENT_REQUESTS': str(args.concurrency), 'STATUS_DISPLAY': 'off', 'PROGRESS_INTERVAL': '60',
+        'MICRO_INTENTS_FILE': catalogue_path,
+    })
+
+    log_path = os.path.join(workdir, 'pipeline.log')
+    results = {}
+    with open(log_path, 'w', encoding='utf-8') as log_stream:
+        server, port = start_mock_server(args.latency, catalogue_path, log_stream)
+        os.environ['QWEN3_PORT'] = str(port)
+        try:
+            # 준비 실행: 지연 import되는 모듈과 캐시를 미리 로드 (측정에서 제외)
+            warmup_dir = os.path.join(workdir, 'warmup')
+            os.makedirs(warmup_dir, exist_ok=True)
+            with contextlib.redirect_stdout(log_stream), contextlib.redirect_stderr(log_stream):
+                for input_name, output_name in SCENARIOS.values():
+                    generate_dataset(os.path.join(warmup_dir, input_name), 50, seed=7)
+                    run_pipeline(os.path.join(warmup_dir, input_name), output_name, warmup_dir)
+
+            for scenario in scenarios:
+                print(f"[{scenario}] 측정 중...", file=sys.stderr)
+                results[scenario] = measure_scenario(scenario, workdir, args.rows, args, log_stream)
+        finally:
+            server.terminate()
+            server.wait()
+
+    print_report(results)
+    metrics = flatten(results)
+
+    if args.save:
+        directory = os.path.dirname(args.save)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump({'rows': args.rows, 'environment': environment(), 'metrics': metrics, 'results': results},
+                      f, ensure_ascii=False, indent=2)
+        print(f"기준값이 {args.save}에 저장되었습니다.")
+
+    if temp_dir:
+        temp_dir.cleanup()
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+        baseline = saved.get('metrics', {})
+        if saved.get('rows') not in (None, args.rows):
+            print(f"\n경고: 기준값은 {saved['rows']:,}행으로 측정되었습니다 (현재 {args.rows:,}행). "
+                  f"같은 행 수(-n {saved['rows']})로 비교해야 정확합니다.")
+
+        # 인터프리터나 라이브러리 버전이 다르면 할당 크기 자체가 달라 비교 결과를 믿을 수 없음
+        current = environment()
+        mismatched = [f"{name}: {version} → {current.get(name)}"
+                      for name, version in saved.get('environment', {}).items() if current.get(name) != version]
+        if mismatched and not args.ignore_environment:
+            print("\n기준값과 측정 환경이 달라 비교를 건너뜁니다 (--ignore-environment로 강제 비교):")
+            for line in mismatched:
+                print(f"  - {line}")
+            return
+
+        regressions = []
+        for name, value in metrics.items():
+            base = baseline.get(name)
+            if base is None:
+                continue
+            if value > base * (1 + args.tolerance) and value - base > args.min_increase:
+                regressions.append(f"{name}: {_mb(base)} → {_mb(value)} (10,000행당)")
+
+        if regressions:
+            print(f"\n기준값 대비 {args.tolerance * 100:.0f}% 이상 늘어난 구간:")
+            for line in regressions:
+                print(f"  - {line}")
+            sys.exit(1)
+        print("\n기준값 대비 회귀 없음")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+로컬 모의 LLM 서버 (OpenAI 호환 /v1/chat/completions)
+
+프롬프트의 "질문:" 줄에서 질문을 꺼내 카탈로그 의도 이름/설명과 맞춰 보고, 합성 응답
+(benchmarks/synthetic_data.py의 synthetic_response)을 지정한 지연 시간 후 반환합니다.
+벤치마크에서 LLM 서버 없이 전체 파이프라인을 실행할 때 사용합니다.
+
+Usage:
+    python benchmarks/mock_llm.py --port 18000 --latency 0.05
+    QWEN3_HOST=127.0.0.1 QWEN3_PORT=18000 THINKING_TIME=0 python main.py -i input/synthetic.jsonl -o result/out.jsonl
+
+Options:
+    --host HOST             바인드 주소 (기본: 127.0.0.1)
+    --port NUMBER           포트 (0이면 빈 포트, 시작 후 "PORT <번호>"를 출력, 기본: 18000)
+    --latency SECONDS       평균 응답 지연 (기본: 0.05)
+    --jitter RATIO          지연 변동 비율 (지연 × (1 ± 비율) 균등 분포, 기본: 0.5)
+    --error-rate RATIO      429 응답 비율 (기본: 0)
+    --seed NUMBER           난수 시드 (기본: 42)
+    --catalogue PATH        의도 카탈로그 JSON (기본: src/micro_intents.json, 없으면 내장 카탈로그)
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic_data import load_catalogue, synthetic_response  # noqa: E402
+
+
+_QUESTION_LINE = re.compile(r'^질문: (.*)$', re.MULTILINE)
+
+
+class MockLLM:
+    """질문 → 합성 응답 생성기 (스레드 안전)"""
+
+    def __init__(self, catalogue: Dict[str, Dict[str, Any]], latency: float = 0.05, jitter: float = 0.5,
+                 error_rate: float = 0.0, seed: int = 42):
+        """
+        Args:
+            catalogue: 의도 카탈로그
+            latency: 평균 응답 지연 (초)
+            jitter: 지연 변동 비율
+            error_rate: 429 응답 비율
+            seed: 난수 시드
+        """
+        self.intents = list(catalogue)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        # 긴 이름부터 확인 (짧은 이름이 긴 이름의 일부인 경우 대비)
+        self._by_name = sorted(self.intents, key=len, reverse=True)
+        self._by_desc = [(info.get('desc'), intent) for intent, info in catalogue.items() if info.get('desc')]
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.requests = 0
+
+    def guess_intent(self, question: str) -> Optional[str]:
+        """질문에 들어 있는 의도 이름 또는 설명으로 정답 의도 추정"""
+        for intent in self._by_name:
+            if intent in question:
+                return intent
+        for desc, intent in self._by_desc:
+            if desc in question:
+                return intent
+        return None
+
+    def respond(self, prompt: str):
+        """
+        프롬프트 1건 처리
+
+        Returns:
+            (상태 코드, 응답 본문 딕셔너리, 지연 시간)
+        """
+        with self._lock:
+            self.requests += 1
+            rng = random.Random(self._rng.random())
+        delay = max(0.0, self.latency * (1 + rng.uniform(-self.jitter, self.jitter)))
+        if rng.random() < self.error_rate:
+            return 429, {'error': {'message': 'rate limited'}}, delay
+
+        match = _QUESTION_LINE.search(prompt)
+        question = match.group(1) if match else ''
+        intent = self.guess_intent(question) or rng.choice(self.intents)
+        content = synthetic_response(rng, intent, self.intents)
+        body = {
+            'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': content}, 'finish_reason': 'stop'}],
+            'usage': {'prompt_tokens': len(prompt) // 2, 'completion_tokens': len(content) // 2,
+                      'total_tokens': len(prompt) // 2 + len(content) // 2},
+        }
+        return 200, body, delay
+
+
+def make_handler(mock: MockLLM):
+    """MockLLM을 사용하는 요청 핸들러 클래스 생성"""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def setup(self):
+            super().setup()
+            # 헤더와 본문을 나눠 보내므로 Nagle 지연(응답당 수십 ms)을 끔
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        def log_message(self, format, *args):
+            pass
+
+        def do_POST(self):
+            length = int(self.headers.get('Content-Length', 0))
+            try:
+                payload = json.loads(self.rfile.read(length) or b'{}')
+                prompt = payload['messages'][-1]['content']
+            except (ValueError, KeyError, IndexError):
+                status, body, delay = 400, {'error': {'message': 'bad request'}}, 0.0
+            else:
+                status, body, delay = mock.respond(prompt)
+            if delay:
+                time.sleep(delay)
+            data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+    return Handler
+
+
+def serve(host: str, port: int, mock: MockLLM) -> ThreadingHTTPServer:
+    """
+    모의 서버 생성 (serve_forever()는 호출자가 실행)
+
+    Args:
+        host: 바인드 주소
+        port: 포트 (0이면 빈 포트)
+        mock: MockLLM
+
+    Returns:
+        ThreadingHTTPServer (server.server_address[1]이 실제 포트)
+    """
+    server = ThreadingHTTPServer((host, port), make_handler(mock))
+    server.daemon_threads = True
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='로컬 모의 LLM 서버')
+    parser.add_argument('--host', default='127.0.0.1', help='바인드 주소 (기본: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=18000, help='포트 (0이면 빈 포트, 기본: 18000)')
+    parser.add_argument('--latency', type=float, default=0.05, help='평균 응답 지연 (초, 기본: 0.05)')
+    parser.add_argument('--jitter', type=float, default=0.5, help='지연 변동 비율 (기본: 0.5)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='429 응답 비율 (기본: 0)')
+    parser.add_argument('--seed', type=int, default=42, help='난수 시드 (기본: 42)')
+    parser.add_argument('--catalogue', default=None, help='의도 카탈로그 JSON')
+    args = parser.parse_args(argv)
+
+    mock = MockLLM(load_catalogue(args.catalogue), args.latency, args.jitter, args.error_rate, args.seed)
+    server = serve(args.host, args.port, mock)
+    print(f"PORT {server.server_address[1]}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+비LLM 단계 확장성 벤치마크
+
+합성 데이터(benchmarks/synthetic_data.py)를 크기별로 생성하고, LLM 호출을 제외한 각 단계의
+소요 시간과 최대 추가 메모리(tracemalloc)를 측정합니다. 마지막 두 크기 사이의 증가 지수
+(시간 ∝ 행 수^지수)가 기준을 넘는 단계는 초선형 의심으로 표시합니다.
+
+측정 단계:
+    read_jsonl      JSONL 입력 읽기 (read_questions)
+    read_excel      ExcelHandler 워크북 로드 + 질문 읽기 (엑셀 최대 행 수 이하일 때만)
+    sample          층화 추출 (행 수의 10%)
+    parse_match     합성 LLM 응답 파싱 + 의도 매칭 (Exact/Fuzzy)
+    score           Hit@K 채점 + Evaluator 누적 (score_classification)
+    statistics      Evaluator 통계 + 오분류 집계
+    result_write    결과 JSONL 기록 (ResultWriter)
+    save_json       result.json 저장 (save_json_result)
+    excel_write     결과 워크시트 기록 + 저장 (read_excel을 측정한 크기만)
+
+Usage:
+    python benchmarks/scalability.py                                   # 1,000 / 10,000 / 100,000행
+    python benchmarks/scalability.py --sizes 10000,100000,1000000 --no-excel
+    python benchmarks/scalability.py --save result/scalability.json --check
+
+Options:
+    --sizes LIST            측정할 행 수 (쉼표 구분, 기본: 1000,10000,100000)
+    --skew EXPONENT         의도별 빈도 Zipf 지수 (기본: 1.0)
+    --duplicate-rate RATIO  중복 질문 비율 (기본: 0.05)
+    --seed NUMBER           난수 시드 (기본: 42)
+    --no-excel              엑셀 읽기/쓰기 단계 제외
+    --no-memory             메모리 측정(tracemalloc) 생략 (시간만 측정)
+    --max-exponent VALUE    초선형 의심 기준 증가 지수 (기본: 1.3)
+    --min-seconds VALUE     증가 지수를 판단할 최소 소요 시간 (기본: 0.05초, 너무 짧으면 잡음)
+    --save PATH             측정 결과 JSON 저장
+    --check                 초선형 의심 단계가 있으면 종료 코드 1
+    --workdir PATH          합성 데이터/결과 파일 작업 디렉토리 (기본: 임시 디렉토리, 종료 시 삭제)
+"""
+
+import argparse
+import gc
+import json
+import logging
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic_data import EXCEL_MAX_ROWS, generate_dataset, load_catalogue, synthetic_response  # noqa: E402
+
+
+def _stage_read_jsonl(ctx):
+    from src.io_backends import read_questions
+
+    ctx['questions'] = read_questions(ctx['jsonl_path'])
+
+
+def _stage_read_excel(ctx):
+    from src.excel_handler import ExcelHandler
+
+    handler = ExcelHandler(ctx['xlsx_path'])
+    handler.load()
+    ctx['excel_questions'] = handler.read_questions()
+    ctx['excel_handler'] = handler
+
+
+def _stage_sample(ctx):
+    from main import stratified_sample
+
+    ctx['sample'] = stratified_sample(ctx['questions'], max(1, len(ctx['questions']) // 10), seed=42)
+
+
+def _stage_parse_match(ctx):
+    classifier = ctx['classifier']
+    ctx['classified'] = [classifier.classify_response(response) for response in ctx['responses']]
+
+
+def _stage_score(ctx):
+    from main import score_classification
+    from src.evaluator import Evaluator
+
+    classifier = ctx['classifier']
+    evaluator = Evaluator(classifier.registry)
+    ctx['results'] = [
+        score_classification(classifier, item, evaluator, domains, opinion, category, matches, None)
+        for item, (domains, opinion, category, matches) in zip(ctx['questions'], ctx['classified'])
+    ]
+    ctx['evaluator'] = evaluator
+
+
+def _stage_statistics(ctx):
+    evaluator = ctx['evaluator']
+    ctx['statistics'] = (evaluator.get_statistics(), evaluator.get_confusion_info())
+
+
+def _stage_result_write(ctx):
+    from src.io_backends import open_result_writer, to_result_record
+
+    with open_result_writer(os.path.join(ctx['workdir'], 'result.jsonl')) as writer:
+        for result, item in zip(ctx['results'], ctx['questions']):
+            writer.write(to_result_record(result, item))
+
+
+def _stage_save_json(ctx):
+    from main import save_json_result
+
+    save_json_result(os.path.join(ctx['workdir'], 'result.xlsx'), ctx['results'], ctx['questions'])
+
+
+def _stage_excel_write(ctx):
+    from main import write_excel_results
+
+    handler = ctx.pop('excel_handler')
+    write_excel_results(handler, ctx['results'])
+    handler.save(os.path.join(ctx['workdir'], 'result_excel.xlsx'))
+    handler.close()
+
+
+# (단계 이름, 함수, 엑셀 단계 여부) - 실행 순서대로
+STAGES: List[Tuple[str, Callable[[Dict[str, Any]], None], bool]] = [
+    ('read_jsonl', _stage_read_jsonl, False),
+    ('read_excel', _stage_read_excel, True),
+    ('sample', _stage_sample, False),
+    ('parse_match', _stage_parse_match, False),
+    ('score', _stage_score, False),
+    ('statistics', _stage_statistics, False),
+    ('result_write', _stage_result_write, False),
+    ('save_json', _stage_save_json, False),
+    ('excel_write', _stage_excel_write, True),
+]
+
+
+def make_classifier(catalogue: Dict[str, Dict[str, Any]]):
+    """
+    매칭 전용 분류기 (LLM 호출 없음, 합성 카탈로그 사용)
+
+    Args:
+        catalogue: 의도 카탈로그
+
+    Returns:
+        LLMClassifier
+    """
+    from src.llm_classifier import LLMClassifier
+
+    classifier = LLMClassifier('qwen3', {'host': '127.0.0.1', 'port': 9}, domains=[])
+    classifier.set_micro_intents(catalogue)
+    return classifier
+
+
+def run_stages(ctx: Dict[str, Any], include_excel: bool, trace_memory: bool) -> Dict[str, Dict[str, float]]:
+    """
+    모든 단계를 순서대로 한 번 실행
+
+    Args:
+        ctx: 단계 간 공유 데이터 (입력 경로, 분류기, 합성 응답 등)
+        include_excel: 엑셀 단계 포함 여부
+        trace_memory: tracemalloc으로 단계별 최대 추가 메모리 측정 여부
+
+    Returns:
+        {단계: {'seconds', 'peak_bytes', 'retained_bytes'}}
+    """
+    measurements = {}
+    for name, func, is_excel in STAGES:
+        if is_excel and not include_excel:
+            continue
+        gc.collect()
+        if trace_memory:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        func(ctx)
+        seconds = time.perf_counter() - start
+        entry = {'seconds': seconds}
+        if trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            entry['peak_bytes'] = peak - before
+            entry['retained_bytes'] = current - before
+        measurements[name] = entry
+    return measurements
+
+
+def benchmark_size(rows: int, workdir: str, catalogue: Dict[str, Dict[str, Any]], classifier, args) -> Dict[str, Any]:
+    """
+    한 크기에 대한 측정 (시간 측정 1회 + 메모리 측정 1회)
+
+    tracemalloc은 할당마다 비용이 들어 시간을 왜곡하므로 시간과 메모리는 따로 실행하여 측정한다.
+
+    Args:
+        rows: 행 수
+        workdir: 작업 디렉토리
+        catalogue: 의도 카탈로그
+        classifier: 매칭 전용 분류기
+        args: 명령행 인자
+
+    Returns:
+        {'rows', 'excel', 'stages': {단계: {'seconds', 'peak_bytes', 'retained_bytes'}}}
+    """
+    size_dir = os.path.join(workdir, f"rows_{rows}")
+    os.makedirs(size_dir, exist_ok=True)
+    jsonl_path = os.path.join(size_dir, 'input.jsonl')
+    generate_dataset(jsonl_path, rows, args.skew, args.duplicate_rate, args.seed, catalogue)
+
+    include_excel = not args.no_excel and rows <= EXCEL_MAX_ROWS
+    xlsx_path = os.path.join(size_dir, 'input.xlsx')
+    if include_excel:
+        generate_dataset(xlsx_path, rows, args.skew, args.duplicate_rate, args.seed, catalogue)
+
+    # 합성 LLM 응답은 측정 전에 미리 생성 (정답 의도 기준)
+    rng = random.Random(args.seed)
+    intents = list(catalogue)
+    with open(jsonl_path, 'r', encoding='utf-8') as f:
+        true_intents = [json.loads(line)['intent'] for line in f]
+    responses = [synthetic_response(rng, intent, intents) for intent in true_intents]
+    del true_intents
+
+    def fresh_context():
+        return {'jsonl_path': jsonl_path, 'xlsx_path': xlsx_path, 'workdir': size_dir,
+                'classifier': classifier, 'responses': responses}
+
+    stages = run_stages(fresh_context(), include_excel, trace_memory=False)
+    if not args.no_memory:
+        tracemalloc.start()
+        try:
+            memory = run_stages(fresh_context(), include_excel, trace_memory=True)
+        finally:
+            tracemalloc.stop()
+        for name, entry in memory.items():
+            stages[name]['peak_bytes'] = entry['peak_bytes']
+            stages[name]['retained_bytes'] = entry['retained_bytes']
+
+    return {'rows': rows, 'excel': include_excel, 'stages': stages}
+
+
+def growth_exponent(small: Tuple[int, float], large: Tuple[int, float]) -> Optional[float]:
+    """
+    두 측정점 사이의 증가 지수 (값 ∝ 행 수^지수)
+
+    Args:
+        small: (행 수, 값)
+        large: (행 수, 값)
+
+    Returns:
+        증가 지수 (값이 0 이하이면 None)
+    """
+    (n1, v1), (n2, v2) = small, large
+    if v1 <= 0 or v2 <= 0 or n1 == n2:
+        return None
+    return math.log(v2 / v1) / math.log(n2 / n1)
+
+
+def analyze(runs: List[Dict[str, Any]], max_exponent: float, min_seconds: float) -> Dict[str, Dict[str, Any]]:
+    """
+    단계별 증가 지수 계산 및 초선형 의심 판정 (해당 단계를 측정한 마지막 두 크기 기준)
+
+    Args:
+        runs: benchmark_size() 결과 리스트 (행 수 오름차순)
+        max_exponent: 초선형 의심 기준 지수
+        min_seconds: 판정에 사용할 최소 소요 시간 (큰 크기 기준)
+
+    Returns:
+        {단계: {'time_exponent', 'memory_exponent', 'superlinear'}}
+    """
+    analysis = {}
+    for name, _, _ in STAGES:
+        points = [(run['rows'], run['stages'][name]) for run in runs if name in run['stages']]
+        if len(points) < 2:
+            continue
+        (n1, small), (n2, large) = points[-2], points[-1]
+        time_exp = growth_exponent((n1, small['seconds']), (n2, large['seconds']))
+        memory_exp = None
+        if 'peak_bytes' in small:
+            memory_exp = growth_exponent((n1, small['peak_bytes']), (n2, large['peak_bytes']))
+        analysis[name] = {
+            'time_exponent': time_exp,
+            'memory_exponent': memory_exp,
+            'superlinear': (
+                (time_exp is not None and time_exp > max_exponent and large['seconds'] >= min_seconds)
+                or (memory_exp is not None and memory_exp > max_exponent and large['peak_bytes'] >= 1 << 20)
+            ),
+        }
+    return analysis
+
+
+def _format_exponent(value: Optional[float]) -> str:
+    return f"{value:.2f}" if value is not None else "-"
+
+
+def print_report(runs: List[Dict[str, Any]], analysis: Dict[str, Dict[str, Any]]):
+    """단계별 크기별 측정 결과와 증가 지수 출력"""
+    print(f"{'단계':<14}{'행 수':>12}{'시간(초)':>11}{'us/행':>10}{'최대 메모리':>14}{'바이트/행':>11}")
+    print("-" * 72)
+    for name, _, _ in STAGES:
+        measured = [run for run in runs if name in run['stages']]
+        if not measured:
+            continue
+        for run in measured:
+            entry = run['stages'][name]
+            rows = run['rows']
+            peak = entry.get('peak_bytes')
+            memory = f"{peak / (1 << 20):>12.1f}MB" if peak is not None else f"{'-':>14}"
+            per_row = f"{peak / rows:>11,.0f}" if peak is not None else f"{'-':>11}"
+            print(f"{name:<14}{rows:>12,}{entry['seconds']:>11.3f}{entry['seconds'] / rows * 1e6:>10.1f}"
+                  f"{memory}{per_row}")
+        if name in analysis:
+            result = analysis[name]
+            mark = "  ⚠ 초선형 의심" if result['superlinear'] else ""
+            print(f"{'':<14}증가 지수: 시간 {_format_exponent(result['time_exponent'])}, "
+                  f"메모리 {_format_exponent(result['memory_exponent'])}{mark}")
+        print()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='비LLM 단계 확장성 벤치마크')
+    parser.add_argument('--sizes', default='1000,10000,100000', help='측정할 행 수 (쉼표 구분)')
+    parser.add_argument('--skew', type=float, default=1.0, help='의도별 빈도 Zipf 지수 (기본: 1.0)')
+    parser.add_argument('--duplicate-rate', type=float, default=0.05, help='중복 질문 비율 (기본: 0.05)')
+    parser.add_argument('--seed', type=int, default=42, help='난수 시드 (기본: 42)')
+    parser.add_argument('--no-excel', action='store_true', help='엑셀 읽기/쓰기 단계 제외')
+    parser.add_argument('--no-memory', action='store_true', help='메모리 측정 생략')
+    parser.add_argument('--max-exponent', type=float, default=1.3, help='초선형 의심 기준 증가 지수 (기본: 1.3)')
+    parser.add_argument('--min-seconds', type=float, default=0.05, help='증가 지수 판정 최소 소요 시간 (기본: 0.05)')
+    parser.add_argument('--save', help='측정 결과 JSON 저장 경로')
+    parser.add_argument('--check', action='store_true', help='초선형 의심 단계가 있으면 종료 코드 1')
+    parser.add_argument('--workdir', help='작업 디렉토리 (기본: 임시 디렉토리)')
+    args = parser.parse_args(argv)
+
+    sizes = sorted(int(size) for size in args.sizes.split(',') if size.strip())
+
+    # 행 단위 로그(Fuzzy Match 등)는 측정 대상이 아니므로 끔
+    logging.disable(logging.WARNING)
+
+    catalogue = load_catalogue()
+    classifier = make_classifier(catalogue)
+    temp_dir = None
+    if args.workdir:
+        workdir = args.workdir
+        os.makedirs(workdir, exist_ok=True)
+    else:
+        temp_dir = tempfile.TemporaryDirectory(prefix='scalability_')
+        workdir = temp_dir.name
+
+    runs = []
+    try:
+        for rows in sizes:
+            print(f"[{rows:,}행] 측정 중...", file=sys.stderr)
+            runs.append(benchmark_size(rows, workdir, catalogue, classifier, args))
+    finally:
+        classifier.close()
+        if temp_dir:
+            temp_dir.cleanup()
+
+    analysis = analyze(runs, args.max_exponent, args.min_seconds)
+    print_report(runs, analysis)
+
+    if args.save:
+        directory = os.path.dirname(args.save)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump({'runs': runs, 'analysis': analysis, 'catalogue_size': len(catalogue)}, f,
+                      ensure_ascii=False, indent=2)
+        print(f"측정 결과가 {args.save}에 저장되었습니다.")
+
+    suspects = [name for name, result in analysis.items() if result['superlinear']]
+    if suspects:
+        print(f"초선형 의심 단계 (증가 지수 > {args.max_exponent}): {', '.join(suspects)}")
+        if args.check:
+            sys.exit(1)
+    else:
+        print("초선형 의심 단계 없음")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+합성 질문 데이터 생성기
+
+micro_intents.json 카탈로그의 의도/설명으로 실제와 비슷한 질문 워크북(xlsx) 또는 JSONL/CSV를 생성합니다.
+행 수, 의도별 쏠림(Zipf 지수), 중복 질문 비율을 조절할 수 있어 대용량 입력에서의 동작을 재현할 때 사용합니다.
+카탈로그 파일이 없으면 도메인 정의 문서 기준의 내장 카탈로그를 사용합니다.
+
+Usage:
+    python benchmarks/synthetic_data.py -n 100000 -o input/synthetic_100k.jsonl
+    python benchmarks/synthetic_data.py -n 50000 -o input/synthetic_50k.xlsx --skew 1.2 --duplicate-rate 0.1
+
+Options:
+    -n, --rows NUMBER           생성할 행 수 (기본: 10000)
+    -o, --output PATH           출력 파일 (.xlsx/.csv/.jsonl, 기본: input/synthetic.jsonl)
+    --skew EXPONENT             의도별 빈도 Zipf 지수 (0이면 균등, 기본: 1.0)
+    --duplicate-rate RATIO      앞서 생성한 질문을 그대로 반복할 비율 (기본: 0.05)
+    --seed NUMBER               난수 시드 (기본: 42)
+    --catalogue PATH            의도 카탈로그 JSON (기본: src/micro_intents.json)
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import os
+import random
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+DEFAULT_CATALOGUE_PATH = os.path.join(PROJECT_ROOT, 'src', 'micro_intents.json')
+
+# 엑셀 시트 최대 행 수 (헤더 1행 제외)
+EXCEL_MAX_ROWS = 1048575
+
+# 입력 워크북 헤더 (ExcelHandler.read_questions: B열 질문, C열 정답, E열 성공여부 / H열은 생성 시 사용한 의도)
+EXCEL_HEADER = ('Index', 'Question', '도메인 Ground Truth', 'LLM 도메인 분류 결과', '성공 여부',
+                '분류 의견', '분류 의견 구분', '정답 의도')
+
+# micro_intents.json이 없을 때 사용하는 내장 카탈로그 (domain_definitions.md의 도메인 기준)
+FALLBACK_CATALOGUE = {
+    '보장 여부 확인': {'gt': '보험금 보장', 'category': '보장', 'desc': '특정 질병, 수술, 상해 보장 여부'},
+    '질병코드 문의': {'gt': '보험금 보장', 'category': '보장', 'desc': '질병 코드의 의미와 보장 대상 여부'},
+    '수술 분류 문의': {'gt': '보험금 보장', 'category': '보장', 'desc': '종 수술 분류와 수술비 지급 기준'},
+    '건강검진 예약': {'gt': '헬스케어서비스', 'category': '헬스케어', 'desc': '건강검진 예약과 이용 방법'},
+    '건강 상담 서비스': {'gt': '헬스케어서비스', 'category': '헬스케어', 'desc': '건강 상담과 운동 프로그램'},
+    '청구 서류 안내': {'gt': '제지급', 'category': '지급', 'desc': '보험금 청구 시 필요한 서류'},
+    '청구 절차 문의': {'gt': '제지급', 'category': '지급', 'desc': '보험금 지급 절차와 지급 기간'},
+    '중도보험금 청구': {'gt': '제지급', 'category': '지급', 'desc': '휴면보험금, 중도보험금 청구'},
+    '계약 부활': {'gt': '계약정보', 'category': '계약', 'desc': '자동부활, 일반부활 조건과 부활 보험료'},
+    '감액 신청': {'gt': '계약정보', 'category': '계약', 'desc': '보험가입금액 감액 신청 방법'},
+    '자동이체 변경': {'gt': '보험료납입', 'category': '납입', 'desc': '자동이체 등록, 변경, 해지'},
+    '보험료 납입 방법': {'gt': '보험료납입', 'category': '납입', 'desc': '카드, 가상계좌 등 보험료 납입 방법'},
+    '계약자 변경': {'gt': '명의변경', 'category': '계약', 'desc': '계약자, 수익자 변경 절차'},
+    '해지 환급금 문의': {'gt': '계약해지', 'category': '해지', 'desc': '해약환급금과 해지 절차'},
+    '약관대출 신청': {'gt': '대출', 'category': '대출', 'desc': '약관대출 신청과 상환 방법'},
+    '연금 개시': {'gt': '연금', 'category': '연금', 'desc': '연금 개시 나이와 수령 방법'},
+    '펀드 변경': {'gt': '변액 펀드', 'category': '변액', 'desc': '변액보험 펀드 변경과 수익률 조회'},
+    '세제 혜택 문의': {'gt': '법 제도', 'category': '법률', 'desc': '보험 관련 세금, 소득공제, 법률 문의'},
+    '주소/연락처 변경': {'gt': '고객정보', 'category': '고객', 'desc': '주소, 전화번호, 이메일 변경'},
+    '증명서 발급': {'gt': '증명서 안내장', 'category': '증명서', 'desc': '납입증명서, 가입증명서 발급'},
+    '압류 질권 문의': {'gt': '채권압류 질권설정', 'category': '법률', 'desc': '보험금 압류와 질권설정 해지'},
+    '분리보관 조회': {'gt': '분리보관', 'category': '고객', 'desc': '분리보관된 계약 정보 조회'},
+    '민원 접수': {'gt': '민원', 'category': '민원', 'desc': '불만 접수와 민원 처리 결과'},
+    '설계사 변경': {'gt': '설계사', 'category': '채널', 'desc': '담당 설계사 변경과 연락처 확인'},
+    '청약 심사 현황': {'gt': '신계약 미결', 'category': '계약', 'desc': '신계약 심사 진행 상황과 미결 서류'},
+    '채널 코드 문의': {'gt': '채널 표기 코드', 'category': '채널', 'desc': '가입 채널 표기 코드 의미'},
+    '바이탈리티 멤버십': {'gt': '바이탈리티', 'category': '헬스케어', 'desc': '바이탈리티 멤버십 가입과 철회'},
+    '해피콜 문의': {'gt': '해피콜', 'category': '계약', 'desc': '완전판매 모니터링 해피콜 일정'},
+}
+
+# 질문 앞에 붙는 상황 설명 (질문 길이와 어휘를 다양하게)
+SUBJECTS = (
+    '', '', '', '계약자가 미성년자인데 ', '피보험자가 해외에 거주 중인데 ', '앱으로 ', '콜센터에 전화했는데 ',
+    '종신보험 가입 후 3년이 지났는데 ', '실손보험에서 ', '암 진단을 받았는데 ', '어머니 명의 계약으로 ',
+    '지난달에 ', '법정대리인이 ', '온라인으로 ', '변액유니버설보험인데 ', '회사 단체보험으로 ',
+)
+
+# 숫자가 들어간 상황 설명 (같은 의도라도 질문 문장이 겹치지 않도록)
+NUMERIC_SUBJECTS = (
+    '가입한 지 {years}년 된 계약인데 ', '월 보험료 {amount}만원을 내고 있는데 ', '{age}세 피보험자가 ',
+    '{month}월에 입원했는데 ', '{years}회차 보험료가 밀렸는데 ', '{amount}만원 정도 받을 수 있다고 들었는데 ',
+)
+
+TEMPLATES = (
+    '{subject}{intent} 관련해서 문의드립니다.',
+    '{subject}{intent}은 어떻게 하나요?',
+    '{subject}{desc}에 대해 알려주세요.',
+    '{subject}{intent} 가능한가요?',
+    '{subject}{intent} 하려면 필요한 서류가 뭔가요?',
+    '{subject}{desc} 관련 기준이 궁금합니다.',
+    '{subject}{intent} 진행 상황을 확인하고 싶어요',
+    '{intent} 문의',
+)
+
+# 긴 질문용 부연 설명
+DETAILS = (
+    ' 지난번에 상담을 받았는데 안내가 달라서 다시 확인하고 싶습니다.',
+    ' 처리 기간은 보통 얼마나 걸리나요?',
+    ' 영업일 기준으로 며칠 안에 가능한지도 알려주세요.',
+    ' 대리인이 신청하는 경우에도 같은 절차인가요?',
+)
+
+
+def load_catalogue(path: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    의도 카탈로그 로드 (파일이 없으면 내장 카탈로그)
+
+    Args:
+        path: 카탈로그 JSON 경로 (기본: src/micro_intents.json)
+
+    Returns:
+        {의도: {'gt', 'category', 'desc'}} 딕셔너리
+    """
+    path = path or DEFAULT_CATALOGUE_PATH
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            catalogue = json.load(f)
+        if catalogue:
+            return catalogue
+    print(f"카탈로그 파일이 없어 내장 카탈로그({len(FALLBACK_CATALOGUE)}개 의도)를 사용합니다: {path}",
+          file=sys.stderr)
+    return dict(FALLBACK_CATALOGUE)
+
+
+def zipf_cum_weights(count: int, skew: float) -> List[float]:
+    """
+    Zipf 분포 누적 가중치 (순위 k의 가중치 = 1 / k^skew)
+
+    Args:
+        count: 항목 수
+        skew: Zipf 지수 (0이면 균등)
+
+    Returns:
+        random.choices(cum_weights=...)용 누적 가중치
+    """
+    return list(itertools.accumulate(1.0 / (rank ** skew) for rank in range(1, count + 1)))
+
+
+def _make_question(rng: random.Random, intent: str, info: Dict[str, Any]) -> str:
+    """의도 1개로 질문 문장 생성"""
+    if rng.random() < 0.5:
+        subject = rng.choice(NUMERIC_SUBJECTS).format(
+            years=rng.randint(1, 30), amount=rng.randint(1, 500), age=rng.randint(1, 90), month=rng.randint(1, 12)
+        )
+    else:
+        subject = rng.choice(SUBJECTS)
+    question = rng.choice(TEMPLATES).format(subject=subject, intent=intent, desc=info.get('desc') or intent)
+    if rng.random() < 0.2:
+        question += rng.choice(DETAILS)
+    return question
+
+
+def iter_synthetic_questions(
+    catalogue: Dict[str, Dict[str, Any]],
+    rows: int,
+    skew: float = 1.0,
+    duplicate_rate: float = 0.05,
+    seed: int = 42,
+    recent_size: int = 10000,
+) -> Iterator[Dict[str, Any]]:
+    """
+    합성 질문 스트리밍 생성 (메모리 사용량은 행 수와 무관)
+
+    의도는 카탈로그 순서를 섞은 뒤 Zipf 분포로 뽑고, 중복 질문은 최근 recent_size개 중에서 그대로 반복한다.
+    문장 템플릿 조합이 유한하므로 행 수가 많으면 duplicate_rate와 별개로 우연히 같은 문장도 생긴다.
+
+    Args:
+        catalogue: 의도 카탈로그
+        rows: 생성할 행 수
+        skew: 의도별 빈도 Zipf 지수 (0이면 균등)
+        duplicate_rate: 앞서 생성한 질문을 반복할 비율
+        seed: 난수 시드
+        recent_size: 중복 질문 후보로 보관할 최근 질문 수
+
+    Yields:
+        {"row": 행번호(2부터), "question": 질문, "ground_truth": 정답 도메인, "intent": 정답 의도}
+    """
+    rng = random.Random(seed)
+    intents = list(catalogue)
+    rng.shuffle(intents)
+    cum_weights = zipf_cum_weights(len(intents), skew)
+    recent = []
+
+    row = 2
+    remaining = rows
+    while remaining > 0:
+        batch = rng.choices(intents, cum_weights=cum_weights, k=min(remaining, 10000))
+        remaining -= len(batch)
+        for intent in batch:
+            if recent and rng.random() < duplicate_rate:
+                question, intent = rng.choice(recent)
+            else:
+                question = _make_question(rng, intent, catalogue[intent])
+                if len(recent) < recent_size:
+                    recent.append((question, intent))
+                else:
+                    recent[rng.randrange(recent_size)] = (question, intent)
+            yield {
+                'row': row,
+                'question': question,
+                'ground_truth': catalogue[intent].get('gt', ''),
+                'intent': intent,
+            }
+            row += 1
+
+
+def synthetic_response(rng: random.Random, intent: str, intents: List[str]) -> str:
+    """
+    정답 의도에 대한 LLM 응답 흉내 (파서/매처 부하 재현용)
+
+    대부분 정답 의도를 그대로 답하고, 일부는 표기를 바꾼 이름(Fuzzy Match 경로),
+    다른 의도(오분류), 카탈로그에 없는 이름(미분류), 도메인 없는 응답('기타')을 섞는다.
+
+    Args:
+        rng: 난수 생성기
+        intent: 정답 의도
+        intents: 전체 의도 목록
+
+    Returns:
+        "도메인1: ...\n도메인2: ...\n이유: ...\n의견구분: ..." 형식의 응답 문자열
+    """
+    draw = rng.random()
+    if draw < 0.70:
+        first = intent
+    elif draw < 0.85:
+        first = intent.replace(' ', '') + ' 관련 문의'
+    elif draw < 0.95:
+        first = rng.choice(intents)
+    elif draw < 0.98:
+        first = '알 수 없는 요청'
+    else:
+        return "질문만으로는 의도를 판단하기 어렵습니다.\n의견구분: 기타의견"
+
+    lines = [f"도메인1: {first}"]
+    if rng.random() < 0.6:
+        lines.append(f"도메인2: {rng.choice(intents)}")
+    lines.append(f"이유: {intent} 관련 질문으로 판단됨")
+    lines.append("의견구분: 정확히 분류됨")
+    return '\n'.join(lines)
+
+
+def write_dataset(path: str, records: Iterable[Dict[str, Any]]) -> int:
+    """
+    합성 질문을 형식별 파일로 저장
+
+    Args:
+        path: 출력 경로 (.xlsx/.csv/.jsonl)
+        records: iter_synthetic_questions() 결과
+
+    Returns:
+        저장한 행 수
+    """
+    from src.io_backends import detect_format
+
+    file_format = detect_format(path)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    count = 0
+    if file_format == 'xlsx':
+        import openpyxl
+
+        # write-only 모드: 행을 바로 직렬화하므로 대용량도 메모리를 거의 쓰지 않음
+        workbook = openpyxl.Workbook(write_only=True)
+        worksheet = workbook.create_sheet()
+        worksheet.append(EXCEL_HEADER)
+        for record in records:
+            if count >= EXCEL_MAX_ROWS:
+                raise ValueError(f"엑셀 시트 최대 행 수({EXCEL_MAX_ROWS:,})를 넘습니다. JSONL/CSV로 생성하세요.")
+            worksheet.append([record['row'] - 1, record['question'], record['ground_truth'],
+                              None, None, None, None, record['intent']])
+            count += 1
+        workbook.save(path)
+    elif file_format == 'jsonl':
+        with open(path, 'w', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+                count += 1
+    elif file_format == 'csv':
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=('row', 'question', 'ground_truth', 'intent'))
+            writer.writeheader()
+            for record in records:
+                writer.writerow(record)
+                count += 1
+    else:
+        raise ValueError(f"합성 데이터는 xlsx/csv/jsonl 형식만 지원합니다 - {path}")
+    return count
+
+
+def generate_dataset(path: str, rows: int, skew: float = 1.0, duplicate_rate: float = 0.05, seed: int = 42,
+                     catalogue: Optional[Dict[str, Dict[str, Any]]] = None) -> int:
+    """
+    합성 데이터 파일 생성
+
+    Args:
+        path: 출력 경로 (.xlsx/.csv/.jsonl)
+        rows: 행 수
+        skew: 의도별 빈도 Zipf 지수
+        duplicate_rate: 중복 질문 비율
+        seed: 난수 시드
+        catalogue: 의도 카탈로그 (기본: load_catalogue())
+
+    Returns:
+        저장한 행 수
+    """
+    catalogue = catalogue if catalogue is not None else load_catalogue()
+    return write_dataset(path, iter_synthetic_questions(catalogue, rows, skew, duplicate_rate, seed))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='합성 질문 데이터 생성기')
+    parser.add_argument('-n', '--rows', type=int, default=10000, help='생성할 행 수 (기본: 10000)')
+    parser.add_argument('-o', '--output', default='input/synthetic.jsonl',
+                        help='출력 파일 (.xlsx/.csv/.jsonl, 기본: input/synthetic.jsonl)')
+    parser.add_argument('--skew', type=float, default=1.0, help='의도별 빈도 Zipf 지수 (0이면 균등, 기본: 1.0)')
+    parser.add_argument('--duplicate-rate', type=float, default=0.05, help='중복 질문 비율 (기본: 0.05)')
+    parser.add_argument('--seed', type=int, default=42, help='난수 시드 (기본: 42)')
+    parser.add_argument('--catalogue', default=None, help='의도 카탈로그 JSON (기본: src/micro_intents.json)')
+    args = parser.parse_args(argv)
+
+    catalogue = load_catalogue(args.catalogue)
+    count = generate_dataset(args.output, args.rows, args.skew, args.duplicate_rate, args.seed, catalogue)
+    print(f"{count:,}행 생성 완료: {args.output} (의도 {len(catalogue)}개, skew {args.skew}, "
+          f"중복 비율 {args.duplicate_rate})")
+
+
+if __name__ == '__main__':
+    main()
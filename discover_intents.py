@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+의도 발견 클러스터링 실행 파일
+
+라벨 없이 질문을 글자 n-gram TF-IDF로 군집화하고, 군집별 대표 키워드 / 샘플 질문 / 가장 가까운 기존 Micro-Intent를
+보고서로 저장합니다. 기존 micro_intents.json과의 유사도가 낮은 군집은 '미커버'로 표시되어 새 의도 후보 검토에 사용합니다.
+LLM 호출 없이 CPU에서만 실행되며, 입력을 배치 단위로 여러 번 스트리밍하므로 대용량 코퍼스도 일정한 메모리로 처리합니다.
+
+Usage:
+    python discover_intents.py [옵션]
+
+Options:
+    -i, --input PATH           입력 파일 (.xlsx/.csv/.jsonl/.parquet, 기본: input/input.xlsx)
+    -o, --output-dir PATH      보고서 출력 디렉토리 (기본: result/intent_discovery)
+    -k, --clusters NUMBER      군집 수 (기본: 50)
+    -t, --coverage-threshold N 기존 의도 유사도 기준 (기본: 0.2)
+    --n-features NUMBER        해싱 특성 차원 (기본: 65536)
+    --batch-size NUMBER        배치당 질문 수 (기본: 4096)
+    --seed NUMBER              난수 시드 (기본: 0)
+
+Examples:
+    python discover_intents.py -k 60
+    python discover_intents.py -i data/questions.parquet -k 200 --batch-size 20000
+"""
+
+import sys
+import os
+import argparse
+import json
+import logging
+import time
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from main import setup_logging
+
+
+def parse_arguments(argv=None):
+    """
+    명령행 인자 파싱
+
+    Args:
+        argv: 인자 리스트 (기본: sys.argv[1:])
+
+    Returns:
+        args 객체
+    """
+    parser = argparse.ArgumentParser(
+        description='의도 발견 클러스터링',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('-i', '--input', default='input/input.xlsx',
+                        help='입력 파일 경로 (기본: input/input.xlsx)')
+    parser.add_argument('-o', '--output-dir', default='result/intent_discovery',
+                        help='보고서 출력 디렉토리 (기본: result/intent_discovery)')
+    parser.add_argument('-k', '--clusters', type=int, default=50, help='군집 수 (기본: 50)')
+    parser.add_argument('-t', '--coverage-threshold', type=float, default=0.2,
+                        help='기존 의도 유사도 기준 (기본: 0.2)')
+    parser.add_argument('--n-features', type=int, default=2 ** 16, help='해싱 특성 차원 (기본: 65536)')
+    parser.add_argument('--batch-size', type=int, default=4096, help='배치당 질문 수 (기본: 4096)')
+    parser.add_argument('--seed', type=int, default=0, help='난수 시드 (기본: 0)')
+    return parser.parse_args(argv)
+
+
+def load_catalogue():
+    """src/micro_intents.json 로드 (없으면 빈 딕셔너리)"""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'micro_intents.json')
+    if not os.path.exists(path):
+        logging.warning(f"Micro-Intent 목록을 찾을 수 없습니다 - {path} (모든 군집이 미커버로 표시됩니다)")
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    """
+    의도 발견 실행
+
+    Args:
+        argv: 명령행 인자 리스트 (기본: sys.argv[1:])
+    """
+    args = parse_arguments(argv)
+    setup_logging()
+
+    from src.intent_clustering import discover_intents, format_cluster_report
+    from src.ngram_mining import iter_corpus
+
+    if not os.path.exists(args.input):
+        logging.error(f"입력 파일을 찾을 수 없습니다 - {args.input}")
+        sys.exit(1)
+
+    logging.info("=" * 60)
+    logging.info(f"의도 발견 클러스터링: {args.input} (군집 {args.clusters}개)")
+    logging.info("=" * 60)
+
+    start = time.perf_counter()
+    try:
+        report = discover_intents(
+            lambda: iter_corpus(args.input),
+            catalogue=load_catalogue(),
+            n_clusters=args.clusters,
+            coverage_threshold=args.coverage_threshold,
+            n_features=args.n_features,
+            batch_size=args.batch_size,
+            seed=args.seed
+        )
+    except (ImportError, ValueError) as e:
+        logging.error(f"클러스터링 실패 - {e}")
+        sys.exit(1)
+    elapsed = time.perf_counter() - start
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    report_path = os.path.join(args.output_dir, 'clusters.md')
+    with open(report_path, 'w', encoding='utf-8') as f:
+        f.write(format_cluster_report(report))
+    detail_path = os.path.join(args.output_dir, 'clusters.json')
+    with open(detail_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    for cluster in report['clusters']:
+        if not cluster['covered']:
+            logging.info(f"[미커버 군집 {cluster['cluster']}] {cluster['size']}건 | {cluster['label']} "
+                         f"| 예: {cluster['samples'][0] if cluster['samples'] else '-'}")
+    logging.info(f"소요 시간 {elapsed:.1f}초, 보고서가 {report_path}에 저장되었습니다. (상세: {detail_path})")
+
+
+if __name__ == '__main__':
+    main()
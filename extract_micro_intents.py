@@ -1,36 +1,84 @@
-import pandas as pd
-from collections import Counter
-import re
+"""
+Micro-Intent 후보 키워드 추출
+
+입력 질문 전체를 한 번 스트리밍하며 어절 n-gram(1~2어절)과 한글 글자 n-gram의 상위 빈도를 집계하고,
+micro_intents.json 큐레이션용 후보 파일을 저장합니다. 카운터 항목 수에 상한이 있어 대용량 코퍼스도 일정한 메모리로 처리합니다.
+
+Usage:
+    python extract_micro_intents.py [-i input/input.xlsx] [-n 100] [-o result/micro_intent_candidates.json]
+                                    [--min-length 1] [--document-frequency]
+"""
+
+import argparse
+import json
+import os
+
+
+def extract_intents(input_path='input/input.xlsx', top=100, output_path=None, capacity=20000,
+                    min_length=1, document_frequency=False):
+    """
+    Micro-Intent 후보 키워드/구문 추출
+
+    Args:
+        input_path: 입력 파일 경로 (.xlsx/.csv/.jsonl/.parquet)
+        top: 출력할 상위 후보 개수
+        output_path: 후보 JSON 저장 경로 (None이면 저장하지 않음)
+        capacity: n-gram 카운터 항목 수 상한
+        min_length: 1어절 후보의 최소 글자 수 (기본: 1, 모든 어절)
+        document_frequency: True면 질문 단위 문서 빈도 (기본: 출현 횟수)
+    """
+    from src.ngram_mining import mine_file, save_candidates
 
-def extract_intents():
     try:
-        df = pd.read_excel('input/input.xlsx')
+        miner = mine_file(input_path, capacity=capacity, min_length=min_length,
+                          document_frequency=document_frequency)
     except Exception as e:
         print(f"파일 로드 실패: {e}")
         return
 
-    col_q = 'Question'
-    questions = df[col_q].dropna().tolist()
-    
-    # 2글자 이상 명사/동사 추출을 위한 간단한 토크나이징 (정교하지 않아도 됨)
-    words = []
-    for q in questions:
-        # 특수문자 제거
-        clean_q = re.sub(r'[^\w\s]', '', q)
-        # 어절 단위 분리
-        tokens = clean_q.split()
-        # 2-gram (연속된 두 단어) 생성하여 문맥 파악
-        if len(tokens) >= 2:
-            for i in range(len(tokens)-1):
-                words.append(f"{tokens[i]} {tokens[i+1]}")
-        words.extend(tokens)
-
-    # 빈도수 상위 키워드/구문 추출
-    common_phrases = Counter(words).most_common(100)
-    
-    print("=== 상위 빈도 키워드/구문 (Micro-Intent 후보) ===")
-    for phrase, count in common_phrases:
-        print(f"{phrase}: {count}")
+    # 이미 등록된 Micro-Intent는 후보 목록에서 표시
+    catalogue_path = os.path.join('src', 'micro_intents.json')
+    existing = ()
+    if os.path.exists(catalogue_path):
+        with open(catalogue_path, 'r', encoding='utf-8') as f:
+            existing = json.load(f).keys()
+    candidates = miner.candidates(top=top, existing=existing)
+
+    print(f"=== 상위 빈도 키워드/구문 (Micro-Intent 후보, 질문 {miner.questions:,}건) ===")
+    for entry in candidates['phrases']:
+        mark = " (등록됨)" if entry['existing'] else ""
+        print(f"{entry['text']}: {entry['count']}{mark}")
+
+    print("\n=== 상위 빈도 글자 n-gram ===")
+    print(", ".join(f"{entry['text']}({entry['count']})" for entry in candidates['char_ngrams'][:30]))
+
+    if output_path:
+        save_candidates(output_path, candidates)
+        print(f"\n후보 목록이 {output_path}에 저장되었습니다.")
+
+
+def main(argv=None):
+    """
+    명령행 실행
+
+    Args:
+        argv: 명령행 인자 리스트 (기본: sys.argv[1:])
+    """
+    parser = argparse.ArgumentParser(description='Micro-Intent 후보 키워드 추출')
+    parser.add_argument('-i', '--input', default='input/input.xlsx',
+                        help='입력 파일 경로 (기본: input/input.xlsx)')
+    parser.add_argument('-n', '--top', type=int, default=100, help='상위 후보 개수 (기본: 100)')
+    parser.add_argument('-o', '--output', default='result/micro_intent_candidates.json',
+                        help='후보 JSON 저장 경로 (기본: result/micro_intent_candidates.json)')
+    parser.add_argument('--capacity', type=int, default=20000,
+                        help='n-gram 카운터 항목 수 상한 (기본: 20000)')
+    parser.add_argument('--min-length', type=int, default=1,
+                        help='1어절 후보의 최소 글자 수 (기본: 1)')
+    parser.add_argument('--document-frequency', action='store_true',
+                        help='출현 횟수 대신 질문 단위 문서 빈도로 집계 (한 질문 안의 중복은 1회)')
+    args = parser.parse_args(argv)
+    extract_intents(args.input, args.top, args.output, args.capacity, args.min_length, args.document_frequency)
+
 
 if __name__ == "__main__":
-    extract_intents()
+    main()
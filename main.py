@@ -6,10 +6,20 @@ Usage:
     python main.py [옵션]
 
 Options:
-    -i, --input PATH         입력 파일 경로 (기본: input/input.xlsx)
-    -o, --output PATH        출력 파일 경로 (기본: result/result.xlsx)
+    -i, --input PATH         입력 파일 경로 (.xlsx/.csv/.jsonl/.parquet, 기본: input/input.xlsx)
+    -o, --output PATH        출력 파일 경로 (.xlsx/.csv/.jsonl/.parquet, 기본: result/result.xlsx)
     -n, --limit NUMBER       처리할 질문 개수 제한 (기본: all)
     -f, --filter SUCCESS     성공여부 필터 (all/O/X, 기본: all)
+    --seed NUMBER            층화 샘플링 난수 시드 (기본: 실행마다 새로 생성, 로그와 매니페스트에 기록)
+    --min-per-class NUMBER   Ground Truth별 최소 샘플 개수 (희귀 의도 보장, 기본: 0)
+    --sample-manifest PATH   샘플 매니페스트 경로 (파일이 있으면 같은 행을 재사용, 없으면 샘플 결과를 저장)
+    --incremental [STORE]    질문/프롬프트가 바뀐 행만 LLM 호출, 나머지는 저장된 응답으로 재채점
+                             (응답 저장소 기본: 출력 디렉토리의 responses.jsonl.gz)
+    --store-responses [STORE]
+                             LLM 원본 응답 저장 (.jsonl/.jsonl.gz/.sqlite, 기본: 출력 디렉토리의 responses.jsonl.gz)
+    --profile                샘플링 프로파일과 단계별 소요 시간 저장 (<출력 파일명>_profile.folded / _profile.txt)
+    --profile-interval SEC   프로파일 샘플링 간격 (기본: 0.01)
+    --trace                  작업 스레드별 처리 타임라인을 Chrome trace JSON으로 저장 (<출력 파일명>_trace.json)
 
 Examples:
     python main.py                                    # 전체 처리
@@ -18,6 +28,11 @@ Examples:
     python main.py -f O                               # 성공(O)만 처리
     python main.py -n 5 -f X                          # 실패 중 5개만 처리
     python main.py -i data/test.xlsx -o result/out.xlsx
+    python main.py -i data/questions.jsonl -o result/out.parquet
+    python main.py -n 100 --seed 42                   # 재현 가능한 층화 샘플
+    python main.py -n 100 --sample-manifest result/sample.json  # 샘플 저장/재사용
+    python main.py --incremental                      # 바뀐 행만 LLM 재호출
+    python main.py -n 500 --profile                   # 단계별 시간 + 샘플링 프로파일 저장
 """
 
 import sys
@@ -25,20 +40,25 @@ import os
 import argparse
 import logging
 import time
-import json
-import random
-from collections import defaultdict
 from datetime import datetime
 from dotenv import load_dotenv
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import threading
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
 
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from src.excel_handler import ExcelHandler
-from src.llm_classifier import LLMClassifier, map_to_hierarchical_domain
+from src.llm_classifier import LLMClassifier
 from src.evaluator import Evaluator
+from src.intent_registry import ResultRecord
+from src.io_backends import detect_format, iter_questions, read_questions, open_result_writer, to_result_record
+from src.result_sink import JsonResultSink
+from src.pipeline import Prefetcher, WriterStage, WriterStageError, submit_windowed
+from src.event_log import ProgressReporter, open_event_log, start_queue_logging
+from src.profiling import stage, start_profiling, finish_profiling, mark_phase
+from src.tracing import tracer, start_tracing, finish_tracing
+from src.status import RunStatus, StatusReporter, classifier_status_source, format_status
 
 
 def setup_logging():
@@ -71,15 +91,12 @@ def setup_logging():
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     log_file = os.path.join(log_dir, f'domain_classifier_{timestamp}.log')
 
-    # 로깅 설정
-    logging.basicConfig(
-        level=log_level,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file, encoding='utf-8'),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    # 로깅 설정 (호출 스레드는 큐에 넣기만 하고, 파일/콘솔 기록은 리스너 스레드에서 수행)
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    handlers = [logging.FileHandler(log_file, encoding='utf-8'), logging.StreamHandler(sys.stdout)]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    start_queue_logging(handlers, log_level)
 
     logger = logging.getLogger(__name__)
     logger.info(f"로그 파일: {log_file}")
@@ -118,35 +135,173 @@ def load_config():
             'port': int(os.getenv('QWEN3_PORT', '9996')),
             'model': os.getenv('QWEN3_MODEL', 'qwen3-30b-a3b-instruct')
         }
+        # 복제본 목록 (QWEN3_HOSTS=host1:port1,host2:port2), 미설정 시 QWEN3_HOST/QWEN3_PORT 사용
+        hosts = [h.strip() for h in os.getenv('QWEN3_HOSTS', '').split(',') if h.strip()]
+        if not hosts:
+            hosts = [f"{llm_config['host']}:{llm_config['port']}"]
+        llm_config['endpoints'] = []
+        for host in hosts:
+            if ':' not in host:
+                host = f"{host}:{llm_config['port']}"
+            llm_config['endpoints'].append(f"http://{host}/v1/chat/completions")
     elif llm_provider == 'databricks':
         llm_config = {
             'url': os.getenv('DATABRICKS_URL'),
             'token': os.getenv('DATABRICKS_TOKEN'),
             'model': os.getenv('DATABRICKS_MODEL', 'databricks-gpt-oss-20b')
         }
+        # 복제본 목록 (DATABRICKS_URLS=url1,url2), 미설정 시 DATABRICKS_URL 사용
+        urls = [u.strip() for u in os.getenv('DATABRICKS_URLS', '').split(',') if u.strip()]
+        llm_config['endpoints'] = urls if urls else [llm_config['url']] if llm_config['url'] else []
     else:
         logging.error(f"지원하지 않는 LLM_PROVIDER - {llm_provider}")
         logging.error("LLM_PROVIDER는 'qwen3' 또는 'databricks'여야 합니다.")
         sys.exit(1)
 
+    # 부하 분산 설정 (엔드포인트가 여러 개일 때 적용)
+    lb_strategy = os.getenv('LB_STRATEGY', 'least_outstanding').lower()
+    if lb_strategy not in ('least_outstanding', 'latency'):
+        logging.error(f"지원하지 않는 LB_STRATEGY - {lb_strategy}")
+        logging.error("LB_STRATEGY는 'least_outstanding' 또는 'latency'여야 합니다.")
+        sys.exit(1)
+    llm_config['lb_strategy'] = lb_strategy
+    llm_config['lb_max_failures'] = int(os.getenv('LB_MAX_FAILURES', '3'))
+    llm_config['lb_eject_seconds'] = float(os.getenv('LB_EJECT_SECONDS', '30'))
+    # 엔드포인트가 여러 개일 때 엔드포인트 내 재시도 횟수 (나머지는 다른 엔드포인트로 장애 전환)
+    llm_config['lb_endpoint_retries'] = int(os.getenv('LB_ENDPOINT_RETRIES', '2'))
+
+    # 토큰 추정용 토크나이저 (approx / tiktoken:<인코딩> / hf:<모델 경로>)
+    llm_config['tokenizer'] = os.getenv('TOKENIZER', 'approx')
+
+    # Micro-Intent 카탈로그 경로 (기본: src/micro_intents.json)
+    llm_config['micro_intents_path'] = os.getenv('MICRO_INTENTS_FILE') or None
+
+    # Few-shot 예시 (static: 고정 예시 3개 / dynamic: 질문별 유사 사례 k개)
+    few_shot_mode = os.getenv('FEW_SHOT_MODE', 'static').lower()
+    if few_shot_mode not in ('static', 'dynamic'):
+        logging.error(f"지원하지 않는 FEW_SHOT_MODE - {few_shot_mode}")
+        logging.error("FEW_SHOT_MODE는 'static' 또는 'dynamic'이어야 합니다.")
+        sys.exit(1)
+    project_dir = os.path.dirname(os.path.abspath(__file__))
+    llm_config['few_shot'] = {
+        'mode': few_shot_mode,
+        'k': int(os.getenv('FEW_SHOT_K', '3')),
+        'success_path': os.getenv('FEW_SHOT_SUCCESS_FILE', os.path.join(project_dir, 'domain_success_examples.txt')),
+        'failure_path': os.getenv('FEW_SHOT_FAILURE_FILE', os.path.join(project_dir, 'domain_failure_examples.txt')),
+    }
+
+    # LLM 요청/응답 카세트 (off / record: 실제 응답 기록 / replay: 서버 없이 기록된 응답을 원래 지연 시간대로 재생)
+    cassette_mode = os.getenv('LLM_CASSETTE_MODE', 'off').lower()
+    if cassette_mode not in ('off', 'record', 'replay'):
+        logging.error(f"지원하지 않는 LLM_CASSETTE_MODE - {cassette_mode}")
+        logging.error("LLM_CASSETTE_MODE는 'off', 'record', 'replay' 중 하나여야 합니다.")
+        sys.exit(1)
+    cassette_path = os.getenv('LLM_CASSETTE_FILE', os.path.join('result', 'llm_cassette.jsonl.gz'))
+    if cassette_mode == 'replay' and not os.path.exists(cassette_path):
+        logging.error(f"재생할 카세트 파일이 없습니다: {cassette_path}")
+        sys.exit(1)
+    llm_config['cassette'] = {
+        'mode': cassette_mode,
+        'path': cassette_path,
+        # 재생 배속 (지연 시간 ÷ 배속, 0이면 대기 없이 즉시 응답)
+        'speed': float(os.getenv('LLM_CASSETTE_SPEED', '1')),
+    }
+
     config = {
         'domains': domains,
         'llm_provider': llm_provider,
         'llm_config': llm_config,
         'llm_timeout': int(os.getenv('LLM_TIMEOUT', '30')),
         'max_concurrent_requests': int(os.getenv('MAX_CONCURRENT_REQUESTS', '5')),
+        # 처리 중인 작업 수 상한 = 실행기 스레드 수 × SUBMIT_WINDOW (나머지 질문은 입력에서 필요할 때 읽음)
+        'submit_window': int(os.getenv('SUBMIT_WINDOW', '4')),
+        # 진행 로그 출력 간격 (초, 0이면 매 건 출력)
+        'progress_interval': float(os.getenv('PROGRESS_INTERVAL', '5')),
+        # 실행 상태 대시보드 (상태 줄: auto=터미널일 때만 / on / off, 상태 파일: 기본은 로그 파일 옆)
+        'status': {
+            'display': os.getenv('STATUS_DISPLAY', 'auto').lower(),
+            'interval': float(os.getenv('STATUS_INTERVAL', '2')),
+            'file': os.getenv('STATUS_FILE'),
+        },
         'thinking_time': int(os.getenv('THINKING_TIME', '3'))
     }
 
+    # 동시 요청 한도 (static: MAX_CONCURRENT_REQUESTS 고정 / adaptive: 지연 기반 자동 조정)
+    concurrency_mode = os.getenv('CONCURRENCY_MODE', 'static').lower()
+    if concurrency_mode not in ('static', 'adaptive'):
+        logging.error(f"지원하지 않는 CONCURRENCY_MODE - {concurrency_mode}")
+        logging.error("CONCURRENCY_MODE는 'static' 또는 'adaptive'여야 합니다.")
+        sys.exit(1)
+    config['concurrency'] = {
+        'mode': concurrency_mode,
+        'initial': config['max_concurrent_requests'],
+        'min': int(os.getenv('CONCURRENCY_MIN', '1')),
+        'max': int(os.getenv('CONCURRENCY_MAX', str(max(32, config['max_concurrent_requests'])))),
+    }
+
+    # 요청 헤징 설정 (꼬리 지연 완화, 기본: 미사용)
+    config['hedge'] = {
+        'enabled': os.getenv('HEDGE_ENABLED', 'false').lower() in ('1', 'true', 'yes'),
+        'percentile': float(os.getenv('HEDGE_PERCENTILE', '95')),
+        'budget': float(os.getenv('HEDGE_BUDGET', '0.1')),
+        'min_delay': float(os.getenv('HEDGE_MIN_DELAY', '1.0')),
+        'initial_delay': float(os.getenv('HEDGE_INITIAL_DELAY', '10.0')),
+        # 1차 요청 + 헤징 요청이 동시에 실행될 수 있도록 동시 요청 수의 2배
+        'max_workers': worker_count(config) * 2
+    }
+
+    # 토큰 예산 / 단가 (예산 0 = 확인 안 함, 단가는 1K 토큰당)
+    config['tokens'] = {
+        'prompt_budget': int(os.getenv('PROMPT_TOKEN_BUDGET', '0')),
+        'price_prompt': float(os.getenv('TOKEN_PRICE_PROMPT', '0')),
+        'price_completion': float(os.getenv('TOKEN_PRICE_COMPLETION', '0')),
+    }
+
     return config
 
 
-def parse_arguments():
+def worker_count(config):
+    """
+    분류 실행기 스레드 수
+
+    적응형 한도 사용 시 한도가 최대치까지 늘어날 수 있도록 CONCURRENCY_MAX만큼 스레드를 만들고,
+    실제 동시 요청 수는 분류기의 한도 제어기가 제한
+
+    Args:
+        config: 설정 딕셔너리
+
+    Returns:
+        스레드 수
+    """
+    concurrency = config.get('concurrency') or {}
+    if concurrency.get('mode') == 'adaptive':
+        return concurrency['max']
+    return config['max_concurrent_requests']
+
+
+def submit_window_size(config):
+    """
+    처리 중 작업 수 상한 (실행기 스레드 수 × SUBMIT_WINDOW, 파이프라인 큐 크기로도 사용)
+
+    Args:
+        config: 설정 딕셔너리
+
+    Returns:
+        작업 수
+    """
+    return worker_count(config) * max(1, config.get('submit_window', 4))
+
+
+def parse_arguments(argv=None):
     """
     명령행 인자 파싱
 
+    Args:
+        argv: 인자 리스트 (기본: sys.argv[1:])
+
     Returns:
-        args 객체 (input, output, limit, filter)
+        args 객체 (input, output, limit, filter, incremental, store_responses, seed, min_per_class, sample_manifest,
+                  profile, profile_interval)
     """
     parser = argparse.ArgumentParser(
         description='도메인 분류 어플리케이션',
@@ -159,19 +314,24 @@ def parse_arguments():
   python main.py -f O                     # 성공(O)만 처리
   python main.py -n 5 -f X                # 실패 중 5개만 처리
   python main.py -i data/test.xlsx -o result/out.xlsx
+  python main.py -i data/questions.jsonl -o result/out.parquet
+  python main.py -n 100 --seed 42         # 재현 가능한 층화 샘플
+  python main.py -n 100 --sample-manifest result/sample.json  # 샘플 저장/재사용
+  python main.py --incremental            # 바뀐 행만 LLM 재호출
+  python main.py -n 500 --profile         # 단계별 시간 + 샘플링 프로파일 저장
         """
     )
 
     parser.add_argument(
         '-i', '--input',
         default='input/input.xlsx',
-        help='입력 파일 경로 (기본: input/input.xlsx)'
+        help='입력 파일 경로 (.xlsx/.csv/.jsonl/.parquet, 기본: input/input.xlsx)'
     )
 
     parser.add_argument(
         '-o', '--output',
         default='result/result.xlsx',
-        help='출력 파일 경로 (기본: result/result.xlsx)'
+        help='출력 파일 경로 (.xlsx/.csv/.jsonl/.parquet, 기본: result/result.xlsx)'
     )
 
     parser.add_argument(
@@ -188,76 +348,114 @@ def parse_arguments():
         help='성공여부 필터 (all/O/X, 기본: all)'
     )
 
-    return parser.parse_args()
+    parser.add_argument(
+        '--incremental',
+        nargs='?',
+        const='',
+        default=None,
+        metavar='STORE',
+        help='증분 실행: 질문/프롬프트가 바뀐 행만 LLM 호출, GT·매처만 바뀐 행은 저장된 응답으로 재채점 '
+             '(응답 저장소 기본: 출력 디렉토리의 responses.jsonl.gz)'
+    )
+
+    parser.add_argument(
+        '--store-responses',
+        nargs='?',
+        const='',
+        default=None,
+        metavar='STORE',
+        help='LLM 원본 응답 저장 (.jsonl/.jsonl.gz/.sqlite, 기본: 출력 디렉토리의 responses.jsonl.gz, '
+             'reparse.py로 재채점)'
+    )
+
+    add_sampling_arguments(parser)
+    add_profile_arguments(parser)
+
+    parser.add_argument(
+        '--trace',
+        action='store_true',
+        help='작업 스레드별 처리 타임라인(대기열, 동시 요청 한도 대기, HTTP, 재시도 백오프, 대기, 파싱)을 '
+             'Chrome trace JSON으로 저장 (<출력 파일명>_trace.json, chrome://tracing 또는 Perfetto UI에서 열기)'
+    )
+
+    return parser.parse_args(argv)
+
+
+def add_sampling_arguments(parser):
+    """
+    층화 샘플링 관련 인자 추가 (main.py / shard_runner.py 공통)
+
+    Args:
+        parser: ArgumentParser
+    """
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=None,
+        help='층화 샘플링 난수 시드 (기본: 실행마다 새로 생성, 로그와 매니페스트에 기록)'
+    )
+
+    parser.add_argument(
+        '--min-per-class',
+        type=int,
+        default=0,
+        help='Ground Truth별 최소 샘플 개수 (희귀 의도 보장, 기본: 0)'
+    )
+
+    parser.add_argument(
+        '--sample-manifest',
+        default=None,
+        help='샘플 매니페스트 경로 (파일이 있으면 같은 행을 재사용, 없으면 샘플 결과를 저장)'
+    )
+
+
+def add_profile_arguments(parser):
+    """
+    프로파일링 관련 인자 추가 (main.py / update_ground_truth.py 공통)
+
+    Args:
+        parser: ArgumentParser
+    """
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='전체 스레드 샘플링 프로파일과 단계별 소요 시간을 결과 파일 옆에 저장 '
+             '(<출력 파일명>_profile.folded / _profile.txt)'
+    )
+
+    parser.add_argument(
+        '--profile-interval',
+        type=float,
+        default=0.01,
+        help='프로파일 샘플링 간격 (초, 기본: 0.01)'
+    )
 
 
-def stratified_sample(questions, limit):
+def stratified_sample(questions, limit, seed=None, min_per_class=0):
     """
     Ground Truth 비율에 맞춰 층화 추출 (랜덤 샘플링)
 
     Args:
         questions: 전체 질문 리스트
         limit: 추출할 샘플 개수
+        seed: 난수 시드 (같은 시드면 같은 샘플)
+        min_per_class: Ground Truth별 최소 추출 개수
 
     Returns:
         샘플링된 질문 리스트
     """
-    total_count = len(questions)
-    if limit >= total_count:
+    from src.sampling import encode_ground_truth, stratified_sample_indices
+
+    if limit >= len(questions):
         return questions
 
-    # Ground Truth별로 그룹화
-    groups = defaultdict(list)
-    for q in questions:
-        gt = q.get('ground_truth', 'Unknown')
-        groups[gt].append(q)
-
-    # 그룹별 할당량 계산
-    # 1. 일단 비율대로 정수 할당
-    targets = {}
-    remaining_limit = limit
-
-    # 비율 계산을 위해 미리 리스트화
-    group_items = list(groups.items())
-    
-    # 소수점 오차 처리를 위한 잔여값 저장 리스트
-    remainders = []
-
-    for gt, items in group_items:
-        ratio = len(items) / total_count
-        exact_target = ratio * limit
-        int_target = int(exact_target)
-        
-        targets[gt] = int_target
-        remaining_limit -= int_target
-        
-        # 소수점 부분 저장 (나중에 남은 limit 배분용)
-        remainders.append((gt, exact_target - int_target))
-
-    # 2. 남은 할당량을 소수점 부분이 큰 순서대로 배분
-    remainders.sort(key=lambda x: x[1], reverse=True)
-    
-    for i in range(remaining_limit):
-        gt = remainders[i % len(remainders)][0]
-        targets[gt] += 1
-
-    # 3. 실제 샘플링 수행
-    sampled_questions = []
-    for gt, target in targets.items():
-        items = groups[gt]
-        # target이 실제 아이템 수보다 클 수는 없음 (계산상)
-        # 하지만 안전장치로 min 적용
-        count = min(target, len(items))
-        if count > 0:
-            sampled_questions.extend(random.sample(items, count))
-
-    # 결과 리스트 섞기 (도메인별로 뭉쳐있지 않게)
-    random.shuffle(sampled_questions)
-    
-    return sampled_questions
-
-
-def process_single_question(classifier, item, evaluator, print_lock, thinking_time):
+    codes, _ = encode_ground_truth(questions)
+    indices = stratified_sample_indices(codes, limit, seed=seed, min_per_class=min_per_class)
+    return [questions[i] for i in indices]
+
+
+def process_single_question(classifier, item, evaluator, thinking_time, response_store=None, status=None,
+                            queued_at=None):
     """
     단일 질문 처리 (스레드에서 실행)
 
@@ -265,54 +463,102 @@ def process_single_question(classifier, item, evaluator, print_lock, thinking_ti
         classifier: LLM 분류기
         item: 질문 데이터 딕셔너리
         evaluator: 평가기
-        print_lock: 출력 동기화를 위한 Lock
         thinking_time: API 호출 후 대기 시간 (초)
+        response_store: LLM 원본 응답을 저장할 ResponseStore (기본: 저장 안 함)
+        status: 분류 지연 시간을 기록할 RunStatus (기본: 기록 안 함)
+        queued_at: 실행기에 제출한 시각 (time.perf_counter, --trace 실행 시 대기열 구간 기록용)
 
     Returns:
-        처리 결과 딕셔너리 (API 오류 시 None)
+        처리 결과 (ResultRecord, API 오류 시 None)
     """
     row = item['row']
+    if queued_at is not None and tracer.enabled:
+        tracer.add_async('queued', row, queued_at, time.perf_counter(), args={'row': row})
+
+    with tracer.span('question', category='question', row=row):
+        return _process_question(classifier, item, evaluator, thinking_time, response_store, status)
+
+
+def _process_question(classifier, item, evaluator, thinking_time, response_store, status):
+    """process_single_question() 본문 (분류 → 응답 저장 → 대기 → 채점)"""
+    row = item['row']
     question = item['question']
     ground_truth = item['ground_truth']
 
     # LLM을 사용하여 도메인 분류 (실험19: Top-3 다중 의도 추론)
-    classified_domains, opinion, opinion_category = classifier.classify(question)
+    meta = {'row': row}
+    start = time.perf_counter()
+    classified_domains, opinion, opinion_category, matches, usage = classifier.classify_detailed(question, meta=meta)
+    if status is not None:
+        status.observe_latency(time.perf_counter() - start)
 
     # API 호출 실패 감지
     if classified_domains is None or (len(classified_domains) > 0 and classified_domains[0] is None):
-        with print_lock:
-            logging.error("=" * 60)
-            logging.error(f"[행: {row}] LLM API 호출 실패")
-            logging.error(f"질문: {question}")
-            logging.error(f"Ground Truth: {ground_truth}")
-            logging.error(f"오류 상세: {opinion}")  # opinion에 상세 오류 메시지 포함
-            logging.error("=" * 60)
-            logging.error("프로그램을 종료합니다.")
+        # 여러 줄을 한 레코드로 기록 (다른 스레드 로그와 섞이지 않음)
+        logging.error("\n".join([
+            "=" * 60,
+            f"[행: {row}] LLM API 호출 실패",
+            f"질문: {question}",
+            f"Ground Truth: {ground_truth}",
+            f"오류 상세: {opinion}",  # opinion에 상세 오류 메시지 포함
+            "=" * 60,
+            "프로그램을 종료합니다.",
+        ]))
         return None  # API 오류 시 None 반환
 
+    # 원본 응답 저장 (증분 실행 시 재채점/재사용용)
+    if response_store is not None:
+        from src.incremental import make_entry
+
+        response_store.put(make_entry(classifier, item, meta, usage))
+
     # API 호출 후 대기 (Rate Limiting 방지)
     if thinking_time > 0:
         logging.debug(f"[행: {row}] API 호출 후 {thinking_time}초 대기 중...")
-        time.sleep(thinking_time)
+        with stage('sleep'):
+            time.sleep(thinking_time)
 
-    # Hit@K 평가: Top-K 중 하나라도 정답이면 성공
-    # Ground Truth와 비교 (대소문자 무시, 공백 제거)
-    gt_normalized = ground_truth.strip().lower()
-    hit = False
-    hit_rank = -1
+    with stage('evaluate'):
+        return score_classification(
+            classifier, item, evaluator, classified_domains, opinion, opinion_category, matches, usage
+        )
 
-    for rank, domain in enumerate(classified_domains, start=1):
-        if domain and domain.strip().lower() == gt_normalized:
-            hit = True
-            hit_rank = rank
-            break
 
-    success = 'O' if hit else 'X'
+def score_classification(classifier, item, evaluator, classified_domains, opinion, opinion_category,
+                         matches, usage):
+    """
+    분류 결과 채점 (Hit@K 평가, 통계 업데이트, 결과 레코드 생성)
+
+    Args:
+        classifier: LLM 분류기 (의도 레지스트리 사용)
+        item: 질문 데이터 딕셔너리
+        evaluator: 평가기
+        classified_domains: 매칭된 도메인 리스트
+        opinion: 분류 이유
+        opinion_category: LLM이 응답한 의견 구분
+        matches: 매칭 정보 튜플
+        usage: 토큰 사용량 (없으면 None)
+
+    Returns:
+        ResultRecord
+    """
+    row = item['row']
+    question = item['question']
+    ground_truth = item['ground_truth']
+
+    # Hit@K 평가: Top-K 중 하나라도 정답이면 성공
+    # 레지스트리 ID 비교 (대소문자 무시, 공백 제거한 이름이 같으면 같은 ID)
+    # 카탈로그에 없는 이름(미분류, 자유 입력 GT)은 등록하지 않고 원문으로 비교
+    registry = classifier.registry
+    gt_id = registry.code(ground_truth)
+    classified_ids = registry.encode(domain for domain in classified_domains if domain)
+    hit_rank = registry.hit_rank(gt_id, classified_ids)
+    success = 'O' if hit_rank else 'X'
 
     # 통계 업데이트 (1순위 도메인 기준으로 evaluator 업데이트)
     # evaluator는 내부적으로 통계를 유지하므로 호출해야 함
-    primary_domain = classified_domains[0] if classified_domains else "없음"
-    evaluator.evaluate(primary_domain, ground_truth)
+    primary_id = classified_ids[0] if classified_ids else registry.code("없음")
+    evaluator.evaluate_ids(primary_id, gt_id)
 
     # success 기준으로 의견 구분 자동 설정 (LLM의 잘못된 판단 방지)
     if success == 'O':
@@ -322,25 +568,50 @@ def process_single_question(classifier, item, evaluator, print_lock, thinking_ti
         if opinion_category == "정확히 분류됨":
             opinion_category = "오분류"
 
-    # 스레드 안전한 로깅
-    with print_lock:
+    # 행별 결과는 이벤트 로그(JSONL)에 기록되므로 사람이 읽는 줄은 DEBUG에서만 (문자열 생성도 생략)
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
         question_display = f"{question[:50]}..." if len(question) > 50 else question
         domains_str = " → ".join(classified_domains[:3])  # Top-3만 표시
-        logging.info(f"[행: {row}] {question_display}")
-        if hit:
-            logging.info(f"  정답: {ground_truth} | 분류: {domains_str} | Hit@{hit_rank} ✓")
-        else:
-            logging.info(f"  정답: {ground_truth} | 분류: {domains_str} | Miss ✗")
+        mark = f"Hit@{hit_rank} ✓" if hit_rank else "Miss ✗"
+        logging.debug(f"[행: {row}] {question_display} | 정답: {ground_truth} | 분류: {domains_str} | {mark}")
 
-    return {
-        'row': row,
-        'classified_domain': primary_domain,  # 1순위 도메인 (하위 호환성)
-        'classified_domains': classified_domains,  # Top-K 전체 (실험19)
-        'hit_rank': hit_rank if hit else None,  # Hit된 순위
-        'success': success,
-        'opinion': opinion,
-        'opinion_category': opinion_category
-    }
+    # 정수 ID 기반 결과 레코드 (기존 결과 딕셔너리와 같은 키로 조회 가능)
+    usage = usage or {}
+    return ResultRecord(registry, row, classified_ids, hit_rank, opinion, opinion_category, matches,
+                        usage.get('prompt_tokens'), usage.get('completion_tokens'))
+
+
+def score_stored_responses(classifier, plan, evaluator, response_store, on_result=None, status=None):
+    """
+    증분 실행: 저장된 LLM 응답으로 재채점/재사용 대상 처리 (LLM 호출 없음)
+
+    Args:
+        classifier: LLM 분류기
+        plan: IncrementalPlan
+        evaluator: 평가기
+        response_store: 응답 저장소 (재채점한 행의 GT/매처 버전 갱신)
+        on_result: 결과 1건마다 on_result(결과, 질문 데이터)로 호출할 콜백
+        status: 진행 상태를 집계할 RunStatus (저장된 응답 사용 = 캐시 적중으로 집계)
+
+    Returns:
+        결과 리스트
+    """
+    from src.incremental import local_inputs, restamp_entry
+
+    results = []
+    for item, entry, rescored in local_inputs(plan):
+        classified_domains, opinion, opinion_category, matches = classifier.classify_response(entry['response'])
+        result = score_classification(
+            classifier, item, evaluator, classified_domains, opinion, opinion_category, matches, entry.get('usage')
+        )
+        if rescored:
+            response_store.put(restamp_entry(entry, item))
+        results.append(result)
+        if on_result:
+            on_result(result, item)
+        if status is not None:
+            status.record(result, cached=True)
+    return results
 
 
 def save_json_result(output_path: str, results: list, questions: list) -> bool:
@@ -352,6 +623,9 @@ def save_json_result(output_path: str, results: list, questions: list) -> bool:
     - 상위 도메인: super_domain_ground_truth, classified_super_domain, super_domain_success
     - 제외 필드: opinion (분류 의견)
 
+    결과를 result.jsonl에 기록한 뒤 배열 형식의 result.json으로 변환
+    (분류 중에 행 단위로 기록하려면 JsonResultSink를 직접 사용)
+
     Args:
         output_path: Excel 출력 파일 경로
         results: 분류 결과 리스트
@@ -361,59 +635,37 @@ def save_json_result(output_path: str, results: list, questions: list) -> bool:
         저장 성공 여부
     """
     try:
-        # Excel 경로를 기반으로 JSON 경로 생성
-        json_path = output_path.replace('.xlsx', '.json')
-
-        # 결과 디렉토리 생성 (존재하지 않는 경우)
-        json_dir = os.path.dirname(json_path)
-        if json_dir and not os.path.exists(json_dir):
-            os.makedirs(json_dir)
-            logging.debug(f"JSON 결과 디렉토리 생성: {json_dir}")
-
+        sink = JsonResultSink(output_path.replace('.xlsx', '.json'))
         logging.info(f"JSON 결과 파일 작성 중... ({len(results)}개 항목)")
 
         # 질문 데이터를 딕셔너리로 변환 (빠른 검색을 위해)
         question_dict = {item['row']: item for item in questions}
-
-        # JSON 데이터 구성 (instruction.md 3.4 형식에 따라)
-        # 분류 의견(opinion)은 제외하고 핵심 데이터만 포함
-        # + 상위 도메인 정보 추가
-        json_data = []
         for result in results:
-            row = result['row']
-            item = question_dict.get(row, {})
-
-            ground_truth = item.get('ground_truth', '')
-            classified_domain = result['classified_domain']
-
-            # 13개 상위 도메인으로 매핑
-            super_domain_gt = map_to_hierarchical_domain(ground_truth)
-            super_domain_classified = map_to_hierarchical_domain(classified_domain)
-
-            # 상위 도메인 레벨에서의 성공 여부
-            super_domain_success = 'O' if super_domain_gt == super_domain_classified else 'X'
-
-            json_data.append({
-                'row': row,
-                'question': item.get('question', ''),
-                'ground_truth': ground_truth,
-                'classified_domain': classified_domain,  # 1순위 도메인 (하위 호환성)
-                'classified_domains': result.get('classified_domains', [classified_domain]),  # 실험19: Top-K
-                'hit_rank': result.get('hit_rank'),  # 실험19: Hit@K 순위
-                'success': result['success'],
-                'opinion_category': result['opinion_category'],
-                'super_domain_ground_truth': super_domain_gt if super_domain_gt else '',
-                'classified_super_domain': super_domain_classified if super_domain_classified else '',
-                'super_domain_success': super_domain_success if (super_domain_gt and super_domain_classified) else ''
-            })
-
-        # JSON 파일 저장 (UTF-8 인코딩, 들여쓰기 2칸)
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(json_data, f, ensure_ascii=False, indent=2)
-
-        logging.info(f"JSON 결과가 {json_path}에 저장되었습니다. (총 {len(json_data)}개 항목)")
-        return True
+            sink.write(result, question_dict.get(result['row'], {}))
+
+        return finalize_json_result(sink)
+
+    except Exception as e:
+        logging.error(f"JSON 결과 파일 저장 실패: {str(e)}")
+        import traceback
+        logging.debug(f"스택 트레이스:\n{traceback.format_exc()}")
+        return False
+
+
+def finalize_json_result(sink) -> bool:
+    """
+    행 단위로 기록된 result.jsonl을 배열 형식의 result.json으로 변환
 
+    Args:
+        sink: JsonResultSink
+
+    Returns:
+        저장 성공 여부
+    """
+    try:
+        count = sink.finalize()
+        logging.info(f"JSON 결과가 {sink.json_path}에 저장되었습니다. (총 {count}개 항목)")
+        return True
     except Exception as e:
         logging.error(f"JSON 결과 파일 저장 실패: {str(e)}")
         import traceback
@@ -421,8 +673,323 @@ def save_json_result(output_path: str, results: list, questions: list) -> bool:
         return False
 
 
-def main():
-    """메인 실행 함수"""
+def classify_questions(classifier, questions, evaluator, config, on_result=None, response_store=None,
+                       keep_results=True, total=None, event_log=None, status=None):
+    """
+    질문을 병렬로 분류 (제출 윈도우 방식)
+
+    질문을 한꺼번에 제출하지 않고, 처리 중인 작업이 (스레드 수 × submit_window)개를 넘지 않도록
+    완료될 때마다 입력에서 다음 질문을 가져와 제출한다. 입력이 스트리밍 이터레이터여도 되며,
+    keep_results=False면 메모리 사용량이 데이터 크기와 무관하게 동시 요청 수에 비례한다.
+
+    Args:
+        classifier: LLM 분류기
+        questions: 질문 데이터 이터러블 (리스트 또는 스트리밍 이터레이터)
+        evaluator: 평가기
+        config: 설정 딕셔너리 (max_concurrent_requests, concurrency, submit_window, thinking_time 사용)
+        on_result: 정상 처리된 결과 1건마다 on_result(결과, 질문 데이터)로 호출할 콜백 (기본: 없음)
+        response_store: LLM 원본 응답 저장소 (기본: 저장 안 함)
+        keep_results: 정상 결과를 반환 리스트에 보관할지 여부 (False면 오류 행만 반환)
+        total: 전체 질문 수 (진행 로그용, 기본: len(questions), 알 수 없으면 None)
+        event_log: 행별 처리 결과를 기록할 RowEventLog (기본: 기록 안 함)
+        status: 처리량/지연/정확도를 집계할 RunStatus (기본: 집계 안 함)
+
+    Returns:
+        (결과 리스트, API 오류 발생 여부) 튜플
+    """
+    results = []
+    api_error_occurred = False
+    if total is None and hasattr(questions, '__len__'):
+        total = len(questions)
+    # 진행 로그는 일정 간격으로만 출력 (결과 처리 루프는 이 스레드 하나이므로 Lock 불필요)
+    progress = ProgressReporter(total, config.get('progress_interval', 5.0))
+
+    def submit(item):
+        queued_at = time.perf_counter() if tracer.enabled else None
+        return executor.submit(process_single_question, classifier, item, evaluator,
+                               config['thinking_time'], response_store, status, queued_at)
+
+    # ThreadPoolExecutor를 사용한 병렬 처리
+    with ThreadPoolExecutor(max_workers=worker_count(config)) as executor:
+        # 완료된 작업은 바로 해제 (Future와 질문 데이터를 더 이상 보관하지 않음)
+        # 종료 시 남은 작업 취소 (윈도우 안의 작업만 대기 중이므로 취소 대상도 최대 윈도우 크기)
+        with closing(submit_windowed(submit, questions, submit_window_size(config))) as completed:
+            for item, future in completed:
+                progress.update()
+                try:
+                    result = future.result()
+
+                    # API 오류 발생 확인
+                    if result is None:
+                        api_error_occurred = True
+                        logging.error("LLM API 오류가 발생했습니다. 남은 작업을 취소하고 종료합니다.")
+
+                        # 실패한 행도 오류 정보로 추가
+                        results.append(_error_result(item, 'API오류', 'LLM API 호출 실패'))
+                        if event_log:
+                            event_log.write('api_error', results[-1], item)
+                        if status is not None:
+                            status.record(error=True)
+                        break
+
+                    if keep_results:
+                        results.append(result)
+                    if on_result:
+                        on_result(result, item)
+                    if event_log:
+                        event_log.write('result', result, item)
+                    if status is not None:
+                        status.record(result)
+
+                except WriterStageError:
+                    # 결과 기록 실패: 남은 작업을 취소하고 호출자에게 전달 (더 이상 LLM을 호출하지 않음)
+                    logging.error("결과 기록에 실패했습니다. 남은 작업을 취소하고 종료합니다.")
+                    raise
+
+                except Exception as e:
+                    logging.error("\n".join([
+                        "=" * 60,
+                        f"행 {item['row']} 처리 중 예외 발생",
+                        f"질문: {item['question']}",
+                        f"오류 메시지: {str(e)}",
+                        "=" * 60,
+                    ]))
+                    import traceback
+                    logging.debug(f"스택 트레이스:\n{traceback.format_exc()}")
+
+                    # 오류가 발생해도 결과에 추가
+                    results.append(_error_result(item, '처리오류', f'오류 발생: {str(e)}'))
+                    if event_log:
+                        event_log.write('error', results[-1], item, error=str(e))
+                    if status is not None:
+                        status.record(error=True)
+
+    progress.finish()
+    return results, api_error_occurred
+
+
+def _error_result(item, classified_domain, opinion):
+    """
+    오류 행 결과 딕셔너리 (원본 질문/Ground Truth를 함께 보관하여 질문 데이터 없이도 기록 가능)
+
+    Args:
+        item: 질문 데이터
+        classified_domain: 오류 구분 ('API오류' / '처리오류')
+        opinion: 오류 설명
+
+    Returns:
+        결과 딕셔너리
+    """
+    return {
+        'row': item['row'],
+        'question': item['question'],
+        'ground_truth': item['ground_truth'],
+        'classified_domain': classified_domain,
+        'success': 'X',
+        'opinion': opinion,
+        'opinion_category': '기타의견'
+    }
+
+
+def write_excel_results(excel_handler, results):
+    """
+    분류 결과를 엑셀 워크시트에 기록
+
+    Args:
+        excel_handler: 엑셀 핸들러
+        results: 분류 결과 리스트
+    """
+    for result in results:
+        excel_handler.write_result(
+            row=result['row'],
+            classified_domain=result['classified_domain'],
+            success=result['success'],
+            opinion=result['opinion'],
+            opinion_category=result['opinion_category']
+        )
+
+
+def log_token_preflight(classifier, questions, token_config, head_sample=None):
+    """
+    실행 전 프롬프트 토큰 예측 출력 (예산 초과 시 경고)
+
+    Args:
+        classifier: LLM 분류기
+        questions: 처리할 질문 이터러블 (스트리밍 입력이면 새로 연 제너레이터)
+        token_config: 토큰 예산/단가 설정
+        head_sample: 앞에서부터 이 개수만 읽어 건당 토큰만 예측 (None이면 전체를 읽어 총 토큰/비용까지 예측)
+    """
+    from itertools import islice
+    from src.llm_classifier import MAX_COMPLETION_TOKENS
+    from src.tokens import preflight_estimate, check_prompt_budget, estimate_cost
+
+    if head_sample is not None:
+        questions = islice(questions, head_sample)
+
+    estimate = preflight_estimate(
+        classifier._build_prompt(""), (item['question'] for item in questions),
+        tokenizer=classifier.token_accountant.tokenizer, max_completion_tokens=MAX_COMPLETION_TOKENS,
+        budget=token_config['prompt_budget']
+    )
+    logging.info(f"예상 프롬프트 토큰 ({estimate['tokenizer']}): 고정 {estimate['fixed_tokens']} + "
+                 f"질문 평균 {estimate['avg_question_tokens']:.1f} = 건당 {estimate['avg_prompt_tokens']:.0f} "
+                 f"(최대 {estimate['max_prompt_tokens']:.0f})")
+    if head_sample is not None:
+        logging.info(f"  (입력 앞 {estimate['questions']:,}개 질문 기준, 총 토큰은 예측하지 않음)")
+        return
+
+    logging.info(f"예상 총 토큰: 프롬프트 {estimate['total_prompt_tokens']:,} "
+                 f"(응답 포함 최대 {estimate['max_total_tokens']:,})")
+
+    cost = estimate_cost(estimate['total_prompt_tokens'], estimate['max_total_tokens'] - estimate['total_prompt_tokens'],
+                         token_config['price_prompt'], token_config['price_completion'])
+    if cost is not None:
+        logging.info(f"예상 최대 비용: {cost:,.4f}")
+
+    for warning in check_prompt_budget(estimate, token_config['prompt_budget']):
+        logging.warning(f"프롬프트 토큰 예산 초과: {warning}")
+
+
+def start_status_reporter(status, status_config, log_file, sources=()):
+    """
+    실행 상태 리포터 시작
+
+    Args:
+        status: RunStatus
+        status_config: 상태 설정 (display: auto/on/off, interval, file)
+        log_file: 실행 로그 파일 경로 (상태 파일 기본 위치: <로그 파일명>_status.json)
+        sources: 상태에 더할 추가 정보 함수
+
+    Returns:
+        시작된 StatusReporter
+    """
+    path = status_config.get('file') or os.path.splitext(log_file)[0] + '_status.json'
+    display = {'on': True, 'off': False}.get(status_config.get('display', 'auto'))
+    reporter = StatusReporter(status, path=path, interval=status_config.get('interval', 2.0),
+                              sources=sources, display=display)
+    logging.info(f"실행 상태 파일: {path}")
+    return reporter.start()
+
+
+def print_token_statistics(classifier, token_config):
+    """
+    토큰 사용량 통계 출력
+
+    Args:
+        classifier: LLM 분류기
+        token_config: 토큰 예산/단가 설정
+    """
+    from src.tokens import estimate_cost
+
+    stats = classifier.get_token_statistics()
+    if not stats['calls']:
+        return
+
+    logging.info("=" * 50)
+    logging.info("토큰 사용량 통계")
+    logging.info("=" * 50)
+    logging.info(f"API 응답: {stats['calls']}건 (usage 제공 {stats['reported_calls']}건, "
+                 f"나머지는 {stats['tokenizer']} 토크나이저 추정)")
+    logging.info(f"프롬프트 토큰: {stats['prompt_tokens']:,} (평균 {stats['avg_prompt_tokens']:.0f}, "
+                 f"최대 {stats['max_prompt_tokens']})")
+    logging.info(f"응답 토큰: {stats['completion_tokens']:,} (평균 {stats['avg_completion_tokens']:.0f})")
+    logging.info(f"총 토큰: {stats['total_tokens']:,}")
+    if stats['estimate_ratio'] is not None:
+        logging.info(f"토크나이저 추정 대비 실제 프롬프트 토큰 비율: {stats['estimate_ratio']:.2f}")
+    cost = estimate_cost(stats['prompt_tokens'], stats['completion_tokens'],
+                         token_config['price_prompt'], token_config['price_completion'])
+    if cost is not None:
+        logging.info(f"비용: {cost:,.4f}")
+    logging.info("=" * 50)
+
+
+def print_hedge_statistics(classifier):
+    """
+    요청 헤징 통계 출력 (헤징 미사용 시 생략)
+
+    Args:
+        classifier: LLM 분류기
+    """
+    stats = classifier.get_hedge_statistics()
+    if not stats:
+        return
+
+    logging.info("=" * 50)
+    logging.info("요청 헤징 통계")
+    logging.info("=" * 50)
+    logging.info(f"총 API 호출: {stats['total_calls']}")
+    logging.info(f"헤징 요청: {stats['hedged_calls']} ({stats['hedge_rate'] * 100:.2f}%)")
+    logging.info(f"헤징 요청 승리: {stats['hedge_wins']}")
+    logging.info(f"예산 초과로 생략: {stats['budget_denied']}")
+    logging.info(f"실행 스레드 부족으로 생략: {stats['capacity_denied']} (중단 후 진행 중: {stats['abandoned_running']})")
+    logging.info(f"취소된 요청: {stats['cancelled']} (시작 전), 중단된 요청: {stats['abandoned']} (진행 중)")
+    logging.info(f"현재 헤징 지연: {stats['current_delay']:.2f}초")
+    logging.info("=" * 50)
+
+
+def print_concurrency_statistics(classifier, log_file=None):
+    """
+    적응형 동시 요청 한도 통계 출력 (적응형 한도 미사용 시 생략)
+
+    Args:
+        classifier: LLM 분류기
+        log_file: 로그 파일 경로 (지정 시 같은 위치에 한도 변경 이력 JSONL 저장)
+    """
+    stats = classifier.get_concurrency_statistics()
+    if not stats:
+        return
+
+    logging.info("=" * 50)
+    logging.info("적응형 동시 요청 한도 통계")
+    logging.info("=" * 50)
+    logging.info(f"최종 한도: {stats['limit']} (범위 {stats['lowest_limit']} ~ {stats['highest_limit']}, "
+                 f"변경 {stats['changes']}회)")
+    logging.info(f"최대 동시 요청: {stats['max_in_flight']}")
+    if stats['baseline_latency'] is not None:
+        logging.info(f"최근 지연: {stats['short_latency']:.2f}초 / 기준 지연: {stats['baseline_latency']:.2f}초")
+    logging.info(f"요청 {stats['requests']}건 중 실패 {stats['failures']}건, 한도 대기 누적 {stats['wait_time']:.1f}초")
+    if log_file:
+        from src.concurrency import save_history
+
+        history_path = os.path.splitext(log_file)[0] + '_concurrency.jsonl'
+        save_history(history_path, classifier.limiter.get_history())
+        logging.info(f"한도 변경 이력: {history_path}")
+    logging.info("=" * 50)
+
+
+def print_endpoint_statistics(classifier):
+    """
+    엔드포인트별 부하 분산 통계 출력 (엔드포인트가 하나면 생략)
+
+    Args:
+        classifier: LLM 분류기
+    """
+    stats = classifier.get_endpoint_statistics()
+    if len(stats) <= 1:
+        return
+
+    logging.info("=" * 50)
+    logging.info("엔드포인트별 부하 분산 통계")
+    logging.info("=" * 50)
+    for endpoint in stats:
+        latency = f"{endpoint['ewma_latency']:.2f}초" if endpoint['ewma_latency'] is not None else "-"
+        status = "정상" if endpoint['available'] else "제외됨"
+        logging.info(f"{endpoint['url']}: 요청 {endpoint['requests']}, 실패 {endpoint['failures']}, "
+                     f"제외 {endpoint['ejections']}회, 재시도 {endpoint['retries']}회 (429: {endpoint['throttled']}), "
+                     f"평균 지연 {latency} ({status})")
+    logging.info("=" * 50)
+
+
+def main(argv=None):
+    """
+    메인 실행 함수
+
+    Args:
+        argv: 명령행 인자 리스트 (기본: sys.argv[1:])
+    """
+    # 명령행 인자 파싱 (-h 사용 시 설정 로드 없이 도움말 출력)
+    args = parse_arguments(argv)
+
     # 로깅 설정
     log_file = setup_logging()
 
@@ -434,168 +1001,302 @@ def main():
     config = load_config()
     logging.info(f"LLM Provider: {config['llm_provider']}")
     logging.info(f"사용 모델: {config['llm_config'].get('model', 'Unknown')}")
-    if config['llm_provider'] == 'qwen3':
-        logging.info(f"LLM 서버: {config['llm_config']['host']}:{config['llm_config']['port']}")
+    if len(config['llm_config']['endpoints']) > 1:
+        logging.info(f"LLM 엔드포인트: {len(config['llm_config']['endpoints'])}개 "
+                     f"(분산 전략: {config['llm_config']['lb_strategy']})")
+        for endpoint in config['llm_config']['endpoints']:
+            logging.info(f"  - {endpoint}")
+    elif config['llm_provider'] == 'qwen3':
+        logging.info(f"LLM 서버: {config['llm_config']['endpoints'][0]}")
     elif config['llm_provider'] == 'databricks':
         logging.info(f"Databricks URL: {config['llm_config']['url']}")
     logging.info(f"도메인 개수: {len(config['domains'])}개")
-    logging.info(f"최대 동시 요청 수: {config['max_concurrent_requests']}")
+    if config['concurrency']['mode'] == 'adaptive':
+        logging.info(f"동시 요청 수: 적응형 (초기 {config['concurrency']['initial']}, "
+                     f"범위 {config['concurrency']['min']} ~ {config['concurrency']['max']})")
+    else:
+        logging.info(f"최대 동시 요청 수: {config['max_concurrent_requests']}")
     logging.info(f"API 호출 대기 시간: {config['thinking_time']}초")
+    if config['hedge']['enabled']:
+        logging.info(f"요청 헤징: p{config['hedge']['percentile']:g} 지연 후 중복 요청 "
+                     f"(예산 {config['hedge']['budget'] * 100:.0f}%)")
 
-    # 명령행 인자 파싱
-    args = parse_arguments()
     logging.info(f"입력 파일: {args.input}")
     logging.info(f"출력 파일: {args.output}")
     logging.info(f"처리 개수 제한: {args.limit if args.limit else '전체'}")
     logging.info(f"성공여부 필터: {args.filter}")
 
-    # 엑셀 핸들러 초기화
-    excel_handler = ExcelHandler(args.input)
-    if not excel_handler.load():
-        logging.error("입력 파일을 로드할 수 없습니다.")
+    # 프로파일링 (입력 로드부터 결과 저장까지)
+    profiler = start_profiling(args.profile_interval) if args.profile else None
+    if args.trace:
+        start_tracing()
+
+    # 실행 구간: load → setup → classify → save → report → done (메모리 벤치마크 등이 구간별로 측정)
+    mark_phase('load')
+
+    # 입출력 형식 확인 (xlsx / csv / jsonl / parquet)
+    try:
+        input_format = detect_format(args.input)
+        output_format = detect_format(args.output)
+    except ValueError as e:
+        logging.error(str(e))
+        sys.exit(1)
+
+    # 엑셀 출력은 입력 워크북에 결과 열을 채우는 방식이므로 엑셀 입력이 필요
+    if output_format == 'xlsx' and input_format != 'xlsx':
+        logging.error("엑셀(.xlsx) 출력은 엑셀 입력 파일에서만 사용할 수 있습니다. (.csv/.jsonl/.parquet 출력 사용)")
         sys.exit(1)
 
-    # 질문 데이터 읽기 (성공여부 필터 적용)
-    questions = excel_handler.read_questions(success_filter=args.filter)
+    # 스트리밍 모드: 입력을 메모리에 모두 올리지 않고 제출 윈도우만큼씩 읽어 처리
+    # (샘플링/증분 실행은 전체 질문이 필요하고, 엑셀 출력은 행 단위 결과가 필요하므로 제외)
+    streaming = (input_format != 'xlsx' and output_format != 'xlsx' and not (args.limit and args.limit > 0)
+                 and not args.sample_manifest and args.incremental is None)
+
+    excel_handler = None
+    if streaming:
+        if not os.path.exists(args.input):
+            logging.error(f"파일을 찾을 수 없습니다 - {args.input}")
+            sys.exit(1)
+        try:
+            peek = iter_questions(args.input, args.filter)
+            empty = next(peek, None) is None
+            peek.close()
+        except Exception as e:
+            logging.error(f"입력 파일 로드 실패 - {e}")
+            sys.exit(1)
+        if empty:
+            logging.error("처리할 질문이 없습니다.")
+            sys.exit(1)
+        questions = iter_questions(args.input, args.filter)
+        logging.info("스트리밍 모드: 입력을 제출 윈도우 단위로 읽어 처리합니다.")
+    elif input_format == 'xlsx':
+        # 엑셀 핸들러 초기화
+        excel_handler = ExcelHandler(args.input)
+        if not excel_handler.load():
+            logging.error("입력 파일을 로드할 수 없습니다.")
+            sys.exit(1)
+
+        # 질문 데이터 읽기 (성공여부 필터 적용)
+        questions = excel_handler.read_questions(success_filter=args.filter)
+    else:
+        questions = read_questions(args.input, success_filter=args.filter)
+
     if not questions:
         logging.error("처리할 질문이 없습니다.")
-        excel_handler.close()
+        if excel_handler:
+            excel_handler.close()
         sys.exit(1)
 
-    # 개수 제한 및 층화 추출 적용
-    if args.limit and args.limit > 0:
-        original_count = len(questions)
-        questions = stratified_sample(questions, args.limit)
-        logging.info(f"층화 랜덤 샘플링 적용: {original_count}개 중 {len(questions)}개 선택 (도메인 비율 유지)")
+    # 개수 제한 및 층화 추출 적용 (매니페스트가 있으면 같은 샘플 재사용)
+    if (args.limit and args.limit > 0) or args.sample_manifest:
+        from src.sampling import sample_questions
+
+        questions = sample_questions(
+            questions, args.limit, seed=args.seed,
+            min_per_class=args.min_per_class, manifest_path=args.sample_manifest
+        )
 
     # LLM 분류기 초기화
+    mark_phase('setup')
     classifier = LLMClassifier(
         provider=config['llm_provider'],
         config=config['llm_config'],
         domains=config['domains'],
-        timeout=config['llm_timeout']
+        timeout=config['llm_timeout'],
+        hedge_config=config['hedge'],
+        concurrency_config=config['concurrency']
     )
 
-    # 평가기 초기화
-    evaluator = Evaluator()
-
-    # 출력 동기화를 위한 Lock
-    print_lock = threading.Lock()
+    # 증분 실행: 지문이 바뀐 행만 LLM 호출, 나머지는 저장된 응답으로 채점
+    response_store = None
+    plan = None
+    questions_to_call = questions
+    if args.incremental is not None:
+        from src.incremental import plan_incremental
+        from src.response_store import open_response_store
+
+        store_path = args.incremental or os.path.join(os.path.dirname(args.output), 'responses.jsonl.gz')
+        response_store = open_response_store(store_path)
+        plan = plan_incremental(classifier, questions, response_store)
+        questions_to_call = plan.to_call
+    elif args.store_responses is not None:
+        from src.response_store import open_response_store
+
+        store_path = args.store_responses or os.path.join(os.path.dirname(args.output), 'responses.jsonl.gz')
+        response_store = open_response_store(store_path)
+
+    # 실행 전 토큰 예측 (예산 초과 시 경고)
+    # 스트리밍 모드는 예산/단가가 설정된 경우에만 입력 전체를 한 번 더 훑고, 아니면 앞부분 표본만 읽음
+    if streaming:
+        token_config = config['tokens']
+        full_scan = bool(token_config['prompt_budget'] or token_config['price_prompt']
+                         or token_config['price_completion'])
+        log_token_preflight(classifier, iter_questions(args.input, args.filter), token_config,
+                            head_sample=None if full_scan else 2000)
+    elif questions_to_call:
+        log_token_preflight(classifier, questions_to_call, config['tokens'])
 
-    # 병렬 처리로 질문 분류
-    logging.info(f"총 {len(questions)}개의 질문 처리 시작 (병렬 처리)...")
-    logging.info("-" * 60)
+    # 평가기 초기화
+    evaluator = Evaluator(classifier.registry)
+
+    # 결과는 나오는 즉시 기록 스레드가 파일에 추가 (분류 루프는 크기 제한 큐에 넣기만 함)
+    # - 엑셀 출력: 워크시트 셀 기록 + result.jsonl에 행 단위 기록 (종료 시 저장 및 result.json 변환)
+    # - 그 외 형식: 출력 파일에 직접 기록
+    result_writer = None
+    json_sink = None
+    if output_format != 'xlsx':
+        result_writer = open_result_writer(args.output)
+
+        def write_result(result, item):
+            with stage('result_write'):
+                result_writer.write(to_result_record(result, item))
+    else:
+        json_sink = JsonResultSink(args.output.replace('.xlsx', '.json'))
 
-    results = []
-    completed_count = 0
-    api_error_occurred = False
+        def write_result(result, item):
+            with stage('excel_write'):
+                write_excel_results(excel_handler, [result])
+            with stage('result_write'):
+                json_sink.write(result, item)
 
-    try:
-        # ThreadPoolExecutor를 사용한 병렬 처리
-        with ThreadPoolExecutor(max_workers=config['max_concurrent_requests']) as executor:
-            # 모든 작업 제출
-            future_to_item = {
-                executor.submit(process_single_question, classifier, item, evaluator, print_lock, config['thinking_time']): item
-                for item in questions
-            }
-
-            # 완료된 작업 처리
-            for future in as_completed(future_to_item):
-                completed_count += 1
-                try:
-                    result = future.result()
+    writer = WriterStage(write_result, maxsize=submit_window_size(config))
+    on_result = writer.put
 
-                    # API 오류 발생 확인
-                    if result is None:
-                        api_error_occurred = True
-                        item = future_to_item[future]
-                        logging.error("LLM API 오류가 발생했습니다. 남은 작업을 취소하고 종료합니다.")
+    # 행별 처리 결과는 JSONL 이벤트 로그에 기록 (사람이 읽는 행별 로그 줄 대신)
+    event_log = open_event_log(log_file)
+    logging.info(f"행별 처리 이벤트 로그: {event_log.path}")
 
-                        # 실패한 행도 오류 정보로 추가
-                        results.append({
-                            'row': item['row'],
-                            'classified_domain': 'API오류',
-                            'success': 'X',
-                            'opinion': 'LLM API 호출 실패',
-                            'opinion_category': '기타의견'
-                        })
-
-                        # 남은 작업 취소
-                        executor.shutdown(wait=False, cancel_futures=True)
-                        break
+    # 스트리밍 입력은 읽기 스레드가 제출 윈도우만큼 미리 읽어 둠 (파싱과 LLM 대기를 겹침)
+    if streaming:
+        questions_to_call = Prefetcher(questions, maxsize=submit_window_size(config))
 
-                    results.append(result)
+    # 실행 상태 대시보드 (터미널 상태 줄 + 상태 파일, 리포터 스레드가 주기적으로 갱신)
+    total = None if streaming else len(questions)
+    status = RunStatus(total=total)
+    reporter = start_status_reporter(status, config['status'], log_file, [classifier_status_source(classifier, config['tokens'])])
 
-                    with print_lock:
-                        logging.info(f"진행: {completed_count}/{len(questions)} 완료")
+    results, api_error_occurred = [], False
+    try:
+        if plan is not None:
+            local_results = score_stored_responses(classifier, plan, evaluator, response_store, on_result, status)
+            logging.info(f"저장된 응답으로 {len(local_results)}개 행 처리 완료 (LLM 호출 없음)")
+
+        # 병렬 처리로 질문 분류
+        mark_phase('classify')
+        if streaming:
+            logging.info("질문 처리 시작 (병렬 처리, 스트리밍)...")
+        else:
+            logging.info(f"총 {len(questions_to_call)}개의 질문 처리 시작 (병렬 처리)...")
+        logging.info("-" * 60)
 
-                except Exception as e:
-                    item = future_to_item[future]
-                    with print_lock:
-                        logging.error("=" * 60)
-                        logging.error(f"행 {item['row']} 처리 중 예외 발생")
-                        logging.error(f"질문: {item['question']}")
-                        logging.error(f"오류 메시지: {str(e)}")
-                        import traceback
-                        logging.debug(f"스택 트레이스:\n{traceback.format_exc()}")
-                        logging.error("=" * 60)
+        # 정상 결과는 기록 단계에서 바로 기록되므로 오류 행만 돌려받음
+        results, api_error_occurred = classify_questions(
+            classifier, questions_to_call, evaluator, config, on_result=on_result, response_store=response_store,
+            keep_results=False, event_log=event_log, status=status
+        )
 
-                    # 오류가 발생해도 결과에 추가
-                    results.append({
-                        'row': item['row'],
-                        'classified_domain': '처리오류',
-                        'success': 'X',
-                        'opinion': f'오류 발생: {str(e)}',
-                        'opinion_category': '기타의견'
-                    })
+    except WriterStageError:
+        # 결과 기록 실패로 분류 중단 (이미 기록된 결과는 아래에서 저장한 뒤 원래 예외를 다시 발생)
+        pass
 
     except KeyboardInterrupt:
         logging.warning("사용자에 의해 중단되었습니다.")
+        if streaming:
+            questions_to_call.close()
+        writer.close(raise_error=False)
+        event_log.close()
+        reporter.stop('aborted')
         classifier.close()
-        excel_handler.close()
+        if response_store:
+            response_store.close()
+        if excel_handler:
+            excel_handler.close()
+        if result_writer:
+            result_writer.close()
+        if json_sink:
+            json_sink.close()
         sys.exit(0)
 
-    if api_error_occurred:
+    # 기록 대기 중인 결과를 모두 기록 (오류 행은 아래에서 행 번호 순으로 추가)
+    mark_phase('save')
+    if streaming:
+        questions_to_call.close()
+    write_error = writer.close(raise_error=False)
+    event_log.close()
+
+    if write_error is not None:
+        logging.error("결과 기록 실패로 처리가 중단되었습니다. 이미 기록된 결과만 저장합니다.")
+    elif api_error_occurred:
         logging.info("API 오류로 인해 처리가 중단되었습니다.")
     else:
         logging.info("-" * 60)
         logging.info("모든 질문 처리 완료")
 
-    # 결과를 행 번호 순으로 정렬
+    final_status = reporter.stop('aborted' if api_error_occurred or write_error is not None else 'finished')
+    logging.info(f"실행 상태: {format_status(final_status)}")
     results.sort(key=lambda x: x['row'])
 
-    # 엑셀에 결과 쓰기
-    logging.info("결과를 엑셀 파일에 작성 중...")
-    for result in results:
-        excel_handler.write_result(
-            row=result['row'],
-            classified_domain=result['classified_domain'],
-            success=result['success'],
-            opinion=result['opinion'],
-            opinion_category=result['opinion_category']
-        )
-
-    # 결과 파일 저장
-    if excel_handler.save(args.output):
-        logging.info(f"결과가 {args.output}에 저장되었습니다.")
+    if result_writer:
+        # 오류 행은 콜백으로 기록되지 않으므로 마지막에 추가
+        for result in results:
+            if 'classified_domains' not in result:
+                result_writer.write(to_result_record(result, result))
+        result_writer.close()
+        logging.info(f"결과가 {args.output}에 저장되었습니다. (총 {result_writer.count}개 항목)")
     else:
-        logging.error("결과 파일 저장에 실패했습니다.")
+        # 오류 행을 엑셀에 쓰기 (정상 결과는 기록 단계에서 이미 기록됨)
+        write_excel_results(excel_handler, results)
+
+        # 결과 파일 저장
+        with stage('excel_save'):
+            saved = excel_handler.save(args.output)
+        if saved:
+            logging.info(f"결과가 {args.output}에 저장되었습니다.")
+        else:
+            logging.error("결과 파일 저장에 실패했습니다.")
 
-    # JSON 결과 파일 저장 (LLM 분석용)
-    save_json_result(args.output, results, questions)
+        # JSON 결과 파일 저장 (LLM 분석용, 오류 행 추가 후 배열 형식으로 변환)
+        for result in results:
+            if 'classified_domains' not in result:
+                json_sink.write(result, result)
+        finalize_json_result(json_sink)
 
     # 통계 출력
+    mark_phase('report')
     evaluator.print_statistics()
 
     # 오분류 케이스 출력
     evaluator.print_misclassified(limit=10)
 
+    # 요청 헤징 / 부하 분산 통계 출력
+    print_token_statistics(classifier, config['tokens'])
+    print_hedge_statistics(classifier)
+    print_concurrency_statistics(classifier, log_file)
+    print_endpoint_statistics(classifier)
+
+    if profiler:
+        folded_path, report_path = finish_profiling(profiler, os.path.splitext(args.output)[0])
+        logging.info(f"프로파일 저장: {report_path} (flamegraph용 folded stack: {folded_path})")
+    if args.trace:
+        trace_path = os.path.splitext(args.output)[0] + '_trace.json'
+        event_count, dropped = finish_tracing(trace_path)
+        logging.info(f"타임라인 저장: {trace_path} (이벤트 {event_count:,}개"
+                     + (f", 한도 초과로 {dropped:,}개 버림)" if dropped else ")"))
+
     # 정리
     classifier.close()
-    excel_handler.close()
+    if response_store:
+        response_store.close()
+    if excel_handler:
+        excel_handler.close()
 
     logging.info("프로그램 종료")
     logging.info("=" * 60)
+    mark_phase('done')
+
+    # 결과 기록 실패 시 (이미 기록된 결과를 저장한 뒤) 원래 예외를 다시 발생
+    if write_error is not None:
+        raise write_error
 
     # API 오류 발생 시 비정상 종료
     if api_error_occurred:
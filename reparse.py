@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+저장된 LLM 원본 응답 재채점 실행 파일
+
+`main.py --store-responses` 또는 `--incremental`로 저장한 원본 응답에 대해
+파싱 / Fuzzy Matching / Hit@K 평가만 다시 수행합니다 (LLM 호출 없음).
+파서나 매처를 수정했거나 Ground Truth를 바꾼 뒤 결과를 로컬 CPU 속도로 다시 계산할 때 사용합니다.
+
+Usage:
+    python reparse.py [옵션]
+
+Options:
+    -i, --input PATH         질문/Ground Truth 입력 파일 (기본: input/input.xlsx)
+    -s, --store PATH         응답 저장소 (.jsonl/.jsonl.gz/.sqlite, 기본: result/responses.jsonl.gz)
+    -o, --output PATH        결과 파일 (.csv/.jsonl/.parquet, 기본: result/reparse.jsonl)
+    -t, --match-threshold N  Fuzzy Match 유사도 기준 (기본: 0.3)
+
+Examples:
+    python reparse.py                                  # 현재 파서/매처로 재채점
+    python reparse.py -t 0.5 -o result/reparse_t05.csv # 다른 Threshold로 재채점
+"""
+
+import sys
+import os
+import argparse
+import logging
+import time
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from main import setup_logging, load_config, score_classification
+
+
+def parse_arguments(argv=None):
+    """
+    명령행 인자 파싱
+
+    Args:
+        argv: 인자 리스트 (기본: sys.argv[1:])
+
+    Returns:
+        args 객체 (input, store, output, match_threshold)
+    """
+    parser = argparse.ArgumentParser(
+        description='저장된 LLM 응답 재채점 (LLM 호출 없음)',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('-i', '--input', default='input/input.xlsx',
+                        help='질문/Ground Truth 입력 파일 (기본: input/input.xlsx)')
+    parser.add_argument('-s', '--store', default='result/responses.jsonl.gz',
+                        help='응답 저장소 (기본: result/responses.jsonl.gz)')
+    parser.add_argument('-o', '--output', default='result/reparse.jsonl',
+                        help='결과 파일 (.csv/.jsonl/.parquet, 기본: result/reparse.jsonl)')
+    parser.add_argument('-t', '--match-threshold', type=float, default=0.3,
+                        help='Fuzzy Match 유사도 기준 (기본: 0.3)')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """
+    재채점 실행
+
+    Args:
+        argv: 명령행 인자 리스트 (기본: sys.argv[1:])
+    """
+    args = parse_arguments(argv)
+    setup_logging()
+
+    from src.evaluator import Evaluator
+    from src.io_backends import load_input_questions, open_result_writer, to_result_record
+    from src.llm_classifier import LLMClassifier
+    from src.response_store import open_response_store
+
+    if not os.path.exists(args.store):
+        logging.error(f"응답 저장소를 찾을 수 없습니다 - {args.store}")
+        sys.exit(1)
+
+    config = load_config()
+    questions = load_input_questions(args.input, 'all')
+    if not questions:
+        logging.error("질문을 읽을 수 없습니다.")
+        sys.exit(1)
+    question_dict = {item['row']: item for item in questions}
+
+    # 분류기는 파싱/매칭과 의도 레지스트리에만 사용 (LLM 호출 없음)
+    classifier = LLMClassifier(
+        provider=config['llm_provider'],
+        config=config['llm_config'],
+        domains=config['domains'],
+        timeout=config['llm_timeout']
+    )
+    classifier.close()
+    evaluator = Evaluator(classifier.registry)
+
+    logging.info("=" * 60)
+    logging.info(f"재채점: {args.store} → {args.output} (Threshold {args.match_threshold})")
+    logging.info("=" * 60)
+
+    start = time.perf_counter()
+    missing = 0
+    with open_response_store(args.store) as store, open_result_writer(args.output) as writer:
+        for entry in store.iter_latest():
+            item = question_dict.get(entry['row'])
+            if item is None:
+                missing += 1
+                continue
+            classified_domains, opinion, opinion_category, matches = classifier.classify_response(
+                entry['response'], args.match_threshold
+            )
+            result = score_classification(
+                classifier, item, evaluator, classified_domains, opinion, opinion_category,
+                matches, entry.get('usage')
+            )
+            writer.write(to_result_record(result, item))
+        count = writer.count
+    elapsed = time.perf_counter() - start
+
+    if missing:
+        logging.warning(f"입력 파일에 없는 행 {missing}개는 제외되었습니다.")
+    not_stored = len(question_dict) - count
+    if not_stored > 0:
+        logging.info(f"저장된 응답이 없는 입력 행: {not_stored}개")
+    logging.info(f"{count}개 행 재채점 완료 ({elapsed:.2f}초, 초당 {count / elapsed if elapsed else 0:,.0f}건)")
+    logging.info(f"결과가 {args.output}에 저장되었습니다.")
+
+    evaluator.print_statistics()
+    evaluator.print_misclassified(limit=10)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+프롬프트 A/B 실험 실행 파일
+
+실험 설정 파일(JSON)에 정의한 여러 프롬프트/파서/매처 변형을 같은 샘플 질문에 대해 한 번에 실행하고,
+변형별 Hit@1 / Hit@K / 토큰 / 지연 시간을 나란히 비교하는 보고서를 생성합니다.
+모든 변형이 동시 요청 수 제한과 응답 캐시를 공유하므로, 프롬프트가 같은 변형은 LLM을 한 번만 호출합니다.
+
+Usage:
+    python run_experiments.py -c experiments/ab.json [옵션]
+
+Options:
+    -c, --config PATH        실험 설정 파일 (필수)
+    -i, --input PATH         입력 파일 경로 (.xlsx/.csv/.jsonl/.parquet, 기본: input/input.xlsx)
+    -o, --output-dir PATH    보고서 출력 디렉토리 (기본: result/experiment)
+    -n, --limit NUMBER       층화 샘플 개수 (기본: all)
+    -f, --filter SUCCESS     성공여부 필터 (all/O/X, 기본: all)
+    --seed NUMBER            층화 샘플링 난수 시드
+    --min-per-class NUMBER   Ground Truth별 최소 샘플 개수
+    --sample-manifest PATH   샘플 매니페스트 (있으면 재사용, 없으면 저장)
+    --no-cache-file          응답 캐시를 파일에 저장하지 않음 (메모리 캐시만 사용)
+
+Examples:
+    python run_experiments.py -c experiments/ab.json -n 100 --seed 42
+    python run_experiments.py -c experiments/ab.json --sample-manifest result/sample.json
+"""
+
+import sys
+import os
+import argparse
+import json
+import logging
+from datetime import datetime
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from main import setup_logging, load_config, add_sampling_arguments, worker_count, submit_window_size
+
+
+def parse_arguments(argv=None):
+    """
+    명령행 인자 파싱
+
+    Args:
+        argv: 인자 리스트 (기본: sys.argv[1:])
+
+    Returns:
+        args 객체
+    """
+    parser = argparse.ArgumentParser(
+        description='프롬프트 A/B 실험 실행',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('-c', '--config', required=True, help='실험 설정 파일 (JSON)')
+    parser.add_argument('-i', '--input', default='input/input.xlsx',
+                        help='입력 파일 경로 (기본: input/input.xlsx)')
+    parser.add_argument('-o', '--output-dir', default='result/experiment',
+                        help='보고서 출력 디렉토리 (기본: result/experiment)')
+    parser.add_argument('-n', '--limit', type=int, default=None,
+                        help='층화 샘플 개수 (기본: all)')
+    parser.add_argument('-f', '--filter', choices=['all', 'O', 'X'], default='all',
+                        help='성공여부 필터 (all/O/X, 기본: all)')
+    parser.add_argument('--no-cache-file', action='store_true',
+                        help='응답 캐시를 파일에 저장하지 않음')
+    add_sampling_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """
+    실험 실행
+
+    Args:
+        argv: 명령행 인자 리스트 (기본: sys.argv[1:])
+    """
+    args = parse_arguments(argv)
+    setup_logging()
+
+    from src.experiment import ExperimentRunner, ResponseCache, load_variants, summarize_variant, format_report
+    from src.io_backends import load_input_questions
+    from src.llm_classifier import LLMClassifier
+    from src.sampling import sample_questions
+
+    try:
+        variants = load_variants(args.config)
+    except (OSError, ValueError) as e:
+        logging.error(f"실험 설정 로드 실패 - {e}")
+        sys.exit(1)
+
+    config = load_config()
+    logging.info("=" * 60)
+    logging.info(f"프롬프트 A/B 실험: {len(variants)}개 변형 ({', '.join(v.name for v in variants)})")
+    logging.info("=" * 60)
+
+    questions = load_input_questions(args.input, args.filter)
+    if not questions:
+        logging.error("처리할 질문이 없습니다.")
+        sys.exit(1)
+
+    if (args.limit and args.limit > 0) or args.sample_manifest:
+        questions = sample_questions(
+            questions, args.limit, seed=args.seed,
+            min_per_class=args.min_per_class, manifest_path=args.sample_manifest
+        )
+
+    classifier = LLMClassifier(
+        provider=config['llm_provider'],
+        config=config['llm_config'],
+        domains=config['domains'],
+        timeout=config['llm_timeout'],
+        hedge_config=config['hedge'],
+        concurrency_config=config['concurrency']
+    )
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    cache_path = None if args.no_cache_file else os.path.join(args.output_dir, 'response_cache.jsonl')
+    cache = ResponseCache(cache_path)
+
+    runner = ExperimentRunner(
+        classifier, variants,
+        max_concurrent=worker_count(config),
+        thinking_time=config['thinking_time'],
+        cache=cache,
+        window=submit_window_size(config)
+    )
+
+    start_time = datetime.now()
+    try:
+        results = runner.run(questions)
+    finally:
+        cache.close()
+        classifier.close()
+    elapsed = (datetime.now() - start_time).total_seconds()
+
+    summaries = {name: summarize_variant(records) for name, records in results.items()}
+    meta = {
+        '실행 시각': start_time.strftime('%Y-%m-%d %H:%M:%S'),
+        '입력': args.input,
+        '질문 수': len(questions),
+        '샘플 매니페스트': args.sample_manifest or '-',
+        '시드': args.seed if args.seed is not None else '-',
+        'LLM 호출': f"{cache.misses}회 (캐시 적중 {cache.hits}회)",
+        '소요 시간': f"{elapsed:.1f}초",
+    }
+
+    report_path = os.path.join(args.output_dir, 'report.md')
+    with open(report_path, 'w', encoding='utf-8') as f:
+        f.write(format_report(variants, summaries, meta))
+
+    detail_path = os.path.join(args.output_dir, 'report.json')
+    with open(detail_path, 'w', encoding='utf-8') as f:
+        json.dump({'meta': meta, 'summaries': summaries, 'results': results}, f, ensure_ascii=False, indent=2)
+
+    logging.info("=" * 60)
+    for variant in variants:
+        s = summaries[variant.name]
+        logging.info(f"[{variant.name}] Hit@1 {s['hit@1_rate'] * 100:.2f}% | Hit@K {s['hit@k_rate'] * 100:.2f}% "
+                     f"| 오류 {s['errors']}건")
+    logging.info(f"LLM 호출 {cache.misses}회, 캐시 적중 {cache.hits}회, 소요 시간 {elapsed:.1f}초")
+    logging.info(f"보고서가 {report_path}에 저장되었습니다. (행별 결과: {detail_path})")
+    logging.info("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,600 @@
+#!/usr/bin/env python3
+"""
+대용량 질문 파일용 다중 프로세스 샤딩 실행 파일
+
+입력 질문(xlsx / csv / jsonl / parquet)을 행 범위(range) 또는 해시(hash) 기준으로 N개 샤드로 나누고,
+샤드마다 별도의 프로세스에서 LLMClassifier를 생성하여 분류합니다.
+각 샤드는 완료된 결과를 체크포인트 파일(JSONL)에 질문/프롬프트 해시와 함께 기록하므로 중단 후 재실행 시
+질문과 프롬프트(지침, 의도 목록, 모델)가 같은 행만 재사용하여 이어서 처리하며 (프롬프트 해시 비교는
+각 샤드 프로세스에서 수행), 모든 샤드가 끝나면 하나의 결과 파일과 통합 통계를 생성합니다.
+(엑셀 출력이면 result.xlsx / result.json, CSV / JSONL / Parquet 출력이면 해당 형식의 결과 파일)
+
+Usage:
+    python shard_runner.py [옵션]
+
+Options:
+    -i, --input PATH         입력 파일 경로 (.xlsx/.csv/.jsonl/.parquet, 기본: input/input.xlsx)
+    -o, --output PATH        출력 파일 경로 (.xlsx/.csv/.jsonl/.parquet, 기본: result/result.xlsx)
+    -n, --limit NUMBER       처리할 질문 개수 제한 (기본: all)
+    -f, --filter SUCCESS     성공여부 필터 (all/O/X, 기본: all)
+    -s, --shards NUMBER      샤드(프로세스) 개수 (기본: CPU 개수, 최대 MAX_CONCURRENT_REQUESTS)
+    --shard-by METHOD        샤드 분할 방식 (range/hash, 기본: range)
+    --fresh                  기존 체크포인트를 무시하고 처음부터 처리
+    --seed NUMBER            층화 샘플링 난수 시드
+    --min-per-class NUMBER   Ground Truth별 최소 샘플 개수
+    --sample-manifest PATH   샘플 매니페스트 (있으면 재사용, 없으면 저장)
+
+Examples:
+    python shard_runner.py -s 8                       # 8개 프로세스로 전체 처리
+    python shard_runner.py -s 4 --shard-by hash       # 행 번호 해시 기준 분할
+    python shard_runner.py -s 8 --fresh               # 체크포인트 무시하고 재처리
+    python shard_runner.py -s 8 -i input/questions.parquet -o result/result.jsonl
+"""
+
+import sys
+import os
+import argparse
+import logging
+import glob
+import json
+import re
+import time
+import zlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from main import (
+    setup_logging,
+    load_config,
+    add_sampling_arguments,
+    classify_questions,
+    worker_count,
+    write_excel_results,
+    save_json_result,
+)
+from src.excel_handler import ExcelHandler
+from src.io_backends import detect_format, read_questions, open_result_writer, to_result_record
+from src.llm_classifier import LLMClassifier
+from src.evaluator import Evaluator
+from src.incremental import classifier_prompt_key
+
+
+def parse_arguments(argv=None):
+    """
+    명령행 인자 파싱
+
+    Args:
+        argv: 인자 리스트 (기본: sys.argv[1:])
+
+    Returns:
+        args 객체 (input, output, limit, filter, shards, shard_by, fresh, seed, min_per_class, sample_manifest)
+    """
+    parser = argparse.ArgumentParser(
+        description='도메인 분류 어플리케이션 (다중 프로세스 샤딩)',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('-i', '--input', default='input/input.xlsx',
+                        help='입력 파일 경로 (.xlsx/.csv/.jsonl/.parquet, 기본: input/input.xlsx)')
+    parser.add_argument('-o', '--output', default='result/result.xlsx',
+                        help='출력 파일 경로 (.xlsx/.csv/.jsonl/.parquet, 기본: result/result.xlsx)')
+    parser.add_argument('-n', '--limit', type=int, default=None,
+                        help='처리할 질문 개수 제한 (기본: all)')
+    parser.add_argument('-f', '--filter', choices=['all', 'O', 'X'], default='all',
+                        help='성공여부 필터 (all/O/X, 기본: all)')
+    parser.add_argument('-s', '--shards', type=int, default=os.cpu_count() or 1,
+                        help='샤드(프로세스) 개수 (기본: CPU 개수, 최대 MAX_CONCURRENT_REQUESTS)')
+    parser.add_argument('--shard-by', choices=['range', 'hash'], default='range',
+                        help='샤드 분할 방식 (range/hash, 기본: range)')
+    parser.add_argument('--fresh', action='store_true',
+                        help='기존 체크포인트를 무시하고 처음부터 처리')
+    add_sampling_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def split_into_shards(questions, num_shards, method='range'):
+    """
+    질문 리스트를 샤드로 분할
+
+    Args:
+        questions: 질문 데이터 리스트
+        num_shards: 샤드 개수
+        method: 'range' (연속된 행 범위) 또는 'hash' (행 번호 CRC32 해시)
+
+    Returns:
+        샤드별 질문 리스트의 리스트
+    """
+    if method == 'hash':
+        shards = [[] for _ in range(num_shards)]
+        for item in questions:
+            shards[zlib.crc32(str(item['row']).encode()) % num_shards].append(item)
+        return shards
+
+    # 행 범위 분할 (앞쪽 샤드가 최대 1개 더 많이 가짐)
+    size, extra = divmod(len(questions), num_shards)
+    shards = []
+    start = 0
+    for i in range(num_shards):
+        end = start + size + (1 if i < extra else 0)
+        shards.append(questions[start:end])
+        start = end
+    return shards
+
+
+def shard_checkpoint_path(output_path, shard_index):
+    """
+    샤드 체크포인트 파일 경로 (출력 파일과 같은 디렉토리)
+
+    Args:
+        output_path: 출력 파일 경로
+        shard_index: 샤드 번호
+
+    Returns:
+        체크포인트 파일 경로 (예: result/result.shard03.jsonl)
+    """
+    base, _ = os.path.splitext(output_path)
+    return f"{base}.shard{shard_index:02d}.jsonl"
+
+
+def find_checkpoints(output_path):
+    """
+    출력 파일에 딸린 모든 샤드 체크포인트 파일 (이번 실행의 샤드 개수와 무관)
+
+    Args:
+        output_path: 출력 파일 경로
+
+    Returns:
+        샤드 번호 순으로 정렬된 체크포인트 파일 경로 리스트
+    """
+    base, _ = os.path.splitext(output_path)
+    pattern = re.compile(re.escape(os.path.basename(base)) + r'\.shard(\d+)\.jsonl$')
+    found = []
+    for path in glob.glob(glob.escape(base) + '.shard*.jsonl'):
+        match = pattern.match(os.path.basename(path))
+        if match:
+            found.append((int(match.group(1)), path))
+    return [path for _, path in sorted(found)]
+
+
+def load_all_checkpoints(output_path):
+    """
+    모든 샤드 체크포인트를 하나로 로드
+    (샤드 개수, 분할 방식, 샘플이 이전 실행과 달라도 이미 처리된 행을 다시 분류하지 않도록)
+
+    같은 행이 여러 체크포인트에 있으면 가장 나중에 기록된 결과(written_at)를 사용
+
+    Args:
+        output_path: 출력 파일 경로
+
+    Returns:
+        {행 번호: 결과 딕셔너리}
+    """
+    done = {}
+    for path in find_checkpoints(output_path):
+        for row, result in load_checkpoint(path).items():
+            previous = done.get(row)
+            if previous is None or result.get('written_at', 0) >= previous.get('written_at', 0):
+                done[row] = result
+    return done
+
+
+def create_classifier(config):
+    """설정으로 LLMClassifier 생성"""
+    return LLMClassifier(
+        provider=config['llm_provider'],
+        config=config['llm_config'],
+        domains=config['domains'],
+        timeout=config['llm_timeout'],
+        hedge_config=config['hedge'],
+        concurrency_config=config['concurrency']
+    )
+
+
+def reusable_checkpoints(questions, done):
+    """
+    질문이 같은 체크포인트 결과의 프롬프트 해시 (프롬프트 해시 비교는 샤드에서 수행)
+
+    Args:
+        questions: 질문 리스트
+        done: {행 번호: 체크포인트 결과}
+
+    Returns:
+        {행 번호: 체크포인트에 기록된 프롬프트 해시}
+    """
+    expected = {}
+    for item in questions:
+        result = done.get(item['row'])
+        if result is not None and result.get('prompt_hash') and result.get('question') == item['question']:
+            expected[item['row']] = result['prompt_hash']
+    return expected
+
+
+def rescore_result(result, ground_truth, registry):
+    """
+    체크포인트 결과를 현재 Ground Truth로 다시 채점 (GT만 바뀐 경우 LLM 재호출 없이 반영)
+
+    Args:
+        result: 체크포인트 결과 딕셔너리
+        ground_truth: 현재 Ground Truth
+        registry: 의도 레지스트리
+
+    Returns:
+        hit_rank, success, opinion_category를 갱신한 결과 딕셔너리
+    """
+    hit_rank = registry.hit_rank(ground_truth, (domain for domain in result['classified_domains'] if domain))
+
+    # main.score_classification과 같은 의견 구분 보정
+    opinion_category = result.get('opinion_category')
+    if hit_rank:
+        opinion_category = "정확히 분류됨"
+    elif opinion_category == "정확히 분류됨":
+        opinion_category = "오분류"
+    return dict(result, hit_rank=hit_rank or None, success='O' if hit_rank else 'X',
+                opinion_category=opinion_category)
+
+
+def load_checkpoint(path):
+    """
+    샤드 체크포인트 로드
+
+    Args:
+        path: 체크포인트 파일 경로
+
+    Returns:
+        {행 번호: 결과 딕셔너리} (파일이 없으면 빈 딕셔너리)
+    """
+    done = {}
+    if not os.path.exists(path):
+        return done
+
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                result = json.loads(line)
+            except json.JSONDecodeError:
+                # 비정상 종료로 마지막 줄이 잘린 경우 무시
+                logging.warning(f"체크포인트의 손상된 줄 무시: {path}")
+                continue
+            done[result['row']] = result
+    return done
+
+
+def setup_worker_logging(shard_index):
+    """
+    샤드 워커 프로세스의 로깅 설정 (샤드별 로그 파일)
+
+    Args:
+        shard_index: 샤드 번호
+    """
+    os.makedirs('log', exist_ok=True)
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    log_file = os.path.join('log', f'domain_classifier_{timestamp}_shard{shard_index:02d}.log')
+    log_level = getattr(logging, os.getenv('LOG_LEVEL', 'INFO').upper(), logging.INFO)
+
+    logging.basicConfig(
+        level=log_level,
+        format=f'%(asctime)s - %(levelname)s - [shard {shard_index:02d}] %(message)s',
+        handlers=[
+            logging.FileHandler(log_file, encoding='utf-8'),
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
+
+
+def shard_share(total, num_shards, shard_index):
+    """
+    전체 값을 샤드별로 나눈 몫 (나머지는 앞쪽 샤드에 1씩, 모든 샤드의 합이 전체 값과 같음)
+
+    Args:
+        total: 전체 값 (예: 동시 요청 수)
+        num_shards: 샤드 개수
+        shard_index: 샤드 번호
+
+    Returns:
+        이 샤드의 몫
+    """
+    base, extra = divmod(total, num_shards)
+    return base + (1 if shard_index < extra else 0)
+
+
+def run_shard(shard_index, num_shards, questions, output_path, expected=None):
+    """
+    단일 샤드 처리 (워커 프로세스에서 실행)
+
+    행마다 현재 프롬프트 해시를 계산하여 체크포인트에 기록된 해시(expected)와 같으면 재사용하고,
+    나머지 행만 분류한다. (프롬프트 생성과 해시 계산도 샤드 간에 나뉨)
+
+    Args:
+        shard_index: 샤드 번호
+        num_shards: 전체 샤드 개수 (동시 요청 수 분배용)
+        questions: 이 샤드에 할당된 질문 리스트
+        output_path: 출력 파일 경로 (체크포인트 경로 결정용)
+        expected: {행 번호: 체크포인트의 프롬프트 해시} (질문이 같은 체크포인트 결과가 있는 행만)
+
+    Returns:
+        요약 딕셔너리 (shard, processed, reused, stale, api_error, errors)
+        stale은 체크포인트 결과가 있었지만 프롬프트가 바뀌어 재사용하지 않은 행 번호 리스트
+    """
+    setup_worker_logging(shard_index)
+    config = load_config()
+    expected = expected or {}
+
+    # 동시 요청 수를 샤드 간에 나눔 (샤드별 몫의 합 = 설정값, 전체 부하는 단일 프로세스 실행과 동일)
+    # 샤드 개수는 main에서 동시 요청 수 이하로 제한되므로 몫은 1 이상
+    share = shard_share(config['max_concurrent_requests'], num_shards, shard_index)
+    config['max_concurrent_requests'] = share
+    config['concurrency']['initial'] = share
+    # 적응형 한도의 최소값은 샤드마다 1 이상이어야 하므로 최소값이 샤드 개수보다 작으면 합이 최소값을 넘을 수 있음
+    config['concurrency']['min'] = max(1, shard_share(config['concurrency']['min'], num_shards, shard_index))
+    config['concurrency']['max'] = max(share, shard_share(config['concurrency']['max'], num_shards, shard_index))
+    config['hedge']['max_workers'] = worker_count(config) * 2
+
+    checkpoint_path = shard_checkpoint_path(output_path, shard_index)
+
+    summary = {
+        'shard': shard_index,
+        'processed': 0,
+        'reused': 0,
+        'stale': [],
+        'api_error': False,
+        'errors': []
+    }
+    if not questions:
+        return summary
+
+    classifier = create_classifier(config)
+
+    # 행별 프롬프트 해시 (체크포인트 재사용 판단 + 새 체크포인트 기록용, 프롬프트는 행마다 한 번만 생성)
+    prompt_hashes = {}
+    pending = []
+    for item in questions:
+        prompt_hash = classifier_prompt_key(classifier, classifier._build_prompt(item['question']))
+        recorded = expected.get(item['row'])
+        if recorded == prompt_hash:
+            summary['reused'] += 1
+            continue
+        if recorded is not None:
+            summary['stale'].append(item['row'])
+        prompt_hashes[item['row']] = prompt_hash
+        pending.append(item)
+    logging.info(f"샤드 {shard_index}: {len(questions)}개 중 {summary['reused']}개 체크포인트 재사용, "
+                 f"{len(pending)}개 처리 (동시 요청 {share})")
+    if not pending:
+        classifier.close()
+        return summary
+
+    checkpoint_dir = os.path.dirname(checkpoint_path)
+    if checkpoint_dir:
+        os.makedirs(checkpoint_dir, exist_ok=True)
+
+    written = 0
+    try:
+        with open(checkpoint_path, 'a', encoding='utf-8') as checkpoint:
+            def write_checkpoint(result, item):
+                nonlocal written
+                # 재실행 시 질문/프롬프트가 같은 행만 재사용하도록 지문과 기록 시각을 함께 기록
+                entry = dict(result, question=item['question'], prompt_hash=prompt_hashes.pop(item['row']),
+                             written_at=time.time())
+                checkpoint.write(json.dumps(entry, ensure_ascii=False) + '\n')
+                checkpoint.flush()
+                written += 1
+
+            # 정상 결과는 체크포인트에만 기록하고 오류 행만 돌려받음 (워커 메모리를 샤드 크기와 무관하게 유지)
+            results, api_error_occurred = classify_questions(
+                classifier, pending, Evaluator(classifier.registry), config, on_result=write_checkpoint,
+                keep_results=False
+            )
+
+        concurrency_stats = classifier.get_concurrency_statistics()
+        if concurrency_stats:
+            logging.info(f"샤드 {shard_index}: 최종 동시 요청 한도 {concurrency_stats['limit']} "
+                         f"(범위 {concurrency_stats['lowest_limit']} ~ {concurrency_stats['highest_limit']})")
+    finally:
+        classifier.close()
+
+    # 오류 행은 체크포인트에 기록하지 않음 (재실행 시 다시 처리)
+    summary['processed'] = written + len(results)
+    summary['api_error'] = api_error_occurred
+    summary['errors'] = results
+    return summary
+
+
+def merge_shards(output_path, questions, errors, stale_rows=(), started_at=0.0):
+    """
+    샤드 체크포인트를 병합하여 최종 결과 리스트 생성
+
+    Args:
+        output_path: 출력 파일 경로
+        questions: 전체 질문 리스트 (이번 실행 대상)
+        errors: 워커에서 반환된 오류 결과 리스트
+        stale_rows: 프롬프트가 바뀌어 재사용하지 않은 행 번호 (이번 실행에서 기록된 결과만 사용)
+        started_at: 이번 실행 시작 시각 (time.time())
+
+    Returns:
+        행 번호 순으로 정렬된 결과 리스트
+    """
+    question_by_row = {item['row']: item['question'] for item in questions}
+    stale_rows = set(stale_rows)
+    merged = {}
+    for row, result in load_all_checkpoints(output_path).items():
+        # 질문이 바뀐 행, 프롬프트가 바뀌었는데 이번 실행에서 다시 기록되지 않은 행의 이전 결과는 제외
+        if row not in question_by_row or result.get('question') != question_by_row[row]:
+            continue
+        if row in stale_rows and result.get('written_at', 0) < started_at:
+            continue
+        # 재사용 지문(질문, 프롬프트 해시, 기록 시각)은 체크포인트 전용이므로 결과에서 제외
+        merged[row] = {key: value for key, value in result.items()
+                       if key not in ('question', 'prompt_hash', 'written_at')}
+
+    # 이번 실행의 오류가 이전 결과보다 우선 (오류 행은 체크포인트에 기록되지 않음)
+    for result in errors:
+        merged[result['row']] = result
+
+    return [merged[row] for row in sorted(merged)]
+
+
+def main(argv=None):
+    """
+    샤딩 실행 메인 함수
+
+    Args:
+        argv: 명령행 인자 리스트 (기본: sys.argv[1:])
+    """
+    # 인자 파싱 후 로깅 설정 (-h/--help나 잘못된 인자로 종료할 때 빈 로그 파일을 만들지 않음)
+    args = parse_arguments(argv)
+    setup_logging()
+    num_shards = max(1, args.shards)
+
+    # 샤드마다 동시 요청이 1개 이상이므로 샤드 개수를 동시 요청 수 이하로 제한 (전체 동시 요청 수 유지)
+    config = load_config()
+    max_concurrent = config['max_concurrent_requests']
+    if num_shards > max_concurrent:
+        logging.info(f"샤드 개수를 MAX_CONCURRENT_REQUESTS({max_concurrent})에 맞춰 {num_shards}개 → {max_concurrent}개로 줄입니다.")
+        num_shards = max(1, max_concurrent)
+
+    logging.info("=" * 60)
+    logging.info("도메인 분류 어플리케이션 시작 (다중 프로세스 샤딩)")
+    logging.info("=" * 60)
+    logging.info(f"입력 파일: {args.input}")
+    logging.info(f"출력 파일: {args.output}")
+    logging.info(f"샤드 개수: {num_shards} (분할 방식: {args.shard_by})")
+
+    # 입출력 형식 확인 (엑셀 출력은 입력 워크북에 결과 열을 채우는 방식이므로 엑셀 입력이 필요)
+    try:
+        input_format = detect_format(args.input)
+        output_format = detect_format(args.output)
+    except ValueError as e:
+        logging.error(str(e))
+        sys.exit(1)
+    if output_format == 'xlsx' and input_format != 'xlsx':
+        logging.error("엑셀(.xlsx) 출력은 엑셀 입력 파일에서만 사용할 수 있습니다. (.csv/.jsonl/.parquet 출력 사용)")
+        sys.exit(1)
+
+    excel_handler = None
+    if input_format == 'xlsx':
+        excel_handler = ExcelHandler(args.input)
+        if not excel_handler.load():
+            logging.error("입력 파일을 로드할 수 없습니다.")
+            sys.exit(1)
+        questions = excel_handler.read_questions(success_filter=args.filter)
+        if output_format != 'xlsx':
+            # 워크북은 결과를 엑셀로 쓸 때만 필요
+            excel_handler.close()
+            excel_handler = None
+    else:
+        # CSV / JSONL / Parquet은 openpyxl 없이 스트리밍 리더로 읽음
+        questions = read_questions(args.input, success_filter=args.filter)
+
+    if not questions:
+        logging.error("처리할 질문이 없습니다.")
+        if excel_handler:
+            excel_handler.close()
+        sys.exit(1)
+
+    if (args.limit and args.limit > 0) or args.sample_manifest:
+        from src.sampling import sample_questions
+
+        questions = sample_questions(
+            questions, args.limit, seed=args.seed,
+            min_per_class=args.min_per_class, manifest_path=args.sample_manifest
+        )
+
+    if args.fresh:
+        for path in find_checkpoints(args.output):
+            os.remove(path)
+        logging.info("기존 체크포인트를 삭제했습니다.")
+
+    # 이전 실행의 모든 샤드 체크포인트에서 질문이 같은 행의 프롬프트 해시를 샤드에 넘기고,
+    # 프롬프트 생성/해시 비교는 각 샤드가 나눠서 수행 (부모 프로세스는 프롬프트를 만들지 않음)
+    started_at = time.time()
+    expected = reusable_checkpoints(questions, load_all_checkpoints(args.output))
+    logging.info(f"{len(questions)}개 중 {len(expected)}개는 체크포인트 재사용 후보 (프롬프트 확인은 샤드에서 수행)")
+
+    # 재사용 후보와 나머지를 각각 분할하여 합침 (실제로 분류할 행이 샤드 간에 고르게 나뉘도록)
+    candidates = [item for item in questions if item['row'] in expected]
+    fresh = [item for item in questions if item['row'] not in expected]
+    shards = [
+        fresh_shard + candidate_shard
+        for fresh_shard, candidate_shard in zip(split_into_shards(fresh, num_shards, args.shard_by),
+                                                split_into_shards(candidates, num_shards, args.shard_by))
+    ]
+    del candidates, fresh
+    for shard_index, shard in enumerate(shards):
+        logging.info(f"  샤드 {shard_index:02d}: {len(shard)}개")
+
+    # 워커 프로세스 실행 (spawn: 부모의 스레드/로깅 상태를 물려받지 않음)
+    errors = []
+    stale_rows = []
+    reused = 0
+    api_error_occurred = False
+    mp_context = multiprocessing.get_context('spawn')
+    try:
+        with ProcessPoolExecutor(max_workers=num_shards, mp_context=mp_context) as executor:
+            futures = [
+                executor.submit(run_shard, shard_index, num_shards, shard, args.output,
+                                {item['row']: expected[item['row']] for item in shard if item['row'] in expected})
+                for shard_index, shard in enumerate(shards) if shard
+            ]
+            for future in as_completed(futures):
+                summary = future.result()
+                errors.extend(summary['errors'])
+                stale_rows.extend(summary['stale'])
+                reused += summary['reused']
+                api_error_occurred = api_error_occurred or summary['api_error']
+                logging.info(f"샤드 {summary['shard']:02d} 완료: {summary['processed']}개 처리, "
+                             f"{summary['reused']}개 재사용, 오류 {len(summary['errors'])}개")
+    except KeyboardInterrupt:
+        logging.warning("사용자에 의해 중단되었습니다. 완료된 결과는 체크포인트에 남아 있습니다.")
+        if excel_handler:
+            excel_handler.close()
+        sys.exit(0)
+    logging.info(f"체크포인트 재사용: {reused}개 (프롬프트 변경으로 재처리 {len(stale_rows)}개)")
+
+    # 병합 및 통합 통계
+    results = merge_shards(args.output, questions, errors, stale_rows, started_at)
+    logging.info(f"샤드 병합 완료: {len(results)}/{len(questions)}개 결과")
+
+    question_dict = {item['row']: item for item in questions}
+    evaluator = Evaluator()
+    for index, result in enumerate(results):
+        if 'classified_domains' in result:
+            # 체크포인트의 채점은 기록 당시 GT 기준이므로 현재 GT로 다시 채점 (결과 파일과 통계 일치)
+            ground_truth = question_dict[result['row']]['ground_truth']
+            results[index] = rescore_result(result, ground_truth, evaluator.registry)
+            evaluator.evaluate(result['classified_domain'], ground_truth)
+
+    if excel_handler:
+        logging.info("결과를 엑셀 파일에 작성 중...")
+        write_excel_results(excel_handler, results)
+        if excel_handler.save(args.output):
+            logging.info(f"결과가 {args.output}에 저장되었습니다.")
+        else:
+            logging.error("결과 파일 저장에 실패했습니다.")
+
+        save_json_result(args.output, results, questions)
+    else:
+        with open_result_writer(args.output) as result_writer:
+            for result in results:
+                result_writer.write(to_result_record(result, question_dict[result['row']]))
+        logging.info(f"결과가 {args.output}에 저장되었습니다. (총 {result_writer.count}개 항목)")
+
+    evaluator.print_statistics()
+    evaluator.print_misclassified(limit=10)
+    if excel_handler:
+        excel_handler.close()
+
+    logging.info("프로그램 종료")
+    logging.info("=" * 60)
+
+    if api_error_occurred:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+통합 CLI 진입점
+
+Usage:
+    python -m src <하위 명령> [옵션]
+
+Commands:
+    classify        도메인 분류 실행 (main.py와 동일한 옵션)
+    shard           다중 프로세스 샤딩 실행 (shard_runner.py와 동일한 옵션)
+    experiment      프롬프트 A/B 실험 (run_experiments.py와 동일한 옵션)
+    tokens          프롬프트 토큰 예측 / 예산 확인 (token_report.py와 동일한 옵션)
+    reparse         저장된 LLM 응답 재채점 (reparse.py와 동일한 옵션)
+    relabel         Ground Truth 재라벨링 (update_ground_truth.py)
+    analyze         결과 분석 (analyze_results.py, --mece 지정 시 analyze_data_for_mece.py)
+    mine-intents    Micro-Intent 후보 키워드 추출 (extract_micro_intents.py와 동일한 옵션)
+    discover        의도 발견 클러스터링 (discover_intents.py와 동일한 옵션)
+
+Examples:
+    python -m src classify -n 5
+    python -m src analyze result/result.jsonl
+    python -m src analyze --mece
+
+무거운 의존성(pandas, openpyxl, requests 등)은 선택된 하위 명령을 실행할 때만 import합니다.
+"""
+
+import argparse
+import os
+import sys
+
+# 프로젝트 루트를 Python 경로에 추가 (루트의 실행 스크립트 import용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _run_classify(args):
+    import logging
+    import main as classify_main
+
+    try:
+        classify_main.main(args.args)
+    except KeyboardInterrupt:
+        logging.warning("\n사용자에 의해 중단되었습니다.")
+        sys.exit(0)
+    except Exception as e:
+        logging.error(f"예상치 못한 오류 발생 - {e}")
+        import traceback
+        logging.debug(traceback.format_exc())
+        sys.exit(1)
+
+
+def _run_shard(args):
+    import shard_runner
+
+    shard_runner.main(args.args)
+
+
+def _run_experiment(args):
+    import run_experiments
+
+    run_experiments.main(args.args)
+
+
+def _run_tokens(args):
+    import token_report
+
+    token_report.main(args.args)
+
+
+def _run_reparse(args):
+    import reparse
+
+    reparse.main(args.args)
+
+
+def _run_relabel(args):
+    import update_ground_truth
+
+    update_ground_truth.main(args.args)
+
+
+def _run_analyze(args):
+    if args.mece:
+        import analyze_data_for_mece
+
+        analyze_data_for_mece.analyze_data()
+        return
+
+    import analyze_results
+
+    analyze_results.main(args.path)
+
+
+def _run_mine_intents(args):
+    import extract_micro_intents
+
+    extract_micro_intents.main(args.args)
+
+
+def _run_discover(args):
+    import discover_intents
+
+    discover_intents.main(args.args)
+
+
+def build_parser():
+    """
+    CLI 인자 파서 생성
+
+    Returns:
+        ArgumentParser
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m src',
+        description='도메인 분류 어플리케이션 통합 CLI',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    subparsers = parser.add_subparsers(dest='command', metavar='<command>')
+    subparsers.required = True
+
+    classify = subparsers.add_parser('classify', help='도메인 분류 실행 (main.py 옵션 사용)', add_help=False)
+    classify.set_defaults(func=_run_classify, passthrough=True)
+
+    shard = subparsers.add_parser('shard', help='다중 프로세스 샤딩 실행 (shard_runner.py 옵션 사용)', add_help=False)
+    shard.set_defaults(func=_run_shard, passthrough=True)
+
+    experiment = subparsers.add_parser('experiment', help='프롬프트 A/B 실험 (run_experiments.py 옵션 사용)',
+                                       add_help=False)
+    experiment.set_defaults(func=_run_experiment, passthrough=True)
+
+    tokens = subparsers.add_parser('tokens', help='프롬프트 토큰 예측 / 예산 확인 (token_report.py 옵션 사용)',
+                                   add_help=False)
+    tokens.set_defaults(func=_run_tokens, passthrough=True)
+
+    reparse = subparsers.add_parser('reparse', help='저장된 LLM 응답 재채점 (reparse.py 옵션 사용)', add_help=False)
+    reparse.set_defaults(func=_run_reparse, passthrough=True)
+
+    relabel = subparsers.add_parser('relabel', help='Ground Truth 재라벨링 (update_ground_truth.py 옵션 사용)',
+                                    add_help=False)
+    relabel.set_defaults(func=_run_relabel, passthrough=True)
+
+    analyze = subparsers.add_parser('analyze', help='결과 분석')
+    analyze.add_argument('path', nargs='?', default='result/result.json',
+                         help='결과 파일 경로 (result.json 또는 result.jsonl, 기본: result/result.json)')
+    analyze.add_argument('--mece', action='store_true',
+                         help='입력 데이터의 GT 도메인별 키워드 분석 (analyze_data_for_mece.py)')
+    analyze.set_defaults(func=_run_analyze)
+
+    mine = subparsers.add_parser('mine-intents', help='Micro-Intent 후보 키워드 추출 (extract_micro_intents.py 옵션 사용)',
+                                 add_help=False)
+    mine.set_defaults(func=_run_mine_intents, passthrough=True)
+
+    discover = subparsers.add_parser('discover', help='의도 발견 클러스터링 (discover_intents.py 옵션 사용)',
+                                     add_help=False)
+    discover.set_defaults(func=_run_discover, passthrough=True)
+
+    return parser
+
+
+def main(argv=None):
+    """
+    CLI 실행
+
+    Args:
+        argv: 명령행 인자 리스트 (기본: sys.argv[1:])
+    """
+    parser = build_parser()
+    args, extra = parser.parse_known_args(argv)
+
+    # passthrough 하위 명령은 나머지 인자를 각 실행 스크립트의 파서에 그대로 전달
+    if getattr(args, 'passthrough', False):
+        args.args = extra
+    elif extra:
+        parser.error(f"알 수 없는 인자: {' '.join(extra)}")
+
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
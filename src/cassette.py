@@ -0,0 +1,201 @@
+"""
+LLM 요청/응답 카세트 모듈
+실제 LLM 서버와 주고받은 요청/응답을 지연 시간과 함께 파일에 기록(record)하고,
+나중에 서버 없이 같은 응답을 원래 지연 시간대로 다시 재생(replay)
+
+- 키: 프롬프트 해시 (Provider, 모델, 프롬프트) → 프롬프트나 의도 목록이 바뀌면 재생되지 않음
+- 응답은 가공 전 content 그대로 저장 (Reasoning 모델의 리스트형 content 포함)
+- 같은 프롬프트가 여러 번 기록되면 재생 시 같은 행 번호의 기록을 우선 사용하고,
+  없으면 기록 순서대로 돌아가며 사용 (동시 요청 순서와 관계없이 같은 입력은 같은 결과)
+- 성공한 응답만 기록 (API 오류는 실행을 중단시키므로 재생할 필요가 없음)
+
+저장 형식: .jsonl 또는 .jsonl.gz (한 줄 = 요청 1건, 기록 모드에서는 기존 파일 뒤에 이어서 기록,
+비정상 종료로 잘린 끝부분은 이어 기록하기 전에 잘라냄)
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .response_store import load_jsonl, open_jsonl, prompt_key
+
+
+class CassetteRecorder:
+    """
+    실제 요청을 보내고 응답/지연 시간을 카세트에 기록 (스레드 안전)
+
+    항목 형식: {key, row, latency, content, usage}
+    """
+
+    def __init__(self, path: str, provider: str, model: Optional[str]):
+        """
+        Args:
+            path: 카세트 경로 (.jsonl / .jsonl.gz)
+            provider: LLM 제공자 (키 계산용)
+            model: 모델 이름 (키 계산용)
+        """
+        self.path = path
+        self.provider = provider
+        self.model = model
+        self.recorded = 0
+        self._lock = threading.Lock()
+
+        cassette_dir = os.path.dirname(path)
+        if cassette_dir:
+            os.makedirs(cassette_dir, exist_ok=True)
+        # 이전 기록이 비정상 종료로 잘렸으면 온전한 앞부분만 남긴 뒤 이어서 기록
+        existing = load_jsonl(path, lambda entry: None, "카세트")
+        self._file = open_jsonl(path, 'at')
+        if existing:
+            logging.info(f"기존 카세트에 이어서 기록: {path} ({existing}줄)")
+        logging.info(f"LLM 카세트 기록 모드: {path}")
+
+    def call(
+        self,
+        prompt: str,
+        meta: Dict[str, Any],
+        send: Callable[[], Tuple[Optional[str], Optional[str]]]
+    ) -> Tuple[Any, Optional[str]]:
+        """
+        실제 요청을 보내고 성공한 응답을 기록
+
+        Args:
+            prompt: 프롬프트
+            meta: 응답 부가 정보 딕셔너리 (row: 행 번호, send가 usage, raw_content를 채움)
+            send: 실제 요청 함수
+
+        Returns:
+            (응답, 오류 메시지) 튜플
+        """
+        start = time.perf_counter()
+        response, error = send()
+        latency = time.perf_counter() - start
+        if response is None:
+            return response, error
+
+        entry = {
+            'key': prompt_key(self.provider, self.model, prompt),
+            'row': meta.get('row'),
+            'latency': round(latency, 4),
+            'content': meta.pop('raw_content', response),
+            'usage': meta.get('usage'),
+        }
+        line = json.dumps(entry, ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + '\n')
+            self._file.flush()
+            self.recorded += 1
+        return response, error
+
+    def close(self):
+        """카세트 파일 닫기"""
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.close()
+        logging.info(f"LLM 카세트 기록 완료: {self.path} ({self.recorded}건)")
+
+
+class CassettePlayer:
+    """
+    카세트에 기록된 응답을 원래 지연 시간(÷ speed)만큼 기다린 뒤 반환 (스레드 안전)
+
+    카세트에 없는 프롬프트는 API 오류로 처리한다 (재생 결과가 기록과 달라지지 않도록).
+    """
+
+    def __init__(self, path: str, provider: str, model: Optional[str], speed: float = 1.0):
+        """
+        Args:
+            path: 카세트 경로 (.jsonl / .jsonl.gz)
+            provider: LLM 제공자 (키 계산용)
+            model: 모델 이름 (키 계산용)
+            speed: 재생 배속 (지연 시간 ÷ speed, 0이면 대기 없음)
+        """
+        self.path = path
+        self.provider = provider
+        self.model = model
+        self.speed = speed
+        self.hits = 0
+        self.misses = 0
+        self._entries = defaultdict(list)   # 키 → 기록 순서대로의 항목
+        self._cursor = defaultdict(int)     # 키 → 다음에 재생할 위치
+        self._by_row = {}                   # (키, 행 번호) → 마지막 항목
+        self._lock = threading.Lock()
+
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"카세트 파일이 없습니다: {path}")
+        # 기록 중 비정상 종료로 마지막 줄/압축 블록이 잘린 경우 그 앞까지 사용
+        count = load_jsonl(path, self._add, "카세트")
+        logging.info(f"LLM 카세트 재생 모드: {path} ({count}건, 프롬프트 {len(self._entries)}개, {speed:g}배속)")
+
+    def _add(self, entry: Dict[str, Any]):
+        self._entries[entry['key']].append(entry)
+        if entry.get('row') is not None:
+            self._by_row[(entry['key'], entry['row'])] = entry
+
+    def call(
+        self,
+        prompt: str,
+        meta: Dict[str, Any],
+        send: Callable[[], Tuple[Optional[str], Optional[str]]]
+    ) -> Tuple[Any, Optional[str]]:
+        """
+        기록된 응답 재생 (send는 호출하지 않음)
+
+        Args:
+            prompt: 프롬프트
+            meta: 응답 부가 정보 딕셔너리 (row: 행 번호, usage와 endpoint를 채움)
+            send: 실제 요청 함수 (사용 안 함)
+
+        Returns:
+            (기록된 content, 오류 메시지) 튜플 - content는 리스트일 수 있음
+        """
+        key = prompt_key(self.provider, self.model, prompt)
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                self.misses += 1
+                return None, f"카세트에 없는 요청 (프롬프트 해시: {key[:12]})"
+            entry = self._by_row.get((key, meta.get('row')))
+            if entry is None:
+                entry = entries[self._cursor[key] % len(entries)]
+                self._cursor[key] += 1
+            self.hits += 1
+
+        if self.speed > 0 and entry.get('latency'):
+            time.sleep(entry['latency'] / self.speed)
+        meta['usage'] = entry.get('usage')
+        meta['endpoint'] = 'cassette'
+        return entry['content'], None
+
+    def close(self):
+        """재생 통계 로그"""
+        logging.info(f"LLM 카세트 재생 완료: {self.hits}건 재생, {self.misses}건 누락")
+
+
+def create_cassette(cassette_config: Optional[Dict[str, Any]], provider: str, model: Optional[str]):
+    """
+    설정으로 카세트 생성
+
+    Args:
+        cassette_config: 카세트 설정 (mode: off/record/replay, path, speed)
+        provider: LLM 제공자
+        model: 모델 이름
+
+    Returns:
+        CassetteRecorder / CassettePlayer (mode가 off이거나 설정이 없으면 None)
+    """
+    if not cassette_config or cassette_config.get('mode', 'off') == 'off':
+        return None
+    path = cassette_config.get('path')
+    if not path or not path.endswith(('.jsonl', '.jsonl.gz')):
+        raise ValueError(f"지원하지 않는 카세트 경로 - {path} (지원: .jsonl, .jsonl.gz)")
+    if cassette_config['mode'] == 'record':
+        return CassetteRecorder(path, provider, model)
+    if cassette_config['mode'] == 'replay':
+        return CassettePlayer(path, provider, model, speed=cassette_config.get('speed', 1.0))
+    raise ValueError(f"지원하지 않는 카세트 모드 - {cassette_config['mode']} (지원: off, record, replay)")
@@ -0,0 +1,231 @@
+"""
+적응형 동시 요청 제한 모듈
+고정된 MAX_CONCURRENT_REQUESTS 대신 요청 지연 시간과 오류를 보고 동시 요청 한도를 실행 중에 조정
+(Netflix concurrency-limits의 Gradient2 / TCP Vegas 방식)
+
+- 기준 지연: 최근 baseline_window개 샘플의 최소 지연 (무부하 지연 추정, 서버 상태 변화를 따라가도록 구간 단위로 갱신)
+- 현재 지연: 최근 지연 시간의 단기 지수 이동 평균
+- 기울기 = clamp(허용 배율 × 기준 / 현재, 0.5, 1.0)
+  → 지연이 기준의 허용 배율 이내면 한도를 sqrt(한도)만큼씩 늘리고, 서버에 대기열이 생겨 지연이 늘면 줄임
+- 오류(타임아웃, 5xx 등) 발생 시 한도를 곱셈으로 감소
+- 처리 중 요청이 한도의 절반도 안 되면(작업이 부족한 상태) 한도를 늘리지 않음
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    지연 기울기 기반 동시 요청 한도 제어기 (스레드 안전)
+
+    요청 전에 acquire(), 요청 후에 release(지연, 실패 여부)를 호출한다.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 5,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        smoothing: float = 0.2,
+        tolerance: float = 1.5,
+        backoff: float = 0.9,
+        short_window: int = 10,
+        baseline_window: int = 500,
+        log_interval: float = 5.0,
+    ):
+        """
+        Args:
+            initial_limit: 초기 한도
+            min_limit: 최소 한도
+            max_limit: 최대 한도 (실행기 스레드 수)
+            smoothing: 한도 변경 평활 계수 (0 ~ 1, 클수록 빠르게 반응)
+            tolerance: 기준 지연 대비 허용 배율 (현재 지연이 이 배율을 넘으면 한도 감소)
+            backoff: 오류 발생 시 한도에 곱할 비율
+            short_window: 현재 지연 이동 평균 샘플 수
+            baseline_window: 기준 지연(최소 지연)을 구하는 최근 샘플 수
+            log_interval: 한도 변경 INFO 로그 최소 간격 (초, 모든 변경은 DEBUG 로그와 이력에 기록)
+        """
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.smoothing = smoothing
+        self.tolerance = tolerance
+        self.backoff = backoff
+        self._short_alpha = 2.0 / (short_window + 1)
+        # 최소 지연을 10개 구간으로 나눠 관리 (오래된 구간은 버려 기준 지연이 서버 변화에 맞춰 갱신됨)
+        self._block_size = max(1, baseline_window // 10)
+        self._block_minima = deque(maxlen=10)
+        self._block_count = 0
+
+        self._limit = float(min(self.max_limit, max(self.min_limit, initial_limit)))
+        self._in_flight = 0
+        self._short_rtt = None
+        self._baseline_rtt = None
+        self._cond = threading.Condition()
+        self._start = time.monotonic()
+        self._log_interval = log_interval
+        self._last_info = -log_interval
+
+        # 통계
+        self.requests = 0
+        self.failures = 0
+        self.max_in_flight = 0
+        self.wait_time = 0.0
+        self.history = [(0.0, int(self._limit), None, None, 'initial')]
+
+    @property
+    def limit(self) -> int:
+        """현재 동시 요청 한도"""
+        with self._cond:
+            return int(self._limit)
+
+    def acquire(self):
+        """한도 내에서 요청 슬롯 획득 (한도가 찼으면 빈 슬롯이 생길 때까지 대기)"""
+        with self._cond:
+            if self._in_flight >= int(self._limit):
+                start = time.monotonic()
+                while self._in_flight >= int(self._limit):
+                    self._cond.wait()
+                self.wait_time += time.monotonic() - start
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+
+    def release(self, latency: float, failed: bool = False):
+        """
+        요청 슬롯 반환 및 한도 갱신
+
+        Args:
+            latency: 요청 지연 시간 (초)
+            failed: 요청 실패 여부 (타임아웃, 서버 오류 등)
+        """
+        with self._cond:
+            in_flight = self._in_flight
+            self._in_flight -= 1
+            self.requests += 1
+            old_limit = int(self._limit)
+
+            if failed:
+                self.failures += 1
+                self._limit = max(self.min_limit, self._limit * self.backoff)
+                reason = 'error'
+            else:
+                reason = self._update(latency, in_flight)
+
+            new_limit = int(self._limit)
+            if new_limit != old_limit:
+                elapsed = time.monotonic() - self._start
+                self.history.append((elapsed, new_limit, self._short_rtt, self._baseline_rtt, reason))
+                message = f"동시 요청 한도 변경: {old_limit} → {new_limit} ({self._describe(reason)})"
+                if reason == 'error' or elapsed - self._last_info >= self._log_interval:
+                    self._last_info = elapsed
+                    logging.info(message)
+                else:
+                    logging.debug(message)
+            self._cond.notify_all()
+
+    def _record_baseline(self, latency: float):
+        """구간별 최소 지연 갱신 (lock 보유 상태에서 호출)"""
+        if self._block_count == 0:
+            self._block_minima.append(latency)
+        elif latency < self._block_minima[-1]:
+            self._block_minima[-1] = latency
+        self._block_count = (self._block_count + 1) % self._block_size
+        self._baseline_rtt = min(self._block_minima)
+
+    def _update(self, latency: float, in_flight: int) -> str:
+        """지연 샘플로 한도 갱신 (lock 보유 상태에서 호출), 변경 사유 반환"""
+        self._record_baseline(latency)
+        if self._short_rtt is None:
+            self._short_rtt = latency
+            return 'latency'
+        self._short_rtt += self._short_alpha * (latency - self._short_rtt)
+
+        # 작업이 부족해 한도를 다 쓰지 않는 동안에는 늘리지 않음 (불필요한 한도 팽창 방지)
+        if in_flight < self._limit / 2:
+            return 'idle'
+
+        gradient = max(0.5, min(1.0, self.tolerance * self._baseline_rtt / self._short_rtt))
+        new_limit = self._limit * gradient + math.sqrt(self._limit)
+        self._limit = self._limit * (1 - self.smoothing) + new_limit * self.smoothing
+        self._limit = min(self.max_limit, max(self.min_limit, self._limit))
+        return 'latency'
+
+    def _describe(self, reason: str) -> str:
+        if reason == 'error':
+            return "요청 오류"
+        if self._short_rtt is None:
+            return reason
+        return f"지연 {self._short_rtt:.3f}초 / 기준 {self._baseline_rtt:.3f}초"
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        한도 제어 통계 반환
+
+        Returns:
+            통계 딕셔너리 (limit, min/max 한도 이력, 지연, 대기 시간 등)
+        """
+        with self._cond:
+            limits = [entry[1] for entry in self.history]
+            return {
+                'limit': int(self._limit),
+                'lowest_limit': min(limits),
+                'highest_limit': max(limits),
+                'changes': len(self.history) - 1,
+                'requests': self.requests,
+                'failures': self.failures,
+                'max_in_flight': self.max_in_flight,
+                'short_latency': self._short_rtt,
+                'baseline_latency': self._baseline_rtt,
+                'wait_time': self.wait_time,
+            }
+
+    def get_history(self) -> List[Dict[str, Any]]:
+        """
+        한도 변경 이력
+
+        Returns:
+            [{'elapsed', 'limit', 'latency', 'baseline', 'reason'}] 리스트
+        """
+        with self._cond:
+            return [
+                {'elapsed': round(elapsed, 3), 'limit': limit, 'latency': short, 'baseline': baseline, 'reason': reason}
+                for elapsed, limit, short, baseline, reason in self.history
+            ]
+
+
+def save_history(path: str, history: List[Dict[str, Any]]):
+    """
+    한도 변경 이력을 JSONL로 저장
+
+    Args:
+        path: 저장 경로
+        history: AdaptiveConcurrencyLimiter.get_history() 결과
+    """
+    import json
+
+    with open(path, 'w', encoding='utf-8') as f:
+        for entry in history:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+
+
+def create_limiter(concurrency_config: Optional[Dict[str, Any]]) -> Optional[AdaptiveConcurrencyLimiter]:
+    """
+    설정으로 한도 제어기 생성
+
+    Args:
+        concurrency_config: 동시성 설정 (mode, initial, min, max)
+
+    Returns:
+        AdaptiveConcurrencyLimiter (mode가 'adaptive'가 아니면 None)
+    """
+    if not concurrency_config or concurrency_config.get('mode') != 'adaptive':
+        return None
+    return AdaptiveConcurrencyLimiter(
+        initial_limit=concurrency_config.get('initial', 5),
+        min_limit=concurrency_config.get('min', 1),
+        max_limit=concurrency_config.get('max', 32),
+    )
@@ -3,19 +3,41 @@
 LLM 분류 결과와 Ground Truth 비교 및 통계 생성
 """
 
-from typing import Dict, List
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple
 import logging
+import threading
+
+from .intent_registry import IntentCode, IntentRegistry, UNKNOWN_ID
 
 
 class Evaluator:
-    """분류 결과 평가기"""
+    """
+    분류 결과 평가기
+
+    행별 결과는 의도 ID 배열(array)과 성공 여부 bytearray로 저장하고,
+    이름은 오분류 출력 등 필요한 시점에만 레지스트리로 복원한다. 카탈로그에 없는 이름은 레지스트리에 등록하지 않고
+    UNKNOWN_ID로 저장하며, 원문은 같은 위치의 이름 리스트에 보관한다 (입력 데이터의 문자열을 참조하므로 복사하지 않음).
+    evaluate_ids()는 여러 작업 스레드에서 호출되므로 카운터와 행별 배열을 한 잠금으로 함께 갱신한다.
+    """
+
+    def __init__(self, registry: Optional[IntentRegistry] = None):
+        """
+        평가기 초기화
 
-    def __init__(self):
-        """평가기 초기화"""
+        Args:
+            registry: 의도 레지스트리 (분류기와 공유, 없으면 새로 생성)
+        """
+        self.registry = registry if registry is not None else IntentRegistry()
         self.total_count = 0
         self.success_count = 0
         self.fail_count = 0
-        self.results = []
+        self._classified_ids = array('i')
+        self._ground_truth_ids = array('i')
+        self._success_flags = bytearray()
+        self._classified_names = []      # 행별 카탈로그에 없는 분류 이름 (카탈로그 의도면 None)
+        self._ground_truth_names = []    # 행별 카탈로그에 없는 정답 이름 (카탈로그 의도면 None)
+        self._lock = threading.Lock()
 
     def evaluate(self, classified_domain: str, ground_truth: str) -> str:
         """
@@ -28,26 +50,59 @@ class Evaluator:
         Returns:
             성공 여부 ('O' 또는 'X')
         """
-        self.total_count += 1
-
-        # 대소문자 구분 없이, 공백 제거하여 비교
-        classified = classified_domain.strip().lower()
-        truth = ground_truth.strip().lower()
+        # 대소문자 구분 없이, 공백 제거하여 비교 (레지스트리 ID가 같으면 같은 도메인)
+        return self.evaluate_ids(self.registry.code(classified_domain), self.registry.code(ground_truth))
 
-        if classified == truth:
-            self.success_count += 1
-            result = 'O'
-        else:
-            self.fail_count += 1
-            result = 'X'
+    def evaluate_ids(self, classified_id: IntentCode, ground_truth_id: IntentCode) -> str:
+        """
+        레지스트리 ID로 분류 결과와 정답 비교
 
-        self.results.append({
-            'classified': classified_domain,
-            'ground_truth': ground_truth,
-            'result': result
-        })
+        Args:
+            classified_id: 분류된 도메인 ID (카탈로그에 없으면 원문 이름)
+            ground_truth_id: 정답 도메인 ID (카탈로그에 없으면 원문 이름)
 
-        return result
+        Returns:
+            성공 여부 ('O' 또는 'X')
+        """
+        success = self.registry.same(classified_id, ground_truth_id)
+        # 행별 값이 세 배열의 같은 위치에 들어가도록 갱신 전체를 잠금 안에서 수행
+        with self._lock:
+            self.total_count += 1
+            if success:
+                self.success_count += 1
+            else:
+                self.fail_count += 1
+
+            self._store(self._classified_ids, self._classified_names, classified_id)
+            self._store(self._ground_truth_ids, self._ground_truth_names, ground_truth_id)
+            self._success_flags.append(success)
+
+        return 'O' if success else 'X'
+
+    @staticmethod
+    def _store(ids: array, names: List[Optional[str]], code: IntentCode):
+        """ID 배열과 이름 리스트에 1행 추가 (카탈로그에 없는 이름은 UNKNOWN_ID + 원문, lock 보유 상태에서 호출)"""
+        if isinstance(code, str):
+            ids.append(UNKNOWN_ID)
+            names.append(code)
+        else:
+            ids.append(code)
+            names.append(None)
+
+    def _rows(self) -> Iterator[Tuple[str, str, bool]]:
+        """행별 (분류 이름, 정답 이름, 성공 여부)"""
+        name = self.registry.name
+        for c, g, c_name, g_name, ok in zip(self._classified_ids, self._ground_truth_ids,
+                                             self._classified_names, self._ground_truth_names, self._success_flags):
+            yield (c_name if c == UNKNOWN_ID else name(c)), (g_name if g == UNKNOWN_ID else name(g)), bool(ok)
+
+    @property
+    def results(self) -> List[Dict]:
+        """행별 평가 결과 (이름으로 복원한 딕셔너리 리스트, 호환용)"""
+        return [
+            {'classified': c, 'ground_truth': g, 'result': 'O' if ok else 'X'}
+            for c, g, ok in self._rows()
+        ]
 
     def get_accuracy(self) -> float:
         """
@@ -95,7 +150,11 @@ class Evaluator:
         Returns:
             오분류 케이스 딕셔너리
         """
-        misclassified = [r for r in self.results if r['result'] == 'X']
+        misclassified = [
+            {'classified': c, 'ground_truth': g, 'result': 'X'}
+            for c, g, ok in self._rows()
+            if not ok
+        ]
         return {
             'count': len(misclassified),
             'cases': misclassified
@@ -0,0 +1,188 @@
+"""
+비동기 로깅 / 행 단위 이벤트 로그 모듈
+
+- 로그 기록은 QueueHandler → QueueListener 스레드로 넘겨, 작업 스레드가 파일/콘솔 I/O를 기다리지 않음
+- 행별 처리 결과는 사람이 읽는 로그 줄 대신 JSONL 이벤트(1줄 = 1행)로 기록
+- 진행 상황은 건마다 출력하지 않고 일정 간격으로 한 줄씩 출력
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+
+_listeners = []
+
+
+def _stop_listeners():
+    """종료 시 큐에 남은 로그를 모두 기록"""
+    while _listeners:
+        _listeners.pop().stop()
+
+
+class _EventQueueHandler(logging.handlers.QueueHandler):
+    """이벤트 딕셔너리를 문자열로 바꾸지 않고 그대로 큐에 넣는 QueueHandler (같은 프로세스 안에서만 사용)"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def start_queue_logging(handlers: List[logging.Handler], level: int = logging.INFO,
+                        logger: Optional[logging.Logger] = None,
+                        queue_handler_class=logging.handlers.QueueHandler) -> logging.handlers.QueueListener:
+    """
+    로거에 QueueHandler를 설치하고 실제 핸들러는 QueueListener 스레드에서 실행
+
+    Args:
+        handlers: 파일/콘솔 등 실제 출력 핸들러
+        level: 로그 레벨
+        logger: 대상 로거 (기본: 루트 로거)
+        queue_handler_class: 로거에 설치할 QueueHandler 클래스
+
+    Returns:
+        시작된 QueueListener (프로세스 종료 시 자동으로 중지되어 남은 로그를 기록)
+    """
+    logger = logger or logging.getLogger()
+    log_queue = queue.SimpleQueue()
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+    logger.addHandler(queue_handler_class(log_queue))
+    logger.setLevel(level)
+
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    if not _listeners:
+        atexit.register(_stop_listeners)
+    _listeners.append(listener)
+    return listener
+
+
+class _JsonLineFormatter(logging.Formatter):
+    """이벤트 딕셔너리(record.msg)를 JSON 한 줄로 변환"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        return json.dumps(record.msg, ensure_ascii=False, default=str)
+
+
+class RowEventLog:
+    """
+    행 단위 JSONL 이벤트 로그
+
+    write()는 이벤트를 큐에 넣고 바로 반환하며, JSON 직렬화와 파일 기록은 리스너 스레드에서 수행한다.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: 이벤트 로그 경로 (.jsonl)
+        """
+        self.path = path
+        self.count = 0
+        self._logger = logging.getLogger(f'domain_classifier.events.{path}')
+        self._logger.propagate = False
+        handler = logging.FileHandler(path, encoding='utf-8')
+        handler.setFormatter(_JsonLineFormatter())
+        self._listener = start_queue_logging([handler], logging.INFO, self._logger, _EventQueueHandler)
+
+    def write(self, event: str, result: Dict[str, Any], item: Dict[str, Any], **extra):
+        """
+        행 이벤트 1건 기록
+
+        Args:
+            event: 이벤트 종류 ('result', 'api_error', 'error')
+            result: 분류 결과 딕셔너리 (오류 행 포함)
+            item: 원본 질문 데이터
+            **extra: 추가 필드
+        """
+        record = {
+            'ts': datetime.now().isoformat(timespec='milliseconds'),
+            'event': event,
+            'row': result['row'],
+            'question': item.get('question', ''),
+            'ground_truth': item.get('ground_truth', ''),
+            'classified_domains': result.get('classified_domains', [result.get('classified_domain')]),
+            'hit_rank': result.get('hit_rank'),
+            'success': result.get('success'),
+            'opinion_category': result.get('opinion_category'),
+            'prompt_tokens': result.get('prompt_tokens'),
+            'completion_tokens': result.get('completion_tokens'),
+        }
+        record.update(extra)
+        self._logger.info(record)
+        self.count += 1
+
+    def close(self):
+        """남은 이벤트를 기록하고 파일 닫기"""
+        self._listener.stop()
+        if self._listener in _listeners:
+            _listeners.remove(self._listener)
+        for handler in self._listener.handlers:
+            handler.close()
+
+
+def open_event_log(log_file: str) -> RowEventLog:
+    """
+    실행 로그 파일 옆에 행 이벤트 로그 생성 (<로그 파일명>_events.jsonl)
+
+    Args:
+        log_file: setup_logging()이 반환한 로그 파일 경로
+
+    Returns:
+        RowEventLog
+    """
+    base, _ = log_file.rsplit('.', 1) if '.' in log_file else (log_file, '')
+    return RowEventLog(f"{base}_events.jsonl")
+
+
+class ProgressReporter:
+    """
+    간격 제한 진행 로그 (분류 루프 한 스레드에서만 호출)
+
+    interval초마다 또는 마지막 건에서만 "진행: n/전체 완료 (초당 처리량, 남은 시간)"을 출력한다.
+    """
+
+    def __init__(self, total: Optional[int] = None, interval: float = 5.0):
+        """
+        Args:
+            total: 전체 건수 (모르면 None)
+            interval: 출력 최소 간격 (초, 0이면 매 건 출력)
+        """
+        self.total = total
+        self.interval = interval
+        self.count = 0
+        self._start = time.monotonic()
+        self._last = self._start
+        self._reported = 0
+
+    def update(self, n: int = 1):
+        """완료 건수 증가 (출력 간격이 지났거나 마지막 건이면 로그 출력)"""
+        self.count += n
+        now = time.monotonic()
+        if now - self._last < self.interval and self.count != self.total:
+            return
+        self._last = now
+        self._reported = self.count
+        logging.info(self.describe(now))
+
+    def finish(self):
+        """마지막 진행 상황이 출력되지 않았으면 출력"""
+        if self.count != self._reported:
+            self._reported = self.count
+            logging.info(self.describe())
+
+    def describe(self, now: Optional[float] = None) -> str:
+        """진행 상황 문자열"""
+        elapsed = (now or time.monotonic()) - self._start
+        rate = self.count / elapsed if elapsed > 0 else 0.0
+        if self.total is None:
+            return f"진행: {self.count} 완료 ({rate:.1f}건/초)"
+        message = f"진행: {self.count}/{self.total} 완료 ({self.count / self.total * 100:.1f}%, {rate:.1f}건/초"
+        if rate > 0 and self.count < self.total:
+            message += f", 남은 시간 약 {(self.total - self.count) / rate:.0f}초"
+        return message + ")"
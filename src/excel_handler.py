@@ -3,7 +3,6 @@
 입력 엑셀 파일 읽기 및 결과 엑셀 파일 쓰기 기능 제공
 """
 
-import openpyxl
 from typing import List, Dict, Any
 import os
 import logging
@@ -33,6 +32,9 @@ class ExcelHandler:
                 logging.error(f"파일을 찾을 수 없습니다 - {self.file_path}")
                 return False
 
+            # openpyxl은 로드 시점에 import (CLI 시작 시간 단축)
+            import openpyxl
+
             self.workbook = openpyxl.load_workbook(self.file_path)
             self.worksheet = self.workbook.active
             logging.info(f"엑셀 파일 로드 완료: {self.file_path}")
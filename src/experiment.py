@@ -0,0 +1,434 @@
+"""
+프롬프트 A/B 실험 모듈
+여러 프롬프트/파서/매처 변형(variant)을 같은 질문 집합에 대해 한 번의 실행으로 비교
+
+- 모든 변형이 하나의 LLMClassifier(엔드포인트 풀, 헤징)와 하나의 스레드 풀을 공유하므로
+  동시 요청 수(MAX_CONCURRENT_REQUESTS)는 변형 수와 관계없이 전체에 적용된다.
+- LLM 응답은 프롬프트 해시로 캐싱되어, 프롬프트가 같은 변형(매처/파서만 다른 경우)이나
+  이전 실행에서 이미 호출한 프롬프트는 다시 호출하지 않는다.
+"""
+
+import json
+import logging
+import math
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .pipeline import submit_windowed
+from .response_store import load_jsonl, open_jsonl, prompt_key
+
+
+# 변형 설정에서 사용할 수 있는 키
+VARIANT_KEYS = ('name', 'description', 'prompt_template', 'top_k', 'match_threshold')
+
+
+class Variant:
+    """
+    실험 변형 (프롬프트 템플릿 / 파서 Top-K / 매처 Threshold)
+
+    prompt_template 파일에는 {question}, {intents}, {intent_count}, {examples} 자리표시자를 사용할 수 있으며,
+    지정하지 않으면 LLMClassifier의 기본 프롬프트를 사용한다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        description: str = "",
+        prompt_template: Optional[str] = None,
+        top_k: int = 3,
+        match_threshold: float = 0.3,
+        base_dir: str = "."
+    ):
+        """
+        Args:
+            name: 변형 이름 (보고서 열 이름)
+            description: 변형 설명
+            prompt_template: 프롬프트 템플릿 파일 경로 (설정 파일 기준 상대 경로 가능)
+            top_k: 파싱한 도메인 중 사용할 최대 개수
+            match_threshold: Fuzzy Match 인정 유사도
+            base_dir: 상대 경로 기준 디렉토리
+        """
+        self.name = name
+        self.description = description
+        self.top_k = top_k
+        self.match_threshold = match_threshold
+        self.prompt_template = prompt_template
+        self.template_text = None
+
+        if prompt_template:
+            path = prompt_template if os.path.isabs(prompt_template) else os.path.join(base_dir, prompt_template)
+            with open(path, 'r', encoding='utf-8') as f:
+                self.template_text = f.read()
+
+    def build_prompt(self, classifier, question: str) -> str:
+        """
+        변형의 프롬프트 생성
+
+        Args:
+            classifier: 공유 LLMClassifier
+            question: 분류할 질문
+
+        Returns:
+            프롬프트
+        """
+        if self.template_text is None:
+            return classifier._build_prompt(question)
+        return (self.template_text
+                .replace('{intents}', classifier._intents_description())
+                .replace('{intent_count}', str(len(classifier.micro_intents_data)))
+                .replace('{examples}', classifier._examples_text(question))
+                .replace('{question}', question))
+
+
+def load_variants(path: str) -> List[Variant]:
+    """
+    실험 설정 파일(JSON)에서 변형 목록 로드
+
+    형식:
+        {"variants": [
+            {"name": "baseline"},
+            {"name": "threshold_0.5", "match_threshold": 0.5},
+            {"name": "short_prompt", "prompt_template": "prompts/short.txt", "top_k": 1}
+        ]}
+
+    Args:
+        path: 설정 파일 경로
+
+    Returns:
+        Variant 리스트
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+
+    base_dir = os.path.dirname(os.path.abspath(path))
+    variants = []
+    for spec in config.get('variants', []):
+        unknown = set(spec) - set(VARIANT_KEYS)
+        if unknown:
+            raise ValueError(f"알 수 없는 변형 설정 키: {', '.join(sorted(unknown))} ({spec.get('name')})")
+        variants.append(Variant(base_dir=base_dir, **spec))
+
+    names = [v.name for v in variants]
+    if not variants:
+        raise ValueError(f"실험 설정에 변형이 없습니다 - {path}")
+    if len(set(names)) != len(names):
+        raise ValueError(f"변형 이름이 중복되었습니다: {names}")
+    return variants
+
+
+class ResponseCache:
+    """
+    프롬프트 해시 → LLM 응답 캐시 (스레드 안전)
+
+    같은 키를 동시에 요청하면 첫 요청만 LLM을 호출하고 나머지는 결과를 기다린다.
+    path를 지정하면 성공한 응답을 JSONL로 추가 기록하고, 다음 실행 시 다시 읽어 재사용한다.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: 캐시 JSONL 파일 경로 (None이면 메모리에만 저장)
+        """
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self._file = None
+
+        if path:
+            if os.path.exists(path):
+                # 비정상 종료로 마지막 줄이 잘렸으면 그 앞까지만 남기고 이어서 기록
+                load_jsonl(path, self._add, "응답 캐시")
+                logging.info(f"응답 캐시 로드: {path} ({len(self._entries)}건)")
+            cache_dir = os.path.dirname(path)
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
+            self._file = open_jsonl(path, 'at')
+
+    def _add(self, entry: Dict[str, Any]):
+        self._entries[entry['key']] = entry
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_call(
+        self,
+        key: str,
+        call: Callable[[], Tuple[Optional[str], Optional[str], Dict[str, Any]]]
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str], bool]:
+        """
+        캐시된 응답 반환, 없으면 call()로 LLM 호출 후 저장
+
+        Args:
+            key: 캐시 키
+            call: (응답, 오류 메시지, 부가 정보) 튜플을 반환하는 LLM 호출 함수
+
+        Returns:
+            (캐시 항목 {response, usage, latency}, 오류 메시지, 캐시 적중 여부) 튜플
+        """
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self.hits += 1
+                    return entry, None, True
+                waiter = self._inflight.get(key)
+                if waiter is None:
+                    self._inflight[key] = threading.Event()
+                    self.misses += 1
+                    break
+            # 같은 프롬프트를 다른 스레드가 호출 중이면 완료 대기 후 다시 확인 (실패 시 직접 호출)
+            waiter.wait()
+
+        entry = None
+        try:
+            start = time.monotonic()
+            response, error_msg, meta = call()
+            if response is not None:
+                entry = {
+                    'key': key,
+                    'response': response,
+                    'usage': meta.get('usage'),
+                    'latency': time.monotonic() - start
+                }
+            return entry, error_msg, False
+        finally:
+            with self._lock:
+                if entry is not None:
+                    self._entries[key] = entry
+                    if self._file:
+                        self._file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+                        self._file.flush()
+                self._inflight.pop(key).set()
+
+    def close(self):
+        """캐시 파일 닫기"""
+        if self._file:
+            self._file.close()
+            self._file = None
+
+
+def _percentile(values: List[float], p: float) -> Optional[float]:
+    """정렬 후 최근접 순위 백분위수"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(p / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class ExperimentRunner:
+    """여러 변형을 같은 질문 집합에 대해 병렬 실행하고 변형별 지표를 집계"""
+
+    def __init__(
+        self,
+        classifier,
+        variants: List[Variant],
+        max_concurrent: int = 5,
+        thinking_time: float = 0,
+        cache: Optional[ResponseCache] = None,
+        window: Optional[int] = None
+    ):
+        """
+        Args:
+            classifier: 모든 변형이 공유할 LLMClassifier
+            variants: 실험 변형 리스트
+            max_concurrent: 전체 동시 LLM 요청 수
+            thinking_time: 실제 API 호출 후 대기 시간 (초, 캐시 적중 시 생략)
+            cache: 응답 캐시 (None이면 메모리 캐시 생성)
+            window: 처리 중 작업 수 상한 (기본: max_concurrent × 4)
+        """
+        self.classifier = classifier
+        self.variants = variants
+        self.max_concurrent = max_concurrent
+        self.window = window or max_concurrent * 4
+        self.thinking_time = thinking_time
+        self.cache = cache if cache is not None else ResponseCache()
+
+    def _call(self, prompt: str) -> Tuple[Optional[str], Optional[str], Dict[str, Any]]:
+        meta = {}
+        response, error_msg = self.classifier._call_llm_api(prompt, meta=meta)
+        if response is not None and self.thinking_time > 0:
+            time.sleep(self.thinking_time)
+        return response, error_msg, meta
+
+    def run_one(self, variant: Variant, item: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        질문 1건을 변형 1개로 분류
+
+        Args:
+            variant: 실험 변형
+            item: 질문 데이터
+
+        Returns:
+            행별 결과 딕셔너리 (classified_domains, hit_rank, usage, latency, cached, error)
+        """
+        classifier = self.classifier
+        prompt = variant.build_prompt(classifier, item['question'])
+        key = prompt_key(classifier.provider, classifier.config.get('model'), prompt)
+
+        entry, error_msg, cached = self.cache.get_or_call(key, lambda: self._call(prompt))
+        record = {
+            'row': item['row'],
+            'ground_truth': item['ground_truth'],
+            'prompt_chars': len(prompt),
+            'cached': cached,
+        }
+        if entry is None:
+            record.update(classified_domains=[], hit_rank=None, error=error_msg)
+            return record
+
+        micro_intents, _, _ = classifier._parse_response(entry['response'])
+        matched, _ = classifier._match_intents(micro_intents[:variant.top_k], threshold=variant.match_threshold)
+
+        # Hit@K: 레지스트리 ID 비교 (대소문자 무시, 공백 제거)
+        hit_rank = classifier.registry.hit_rank(item['ground_truth'], (domain for domain in matched if domain)) or None
+
+        record.update(
+            classified_domains=matched,
+            hit_rank=hit_rank,
+            usage=classifier.token_accountant.count_usage(prompt, entry['response'], entry.get('usage')),
+            latency=entry.get('latency'),  # 캐시 적중 시에도 최초 호출의 지연 시간
+            error=None
+        )
+        return record
+
+    def run(self, questions: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        모든 변형 × 질문 실행
+
+        질문 순서대로(질문마다 모든 변형) 작업을 제출하여 같은 프롬프트가 가까운 시점에 요청되도록 하며,
+        처리 중인 작업이 window개를 넘지 않도록 완료될 때마다 다음 작업을 제출함
+
+        Args:
+            questions: 질문 데이터 리스트
+
+        Returns:
+            {변형 이름: 행별 결과 리스트 (행 번호 순)}
+        """
+        results = {variant.name: [] for variant in self.variants}
+        total = len(questions) * len(self.variants)
+        completed = 0
+
+        tasks = ((variant, item) for item in questions for variant in self.variants)
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrent) as executor:
+            def submit(task):
+                return executor.submit(self.run_one, *task)
+
+            with closing(submit_windowed(submit, tasks, self.window)) as finished:
+                for (variant, item), future in finished:
+                    completed += 1
+                    try:
+                        results[variant.name].append(future.result())
+                    except Exception as e:
+                        logging.error(f"[{variant.name}] 행 {item['row']} 처리 중 예외 발생: {e}")
+                        results[variant.name].append({
+                            'row': item['row'], 'ground_truth': item['ground_truth'],
+                            'classified_domains': [], 'hit_rank': None, 'cached': False, 'error': str(e)
+                        })
+                    if completed % 50 == 0 or completed == total:
+                        logging.info(f"진행: {completed}/{total} 완료 (캐시 적중 {self.cache.hits}건)")
+
+        for records in results.values():
+            records.sort(key=lambda r: r['row'])
+        return results
+
+
+def summarize_variant(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    변형 1개의 지표 집계
+
+    Args:
+        records: 행별 결과 리스트
+
+    Returns:
+        지표 딕셔너리 (hit@1, hit@k, 토큰, 지연 시간, 캐시 적중, 오류)
+    """
+    total = len(records)
+    answered = [r for r in records if r.get('error') is None]
+    hit1 = sum(1 for r in answered if r['hit_rank'] == 1)
+    hitk = sum(1 for r in answered if r['hit_rank'])
+    unmatched = sum(
+        1 for r in answered if any(d.startswith('미분류-') for d in r['classified_domains'])
+    )
+
+    usages = [r['usage'] for r in answered if r.get('usage')]
+    prompt_tokens = [u.get('prompt_tokens', 0) for u in usages]
+    completion_tokens = [u.get('completion_tokens', 0) for u in usages]
+    latencies = [r['latency'] for r in answered if r.get('latency') is not None]
+
+    return {
+        'total': total,
+        'errors': total - len(answered),
+        'hit@1': hit1,
+        'hit@k': hitk,
+        'hit@1_rate': hit1 / total if total else 0.0,
+        'hit@k_rate': hitk / total if total else 0.0,
+        'unmatched': unmatched,
+        'avg_prompt_chars': sum(r['prompt_chars'] for r in records) / total if total else 0.0,
+        'avg_prompt_tokens': sum(prompt_tokens) / len(prompt_tokens) if prompt_tokens else None,
+        'avg_completion_tokens': sum(completion_tokens) / len(completion_tokens) if completion_tokens else None,
+        'total_tokens': sum(prompt_tokens) + sum(completion_tokens) if usages else None,
+        'latency_p50': _percentile(latencies, 50),
+        'latency_p95': _percentile(latencies, 95),
+        'cached': sum(1 for r in records if r.get('cached')),
+        'estimated_tokens': sum(1 for u in usages if u.get('estimated')),
+    }
+
+
+def format_report(variants: List[Variant], summaries: Dict[str, Dict[str, Any]], meta: Dict[str, Any]) -> str:
+    """
+    변형별 지표를 나란히 비교하는 Markdown 보고서 생성
+
+    Args:
+        variants: 실험 변형 리스트
+        summaries: {변형 이름: 지표}
+        meta: 실행 정보 (입력, 샘플 수, 시드 등)
+
+    Returns:
+        Markdown 문자열
+    """
+    def fmt(value, pattern):
+        return '-' if value is None else pattern.format(value)
+
+    rows = [
+        ('Hit@1', lambda s: f"{s['hit@1_rate'] * 100:.2f}% ({s['hit@1']}/{s['total']})"),
+        ('Hit@K', lambda s: f"{s['hit@k_rate'] * 100:.2f}% ({s['hit@k']}/{s['total']})"),
+        ('미분류 포함', lambda s: str(s['unmatched'])),
+        ('API 오류', lambda s: str(s['errors'])),
+        ('평균 프롬프트 길이 (문자)', lambda s: f"{s['avg_prompt_chars']:.0f}"),
+        ('평균 프롬프트 토큰', lambda s: fmt(s['avg_prompt_tokens'], '{:.0f}')),
+        ('평균 응답 토큰', lambda s: fmt(s['avg_completion_tokens'], '{:.0f}')),
+        ('총 토큰', lambda s: fmt(s['total_tokens'], '{:,}')),
+        ('토큰 추정 건수 (usage 없음)', lambda s: str(s['estimated_tokens'])),
+        ('지연 p50 (초)', lambda s: fmt(s['latency_p50'], '{:.2f}')),
+        ('지연 p95 (초)', lambda s: fmt(s['latency_p95'], '{:.2f}')),
+        ('캐시 적중', lambda s: str(s['cached'])),
+    ]
+
+    names = [v.name for v in variants]
+    lines = ["# 프롬프트 A/B 실험 보고서", ""]
+    for key, value in meta.items():
+        lines.append(f"- **{key}**: {value}")
+    lines.append("")
+    lines.append("| 지표 | " + " | ".join(names) + " |")
+    lines.append("|---|" + "---|" * len(names))
+    for label, render in rows:
+        lines.append(f"| {label} | " + " | ".join(render(summaries[n]) for n in names) + " |")
+
+    lines.append("")
+    lines.append("## 변형 설정")
+    lines.append("")
+    for v in variants:
+        template = v.prompt_template or '(기본 프롬프트)'
+        desc = f" - {v.description}" if v.description else ""
+        lines.append(f"- **{v.name}**{desc}: 프롬프트 `{template}`, top_k={v.top_k}, match_threshold={v.match_threshold}")
+    lines.append("")
+    return "\n".join(lines)
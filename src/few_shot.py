@@ -0,0 +1,215 @@
+"""
+동적 Few-shot 예시 선택 모듈
+domain_success_examples.txt / domain_failure_examples.txt의 라벨된 질문으로 글자 bigram 역색인을 미리 만들고,
+질문마다 가장 비슷한 예시 k개를 골라 프롬프트에 넣음
+
+- 색인은 분류기 생성 시 한 번만 구축하며, 조회는 질문의 bigram 게시 목록만 훑으므로 예시 수백 개 기준 1ms 미만
+- 같은 질문에는 항상 같은 예시를 사용하도록 질문별 선택 결과를 캐시 (프롬프트 해시 / 증분 실행과 일관성 유지)
+- 평가 데이터의 질문과 같은 예시는 정답 유출을 막기 위해 제외
+"""
+
+import heapq
+import logging
+import math
+import os
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+_SPACES = re.compile(r'\s+')
+_SUCCESS_DOMAIN = re.compile(r'^도메인:\s*(.+?)\s*\(성공 사례')
+_FAILURE_DOMAIN = re.compile(r'^정답 도메인:\s*(.+?)\s*$')
+_FAILURE_CONFUSED = re.compile(r'^→\s*잘못 분류된 도메인:\s*(.+?)\s*\(\d+건\)')
+_NUMBERED = re.compile(r'^(\d+)\.\s+(.+)$')
+
+
+class FewShotExample:
+    """라벨된 예시 질문 (confused_with: 실패 사례에서 잘못 분류된 도메인)"""
+
+    __slots__ = ('question', 'ground_truth', 'confused_with')
+
+    def __init__(self, question: str, ground_truth: str, confused_with: Optional[str] = None):
+        self.question = question
+        self.ground_truth = ground_truth
+        self.confused_with = confused_with
+
+
+def parse_example_file(path: str) -> List[FewShotExample]:
+    """
+    성공/실패 사례 파일 파싱 (analyze_results.py 출력 형식)
+
+    Args:
+        path: 사례 파일 경로
+
+    Returns:
+        FewShotExample 리스트
+    """
+    examples = []
+    ground_truth = None
+    confused_with = None
+    with open(path, 'r', encoding='utf-8') as f:
+        for raw in f:
+            line = raw.strip()
+            match = _SUCCESS_DOMAIN.match(line)
+            if match:
+                ground_truth, confused_with = match.group(1), None
+                continue
+            match = _FAILURE_DOMAIN.match(line)
+            if match:
+                ground_truth, confused_with = match.group(1), None
+                continue
+            match = _FAILURE_CONFUSED.match(line)
+            if match:
+                confused_with = match.group(1)
+                continue
+            match = _NUMBERED.match(line)
+            if match and ground_truth:
+                examples.append(FewShotExample(match.group(2), ground_truth, confused_with))
+    return examples
+
+
+def _bigrams(text: str) -> frozenset:
+    """공백을 제거한 글자 bigram 집합 (한 글자 질문은 글자 자체)"""
+    text = _SPACES.sub('', text)
+    if len(text) < 2:
+        return frozenset((text,)) if text else frozenset()
+    return frozenset(text[i:i + 2] for i in range(len(text) - 1))
+
+
+class FewShotSelector:
+    """
+    글자 bigram 역색인 기반 유사 예시 선택기 (스레드 안전)
+
+    유사도는 bigram 집합의 코사인 유사도 |A ∩ B| / sqrt(|A| × |B|)
+    """
+
+    def __init__(self, examples: Sequence[FewShotExample], k: int = 3, min_similarity: float = 0.1):
+        """
+        Args:
+            examples: 라벨된 예시
+            k: 질문당 예시 개수
+            min_similarity: 이보다 유사도가 낮은 예시는 사용하지 않음
+        """
+        self.k = k
+        self.min_similarity = min_similarity
+        self.examples = []
+        self._sizes = []
+        self._keys = []
+        self._postings = {}
+        # 같은 질문의 프롬프트를 여러 번 만드는 경우(프롬프트 해시, 재시도)용 최근 질문 캐시
+        # (크기 제한: 100만 건 입력에서도 메모리가 늘지 않도록)
+        self._ranked = lru_cache(maxsize=4096)(self._rank)
+
+        seen = set()
+        for example in examples:
+            key = _SPACES.sub('', example.question)
+            if (key, example.ground_truth, example.confused_with) in seen:
+                continue
+            seen.add((key, example.ground_truth, example.confused_with))
+            grams = _bigrams(example.question)
+            if not grams:
+                continue
+            example_id = len(self.examples)
+            self.examples.append(example)
+            self._sizes.append(len(grams))
+            self._keys.append(key)
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(example_id)
+
+        # 게시 목록을 튜플로 고정 (조회 전용)
+        self._postings = {gram: tuple(ids) for gram, ids in self._postings.items()}
+
+    def _rank(self, question: str) -> Tuple[int, ...]:
+        grams = _bigrams(question)
+        if not grams:
+            return ()
+        key = _SPACES.sub('', question)
+        overlaps = {}
+        for gram in grams:
+            for example_id in self._postings.get(gram, ()):
+                overlaps[example_id] = overlaps.get(example_id, 0) + 1
+
+        query_size = len(grams)
+        scored = []
+        for example_id, overlap in overlaps.items():
+            # 평가 질문과 같은 예시는 정답 유출이므로 제외
+            if self._keys[example_id] == key:
+                continue
+            score = overlap / math.sqrt(query_size * self._sizes[example_id])
+            if score >= self.min_similarity:
+                scored.append((score, -example_id))
+        return tuple(-neg_id for _, neg_id in heapq.nlargest(self.k, scored))
+
+    def select(self, question: str) -> List[FewShotExample]:
+        """
+        질문과 가장 비슷한 예시 (유사도 내림차순, 같은 질문은 항상 같은 결과)
+
+        Args:
+            question: 분류할 질문
+
+        Returns:
+            FewShotExample 리스트 (최대 k개, 유사한 예시가 없으면 빈 리스트)
+        """
+        return [self.examples[i] for i in self._ranked(question)]
+
+    def __len__(self) -> int:
+        return len(self.examples)
+
+
+def format_examples(examples: Sequence[FewShotExample], intents_by_gt: Dict[str, List[str]],
+                    max_intents: int = 5) -> str:
+    """
+    선택된 예시를 프롬프트 예시 블록으로 변환
+
+    Args:
+        examples: 선택된 예시
+        intents_by_gt: Ground Truth 도메인별 Micro-Intent 이름 (micro_intents.json의 gt 기준)
+        max_intents: 예시당 표시할 Micro-Intent 최대 개수
+
+    Returns:
+        프롬프트 문자열
+    """
+    lines = ["아래는 이 질문과 비슷한 실제 질문의 정답 도메인입니다. 해당 도메인에 속한 세부 의도 중에서 선택하세요.", ""]
+    for i, example in enumerate(examples, 1):
+        lines.append(f"사례 {i}:")
+        lines.append(f"질문: {example.question}")
+        intents = intents_by_gt.get(example.ground_truth, [])[:max_intents]
+        if intents:
+            lines.append(f"정답 도메인: {example.ground_truth} (세부 의도: {', '.join(intents)})")
+        else:
+            lines.append(f"정답 도메인: {example.ground_truth}")
+        if example.confused_with:
+            lines.append(f"주의: '{example.confused_with}'(으)로 잘못 분류되기 쉬운 질문")
+        lines.append("")
+    return '\n'.join(lines) + '\n'
+
+
+def load_few_shot_selector(success_path: str, failure_path: str, k: int = 3) -> Optional[FewShotSelector]:
+    """
+    성공/실패 사례 파일로 선택기 생성
+
+    Args:
+        success_path: domain_success_examples.txt 경로
+        failure_path: domain_failure_examples.txt 경로
+        k: 질문당 예시 개수
+
+    Returns:
+        FewShotSelector (사례가 하나도 없으면 None)
+    """
+    examples = []
+    for path in (success_path, failure_path):
+        if not path:
+            continue
+        if not os.path.exists(path):
+            logging.warning(f"Few-shot 사례 파일을 찾을 수 없습니다 - {path}")
+            continue
+        examples.extend(parse_example_file(path))
+
+    if not examples:
+        logging.warning("Few-shot 사례가 없어 고정 예시를 사용합니다.")
+        return None
+
+    selector = FewShotSelector(examples, k=k)
+    logging.info(f"동적 Few-shot 색인 생성: 사례 {len(selector)}개, 질문당 {k}개 선택")
+    return selector
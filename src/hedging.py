@@ -0,0 +1,243 @@
+"""
+요청 헤징(Hedged Request) 모듈
+느린 LLM 요청의 꼬리 지연(tail latency)을 줄이기 위해, 최근 지연 시간의 백분위수만큼
+기다린 뒤에도 응답이 없으면 중복 요청을 보내고 먼저 끝난 결과를 사용
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class LatencyTracker:
+    """최근 요청 지연 시간의 슬라이딩 윈도우 (스레드 안전)"""
+
+    def __init__(self, window: int = 200):
+        """
+        Args:
+            window: 유지할 최근 지연 시간 샘플 수
+        """
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, latency: float):
+        """
+        지연 시간 샘플 기록
+
+        Args:
+            latency: 요청 지연 시간 (초)
+        """
+        with self._lock:
+            self._samples.append(latency)
+
+    def count(self) -> int:
+        """현재 보유한 샘플 수"""
+        with self._lock:
+            return len(self._samples)
+
+    def percentile(self, p: float) -> Optional[float]:
+        """
+        지연 시간 백분위수 계산 (nearest-rank 방식)
+
+        Args:
+            p: 백분위수 (0 ~ 100)
+
+        Returns:
+            백분위수 지연 시간 (샘플이 없으면 None)
+        """
+        with self._lock:
+            if not self._samples:
+                return None
+            ordered = sorted(self._samples)
+        rank = max(0, min(len(ordered) - 1, int(round(p / 100.0 * len(ordered))) - 1))
+        return ordered[rank]
+
+
+class RequestHedger:
+    """
+    백분위수 지연 기반 요청 헤징기
+
+    1차 요청이 최근 지연 시간의 p 백분위수를 넘기면 동일한 2차 요청을 보내고,
+    먼저 성공한 응답을 사용한다. 추가 부하는 전체 호출 대비 budget 비율로 제한된다.
+    진 요청은 취소 이벤트를 보고 곧 끝나지만 응답을 받을 때까지는 실행 스레드를 차지하므로,
+    중단된 요청이 max_abandoned개 이상 남아 있거나 남는 실행 스레드가 없으면 헤징하지 않는다.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        budget: float = 0.1,
+        min_delay: float = 1.0,
+        initial_delay: float = 10.0,
+        min_samples: int = 20,
+        max_workers: int = 10,
+        max_abandoned: Optional[int] = None,
+    ):
+        """
+        Args:
+            percentile: 헤징 지연 기준 백분위수 (예: 95 → p95 지연 후 헤징)
+            budget: 전체 호출 대비 헤징 요청 허용 비율 (예: 0.1 → 최대 10%)
+            min_delay: 헤징 지연의 하한 (초)
+            initial_delay: 샘플이 충분히 모이기 전 사용할 헤징 지연 (초)
+            min_samples: 백분위수 계산에 필요한 최소 샘플 수
+            max_workers: 요청 실행용 스레드 수 (동시 요청 수의 2배 권장)
+            max_abandoned: 아직 끝나지 않은 중단 요청의 상한 (기본: max_workers의 1/4, 최소 1)
+        """
+        self.percentile = percentile
+        self.budget = budget
+        self.min_delay = min_delay
+        self.initial_delay = initial_delay
+        self.min_samples = min_samples
+        self.max_workers = max_workers
+        self.max_abandoned = max_abandoned if max_abandoned is not None else max(1, max_workers // 4)
+
+        self.latency = LatencyTracker()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='hedge')
+        self._lock = threading.Lock()
+        self._running = 0               # 실행 스레드에서 진행 중인 요청 수
+        self._abandoned_running = 0     # 그중 중단되었지만 아직 끝나지 않은 요청 수
+
+        # 실행 통계
+        self.total_calls = 0
+        self.hedged_calls = 0
+        self.hedge_wins = 0
+        self.budget_denied = 0
+        self.capacity_denied = 0
+        self.cancelled = 0
+        self.abandoned = 0
+
+    def _hedge_delay(self) -> float:
+        """현재 헤징 지연 시간 계산 (초)"""
+        if self.latency.count() < self.min_samples:
+            return max(self.min_delay, self.initial_delay)
+        delay = self.latency.percentile(self.percentile)
+        return max(self.min_delay, delay if delay is not None else self.initial_delay)
+
+    def _acquire_budget(self) -> bool:
+        """헤징 예산과 실행 스레드 여유 확인 및 차감 (허용 시 True)"""
+        with self._lock:
+            if self._abandoned_running >= self.max_abandoned or self._running >= self.max_workers:
+                # 중단된 요청이 스레드를 차지하고 있으면 헤징 요청이 대기열에서 기다리거나
+                # 새 1차 요청이 밀리므로 헤징하지 않음
+                self.capacity_denied += 1
+                return False
+            if self.hedged_calls + 1 > self.budget * self.total_calls:
+                self.budget_denied += 1
+                return False
+            self.hedged_calls += 1
+            return True
+
+    def _timed(self, fn: Callable[[threading.Event], Tuple[Optional[str], Optional[str]]],
+               cancel_event: threading.Event) -> Tuple[Tuple[Optional[str], Optional[str]], float]:
+        """요청 함수 실행 후 (결과, 소요 시간) 반환"""
+        with self._lock:
+            self._running += 1
+        try:
+            start = time.monotonic()
+            result = fn(cancel_event)
+            return result, time.monotonic() - start
+        finally:
+            with self._lock:
+                self._running -= 1
+
+    def _abandon_finished(self, future):
+        """중단된 요청이 끝나 실행 스레드를 돌려줌"""
+        with self._lock:
+            self._abandoned_running -= 1
+
+    def call(
+        self,
+        fn: Callable[[threading.Event], Tuple[Optional[str], Optional[str]]]
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        헤징을 적용하여 요청 실행
+
+        Args:
+            fn: (응답 내용, 오류 메시지)를 반환하는 요청 함수.
+                취소 이벤트를 인자로 받으며, 이벤트가 설정되면 요청을 보내지 않고 진행 중인 요청은 중단해야 함
+                응답 내용이 None이면 실패로 보며, 그 외 값은 그대로 반환하므로 요청별 부가 정보를 함께 담아도 됨
+
+        Returns:
+            (응답 내용, 오류 메시지) 튜플
+        """
+        with self._lock:
+            self.total_calls += 1
+
+        primary_cancel = threading.Event()
+        primary_start = time.monotonic()
+        primary = self._executor.submit(self._timed, fn, primary_cancel)
+
+        done, _ = wait([primary], timeout=self._hedge_delay())
+        if done or not self._acquire_budget():
+            result, latency = primary.result()
+            if result[0] is not None:
+                self.latency.record(latency)
+            return result
+
+        logging.debug("요청 지연으로 헤징 요청 전송")
+        hedge_cancel = threading.Event()
+        hedge = self._executor.submit(self._timed, fn, hedge_cancel)
+        pending = {primary: primary_cancel, hedge: hedge_cancel}
+
+        # 먼저 성공한 응답 사용 (둘 다 실패하면 마지막 오류 반환)
+        result = (None, "헤징 요청 실패")
+        while pending:
+            done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.pop(future)
+                result, latency = future.result()
+                if result[0] is None:
+                    continue
+
+                if future is hedge:
+                    # 헤징 요청의 지연(헤징 시점부터)만 기록하면 느린 1차 요청이 빠져 백분위가 계속 낮아지므로,
+                    # 1차 요청을 보낸 뒤 지금까지의 시간(1차 요청 지연의 하한)을 기록
+                    self.latency.record(time.monotonic() - primary_start)
+                    with self._lock:
+                        self.hedge_wins += 1
+                else:
+                    self.latency.record(latency)
+
+                # 나머지 요청 중단: 시작 전이면 실행되지 않고(cancelled),
+                # 진행 중이면 응답 헤더를 받는 즉시 또는 다음 재시도 전에 취소 이벤트를 보고 끝남(abandoned)
+                for other, cancel_event in pending.items():
+                    cancel_event.set()
+                    if other.cancel():
+                        with self._lock:
+                            self.cancelled += 1
+                        continue
+                    with self._lock:
+                        self.abandoned += 1
+                        self._abandoned_running += 1
+                    other.add_done_callback(self._abandon_finished)
+                return result
+
+        return result
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        헤징 통계 반환
+
+        Returns:
+            통계 딕셔너리
+        """
+        with self._lock:
+            return {
+                'total_calls': self.total_calls,
+                'hedged_calls': self.hedged_calls,
+                'hedge_wins': self.hedge_wins,
+                'budget_denied': self.budget_denied,
+                'capacity_denied': self.capacity_denied,
+                'abandoned_running': self._abandoned_running,
+                'cancelled': self.cancelled,
+                'abandoned': self.abandoned,
+                'hedge_rate': self.hedged_calls / self.total_calls if self.total_calls else 0.0,
+                'current_delay': self._hedge_delay(),
+            }
+
+    def close(self):
+        """실행 스레드 종료 (진행 중인 요청은 기다리지 않음)"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
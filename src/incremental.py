@@ -0,0 +1,122 @@
+"""
+증분 재평가 모듈
+행별 지문(프롬프트 해시, Ground Truth, 매처 버전)을 이전 실행과 비교하여
+LLM 재호출 / 저장된 응답으로 재채점 / 이전 결과 재사용 대상을 나눔
+
+- 프롬프트 해시: 질문, 프롬프트 템플릿, 의도 목록(micro_intents.json), 모델 중 하나라도 바뀌면 변경 → LLM 재호출
+  (저장소는 행별로 프롬프트 버전마다 응답을 보관하므로, 이전 프롬프트로 되돌리면 저장된 응답을 다시 사용)
+- Ground Truth 또는 매처 버전(파서/매처 코드 해시)만 바뀜 → 저장된 원본 응답으로 로컬 재채점
+- 모두 같음 → 이전 결과 재사용 (저장된 응답에서 결과를 복원, LLM 호출 없음)
+"""
+
+import logging
+from typing import Any, Dict, List, Tuple
+
+from .llm_classifier import matcher_version
+from .response_store import ResponseStore, prompt_key
+
+
+class IncrementalPlan:
+    """행별 처리 방식 분류 결과"""
+
+    def __init__(self):
+        self.to_call = []       # LLM 호출 대상 질문
+        self.to_rescore = []    # (질문, 저장 항목) - GT/매처 변경으로 재채점
+        self.to_reuse = []      # (질문, 저장 항목) - 변경 없음
+        self.new_rows = 0       # to_call 중 저장된 응답이 없는 행
+        self.prompt_changed = 0  # to_call 중 프롬프트가 바뀐 행
+        self.gt_changed = 0
+        self.matcher_changed = 0
+
+    def summary(self) -> str:
+        """로그 출력용 요약 문자열"""
+        return (f"LLM 호출 {len(self.to_call)}건 (신규 {self.new_rows}, 프롬프트 변경 {self.prompt_changed}), "
+                f"재채점 {len(self.to_rescore)}건 (GT 변경 {self.gt_changed}, 매처 변경 {self.matcher_changed}), "
+                f"재사용 {len(self.to_reuse)}건")
+
+
+def classifier_prompt_key(classifier, prompt: str) -> str:
+    """분류기 설정(Provider, 모델) 기준 프롬프트 해시"""
+    return prompt_key(classifier.provider, classifier.config.get('model'), prompt)
+
+
+def plan_incremental(classifier, questions: List[Dict[str, Any]], store: ResponseStore) -> IncrementalPlan:
+    """
+    질문별 지문을 저장소와 비교하여 처리 방식 결정
+
+    Args:
+        classifier: LLM 분류기 (프롬프트 생성용)
+        questions: 질문 데이터 리스트
+        store: 이전 실행의 응답 저장소
+
+    Returns:
+        IncrementalPlan
+    """
+    plan = IncrementalPlan()
+    version = matcher_version()
+
+    for item in questions:
+        # 현재 프롬프트의 응답이 있으면 사용 (이전 프롬프트로 되돌린 경우에도 재사용)
+        prompt_hash = classifier_prompt_key(classifier, classifier._build_prompt(item['question']))
+        entry = store.get(item['row'], prompt_hash)
+        if entry is None:
+            if store.get(item['row']) is None:
+                plan.new_rows += 1
+            else:
+                plan.prompt_changed += 1
+            plan.to_call.append(item)
+            continue
+
+        gt_changed = entry.get('ground_truth') != item['ground_truth']
+        matcher_changed = entry.get('matcher_version') != version
+        if gt_changed or matcher_changed:
+            plan.gt_changed += gt_changed
+            plan.matcher_changed += matcher_changed
+            plan.to_rescore.append((item, entry))
+        else:
+            plan.to_reuse.append((item, entry))
+
+    logging.info(f"증분 실행 계획: {plan.summary()}")
+    return plan
+
+
+def make_entry(classifier, item: Dict[str, Any], meta: Dict[str, Any], usage: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    LLM 호출 결과로 저장 항목 생성
+
+    Args:
+        classifier: LLM 분류기
+        item: 질문 데이터
+        meta: classify_detailed가 채운 부가 정보 (prompt, response)
+        usage: 토큰 사용량
+
+    Returns:
+        저장 항목
+    """
+    return {
+        'row': item['row'],
+        'prompt_hash': classifier_prompt_key(classifier, meta['prompt']),
+        'ground_truth': item['ground_truth'],
+        'matcher_version': matcher_version(),
+        'response': meta['response'],
+        'usage': usage,
+    }
+
+
+def restamp_entry(entry: Dict[str, Any], item: Dict[str, Any]) -> Dict[str, Any]:
+    """재채점한 항목의 GT/매처 버전 갱신 (다음 실행에서 재사용 대상이 되도록)"""
+    return dict(entry, ground_truth=item['ground_truth'], matcher_version=matcher_version())
+
+
+def local_inputs(plan: IncrementalPlan) -> List[Tuple[Dict[str, Any], Dict[str, Any], bool]]:
+    """
+    로컬 처리 대상 (질문, 저장 항목, 재채점 여부) 리스트
+
+    Args:
+        plan: IncrementalPlan
+
+    Returns:
+        재채점 대상 → 재사용 대상 순 리스트
+    """
+    return ([(item, entry, True) for item, entry in plan.to_rescore] +
+            [(item, entry, False) for item, entry in plan.to_reuse])
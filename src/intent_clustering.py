@@ -0,0 +1,292 @@
+"""
+의도 발견 클러스터링 모듈
+라벨이 없는 질문을 글자 n-gram 해싱 + TF-IDF로 벡터화하고 MiniBatchKMeans로 군집화하여,
+군집별 대표 키워드와 가장 가까운 기존 Micro-Intent를 찾고 기존 목록이 다루지 못하는 군집을 표시
+
+- 벡터화: HashingVectorizer(char_wb 2~3-gram)는 상태가 없어 어휘 사전 없이 배치 단위로 변환 가능
+- 입력을 여러 번 스트리밍(IDF 집계 → 학습 → 할당)하며, 한 번에 batch_size개 질문의 희소 행렬만 메모리에 올림
+- scikit-learn은 이 모듈을 사용할 때만 필요 (pip install scikit-learn)
+"""
+
+import logging
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .ngram_mining import NGramMiner
+
+
+def _import_sklearn():
+    """scikit-learn 지연 import (클러스터링 사용 시에만 필요)"""
+    try:
+        import sklearn.cluster
+        import sklearn.feature_extraction.text
+        import sklearn.preprocessing
+        return sklearn
+    except ImportError:
+        raise ImportError("의도 발견 클러스터링에는 scikit-learn이 필요합니다. (pip install scikit-learn)")
+
+
+def _batches(records: Iterable[Tuple[str, Optional[str]]], batch_size: int) -> Iterator[List[Tuple[str, Optional[str]]]]:
+    """(질문, Ground Truth) 스트림을 batch_size개씩 묶음 (빈 질문 제외)"""
+    batch = []
+    for question, ground_truth in records:
+        if not question:
+            continue
+        batch.append((question, ground_truth))
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class IntentClusterer:
+    """
+    스트리밍 의도 군집화
+
+    corpus_factory()는 호출할 때마다 같은 (질문, Ground Truth) 스트림을 처음부터 반환해야 한다.
+    """
+
+    def __init__(
+        self,
+        n_clusters: int = 50,
+        n_features: int = 2 ** 16,
+        ngram_range: Tuple[int, int] = (2, 3),
+        batch_size: int = 4096,
+        seed: int = 0
+    ):
+        """
+        Args:
+            n_clusters: 군집 수
+            n_features: 해싱 특성 차원 (군집 중심 메모리 = n_clusters × n_features × 8바이트)
+            ngram_range: 글자 n-gram 범위
+            batch_size: 배치당 질문 수
+            seed: MiniBatchKMeans 난수 시드
+        """
+        sklearn = _import_sklearn()
+        self.n_clusters = n_clusters
+        self.batch_size = batch_size
+        self.vectorizer = sklearn.feature_extraction.text.HashingVectorizer(
+            analyzer='char_wb', ngram_range=ngram_range, n_features=n_features,
+            alternate_sign=False, norm=None
+        )
+        self.kmeans = sklearn.cluster.MiniBatchKMeans(
+            n_clusters=n_clusters, batch_size=batch_size, random_state=seed, n_init=3
+        )
+        self._normalize = sklearn.preprocessing.normalize
+        self.idf = None
+        self.documents = 0
+
+    def transform(self, texts: List[str]):
+        """
+        텍스트를 L2 정규화된 TF-IDF 희소 행렬로 변환
+
+        Args:
+            texts: 텍스트 리스트
+
+        Returns:
+            CSR 희소 행렬 (len(texts) × n_features)
+        """
+        import numpy as np
+
+        matrix = self.vectorizer.transform(texts)
+        matrix.data = 1.0 + np.log(matrix.data)   # 부선형 TF
+        return self._normalize(matrix.multiply(self.idf).tocsr())
+
+    def fit_idf(self, corpus_factory: Callable[[], Iterable[Tuple[str, Optional[str]]]]):
+        """1차 패스: 특성별 문서 빈도로 IDF 계산"""
+        import numpy as np
+
+        df = np.zeros(self.vectorizer.n_features, dtype=np.int64)
+        documents = 0
+        for batch in _batches(corpus_factory(), self.batch_size):
+            matrix = self.vectorizer.transform([q for q, _ in batch])
+            df += np.bincount(matrix.indices, minlength=df.shape[0])
+            documents += len(batch)
+        self.documents = documents
+        self.idf = np.log((1 + documents) / (1 + df)) + 1.0
+        logging.info(f"IDF 집계 완료: 질문 {documents:,}건")
+
+    def fit(self, corpus_factory: Callable[[], Iterable[Tuple[str, Optional[str]]]], epochs: int = 1):
+        """
+        IDF 집계 후 배치 단위로 MiniBatchKMeans 학습
+
+        Args:
+            corpus_factory: (질문, Ground Truth) 스트림 생성 함수
+            epochs: 학습 패스 수
+        """
+        self.fit_idf(corpus_factory)
+        if self.documents < self.n_clusters:
+            raise ValueError(f"질문 수({self.documents})가 군집 수({self.n_clusters})보다 적습니다.")
+
+        for epoch in range(1, epochs + 1):
+            pending = []
+            for batch in _batches(corpus_factory(), self.batch_size):
+                pending.extend(q for q, _ in batch)
+                # 첫 partial_fit은 군집 수 이상의 샘플이 필요하므로 부족하면 다음 배치와 합침
+                if len(pending) < max(self.n_clusters * 3, self.batch_size):
+                    continue
+                self.kmeans.partial_fit(self.transform(pending))
+                pending = []
+            if pending:
+                if hasattr(self.kmeans, 'cluster_centers_') or len(pending) >= self.n_clusters:
+                    self.kmeans.partial_fit(self.transform(pending))
+            logging.info(f"MiniBatchKMeans 학습 {epoch}/{epochs} 완료")
+        return self
+
+    def assign(
+        self,
+        corpus_factory: Callable[[], Iterable[Tuple[str, Optional[str]]]],
+        top_terms: int = 8,
+        sample_size: int = 5
+    ) -> Tuple[NGramMiner, List[Counter], List[float]]:
+        """
+        최종 패스: 질문을 군집에 할당하며 군집별 키워드 / Ground Truth 분포 / 응집도 집계
+
+        Args:
+            corpus_factory: (질문, Ground Truth) 스트림 생성 함수
+            top_terms: 군집별 키워드 개수 (NGramMiner 그룹 카운터 상한 계산용)
+            sample_size: 군집별 샘플 질문 수
+
+        Returns:
+            (군집 id를 그룹으로 한 NGramMiner, 군집별 Ground Truth Counter, 군집별 중심과의 평균 코사인 유사도)
+        """
+        import numpy as np
+
+        miner = NGramMiner(capacity=0, group_capacity=max(top_terms * 50, 500), sample_size=sample_size)
+        ground_truths = [Counter() for _ in range(self.n_clusters)]
+        similarity_sum = np.zeros(self.n_clusters)
+        sizes = np.zeros(self.n_clusters, dtype=np.int64)
+        centers = self._normalize(self.kmeans.cluster_centers_)
+
+        for batch in _batches(corpus_factory(), self.batch_size):
+            matrix = self.transform([q for q, _ in batch])
+            labels = self.kmeans.predict(matrix)
+            # 희소 행렬 × 중심(질문 × 군집)만 계산하여 배치 × n_features 밀집 배열을 만들지 않음
+            similarity = np.asarray(matrix @ centers.T)[np.arange(len(labels)), labels]
+            np.add.at(similarity_sum, labels, similarity)
+            np.add.at(sizes, labels, 1)
+            for (question, ground_truth), label in zip(batch, labels):
+                miner.add(question, int(label))
+                if ground_truth:
+                    ground_truths[label][ground_truth] += 1
+
+        cohesion = [float(similarity_sum[i] / sizes[i]) if sizes[i] else 0.0 for i in range(self.n_clusters)]
+        return miner, ground_truths, cohesion
+
+    def match_intents(self, catalogue: Dict[str, Dict[str, Any]]) -> List[Tuple[Optional[str], float]]:
+        """
+        군집 중심과 가장 가까운 기존 Micro-Intent (이름 + 설명의 TF-IDF 코사인 유사도)
+
+        Args:
+            catalogue: micro_intents.json 데이터
+
+        Returns:
+            군집별 (Micro-Intent 이름, 유사도) 리스트 (목록이 비어 있으면 (None, 0.0))
+        """
+        if not catalogue:
+            return [(None, 0.0)] * self.n_clusters
+        names = list(catalogue)
+        texts = [f"{name} {info.get('desc', '')}" if isinstance(info, dict) else name
+                 for name, info in catalogue.items()]
+        intent_matrix = self.transform(texts)
+        centers = self._normalize(self.kmeans.cluster_centers_)
+        similarity = intent_matrix.dot(centers.T).T     # 군집 × 의도
+        best = similarity.argmax(axis=1)
+        return [(names[best[i]], float(similarity[i, best[i]])) for i in range(self.n_clusters)]
+
+
+def discover_intents(
+    corpus_factory: Callable[[], Iterable[Tuple[str, Optional[str]]]],
+    catalogue: Optional[Dict[str, Dict[str, Any]]] = None,
+    n_clusters: int = 50,
+    coverage_threshold: float = 0.2,
+    top_terms: int = 8,
+    sample_size: int = 5,
+    **kwargs
+) -> Dict[str, Any]:
+    """
+    질문 군집화 후 군집별 보고서 생성
+
+    Args:
+        corpus_factory: (질문, Ground Truth) 스트림 생성 함수 (호출마다 처음부터)
+        catalogue: micro_intents.json 데이터 (기존 의도 매핑용)
+        n_clusters: 군집 수
+        coverage_threshold: 기존 의도와의 유사도가 이 값 미만이면 미커버 군집으로 표시
+        top_terms: 군집별 키워드 개수
+        sample_size: 군집별 샘플 질문 수
+        **kwargs: IntentClusterer 생성 인자 (n_features, batch_size, seed 등)
+
+    Returns:
+        {'questions', 'n_clusters', 'uncovered', 'clusters': [...]} (군집은 크기 내림차순)
+    """
+    clusterer = IntentClusterer(n_clusters=n_clusters, **kwargs).fit(corpus_factory)
+    miner, ground_truths, cohesion = clusterer.assign(corpus_factory, top_terms, sample_size)
+    matches = clusterer.match_intents(catalogue or {})
+    summary = miner.group_summary(top=top_terms)
+
+    clusters = []
+    for cluster_id in range(n_clusters):
+        info = summary.get(cluster_id)
+        if info is None:
+            continue
+        keywords = info['keywords']
+        intent, similarity = matches[cluster_id]
+        gt_counts = ground_truths[cluster_id]
+        top_gt = gt_counts.most_common(1)
+        clusters.append({
+            'cluster': cluster_id,
+            'size': info['count'],
+            'label': ' / '.join(word for word, _ in keywords[:3]),
+            'keywords': keywords,
+            'cohesion': round(cohesion[cluster_id], 4),
+            'nearest_intent': intent,
+            'intent_similarity': round(similarity, 4),
+            'covered': intent is not None and similarity >= coverage_threshold,
+            'ground_truth': top_gt[0][0] if top_gt else None,
+            'ground_truth_purity': (round(top_gt[0][1] / sum(gt_counts.values()), 4)
+                                    if top_gt else None),
+            'samples': info['samples'],
+        })
+
+    clusters.sort(key=lambda c: -c['size'])
+    uncovered = sum(not c['covered'] for c in clusters)
+    logging.info(f"군집화 완료: 질문 {clusterer.documents:,}건, 군집 {len(clusters)}개 "
+                 f"(기존 의도로 설명되지 않는 군집 {uncovered}개)")
+    return {
+        'questions': clusterer.documents,
+        'n_clusters': len(clusters),
+        'coverage_threshold': coverage_threshold,
+        'uncovered': uncovered,
+        'clusters': clusters,
+    }
+
+
+def format_cluster_report(report: Dict[str, Any], limit: Optional[int] = None) -> str:
+    """
+    군집 보고서를 Markdown 표로 변환
+
+    Args:
+        report: discover_intents 결과
+        limit: 출력할 군집 수 (None이면 전체)
+
+    Returns:
+        Markdown 문자열
+    """
+    lines = [
+        "# 의도 발견 군집 보고서",
+        "",
+        f"- 질문 수: {report['questions']:,}",
+        f"- 군집 수: {report['n_clusters']} (미커버 {report['uncovered']}개, 유사도 기준 {report['coverage_threshold']})",
+        "",
+        "| 군집 | 크기 | 대표 키워드 | 응집도 | 가장 가까운 Micro-Intent | 유사도 | 주요 GT (비율) | 커버 |",
+        "|------|------|-------------|--------|--------------------------|--------|----------------|------|",
+    ]
+    for c in report['clusters'][:limit]:
+        gt = f"{c['ground_truth']} ({c['ground_truth_purity'] * 100:.0f}%)" if c['ground_truth'] else '-'
+        lines.append(
+            f"| {c['cluster']} | {c['size']:,} | {c['label']} | {c['cohesion']:.2f} | "
+            f"{c['nearest_intent'] or '-'} | {c['intent_similarity']:.2f} | {gt} | "
+            f"{'O' if c['covered'] else '**미커버**'} |"
+        )
+    return '\n'.join(lines) + '\n'
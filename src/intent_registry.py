@@ -0,0 +1,253 @@
+"""
+의도(Intent) 레지스트리 모듈
+의도 이름을 작은 정수 ID로 변환(intern)하여 행별 결과를 정수로 저장하고, 출력 시점에만 이름으로 복원
+"""
+
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+
+# 매칭 종류 코드 (ResultRecord.matches에 저장)
+MATCH_EXACT = 0
+MATCH_FUZZY = 1
+MATCH_NONE = 2
+
+# 카탈로그에 없는 이름의 ID (Evaluator 정수 배열용, 원문 이름은 따로 보관)
+UNKNOWN_ID = -1
+
+# 카탈로그 의도는 정수 ID, 카탈로그에 없는 이름(매칭 실패한 LLM 출력, 자유 입력 GT)은 원문 문자열
+IntentCode = Union[int, str]
+
+
+class IntentRegistry:
+    """
+    의도 이름 ↔ 정수 ID 레지스트리 (스레드 안전)
+
+    비교 기준은 `.strip().lower()`로 정규화한 이름이며, 정규화는 서로 다른 원문 문자열마다 한 번만 수행된다.
+    ID는 처음 등록된 순서대로 0부터 부여되고, 이름 복원 시 처음 등록된 표기를 사용한다.
+    채점(code/encode/hit_rank)은 이름을 등록하지 않으므로, 카탈로그에 없는 이름이 행마다 나와도
+    레지스트리 크기는 카탈로그 크기로 유지된다.
+    """
+
+    def __init__(self, names: Iterable[str] = ()):
+        """
+        Args:
+            names: 미리 등록할 의도 이름 (예: micro_intents.json 카탈로그)
+        """
+        self._raw_ids = {}     # 원문 문자열 → ID (정규화 생략용 캐시)
+        self._norm_ids = {}    # 정규화된 이름 → ID
+        self._names = []       # ID → 대표 이름
+        self._lock = threading.Lock()
+        for name in names:
+            self.intern(name)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def intern(self, name: str) -> int:
+        """
+        의도 이름의 ID 반환 (없으면 새로 등록)
+
+        Args:
+            name: 의도 이름
+
+        Returns:
+            정수 ID
+        """
+        intent_id = self._raw_ids.get(name)
+        if intent_id is not None:
+            return intent_id
+
+        with self._lock:
+            key = name.strip().lower()
+            intent_id = self._norm_ids.get(key)
+            if intent_id is None:
+                intent_id = len(self._names)
+                self._names.append(name.strip())
+                self._norm_ids[key] = intent_id
+            self._raw_ids[name] = intent_id
+            return intent_id
+
+    def lookup(self, name: str) -> Optional[int]:
+        """
+        등록된 의도 이름의 ID 조회 (등록하지 않음)
+
+        Args:
+            name: 의도 이름
+
+        Returns:
+            정수 ID (없으면 None)
+        """
+        intent_id = self._raw_ids.get(name)
+        if intent_id is None:
+            intent_id = self._norm_ids.get(name.strip().lower())
+        return intent_id
+
+    def code(self, name: str) -> IntentCode:
+        """
+        등록된 이름은 ID로, 등록되지 않은 이름은 등록하지 않고 원문(앞뒤 공백 제거)으로 반환
+
+        Args:
+            name: 의도 이름
+
+        Returns:
+            정수 ID 또는 원문 이름
+        """
+        intent_id = self.lookup(name)
+        return intent_id if intent_id is not None else name.strip()
+
+    def _key(self, code: IntentCode) -> IntentCode:
+        """비교 키 (ID 또는 정규화된 미등록 이름, ID와 이름은 서로 같지 않음)"""
+        if isinstance(code, int):
+            return code
+        intent_id = self.lookup(code)
+        return intent_id if intent_id is not None else code.strip().lower()
+
+    def same(self, a: IntentCode, b: IntentCode) -> bool:
+        """두 이름(또는 ID)이 같은 의도인지 여부 (대소문자 무시, 공백 제거)"""
+        return self._key(a) == self._key(b)
+
+    def hit_rank(self, ground_truth: IntentCode, codes: Iterable[IntentCode]) -> int:
+        """
+        Top-K 결과에서 정답 순위 계산 (이름을 등록하지 않음)
+
+        Args:
+            ground_truth: 정답 이름 또는 ID
+            codes: Top-K 분류 결과 (이름 또는 ID)
+
+        Returns:
+            정답 순위 (1부터, 미적중 시 0)
+        """
+        target = self._key(ground_truth)
+        for rank, code in enumerate(codes, 1):
+            if self._key(code) == target:
+                return rank
+        return 0
+
+    def name(self, intent_id: IntentCode) -> str:
+        """ID를 의도 이름으로 복원 (미등록 원문 이름은 그대로)"""
+        return intent_id if isinstance(intent_id, str) else self._names[intent_id]
+
+    def encode(self, names: Iterable[str]) -> Tuple[IntentCode, ...]:
+        """이름 리스트를 code() 튜플로 변환"""
+        return tuple(self.code(name) for name in names)
+
+    def decode(self, ids: Iterable[IntentCode]) -> List[str]:
+        """ID 리스트를 이름 리스트로 복원"""
+        return [self.name(i) for i in ids]
+
+
+def format_match_details(registry: IntentRegistry, matches: Iterable[Tuple[IntentCode, int, float]]) -> str:
+    """
+    매칭 상세 정보를 문자열로 변환 (분류 의견 출력용)
+
+    Args:
+        registry: 의도 레지스트리
+        matches: (의도 ID 또는 미매칭 원문, 매칭 종류, 유사도) 튜플 리스트
+
+    Returns:
+        예: "주소/연락처 변경 (Exact), 청구 서류 안내 (Fuzzy: 0.85)"
+    """
+    details = []
+    for intent_id, kind, score in matches:
+        name = registry.name(intent_id)
+        if kind == MATCH_EXACT:
+            details.append(f"{name} (Exact)")
+        elif kind == MATCH_FUZZY:
+            details.append(f"{name} (Fuzzy: {score:.2f})")
+        else:
+            details.append(f"{name} (No Match: {score:.2f})")
+    return ', '.join(details)
+
+
+class ResultRecord:
+    """
+    행별 분류 결과 (정수 ID 기반, __slots__로 메모리 절약)
+
+    기존 결과 딕셔너리와 같은 키로 읽을 수 있으며(result['classified_domains'] 등),
+    이름과 분류 의견 문자열은 읽는 시점에 레지스트리로 복원된다.
+    """
+
+    __slots__ = ('registry', 'row', 'classified_ids', 'hit_rank', 'reason', 'opinion_category', 'matches',
+                 'prompt_tokens', 'completion_tokens')
+
+    KEYS = ('row', 'classified_domain', 'classified_domains', 'hit_rank', 'success', 'opinion', 'opinion_category',
+            'prompt_tokens', 'completion_tokens')
+
+    def __init__(
+        self,
+        registry: IntentRegistry,
+        row: int,
+        classified_ids: Tuple[IntentCode, ...],
+        hit_rank: int,
+        reason: str,
+        opinion_category: str,
+        matches: Tuple[Tuple[IntentCode, int, float], ...] = (),
+        prompt_tokens: Optional[int] = None,
+        completion_tokens: Optional[int] = None
+    ):
+        """
+        Args:
+            registry: 의도 레지스트리
+            row: 행 번호
+            classified_ids: Top-K 분류 결과 (카탈로그 의도는 ID, 그 외는 원문 이름)
+            hit_rank: 정답 순위 (1부터, 미적중 시 0)
+            reason: LLM 분류 이유
+            opinion_category: 의견 구분
+            matches: (의도 ID 또는 미매칭 원문, 매칭 종류, 유사도) 튜플 (분류 의견 복원용)
+            prompt_tokens: 프롬프트 토큰 수
+            completion_tokens: 응답 토큰 수
+        """
+        self.registry = registry
+        self.row = row
+        self.classified_ids = classified_ids
+        self.hit_rank = hit_rank
+        self.reason = reason
+        self.opinion_category = opinion_category
+        self.matches = matches
+        self.prompt_tokens = prompt_tokens
+        self.completion_tokens = completion_tokens
+
+    @property
+    def success(self) -> str:
+        return 'O' if self.hit_rank else 'X'
+
+    def _value(self, key: str) -> Any:
+        if key == 'row':
+            return self.row
+        if key == 'classified_domain':
+            return self.registry.name(self.classified_ids[0]) if self.classified_ids else "없음"
+        if key == 'classified_domains':
+            return self.registry.decode(self.classified_ids)
+        if key == 'hit_rank':
+            return self.hit_rank or None
+        if key == 'success':
+            return self.success
+        if key == 'opinion':
+            return f"{self.reason} [매칭: {format_match_details(self.registry, self.matches)}]"
+        if key == 'opinion_category':
+            return self.opinion_category
+        if key == 'prompt_tokens':
+            return self.prompt_tokens
+        if key == 'completion_tokens':
+            return self.completion_tokens
+        raise KeyError(key)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._value(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._value(key) if key in self.KEYS else default
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.KEYS
+
+    def keys(self) -> Tuple[str, ...]:
+        return self.KEYS
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.KEYS)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """기존 형식의 결과 딕셔너리로 변환"""
+        return {key: self._value(key) for key in self.KEYS}
@@ -0,0 +1,357 @@
+"""
+입출력 백엔드 모듈
+Excel 외에 CSV / JSONL / Parquet 형식의 질문 입력과 결과 출력을 동일한 논리 스키마로 제공
+
+입력 스키마: row, question, ground_truth, success
+결과 스키마: row, question, ground_truth, classified_domains, hit_rank, success, opinion_category
+"""
+
+import csv
+import json
+import logging
+import os
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterator, List
+
+
+# 결과 레코드 필드 (모든 출력 형식 공통)
+RESULT_FIELDS = (
+    'row', 'question', 'ground_truth', 'classified_domains', 'hit_rank', 'success', 'opinion_category'
+)
+
+# 입력 컬럼 별칭 (Excel에서 내보낸 CSV 헤더도 그대로 읽을 수 있도록)
+INPUT_COLUMN_ALIASES = {
+    'question': ('question', 'Question'),
+    'ground_truth': ('ground_truth', '도메인 Ground Truth'),
+    'success': ('success', '성공 여부', '성공여부'),
+}
+
+SUPPORTED_FORMATS = ('xlsx', 'csv', 'jsonl', 'parquet')
+
+
+def detect_format(path: str) -> str:
+    """
+    파일 확장자로 형식 판별
+
+    Args:
+        path: 파일 경로
+
+    Returns:
+        형식 문자열 ('xlsx', 'csv', 'jsonl', 'parquet')
+    """
+    ext = os.path.splitext(path)[1].lower().lstrip('.')
+    if ext == 'ndjson':
+        ext = 'jsonl'
+    if ext not in SUPPORTED_FORMATS:
+        raise ValueError(f"지원하지 않는 파일 형식 - {path} (지원: {', '.join(SUPPORTED_FORMATS)})")
+    return ext
+
+
+def _import_pyarrow():
+    """pyarrow 지연 import (Parquet 사용 시에만 필요)"""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+        return pyarrow
+    except ImportError:
+        raise ImportError("Parquet 입출력에는 pyarrow가 필요합니다. (pip install pyarrow)")
+
+
+def _normalize_question(raw: Dict[str, Any], default_row: int) -> Dict[str, Any]:
+    """원본 레코드를 입력 스키마로 변환"""
+    values = {}
+    for field, aliases in INPUT_COLUMN_ALIASES.items():
+        value = next((raw[a] for a in aliases if raw.get(a) is not None), "")
+        values[field] = str(value).strip()
+
+    row = raw.get('row')
+    return {
+        "row": int(row) if row not in (None, "") else default_row,
+        "question": values['question'],
+        "ground_truth": values['ground_truth'],
+        "success": values['success']
+    }
+
+
+def _iter_raw_records(path: str, file_format: str) -> Iterator[Dict[str, Any]]:
+    """형식별 원본 레코드 스트리밍"""
+    if file_format == 'csv':
+        with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+            yield from csv.DictReader(f)
+    elif file_format == 'jsonl':
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+    elif file_format == 'parquet':
+        pa = _import_pyarrow()
+        parquet_file = pa.parquet.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=10000):
+            yield from batch.to_pylist()
+    else:
+        raise ValueError(f"스트리밍을 지원하지 않는 입력 형식 - {file_format}")
+
+
+def iter_questions(path: str, success_filter: str = 'all') -> Iterator[Dict[str, Any]]:
+    """
+    CSV / JSONL / Parquet 파일에서 질문 데이터를 한 건씩 읽기
+
+    row 컬럼이 없으면 Excel과 같은 행 번호 체계(헤더 다음 행 = 2)를 사용
+
+    Args:
+        path: 입력 파일 경로
+        success_filter: 성공여부 필터 ('all', 'O', 'X')
+
+    Yields:
+        {"row": 행번호, "question": 질문, "ground_truth": 정답도메인, "success": 성공여부}
+    """
+    file_format = detect_format(path)
+    for index, raw in enumerate(_iter_raw_records(path, file_format), start=2):
+        item = _normalize_question(raw, default_row=index)
+
+        # 빈 행은 스킵
+        if not item['question']:
+            continue
+
+        # 성공여부 필터 적용
+        if success_filter != 'all' and item['success'] != success_filter:
+            continue
+
+        yield item
+
+
+def read_questions(path: str, success_filter: str = 'all') -> List[Dict[str, Any]]:
+    """
+    CSV / JSONL / Parquet 파일에서 질문 데이터 전체 읽기
+
+    Args:
+        path: 입력 파일 경로
+        success_filter: 성공여부 필터 ('all', 'O', 'X')
+
+    Returns:
+        질문 데이터 리스트 (ExcelHandler.read_questions와 동일한 형식)
+    """
+    if not os.path.exists(path):
+        logging.error(f"파일을 찾을 수 없습니다 - {path}")
+        return []
+
+    try:
+        questions = list(iter_questions(path, success_filter))
+    except Exception as e:
+        logging.error(f"입력 파일 로드 실패 - {e}")
+        return []
+
+    logging.info(f"총 {len(questions)}개의 질문을 읽었습니다. ({path})")
+    return questions
+
+
+def load_input_questions(path: str, success_filter: str = 'all') -> List[Dict[str, Any]]:
+    """
+    형식에 관계없이 입력 파일의 질문 전체 읽기 (엑셀은 읽은 후 바로 닫음)
+
+    Args:
+        path: 입력 파일 경로 (.xlsx / .csv / .jsonl / .parquet)
+        success_filter: 성공여부 필터 ('all', 'O', 'X')
+
+    Returns:
+        질문 데이터 리스트 (읽을 수 없으면 빈 리스트)
+    """
+    if detect_format(path) != 'xlsx':
+        return read_questions(path, success_filter=success_filter)
+
+    # openpyxl은 엑셀 입력일 때만 import
+    from .excel_handler import ExcelHandler
+
+    excel_handler = ExcelHandler(path)
+    if not excel_handler.load():
+        return []
+    try:
+        return excel_handler.read_questions(success_filter=success_filter)
+    finally:
+        excel_handler.close()
+
+
+def to_result_record(result: Dict[str, Any], item: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    분류 결과와 원본 질문으로 결과 스키마 레코드 생성
+
+    Args:
+        result: 분류 결과 딕셔너리 (process_single_question 반환값)
+        item: 원본 질문 데이터
+
+    Returns:
+        RESULT_FIELDS 순서의 결과 레코드
+    """
+    return {
+        'row': result['row'],
+        'question': item.get('question', ''),
+        'ground_truth': item.get('ground_truth', ''),
+        'classified_domains': result.get('classified_domains', [result['classified_domain']]),
+        'hit_rank': result.get('hit_rank'),
+        'success': result['success'],
+        'opinion_category': result['opinion_category']
+    }
+
+
+class ResultWriter(ABC):
+    """결과 레코드를 생성 즉시 파일에 추가하는 Writer 기본 클래스"""
+
+    def __init__(self, path: str, append: bool = False):
+        """
+        Args:
+            path: 출력 파일 경로
+            append: 기존 파일에 이어서 쓸지 여부
+        """
+        self.path = path
+        self.append = append
+        self.count = 0
+
+        output_dir = os.path.dirname(path)
+        if output_dir and not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+
+    def write(self, record: Dict[str, Any]):
+        """
+        결과 레코드 1건 기록
+
+        Args:
+            record: RESULT_FIELDS를 가진 결과 레코드
+        """
+        self._write(record)
+        self.count += 1
+
+    @abstractmethod
+    def _write(self, record: Dict[str, Any]):
+        """결과 레코드 1건을 형식에 맞게 기록"""
+
+    def close(self):
+        """파일 닫기 (버퍼 기록)"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class JsonlResultWriter(ResultWriter):
+    """JSONL 결과 Writer (1줄 = 1레코드, 기록 즉시 flush)"""
+
+    def __init__(self, path: str, append: bool = False):
+        super().__init__(path, append)
+        self._file = open(path, 'a' if append else 'w', encoding='utf-8')
+
+    def _write(self, record: Dict[str, Any]):
+        self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class CsvResultWriter(ResultWriter):
+    """CSV 결과 Writer (classified_domains는 JSON 배열 문자열로 기록)"""
+
+    def __init__(self, path: str, append: bool = False):
+        super().__init__(path, append)
+        write_header = not (append and os.path.exists(path) and os.path.getsize(path) > 0)
+        self._file = open(path, 'a' if append else 'w', encoding='utf-8', newline='')
+        self._writer = csv.DictWriter(self._file, fieldnames=RESULT_FIELDS)
+        if write_header:
+            self._writer.writeheader()
+
+    def _write(self, record: Dict[str, Any]):
+        row = dict(record)
+        row['classified_domains'] = json.dumps(record['classified_domains'], ensure_ascii=False)
+        row['hit_rank'] = '' if record['hit_rank'] is None else record['hit_rank']
+        self._writer.writerow(row)
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class ParquetResultWriter(ResultWriter):
+    """
+    Parquet 결과 Writer (batch_size 건마다 row group 기록)
+
+    Parquet 파일은 이어쓰기를 지원하지 않으므로 append=True는 사용할 수 없음
+    """
+
+    def __init__(self, path: str, append: bool = False, batch_size: int = 10000):
+        if append:
+            raise ValueError("Parquet 출력은 이어쓰기를 지원하지 않습니다.")
+        super().__init__(path, append)
+        self._pa = _import_pyarrow()
+        self._schema = self._pa.schema([
+            ('row', self._pa.int64()),
+            ('question', self._pa.string()),
+            ('ground_truth', self._pa.string()),
+            ('classified_domains', self._pa.list_(self._pa.string())),
+            ('hit_rank', self._pa.int32()),
+            ('success', self._pa.string()),
+            ('opinion_category', self._pa.string()),
+        ])
+        self._writer = self._pa.parquet.ParquetWriter(path, self._schema)
+        self._batch_size = batch_size
+        self._buffer = []
+
+    def _write(self, record: Dict[str, Any]):
+        self._buffer.append(record)
+        if len(self._buffer) >= self._batch_size:
+            self._flush()
+
+    def _flush(self):
+        if not self._buffer:
+            return
+        table = self._pa.Table.from_pylist(self._buffer, schema=self._schema)
+        self._writer.write_table(table)
+        self._buffer = []
+
+    def close(self):
+        self._flush()
+        self._writer.close()
+
+
+WRITERS = {
+    'jsonl': JsonlResultWriter,
+    'csv': CsvResultWriter,
+    'parquet': ParquetResultWriter,
+}
+
+
+def open_result_writer(path: str, append: bool = False) -> ResultWriter:
+    """
+    출력 경로 확장자에 맞는 결과 Writer 생성
+
+    Args:
+        path: 출력 파일 경로 (.csv / .jsonl / .parquet)
+        append: 기존 파일에 이어서 쓸지 여부
+
+    Returns:
+        ResultWriter 인스턴스
+    """
+    file_format = detect_format(path)
+    if file_format not in WRITERS:
+        raise ValueError(f"결과 Writer가 없는 형식 - {file_format} (Excel은 ExcelHandler 사용)")
+    return WRITERS[file_format](path, append=append)
+
+
+def read_results(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    CSV / JSONL / Parquet 결과 파일을 결과 스키마 레코드로 읽기
+
+    Args:
+        path: 결과 파일 경로
+
+    Yields:
+        결과 레코드
+    """
+    file_format = detect_format(path)
+    for raw in _iter_raw_records(path, file_format):
+        if file_format == 'csv':
+            raw['row'] = int(raw['row'])
+            raw['classified_domains'] = json.loads(raw['classified_domains'] or '[]')
+            raw['hit_rank'] = int(raw['hit_rank']) if raw['hit_rank'] else None
+        yield raw
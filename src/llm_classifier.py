@@ -1,17 +1,81 @@
 import os
 import logging
-import requests
-from requests.adapters import HTTPAdapter
-from requests.packages.urllib3.util.retry import Retry
+import time
 from typing import List, Dict, Tuple, Optional, Any
 import re
+import hashlib
 import json
 from collections import defaultdict
-import difflib
+from functools import lru_cache
+import threading
+
+from .hedging import RequestHedger
+from .profiling import stage
+from .tokens import TokenAccountant, get_tokenizer
+from .intent_registry import IntentRegistry, MATCH_EXACT, MATCH_FUZZY, MATCH_NONE, format_match_details
 
 # Dummy mapping for backward compatibility (main.py imports this)
 HIERARCHICAL_DOMAIN_MAPPING = {}
 
+def _content_text(content: Any) -> Any:
+    """응답 content가 리스트인 경우 (Reasoning step 포함 시) text 항목만 이어 붙임"""
+    if not isinstance(content, list):
+        return content
+    text_content = ""
+    for item in content:
+        if isinstance(item, dict) and item.get("type") == "text":
+            text_content += item.get("text", "")
+    return text_content
+
+
+# 요청당 최대 응답 토큰 (max_tokens)
+MAX_COMPLETION_TOKENS = 500
+
+# 고정 Few-shot 예시 (동적 Few-shot 미사용 또는 유사 사례가 없을 때)
+STATIC_EXAMPLES = """예시 1:
+질문: 주소를 변경하고 싶어요
+도메인1: 주소/연락처 변경
+이유: 주소 변경 문의로 명확함
+의견구분: 정확히 분류됨
+
+예시 2:
+질문: 보험금 청구 서류가 뭔가요?
+도메인1: 청구 서류 안내
+도메인2: 청구 절차 문의
+이유: 청구 서류 안내가 가장 적합하며, 절차 문의도 관련됨
+의견구분: 정확히 분류됨
+
+예시 3:
+질문: 앱으로 보험금 청구할 때 최대 금액이 얼마인가요?
+도메인1: 보장 여부 확인
+도메인2: 청구 절차 문의
+이유: 보험금 청구 한도를 묻는 것으로 보장 범위 확인에 해당함
+의견구분: 정확히 분류됨
+
+"""
+
+
+@lru_cache(maxsize=None)
+def matcher_version() -> str:
+    """
+    응답 파싱/매칭 로직 버전 (LLMClassifier._parse_response, _match_intents 소스 코드 해시)
+
+    파서나 매처 코드가 바뀌면 값이 달라지므로, 저장된 응답을 다시 채점해야 하는지 판단하는 데 사용
+
+    Returns:
+        16자리 16진수 문자열
+    """
+    import inspect
+
+    digest = hashlib.sha256()
+    for method in (LLMClassifier._parse_response, LLMClassifier._match_intents):
+        try:
+            digest.update(inspect.getsource(method).encode('utf-8'))
+        except (OSError, TypeError):
+            digest.update(method.__qualname__.encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
 def map_to_hierarchical_domain(detail_domain: str) -> Optional[str]:
     """
     Dummy function for backward compatibility.
@@ -29,6 +93,8 @@ class LLMClassifier:
         config: Dict[str, Any],
         domains: List[str],
         timeout: int = 30,
+        hedge_config: Optional[Dict[str, Any]] = None,
+        concurrency_config: Optional[Dict[str, Any]] = None,
     ):
         """
         Args:
@@ -36,49 +102,166 @@ class LLMClassifier:
             config: LLM 설정 딕셔너리
             domains: 도메인 목록
             timeout: API 타임아웃 (초)
+            hedge_config: 요청 헤징 설정 (None 또는 enabled=False면 미사용)
+            concurrency_config: 동시 요청 한도 설정 (mode='adaptive'면 지연 기반으로 한도 자동 조정)
         """
         self.provider = provider.lower()
         self.config = config
         self.domains = domains
         self.timeout = timeout
 
+        # 요청 헤징 설정 (꼬리 지연 완화)
+        self.hedger = None
+        if hedge_config and hedge_config.get('enabled'):
+            self.hedger = RequestHedger(
+                percentile=hedge_config.get('percentile', 95.0),
+                budget=hedge_config.get('budget', 0.1),
+                min_delay=hedge_config.get('min_delay', 1.0),
+                initial_delay=hedge_config.get('initial_delay', 10.0),
+                max_workers=hedge_config.get('max_workers', 10),
+                max_abandoned=hedge_config.get('max_abandoned'),
+            )
+
+        # 적응형 동시 요청 한도 (기본: 미사용, 실행기 스레드 수로 고정)
+        from .concurrency import create_limiter
+
+        self.limiter = create_limiter(concurrency_config)
+
+        # LLM 요청/응답 카세트 (record: 실제 응답을 기록 / replay: 서버 없이 기록된 응답 재생, 기본: 미사용)
+        from .cassette import create_cassette
+
+        self.cassette = create_cassette(config.get('cassette'), self.provider, config.get('model'))
+
         # 키워드 규칙 적용 여부 (Experiment 16: False)
         self.enable_keyword_rules = False
 
-        # Micro-Intent 매핑 파일 로드
+        # Micro-Intent 매핑 파일 로드 (config['micro_intents_path']가 없으면 src/micro_intents.json)
+        json_path = config.get('micro_intents_path') or os.path.join(os.path.dirname(__file__), 'micro_intents.json')
         try:
-            script_dir = os.path.dirname(__file__)
-            json_path = os.path.join(script_dir, 'micro_intents.json')
             with open(json_path, 'r', encoding='utf-8') as f:
-                self.micro_intents_data = json.load(f)
-            logging.info(f"Micro-Intents loaded from {json_path}: {len(self.micro_intents_data)} intents.")
+                micro_intents_data = json.load(f)
+            logging.info(f"Micro-Intents loaded from {json_path}: {len(micro_intents_data)} intents.")
         except Exception as e:
             logging.error(f"Micro-Intents 파일 로드 실패 ({json_path}): {e}")
-            self.micro_intents_data = {}
+            micro_intents_data = {}
+        self.set_micro_intents(micro_intents_data)
+
+        # 동적 Few-shot (질문별 유사 사례 선택, 기본: 고정 예시)
+        self.few_shot = None
+        self._intents_by_gt = defaultdict(list)
+        few_shot_config = config.get('few_shot') or {}
+        if few_shot_config.get('mode') == 'dynamic':
+            from .few_shot import load_few_shot_selector
+
+            self.few_shot = load_few_shot_selector(
+                few_shot_config.get('success_path'),
+                few_shot_config.get('failure_path'),
+                k=few_shot_config.get('k', 3)
+            )
+            for intent, info in self.micro_intents_data.items():
+                self._intents_by_gt[info.get('gt')].append(intent)
+
+        # 토큰 사용량 집계 (API usage 우선, 없으면 토크나이저 추정)
+        self.token_accountant = TokenAccountant(get_tokenizer(config.get('tokenizer')))
+
+        # 엔드포인트 풀 생성 (엔드포인트별 Connection Pool, 실패 복제본 제외)
+        # requests/urllib3는 분류기 생성 시점에 import (분석 스크립트 등 시작 시간 단축)
+        from .load_balancer import EndpointPool
+
+        endpoints = self._resolve_endpoints()
+        if not endpoints:
+            logging.error(f"LLM 엔드포인트가 설정되지 않았습니다 (provider: {self.provider})")
+        self.endpoint_pool = EndpointPool(
+            urls=endpoints,
+            strategy=config.get('lb_strategy', 'least_outstanding'),
+            pool_size=config.get('pool_size', 10),
+            max_retries=config.get('max_retries', 10),
+            failover_retries=config.get('lb_endpoint_retries', 2),
+            max_failures=config.get('lb_max_failures', 3),
+            eject_seconds=config.get('lb_eject_seconds', 30.0),
+        )
 
-        # Connection Pool을 위한 Session 객체 생성
-        self.session = requests.Session()
+    def set_micro_intents(self, micro_intents_data: Dict[str, Dict[str, Any]]):
+        """
+        Micro-Intent 카탈로그 설정 (레지스트리와 매칭용 사전 계산을 새로 만듦)
 
-        # Retry 전략 설정
-        retry_strategy = Retry(
-            total=10,
-            backoff_factor=2,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["POST", "GET"],
-        )
+        Args:
+            micro_intents_data: {의도: {'gt', 'category', 'desc'}} 카탈로그
+        """
+        self.micro_intents_data = micro_intents_data
 
-        # HTTPAdapter를 사용하여 Connection Pool 설정
-        adapter = HTTPAdapter(
-            max_retries=retry_strategy, pool_connections=10, pool_maxsize=10
-        )
+        # 의도 레지스트리 (카탈로그 순서대로 정수 ID 부여) 및 매칭용 사전 계산
+        self.registry = IntentRegistry(self.micro_intents_data.keys())
+        self._standard_intent_set = set(self.micro_intents_data.keys())
+        self._normalized_standards = [
+            (standard, re.sub(r'[^\w]', '', standard)) for standard in self.micro_intents_data
+        ]
+        self._intents_text = None
 
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+    def _resolve_endpoints(self) -> List[str]:
+        """
+        설정에서 API 엔드포인트 URL 목록 결정
+
+        우선순위: endpoints 리스트 → url (databricks) → host/port (qwen3)
+
+        Returns:
+            엔드포인트 URL 리스트
+        """
+        if self.config.get('endpoints'):
+            return list(self.config['endpoints'])
+        if self.config.get('url'):
+            return [self.config['url']]
+        if self.config.get('host'):
+            return [f"http://{self.config['host']}:{self.config.get('port', 80)}/v1/chat/completions"]
+        return []
 
     def close(self):
         """세션 종료"""
-        if self.session:
-            self.session.close()
+        if self.hedger:
+            self.hedger.close()
+        if self.cassette is not None:
+            self.cassette.close()
+        self.endpoint_pool.close()
+
+    def get_endpoint_statistics(self) -> List[Dict[str, Any]]:
+        """
+        엔드포인트별 부하 분산 통계 반환
+
+        Returns:
+            엔드포인트별 통계 딕셔너리 리스트
+        """
+        return self.endpoint_pool.get_statistics()
+
+    def get_token_statistics(self) -> Dict[str, Any]:
+        """
+        토큰 사용량 통계 반환
+
+        Returns:
+            통계 딕셔너리
+        """
+        return self.token_accountant.get_statistics()
+
+    def get_concurrency_statistics(self) -> Optional[Dict[str, Any]]:
+        """
+        적응형 동시 요청 한도 통계 반환
+
+        Returns:
+            통계 딕셔너리 (적응형 한도 미사용 시 None)
+        """
+        if not self.limiter:
+            return None
+        return self.limiter.get_statistics()
+
+    def get_hedge_statistics(self) -> Optional[Dict[str, Any]]:
+        """
+        요청 헤징 통계 반환
+
+        Returns:
+            통계 딕셔너리 (헤징 미사용 시 None)
+        """
+        if not self.hedger:
+            return None
+        return self.hedger.get_statistics()
 
     def _apply_keyword_rules(self, question: str) -> Optional[str]:
         """
@@ -99,108 +282,202 @@ class LLMClassifier:
         Returns:
             (분류된 Micro-Intent 리스트, 분류 의견, 의견 구분) 튜플
         """
-        # 42개 표준 의도 목록
-        STANDARD_INTENTS = list(self.micro_intents_data.keys())
+        matched_intents, opinion, opinion_category, matches, _ = self.classify_detailed(question)
+        if matches is None:
+            # API 오류/예외 시 opinion에 오류 메시지가 들어 있음
+            return matched_intents, opinion, opinion_category
 
-        # LLM 분류 수행
-        try:
-            prompt = self._build_prompt(question)
-            response, error_msg = self._call_llm_api(prompt)
+        # 매칭 상세 정보를 의견에 추가
+        detailed_opinion = f"{opinion} [매칭: {format_match_details(self.registry, matches)}]"
+        return matched_intents, detailed_opinion, opinion_category
 
-            if response is not None:
-                # LLM 응답에서 Micro-Intent 리스트 파싱
-                micro_intents, opinion, opinion_category = self._parse_response(response)
-
-                # 각 도메인에 대해 Fuzzy Matching 수행
-                matched_intents = []
-                match_details = []
-
-                for micro_intent in micro_intents:
-                    # 1. Exact Match 확인
-                    if micro_intent in STANDARD_INTENTS:
-                        matched_intents.append(micro_intent)
-                        match_details.append(f"{micro_intent} (Exact)")
-                        continue
-
-                    # 2. Fuzzy Match (유사도 계산)
-                    best_match = None
-                    highest_ratio = 0.0
+    def classify_detailed(
+        self,
+        question: str,
+        meta: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[str], str, str, Optional[Tuple[Tuple[int, int, float], ...]], Optional[Dict[str, Any]]]:
+        """
+        질문 분류 (매칭 상세 정보를 문자열 대신 정수 ID 튜플로 반환)
 
-                    for standard in STANDARD_INTENTS:
-                        # 노이즈 제거 후 비교 (공백, 특수문자)
-                        norm_intent = re.sub(r'[^\w]', '', micro_intent)
-                        norm_standard = re.sub(r'[^\w]', '', standard)
+        Args:
+            question: 분류할 질문
+            meta: 원본 응답을 채울 딕셔너리 (prompt, response, usage, 기본: 없음)
+                  row가 들어 있으면 카세트 기록/재생 시 행 번호로 사용
 
-                        ratio = difflib.SequenceMatcher(None, norm_intent, norm_standard).ratio()
+        Returns:
+            (분류된 Micro-Intent 리스트, 분류 이유, 의견 구분, 매칭 정보, 토큰 사용량) 튜플
+            매칭 정보는 (의도 ID, 매칭 종류, 유사도) 튜플,
+            토큰 사용량은 {'prompt_tokens', 'completion_tokens', 'estimated'}이며 API 오류/예외 시 둘 다 None
+        """
+        # LLM 분류 수행
+        try:
+            with stage('prompt'):
+                prompt = self._build_prompt(question)
+            meta = meta if meta is not None else {}
+            meta['prompt'] = prompt
+            with stage('http'):
+                response, error_msg = self._call_llm_api(prompt, meta=meta)
 
-                        # 부분 문자열 포함 시 가산점
-                        if norm_standard in norm_intent or norm_intent in norm_standard:
-                            ratio += 0.2
-                            if ratio > 1.0: ratio = 1.0
+            if response is not None:
+                meta['response'] = response
+                with stage('tokens'):
+                    usage = self.token_accountant.record(prompt, response, meta.get('usage'))
+                matched_intents, opinion, opinion_category, matches = self.classify_response(response)
+                return matched_intents, opinion, opinion_category, matches, usage
 
-                        if ratio > highest_ratio:
-                            highest_ratio = ratio
-                            best_match = standard
+            else:
+                return [None], f"LLM API 호출 실패: {error_msg}", "API Error", None, None
 
-                    # Threshold 설정 (0.3 이상이면 인정 - 실험20: 강제 매칭 제거)
-                    THRESHOLD = 0.3
+        except Exception as e:
+            logging.error(f"분류 중 예외 발생: {e}")
+            return [None], f"예외 발생: {str(e)}", "Error", None, None
 
-                    if best_match and highest_ratio >= THRESHOLD:
-                        matched_intents.append(best_match)
-                        match_details.append(f"{best_match} (Fuzzy: {highest_ratio:.2f})")
-                        logging.info(f"Fuzzy Match: '{micro_intent}' -> '{best_match}' (Score: {highest_ratio:.2f})")
-                    else:
-                        # 유사도 미달 시 미분류 처리 (강제 매칭 제거)
-                        matched_intents.append(f"미분류-{micro_intent}")
-                        match_details.append(f"{micro_intent} (No Match: {highest_ratio:.2f})")
-                        logging.warning(f"No Match (Below Threshold): '{micro_intent}' (Best: '{best_match}', Score: {highest_ratio:.2f})")
+    def classify_response(
+        self,
+        response: str,
+        threshold: float = 0.3
+    ) -> Tuple[List[str], str, str, Tuple[Tuple[int, int, float], ...]]:
+        """
+        저장된 LLM 응답을 파싱/매칭 (LLM 호출 없음, 재채점용)
 
-                # 중복 제거
-                matched_intents = list(dict.fromkeys(matched_intents))
+        Args:
+            response: LLM 원본 응답
+            threshold: Fuzzy Match 인정 유사도 (기본: 0.3)
 
-                # 매칭 상세 정보를 의견에 추가
-                detailed_opinion = f"{opinion} [매칭: {', '.join(match_details)}]"
+        Returns:
+            (분류된 Micro-Intent 리스트, 분류 이유, 의견 구분, 매칭 정보) 튜플
+        """
+        # LLM 응답에서 Micro-Intent 리스트 파싱
+        with stage('parse'):
+            micro_intents, opinion, opinion_category = self._parse_response(response)
+        with stage('match'):
+            matched_intents, matches = self._match_intents(micro_intents, threshold)
+        return matched_intents, opinion, opinion_category, matches
+
+    def _match_intents(
+        self,
+        micro_intents: List[str],
+        threshold: float = 0.3
+    ) -> Tuple[List[str], Tuple[Tuple[int, int, float], ...]]:
+        """
+        LLM이 반환한 의도를 표준 의도 목록에 매칭 (Exact → Fuzzy, 미달 시 미분류)
 
-                return matched_intents, detailed_opinion, opinion_category
+        Args:
+            micro_intents: LLM 응답에서 파싱한 의도 리스트
+            threshold: Fuzzy Match 인정 유사도 (실험20: 0.3, 강제 매칭 제거)
 
+        Returns:
+            (매칭된 의도 리스트, (의도 ID, 매칭 종류, 유사도) 튜플)
+        """
+        import difflib
+
+        matched_intents = []
+        matches = []
+
+        for micro_intent in micro_intents:
+            # 1. Exact Match 확인
+            if micro_intent in self._standard_intent_set:
+                matched_intents.append(micro_intent)
+                matches.append((self.registry.intern(micro_intent), MATCH_EXACT, 1.0))
+                continue
+
+            # 2. Fuzzy Match (유사도 계산, 노이즈 제거 후 비교: 공백, 특수문자)
+            best_match = None
+            highest_ratio = 0.0
+            norm_intent = re.sub(r'[^\w]', '', micro_intent)
+
+            for standard, norm_standard in self._normalized_standards:
+                ratio = difflib.SequenceMatcher(None, norm_intent, norm_standard).ratio()
+
+                # 부분 문자열 포함 시 가산점
+                if norm_standard in norm_intent or norm_intent in norm_standard:
+                    ratio += 0.2
+                    if ratio > 1.0: ratio = 1.0
+
+                if ratio > highest_ratio:
+                    highest_ratio = ratio
+                    best_match = standard
+
+            if best_match and highest_ratio >= threshold:
+                matched_intents.append(best_match)
+                matches.append((self.registry.intern(best_match), MATCH_FUZZY, highest_ratio))
+                logging.info(f"Fuzzy Match: '{micro_intent}' -> '{best_match}' (Score: {highest_ratio:.2f})")
             else:
-                return [None], f"LLM API 호출 실패: {error_msg}", "API Error"
+                # 유사도 미달 시 미분류 처리 (강제 매칭 제거)
+                matched_intents.append(f"미분류-{micro_intent}")
+                # 카탈로그에 없는 이름은 레지스트리에 등록하지 않고 원문으로 보관 (행 수만큼 늘어나지 않도록)
+                matches.append((micro_intent, MATCH_NONE, highest_ratio))
+                logging.warning(f"No Match (Below Threshold): '{micro_intent}' (Best: '{best_match}', Score: {highest_ratio:.2f})")
 
-        except Exception as e:
-            logging.error(f"분류 중 예외 발생: {e}")
-            return [None], f"예외 발생: {str(e)}", "Error"
+        # 중복 제거
+        matched_intents = list(dict.fromkeys(matched_intents))
 
-    def _build_prompt(self, question: str) -> str:
-        """
-        LLM 프롬프트 생성 (Experiment 16: 42개 Micro-Intent, 동적 생성)
+        return matched_intents, tuple(matches)
 
-        Args:
-            question: 분류할 질문
+    def _intents_description(self) -> str:
+        """
+        프롬프트용 세부 의도 목록 텍스트 (카테고리별 그룹, 최초 1회 생성 후 재사용)
 
         Returns:
-            생성된 프롬프트
+            "[카테고리]\n1. 의도 (설명)\n..." 형식의 텍스트
         """
+        if self._intents_text is not None:
+            return self._intents_text
+
         # 그룹화 (동적)
         grouped_intents = defaultdict(list)
-        
+
         for intent, info in self.micro_intents_data.items():
             category = info.get('category', '기타')
             desc = info.get('desc', '')
             grouped_intents[category].append(f"{intent} ({desc})")
-        
+
         # 프롬프트 텍스트 조합
         intents_description = ""
         intent_number = 1
-        
+
         # 카테고리 순서 고정을 위해 정렬
         sorted_categories = sorted(grouped_intents.keys())
-        
+
         for category in sorted_categories:
             intents_description += f"\n[{category}]\n"
             for intent_str in grouped_intents[category]:
                 intents_description += f"{intent_number}. {intent_str}\n"
                 intent_number += 1
 
+        self._intents_text = intents_description
+        return intents_description
+
+    def _examples_text(self, question: str) -> str:
+        """
+        프롬프트 예시 블록 (동적 Few-shot 사용 시 질문과 비슷한 사례, 없으면 고정 예시)
+
+        Args:
+            question: 분류할 질문
+
+        Returns:
+            예시 문자열
+        """
+        if self.few_shot is not None:
+            examples = self.few_shot.select(question)
+            if examples:
+                from .few_shot import format_examples
+
+                return format_examples(examples, self._intents_by_gt)
+        return STATIC_EXAMPLES
+
+    def _build_prompt(self, question: str) -> str:
+        """
+        LLM 프롬프트 생성 (Experiment 16: 42개 Micro-Intent, 동적 생성)
+
+        Args:
+            question: 분류할 질문
+
+        Returns:
+            생성된 프롬프트
+        """
+        intents_description = self._intents_description()
+
         prompt = f"""당신은 보험사 고객 센터 AI입니다.
 고객의 질문을 분석하여, 아래 **{len(self.micro_intents_data)}개 세부 의도(Micro-Intent)** 중 가능성이 높은 순서대로 **최대 3개**를 나열하세요.
 
@@ -222,27 +499,7 @@ class LLMClassifier:
 
 === 분류 예시 ===
 
-예시 1:
-질문: 주소를 변경하고 싶어요
-도메인1: 주소/연락처 변경
-이유: 주소 변경 문의로 명확함
-의견구분: 정확히 분류됨
-
-예시 2:
-질문: 보험금 청구 서류가 뭔가요?
-도메인1: 청구 서류 안내
-도메인2: 청구 절차 문의
-이유: 청구 서류 안내가 가장 적합하며, 절차 문의도 관련됨
-의견구분: 정확히 분류됨
-
-예시 3:
-질문: 앱으로 보험금 청구할 때 최대 금액이 얼마인가요?
-도메인1: 보장 여부 확인
-도메인2: 청구 절차 문의
-이유: 보험금 청구 한도를 묻는 것으로 보장 범위 확인에 해당함
-의견구분: 정확히 분류됨
-
-=== 응답 형식 (반드시 정확히 따르세요) ===
+{self._examples_text(question)}=== 응답 형식 (반드시 정확히 따르세요) ===
 도메인1: [위 목록에서 선택]
 도메인2: [위 목록에서 선택, 없으면 생략]
 도메인3: [위 목록에서 선택, 없으면 생략]
@@ -254,57 +511,188 @@ class LLMClassifier:
 """
         return prompt
 
-    def _call_llm_api(self, prompt: str) -> Tuple[Optional[str], Optional[str]]:
+    def _call_llm_api(
+        self,
+        prompt: str,
+        meta: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Optional[str], Optional[str]]:
         """
-        LLM API 호출 (Databricks 또는 Qwen)
+        LLM API 호출 (헤징 설정 시 지연된 요청에 대해 중복 요청 전송)
+
+        적응형 동시 요청 한도 사용 시 한도 내에서만 요청하고, 지연 시간과 실패 여부로 한도를 갱신
+
+        Args:
+            prompt: 프롬프트
+            meta: 응답 부가 정보를 채울 딕셔너리 (usage, endpoint, 기본: 없음)
         """
+        if not self.limiter:
+            return self._dispatch(prompt, meta)
+
+        with stage('limiter_wait'):
+            self.limiter.acquire()
+        start = time.perf_counter()
+        response = None
         try:
-            if self.provider == "qwen3":
-                # Qwen3 API 호출 로직 (생략 - 기존 코드 유지 필요 시 구현)
-                pass
-            elif self.provider == "databricks":
-                # Databricks API 호출
-                api_url = self.config.get("url")
-                access_token = self.config.get("token")
-                
-                headers = {
-                    "Authorization": f"Bearer {access_token}",
-                    "Content-Type": "application/json",
-                }
-                
-                payload = {
-                    "messages": [
-                        {"role": "system", "content": "You are a helpful assistant."}, 
-                        {"role": "user", "content": prompt}
-                    ],
-                    "max_tokens": 500,
-                    "temperature": 0.0,
-                }
-                
-                response = self.session.post(
-                    api_url, headers=headers, json=payload, timeout=self.timeout
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    content = result["choices"][0]["message"]["content"]
-                    
-                    # content가 리스트인 경우 (Reasoning step 포함 시) 처리
-                    if isinstance(content, list):
-                        text_content = ""
-                        for item in content:
-                            if isinstance(item, dict) and item.get("type") == "text":
-                                text_content += item.get("text", "")
-                        content = text_content
-                        
-                    return content, None
-                else:
-                    return None, f"Status Code: {response.status_code}, Response: {response.text}"
-            
+            response, error = self._dispatch(prompt, meta)
+            return response, error
+        finally:
+            self.limiter.release(time.perf_counter() - start, failed=response is None)
+
+    def _dispatch(
+        self,
+        prompt: str,
+        meta: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """카세트 사용 시 기록/재생을 거쳐 요청 전송"""
+        if self.cassette is not None:
+            meta = meta if meta is not None else {}
+            response, error = self.cassette.call(prompt, meta, lambda: self._send(prompt, meta))
+            # 재생 시 기록된 원본 content(리스트일 수 있음)를 실제 응답과 같은 방식으로 변환
+            return _content_text(response), error
+        return self._send(prompt, meta)
+
+    def _send(
+        self,
+        prompt: str,
+        meta: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """헤징 여부에 따라 요청 전송"""
+        if self.hedger:
+            if meta is None:
+                return self.hedger.call(lambda cancel_event: self._send_request(prompt, cancel_event))
+
+            # 1차/헤징 요청은 각자의 부가 정보 딕셔너리에 기록하고, 채택된 응답의 것만 호출자 meta로 복사
+            # (진 요청이 늦게 usage/endpoint를 덮어쓰지 않도록)
+            def attempt(cancel_event):
+                attempt_meta = {}
+                response, error = self._send_request(prompt, cancel_event, attempt_meta)
+                return ((response, attempt_meta) if response is not None else None), error
+
+            winner, error = self.hedger.call(attempt)
+            if winner is None:
+                return None, error
+            response, attempt_meta = winner
+            meta.update(attempt_meta)
+            return response, error
+        return self._send_request(prompt, meta=meta)
+
+    def _build_request(self, prompt: str) -> Tuple[Dict[str, str], Dict[str, Any]]:
+        """
+        Provider별 요청 헤더와 페이로드 생성
+
+        Args:
+            prompt: 프롬프트
+
+        Returns:
+            (헤더, 페이로드) 튜플
+        """
+        headers = {"Content-Type": "application/json"}
+        payload = {
+            "messages": [
+                {"role": "system", "content": "You are a helpful assistant."},
+                {"role": "user", "content": prompt}
+            ],
+            "max_tokens": MAX_COMPLETION_TOKENS,
+            "temperature": 0.0,
+        }
+
+        if self.provider == "qwen3":
+            # OpenAI 호환 Chat Completions API (vLLM 등)
+            payload["model"] = self.config.get("model")
+        elif self.provider == "databricks":
+            headers["Authorization"] = f"Bearer {self.config.get('token')}"
+
+        return headers, payload
+
+    def _send_request(
+        self,
+        prompt: str,
+        cancel_event: Optional[threading.Event] = None,
+        meta: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        LLM API 단일 요청 (Databricks 또는 Qwen)
+        엔드포인트 풀에서 엔드포인트를 선택하며, 실패 시 다른 엔드포인트로 재시도
+
+        Args:
+            prompt: 프롬프트
+            cancel_event: 헤징 취소 이벤트 (설정되면 요청을 보내지 않고, 진행 중이면 본문을 받지 않고 연결을 끊음)
+            meta: 응답 부가 정보를 채울 딕셔너리 (usage: API 토큰 사용량, endpoint: 응답한 엔드포인트)
+        """
+        if self.provider not in ("qwen3", "databricks"):
             return None, "지원하지 않는 Provider"
 
-        except Exception as e:
-            return None, str(e)
+        # 분류기 생성 시 이미 import된 모듈 (시작 시간 단축용 지연 import)
+        from .load_balancer import is_non_retryable
+
+        headers, payload = self._build_request(prompt)
+        tried = []
+        error_msg = "사용 가능한 엔드포인트 없음"
+
+        while True:
+            if cancel_event is not None and cancel_event.is_set():
+                return None, "헤징으로 취소된 요청"
+
+            endpoint = self.endpoint_pool.acquire(exclude=tried)
+            if endpoint is None:
+                return None, error_msg
+            tried.append(endpoint)
+
+            start = time.monotonic()
+            try:
+                if cancel_event is None:
+                    response = endpoint.session.post(
+                        endpoint.url, headers=headers, json=payload, timeout=self.timeout
+                    )
+                else:
+                    # 헤징 요청은 urllib3 재시도 없이 보내고 재시도 사이마다 취소 여부를 확인하며,
+                    # stream=True로 헤더만 먼저 받아 진 요청은 본문을 읽지 않고 연결을 닫음
+                    # (연결을 풀에 돌려주지 않고 끊으므로 서버도 요청 중단을 알 수 있음)
+                    response = endpoint.post_cancellable(
+                        cancel_event, headers=headers, json=payload, timeout=self.timeout, stream=True
+                    )
+            except Exception as e:
+                self.endpoint_pool.release(endpoint, time.monotonic() - start, success=False)
+                error_msg = f"{endpoint.url}: {e}"
+                continue
+
+            if response is None:
+                # 재시도 백오프 중에 취소됨 (직전 시도는 재시도 대상 오류였으므로 실패로 기록)
+                self.endpoint_pool.release(endpoint, time.monotonic() - start, success=False)
+                return None, "헤징으로 취소된 요청"
+
+            # 408/429 외의 4xx는 요청 자체의 문제이므로 엔드포인트 실패로 세지 않음
+            non_retryable = is_non_retryable(response.status_code)
+            self.endpoint_pool.release(
+                endpoint, time.monotonic() - start, success=response.status_code == 200 or non_retryable
+            )
+
+            if cancel_event is not None and cancel_event.is_set():
+                response.close()
+                return None, "헤징으로 취소된 요청"
+
+            if response.status_code != 200:
+                error_msg = f"Status Code: {response.status_code}, Response: {response.text}"
+                if non_retryable:
+                    # 다른 복제본에서도 똑같이 실패하므로 바로 반환
+                    return None, error_msg
+                continue
+
+            try:
+                result = response.json()
+                content = result["choices"][0]["message"]["content"]
+            except Exception as e:
+                return None, str(e)
+
+            if meta is not None:
+                meta['usage'] = result.get('usage')
+                meta['endpoint'] = endpoint.url
+
+            # 카세트 기록 시 변환 전 원본 content 보존
+            if meta is not None and self.cassette is not None and isinstance(content, list):
+                meta['raw_content'] = content
+
+            return _content_text(content), None
 
     def _parse_response(
         self,
@@ -0,0 +1,317 @@
+"""
+다중 엔드포인트 부하 분산 모듈
+여러 LLM 추론 서버 복제본(replica)에 요청을 분산하고, 실패하는 복제본을 일시적으로 제외
+"""
+
+import logging
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.util.retry import Retry
+
+from .profiling import stage
+
+
+# 지원하는 분산 전략
+STRATEGIES = ('least_outstanding', 'latency')
+
+# 다른 엔드포인트로 넘겨도 결과가 같은 클라이언트 오류 (408 Request Timeout, 429 Too Many Requests 외의 4xx)
+RETRYABLE_CLIENT_ERRORS = (408, 429)
+
+# 엔드포인트 내에서 재시도하는 상태 코드
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# 재시도 백오프 상한 (초, urllib3 기본값과 동일)
+BACKOFF_MAX = 120.0
+
+
+def is_non_retryable(status_code: int) -> bool:
+    """모든 복제본에서 똑같이 실패할 상태 코드인지 여부 (408/429를 제외한 4xx)"""
+    return 400 <= status_code < 500 and status_code not in RETRYABLE_CLIENT_ERRORS
+
+
+class _CountingRetry(Retry):
+    """재시도가 일어날 때마다 counter(상태 코드 또는 None)를 호출하고 백오프 대기 시간을 기록하는 urllib3 Retry"""
+
+    counter = None
+
+    def new(self, **kwargs):
+        # urllib3는 재시도마다 new()로 객체를 새로 만들므로 counter를 넘겨 줌
+        retry = super().new(**kwargs)
+        retry.counter = self.counter
+        return retry
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        if self.counter is not None:
+            self.counter(response.status if response is not None else None)
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+    def sleep(self, response=None):
+        # 재시도 백오프 / Retry-After 대기 시간을 단계 타이머와 타임라인에 기록
+        with stage('retry_backoff'):
+            super().sleep(response)
+
+
+class Endpoint:
+    """단일 LLM 엔드포인트 (엔드포인트별 Connection Pool과 상태 보유)"""
+
+    def __init__(self, url: str, pool_size: int = 10, max_retries: int = 10, backoff_factor: float = 2.0):
+        """
+        Args:
+            url: API URL
+            pool_size: Connection Pool 크기
+            max_retries: 엔드포인트 내 재시도 횟수
+            backoff_factor: 재시도 백오프 계수
+        """
+        self.url = url
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+
+        # 엔드포인트별 Connection Pool
+        self.session = requests.Session()
+        retry_strategy = _CountingRetry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=list(RETRY_STATUSES),
+            allowed_methods=["POST", "GET"],
+        )
+        retry_strategy.counter = self._count_retry
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy, pool_connections=pool_size, pool_maxsize=pool_size
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        # 헤징 요청용 세션 (urllib3 재시도 없음, 재시도는 post_cancellable()에서 취소 여부를 확인하며 수행)
+        self.hedge_session = requests.Session()
+        hedge_adapter = HTTPAdapter(
+            max_retries=Retry(total=0, raise_on_status=False), pool_connections=pool_size, pool_maxsize=pool_size
+        )
+        self.hedge_session.mount("http://", hedge_adapter)
+        self.hedge_session.mount("https://", hedge_adapter)
+
+        # 부하/상태 정보 (EndpointPool의 Lock으로 보호)
+        self.outstanding = 0
+        self.ewma_latency = None
+        self.consecutive_failures = 0
+        self.ejected_until = 0.0
+        self.total_requests = 0
+        self.total_failures = 0
+        self.ejections = 0
+
+        # urllib3 내부 재시도 집계 (연결 스레드에서 갱신되므로 별도 Lock)
+        self.retries = 0
+        self.throttled = 0
+        self._retry_lock = threading.Lock()
+
+    def _count_retry(self, status: Optional[int]):
+        """재시도 1회 기록 (status: 재시도 원인 HTTP 상태 코드, 연결 오류면 None)"""
+        with self._retry_lock:
+            self.retries += 1
+            if status == 429:
+                self.throttled += 1
+
+    def _backoff(self, attempt: int, response=None) -> float:
+        """attempt번째 재시도 전 대기 시간 (초, 429/503의 Retry-After 우선)"""
+        if response is not None:
+            retry_after = response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                return min(float(retry_after), BACKOFF_MAX)
+        return min(self.backoff_factor * (2 ** (attempt - 1)), BACKOFF_MAX)
+
+    def post_cancellable(self, cancel_event: threading.Event, **kwargs):
+        """
+        취소 가능한 POST 요청 (헤징 요청용)
+
+        urllib3 재시도 안에서는 취소 이벤트를 볼 수 없어 진 요청이 백오프를 반복하며 스레드와
+        엔드포인트 슬롯을 오래 차지하므로, 한 번씩 보내고 재시도마다 취소 여부를 확인한다.
+        재시도 정책(횟수, 상태 코드, 백오프)은 session과 같다.
+
+        Args:
+            cancel_event: 취소 이벤트 (백오프 대기 중에 설정되어도 바로 중단)
+            **kwargs: requests.Session.post 인자 (url 제외)
+
+        Returns:
+            응답 (재시도가 끝난 뒤의 마지막 응답, 취소되면 None)
+
+        Raises:
+            requests.RequestException: 재시도 후에도 연결 오류가 계속된 경우
+        """
+        attempt = 0
+        while True:
+            response = None
+            try:
+                response = self.hedge_session.post(self.url, **kwargs)
+            except requests.RequestException:
+                if attempt >= self.max_retries or cancel_event.is_set():
+                    raise
+            else:
+                if response.status_code not in RETRY_STATUSES or attempt >= self.max_retries:
+                    return response
+                response.close()
+
+            attempt += 1
+            self._count_retry(response.status_code if response is not None else None)
+            # 헤징 실행 스레드에서 돌므로 호출 스레드의 http 단계 하위로 명시
+            with stage('retry_backoff', parent='http'):
+                if cancel_event.wait(self._backoff(attempt, response)):
+                    return None
+
+    def is_available(self, now: float) -> bool:
+        """제외(ejection) 기간이 아닌지 여부"""
+        return now >= self.ejected_until
+
+    def close(self):
+        """세션 종료"""
+        self.session.close()
+        self.hedge_session.close()
+
+
+class EndpointPool:
+    """
+    엔드포인트 풀
+
+    - least_outstanding: 처리 중인 요청 수가 가장 적은 엔드포인트 선택
+    - latency: EWMA 지연 × (처리 중 요청 수 + 1) 점수가 가장 낮은 엔드포인트 선택
+    연속 실패가 max_failures회에 도달하면 eject_seconds 동안 후보에서 제외 (passive health check)
+    """
+
+    def __init__(
+        self,
+        urls: List[str],
+        strategy: str = 'least_outstanding',
+        pool_size: int = 10,
+        max_retries: int = 10,
+        failover_retries: int = 2,
+        max_failures: int = 3,
+        eject_seconds: float = 30.0,
+        ewma_alpha: float = 0.3,
+    ):
+        """
+        Args:
+            urls: 엔드포인트 URL 리스트 (비어 있으면 모든 요청이 실패 처리됨)
+            strategy: 분산 전략 ('least_outstanding' 또는 'latency')
+            pool_size: 엔드포인트별 Connection Pool 크기
+            max_retries: 엔드포인트 내 재시도 횟수 (엔드포인트가 1개일 때)
+            failover_retries: 엔드포인트가 여러 개일 때의 엔드포인트 내 재시도 횟수 (백오프 계수도 0.5로 줄임)
+                (나머지는 다른 엔드포인트로 넘겨 처리, 긴 백오프 동안 장애 전환과 제외가 늦어지지 않도록)
+            max_failures: 제외되기까지의 연속 실패 횟수
+            eject_seconds: 제외 기간 (초, 반복 제외 시 2배씩 증가)
+            ewma_alpha: 지연 시간 EWMA 가중치
+        """
+        if strategy not in STRATEGIES:
+            raise ValueError(f"지원하지 않는 분산 전략 - {strategy}")
+
+        self.strategy = strategy
+        self.max_failures = max_failures
+        self.eject_seconds = eject_seconds
+        self.ewma_alpha = ewma_alpha
+        backoff_factor = 2.0
+        if len(urls) > 1:
+            max_retries = min(max_retries, failover_retries)
+            backoff_factor = 0.5
+        self.endpoints = [Endpoint(url, pool_size, max_retries, backoff_factor) for url in urls]
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.endpoints)
+
+    def _score(self, endpoint: Endpoint) -> float:
+        """선택 점수 (낮을수록 우선)"""
+        if self.strategy == 'latency':
+            # 측정 전 엔드포인트는 우선 시도
+            latency = endpoint.ewma_latency if endpoint.ewma_latency is not None else 0.0
+            return latency * (endpoint.outstanding + 1)
+        return endpoint.outstanding
+
+    def acquire(self, exclude: Optional[List[Endpoint]] = None) -> Optional[Endpoint]:
+        """
+        요청을 보낼 엔드포인트 선택 (처리 중 요청 수 증가)
+
+        Args:
+            exclude: 제외할 엔드포인트 (이미 시도한 엔드포인트)
+
+        Returns:
+            선택된 엔드포인트 (후보가 없으면 None)
+        """
+        exclude = exclude or []
+        now = time.monotonic()
+        with self._lock:
+            candidates = [e for e in self.endpoints if e not in exclude]
+            if not candidates:
+                return None
+
+            available = [e for e in candidates if e.is_available(now)]
+            if not available:
+                # 모두 제외 상태면 가장 먼저 복귀할 엔드포인트 사용 (fail-open)
+                available = [min(candidates, key=lambda e: e.ejected_until)]
+
+            best_score = min(self._score(e) for e in available)
+            endpoint = random.choice([e for e in available if self._score(e) == best_score])
+            endpoint.outstanding += 1
+            endpoint.total_requests += 1
+            return endpoint
+
+    def release(self, endpoint: Endpoint, latency: float, success: bool):
+        """
+        요청 완료 처리 (지연 시간 및 상태 갱신)
+
+        Args:
+            endpoint: 요청을 보낸 엔드포인트
+            latency: 요청 소요 시간 (초)
+            success: 성공 여부
+        """
+        with self._lock:
+            endpoint.outstanding -= 1
+            if success:
+                endpoint.consecutive_failures = 0
+                if endpoint.ewma_latency is None:
+                    endpoint.ewma_latency = latency
+                else:
+                    endpoint.ewma_latency = (
+                        self.ewma_alpha * latency + (1 - self.ewma_alpha) * endpoint.ewma_latency
+                    )
+                return
+
+            endpoint.total_failures += 1
+            endpoint.consecutive_failures += 1
+            if endpoint.consecutive_failures >= self.max_failures:
+                # 반복 제외 시 제외 기간을 2배씩 늘림 (최대 8배)
+                duration = self.eject_seconds * (2 ** min(endpoint.ejections, 3))
+                endpoint.ejected_until = time.monotonic() + duration
+                endpoint.ejections += 1
+                endpoint.consecutive_failures = 0
+                logging.warning(f"엔드포인트 제외: {endpoint.url} ({duration:.0f}초)")
+
+    def get_statistics(self) -> List[Dict[str, Any]]:
+        """
+        엔드포인트별 통계 반환
+
+        Returns:
+            엔드포인트별 통계 딕셔너리 리스트
+        """
+        now = time.monotonic()
+        with self._lock:
+            return [
+                {
+                    'url': e.url,
+                    'requests': e.total_requests,
+                    'failures': e.total_failures,
+                    'ejections': e.ejections,
+                    'retries': e.retries,
+                    'throttled': e.throttled,
+                    'outstanding': e.outstanding,
+                    'ewma_latency': e.ewma_latency,
+                    'available': e.is_available(now),
+                }
+                for e in self.endpoints
+            ]
+
+    def close(self):
+        """모든 엔드포인트 세션 종료"""
+        for endpoint in self.endpoints:
+            endpoint.close()
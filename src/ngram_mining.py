@@ -0,0 +1,374 @@
+"""
+N-gram 마이닝 모듈
+질문 코퍼스에서 어절 n-gram(1~2어절)과 한글 글자 n-gram 빈도를 한 번의 스트리밍 패스로 집계
+
+- 카운터는 Space-Saving 방식으로 항목 수 상한을 두므로, 수백만 건의 질문에서도 메모리 사용량이 일정함
+- Ground Truth별 집계도 같은 패스에서 수행 (도메인마다 DataFrame을 다시 필터링하지 않음)
+- 빈도는 출현 횟수 (document_frequency=True면 질문 단위 문서 빈도: 한 질문에 같은 n-gram이 여러 번 나와도 1회)
+- 결과는 micro_intents.json 큐레이션용 후보 파일로 저장 가능
+"""
+
+import json
+import logging
+import os
+import re
+from operator import itemgetter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+
+_NON_WORD = re.compile(r'[^\w\s]')
+_HANGUL = re.compile(r'[가-힣]')
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    특수문자 제거 후 어절 단위 분리
+
+    Args:
+        text: 질문 텍스트
+
+    Returns:
+        어절 리스트
+    """
+    return _NON_WORD.sub('', text).split()
+
+
+def word_ngrams(tokens: Sequence[str], max_n: int = 2, min_length: int = 2) -> Iterator[str]:
+    """
+    어절 n-gram 생성 (1어절은 min_length 글자 이상만)
+
+    Args:
+        tokens: 어절 리스트
+        max_n: 최대 어절 수
+        min_length: 1어절 n-gram의 최소 글자 수
+
+    Yields:
+        공백으로 이어 붙인 n-gram
+    """
+    for token in tokens:
+        if len(token) >= min_length:
+            yield token
+    for n in range(2, max_n + 1):
+        for i in range(len(tokens) - n + 1):
+            yield ' '.join(tokens[i:i + n])
+
+
+def char_ngrams(tokens: Sequence[str], sizes: Sequence[int] = (2, 3)) -> Iterator[str]:
+    """
+    한글 어절 내부의 글자 n-gram 생성 (조사/어미가 붙은 어절에서 공통 어간을 잡기 위함)
+
+    Args:
+        tokens: 어절 리스트
+        sizes: 글자 n-gram 길이
+
+    Yields:
+        글자 n-gram
+    """
+    for token in tokens:
+        if not _HANGUL.search(token):
+            continue
+        for size in sizes:
+            for i in range(len(token) - size + 1):
+                yield token[i:i + size]
+
+
+class SpaceSavingCounter:
+    """
+    메모리 상한이 있는 상위 빈도 카운터 (Space-Saving, 일괄 축출)
+
+    항목 수가 capacity의 2배를 넘으면 상위 capacity개만 남기고, 축출된 최대 빈도를 floor로 기록한다.
+    이후 새로 들어오는 항목은 floor부터 세므로 빈도는 실제보다 최대 error만큼 크게 추정될 수 있다.
+    서로 다른 항목 수가 2 × capacity 이하인 코퍼스에서는 정확한 빈도와 같다.
+    """
+
+    __slots__ = ('capacity', 'total', '_counts', '_errors', '_floor')
+
+    def __init__(self, capacity: int = 10000):
+        """
+        Args:
+            capacity: 유지할 최소 항목 수 (메모리 상한은 2 × capacity)
+        """
+        if capacity <= 0:
+            raise ValueError("capacity는 1 이상이어야 합니다.")
+        self.capacity = capacity
+        self.total = 0
+        self._counts = {}
+        self._errors = {}
+        self._floor = 0
+
+    def add(self, item: str, count: int = 1):
+        """
+        항목 빈도 증가
+
+        Args:
+            item: 항목
+            count: 증가량
+        """
+        self.total += count
+        counts = self._counts
+        if item in counts:
+            counts[item] += count
+            return
+        counts[item] = self._floor + count
+        if self._floor:
+            self._errors[item] = self._floor
+        if len(counts) > 2 * self.capacity:
+            self._prune()
+
+    def update(self, items: Iterable[str]):
+        """여러 항목 빈도를 1씩 증가"""
+        for item in items:
+            self.add(item)
+
+    def _prune(self):
+        """상위 capacity개만 남기고 축출"""
+        ranked = sorted(self._counts.items(), key=itemgetter(1), reverse=True)
+        self._floor = max(self._floor, ranked[self.capacity][1])
+        self._counts = dict(ranked[:self.capacity])
+        self._errors = {item: error for item, error in self._errors.items() if item in self._counts}
+
+    def most_common(self, n: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        빈도 상위 항목
+
+        Args:
+            n: 반환할 개수 (None이면 전체)
+
+        Returns:
+            (항목, 추정 빈도) 리스트
+        """
+        ranked = sorted(self._counts.items(), key=lambda kv: (-kv[1], kv[0]))
+        return ranked if n is None else ranked[:n]
+
+    def error(self, item: str) -> int:
+        """항목 빈도의 최대 과대 추정치 (정확하면 0)"""
+        return self._errors.get(item, 0)
+
+    def __getitem__(self, item: str) -> int:
+        return self._counts.get(item, 0)
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+
+class _GroupStats:
+    """Ground Truth별 집계 (질문 수, 샘플, 키워드 카운터)"""
+
+    __slots__ = ('count', 'samples', 'words')
+
+    def __init__(self, capacity: int):
+        self.count = 0
+        self.samples = []
+        self.words = SpaceSavingCounter(capacity)
+
+
+class NGramMiner:
+    """
+    질문 코퍼스 n-gram 마이너
+
+    add()로 질문을 한 건씩 넣으면 전체 어절 n-gram, 한글 글자 n-gram, Ground Truth별 키워드를 동시에 집계한다.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 20000,
+        group_capacity: int = 2000,
+        max_n: int = 2,
+        char_sizes: Sequence[int] = (2, 3),
+        min_length: int = 2,
+        sample_size: int = 8,
+        document_frequency: bool = False
+    ):
+        """
+        Args:
+            capacity: 전체 카운터 항목 수 상한 (0이면 Ground Truth별 집계만 수행)
+            group_capacity: Ground Truth별 카운터 항목 수 상한
+            max_n: 어절 n-gram 최대 길이
+            char_sizes: 글자 n-gram 길이 (빈 튜플이면 집계하지 않음)
+            min_length: 1어절 n-gram 최소 글자 수
+            sample_size: Ground Truth별 보관할 샘플 질문 수
+            document_frequency: True면 한 질문 안의 중복 n-gram을 1회로 셈 (기본: 출현 횟수)
+        """
+        self.max_n = max_n
+        self.char_sizes = tuple(char_sizes)
+        self.min_length = min_length
+        self.sample_size = sample_size
+        self.document_frequency = document_frequency
+        self.group_capacity = group_capacity
+        self.questions = 0
+        self.words = SpaceSavingCounter(capacity) if capacity else None
+        self.chars = SpaceSavingCounter(capacity) if capacity and self.char_sizes else None
+        self.groups = {}
+
+    def add(self, question: str, group: Optional[str] = None):
+        """
+        질문 1건 집계
+
+        Args:
+            question: 질문 텍스트
+            group: Ground Truth (None이면 그룹별 집계 생략)
+        """
+        if not isinstance(question, str) or not question.strip():
+            return
+        self.questions += 1
+        tokens = tokenize(question)
+        dedupe = set if self.document_frequency else iter
+        if self.words is not None:
+            self.words.update(dedupe(word_ngrams(tokens, self.max_n, self.min_length)))
+        if self.chars is not None:
+            self.chars.update(dedupe(char_ngrams(tokens, self.char_sizes)))
+
+        if group is None:
+            return
+        stats = self.groups.get(group)
+        if stats is None:
+            stats = self.groups[group] = _GroupStats(self.group_capacity)
+        stats.count += 1
+        if len(stats.samples) < self.sample_size:
+            stats.samples.append(question)
+        stats.words.update(token for token in dedupe(tokens) if len(token) >= self.min_length)
+
+    def add_many(self, records: Iterable[Tuple[str, Optional[str]]]) -> 'NGramMiner':
+        """
+        (질문, Ground Truth) 스트림 집계
+
+        Args:
+            records: (질문, Ground Truth) 이터러블
+
+        Returns:
+            self
+        """
+        for question, group in records:
+            self.add(question, group)
+        return self
+
+    def group_summary(self, top: int = 5) -> Dict[str, Dict[str, Any]]:
+        """
+        Ground Truth별 요약
+
+        Args:
+            top: 그룹별 키워드 개수
+
+        Returns:
+            {Ground Truth: {'count', 'samples', 'keywords'}} (Ground Truth 이름순)
+        """
+        return {
+            group: {
+                'count': stats.count,
+                'samples': list(stats.samples),
+                'keywords': stats.words.most_common(top),
+            }
+            for group, stats in sorted(self.groups.items(), key=lambda kv: str(kv[0]))
+        }
+
+    def candidates(
+        self,
+        top: int = 100,
+        min_count: int = 2,
+        existing: Iterable[str] = ()
+    ) -> Dict[str, Any]:
+        """
+        micro_intents.json 큐레이션용 후보 목록
+
+        Args:
+            top: 전체/그룹별 후보 개수
+            min_count: 최소 빈도
+            existing: 이미 등록된 Micro-Intent 이름 (해당 이름과 같은 후보는 표시)
+
+        Returns:
+            후보 딕셔너리 (phrases, char_ngrams, by_ground_truth)
+        """
+        existing = {re.sub(r'\s', '', name) for name in existing}
+
+        def entries(counter, limit):
+            if counter is None:
+                return []
+            return [
+                {'text': text, 'count': count, 'error': counter.error(text),
+                 'existing': re.sub(r'\s', '', text) in existing}
+                for text, count in counter.most_common(limit) if count >= min_count
+            ]
+
+        return {
+            'questions': self.questions,
+            'phrases': entries(self.words, top),
+            'char_ngrams': entries(self.chars, top),
+            'by_ground_truth': {
+                group: {
+                    'count': stats.count,
+                    'keywords': entries(stats.words, top),
+                    'samples': list(stats.samples),
+                }
+                for group, stats in sorted(self.groups.items(), key=lambda kv: str(kv[0]))
+            },
+        }
+
+
+def iter_corpus(path: str) -> Iterator[Tuple[str, Optional[str]]]:
+    """
+    입력 파일에서 (질문, Ground Truth) 스트리밍
+
+    엑셀은 openpyxl 읽기 전용 모드로, CSV/JSONL/Parquet은 io_backends로 한 건씩 읽음
+
+    Args:
+        path: 입력 파일 경로 (.xlsx/.csv/.jsonl/.parquet)
+
+    Yields:
+        (질문, Ground Truth) - Ground Truth가 비어 있으면 None
+    """
+    from .io_backends import INPUT_COLUMN_ALIASES, detect_format, iter_questions
+
+    if detect_format(path) != 'xlsx':
+        for item in iter_questions(path):
+            yield item['question'], item['ground_truth'] or None
+        return
+
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = [str(cell).strip() if cell is not None else '' for cell in next(rows, ())]
+        q_col = next((header.index(a) for a in INPUT_COLUMN_ALIASES['question'] if a in header), 0)
+        gt_col = next((header.index(a) for a in INPUT_COLUMN_ALIASES['ground_truth'] if a in header), None)
+        for row in rows:
+            question = row[q_col] if q_col < len(row) else None
+            if question is None:
+                continue
+            ground_truth = row[gt_col] if gt_col is not None and gt_col < len(row) else None
+            yield str(question).strip(), (str(ground_truth).strip() or None) if ground_truth is not None else None
+    finally:
+        workbook.close()
+
+
+def mine_file(path: str, **kwargs) -> NGramMiner:
+    """
+    입력 파일 전체를 한 번 읽어 n-gram 집계
+
+    Args:
+        path: 입력 파일 경로
+        **kwargs: NGramMiner 생성 인자
+
+    Returns:
+        NGramMiner
+    """
+    miner = NGramMiner(**kwargs).add_many(iter_corpus(path))
+    logging.info(f"n-gram 집계 완료: 질문 {miner.questions:,}건, "
+                 f"어절 n-gram {len(miner.words or ()):,}개, 글자 n-gram {len(miner.chars or ()):,}개, "
+                 f"Ground Truth {len(miner.groups)}개")
+    return miner
+
+
+def save_candidates(path: str, candidates: Dict[str, Any]):
+    """
+    후보 목록을 JSON으로 저장
+
+    Args:
+        path: 저장 경로
+        candidates: NGramMiner.candidates() 결과
+    """
+    out_dir = os.path.dirname(path)
+    if out_dir:
+        os.makedirs(out_dir, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(candidates, f, ensure_ascii=False, indent=2)
@@ -0,0 +1,215 @@
+"""
+파이프라인 단계 모듈
+입력 읽기 → 분류 → 결과 기록을 별도 스레드 단계로 나누고 크기 제한 큐로 연결
+
+- Prefetcher: 읽기 스레드가 입력을 미리 읽어 큐에 채움 (파싱과 LLM 대기가 겹침)
+- WriterStage: 기록 스레드가 결과를 파일/워크북에 기록 (분류 루프는 큐에 넣기만 함)
+- 큐가 가득 차면 앞 단계가 대기하므로(backpressure) 메모리 사용량은 큐 크기로 제한됨
+- submit_windowed: 처리 중 작업 수를 윈도우 크기로 제한하며 입력을 순서대로 실행기에 제출
+"""
+
+import logging
+import queue
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+
+_END = object()
+
+
+class _StageError:
+    """단계 스레드에서 발생한 예외 전달용"""
+
+    __slots__ = ('error',)
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class WriterStageError(RuntimeError):
+    """기록 단계가 이전 예외로 중단된 뒤 put()이 호출된 경우"""
+
+
+class Prefetcher:
+    """
+    입력 미리 읽기 단계
+
+    별도 스레드가 이터러블을 읽어 최대 maxsize개까지 큐에 채워 두고, 소비자는 일반 이터레이터처럼 사용한다.
+    읽기 중 예외는 소비자 쪽 next()에서 다시 발생한다.
+    """
+
+    def __init__(self, iterable: Iterable[Any], maxsize: int = 64, name: str = 'reader'):
+        """
+        Args:
+            iterable: 입력 이터러블 (질문 데이터 제너레이터 등)
+            maxsize: 미리 읽어 둘 최대 항목 수
+            name: 스레드 이름
+        """
+        self._queue = queue.Queue(maxsize=max(1, maxsize))
+        self._stop = threading.Event()
+        self._done = False
+        self.count = 0
+        self._thread = threading.Thread(target=self._run, args=(iterable,), name=name, daemon=True)
+        self._thread.start()
+
+    def _put(self, value) -> bool:
+        """큐에 넣기 (중단 요청 시 False)"""
+        while not self._stop.is_set():
+            try:
+                self._queue.put(value, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run(self, iterable: Iterable[Any]):
+        try:
+            for item in iterable:
+                if not self._put(item):
+                    return
+        except BaseException as e:
+            self._put(_StageError(e))
+            return
+        self._put(_END)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._done:
+            raise StopIteration
+        value = self._queue.get()
+        if value is _END:
+            self._done = True
+            raise StopIteration
+        if isinstance(value, _StageError):
+            self._done = True
+            raise value.error
+        self.count += 1
+        return value
+
+    def close(self):
+        """읽기 중단 (남은 입력은 읽지 않음)"""
+        self._stop.set()
+        self._done = True
+        self._thread.join(timeout=1.0)
+
+
+class WriterStage:
+    """
+    결과 기록 단계
+
+    put(결과, 질문 데이터)은 큐에 넣고 바로 반환하며, 기록 스레드가 도착 순서대로 write 함수를 호출한다.
+    큐가 가득 차면 put()이 대기한다. 기록 중 예외가 발생하면 이후 항목은 버리고, 다음 put()부터
+    WriterStageError를 발생시켜 분류 루프가 남은 질문을 제출하지 않도록 한다 (close()는 원래 예외를 반환/발생).
+    """
+
+    def __init__(self, write: Callable[[Dict[str, Any], Dict[str, Any]], None], maxsize: int = 64,
+                 name: str = 'writer'):
+        """
+        Args:
+            write: 결과 1건 기록 함수 write(결과, 질문 데이터)
+            maxsize: 기록 대기 최대 항목 수
+            name: 스레드 이름
+        """
+        self._write = write
+        self._queue = queue.Queue(maxsize=max(1, maxsize))
+        self._error = None
+        self.count = 0
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            value = self._queue.get()
+            if value is _END:
+                return
+            if self._error is not None:
+                continue
+            try:
+                self._write(*value)
+                self.count += 1
+            except BaseException as e:
+                self._error = e
+                logging.error(f"결과 기록 실패 - {e}")
+
+    def put(self, result: Dict[str, Any], item: Dict[str, Any]):
+        """
+        결과 1건 기록 요청 (on_result 콜백으로 사용)
+
+        Args:
+            result: 분류 결과 딕셔너리
+            item: 원본 질문 데이터
+
+        Raises:
+            WriterStageError: 이전 기록에서 예외가 발생한 경우 (이 결과는 기록되지 않음)
+        """
+        if self._error is not None:
+            raise WriterStageError(f"결과 기록 단계 중단 - {self._error}") from self._error
+        self._queue.put((result, item))
+
+    def close(self, raise_error: bool = True) -> Optional[BaseException]:
+        """
+        남은 결과를 모두 기록하고 기록 스레드 종료
+
+        Args:
+            raise_error: 기록 중 발생한 예외를 다시 발생시킬지 여부
+
+        Returns:
+            기록 중 발생한 예외 (없으면 None)
+        """
+        if self._thread.is_alive():
+            self._queue.put(_END)
+            self._thread.join()
+        if self._error is not None and raise_error:
+            raise self._error
+        return self._error
+
+
+def submit_windowed(
+    submit: Callable[[Any], Future],
+    items: Iterable[Any],
+    window: int
+) -> Iterator[Tuple[Any, Future]]:
+    """
+    제출 윈도우 방식 실행
+
+    입력을 한꺼번에 제출하지 않고, 처리 중인 작업이 window개가 될 때까지만 submit(항목)을 호출한 뒤
+    작업이 끝날 때마다 다음 항목을 제출한다. 입력이 스트리밍 이터레이터여도 되며, 완료된 Future는
+    반환 즉시 놓으므로 메모리 사용량은 입력 크기와 무관하게 윈도우 크기에 비례한다.
+    제너레이터를 닫으면(close()) 아직 시작하지 않은 작업은 취소된다.
+
+    Args:
+        submit: 항목 1건을 실행기에 제출하고 Future를 반환하는 함수
+        items: 입력 이터러블
+        window: 처리 중 작업 수 상한
+
+    Yields:
+        완료된 순서대로 (항목, Future) 튜플
+    """
+    source = iter(items)
+    window = max(1, window)
+    pending = {}
+    exhausted = False
+
+    def fill():
+        nonlocal exhausted
+        while not exhausted and len(pending) < window:
+            item = next(source, _END)
+            if item is _END:
+                exhausted = True
+                break
+            pending[submit(item)] = item
+
+    try:
+        fill()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), future
+            fill()
+    finally:
+        # 소비 중단 시 남은 작업 취소 (대기 중인 작업은 최대 윈도우 크기)
+        for future in pending:
+            future.cancel()
@@ -0,0 +1,348 @@
+"""
+프로파일링 모듈
+--profile 실행 시 모든 스레드의 호출 스택을 주기적으로 샘플링하고, 처리 단계별 소요 시간을 집계
+
+- 샘플링 프로파일러: sys._current_frames()로 interval초마다 전체 스레드 스택을 수집 (벽시계 기준이므로
+  네트워크 대기, Lock 대기도 포함). 결과는 flamegraph.pl / speedscope에서 열 수 있는 folded stack 형식
+- 단계 타이머: 프롬프트 생성, HTTP, 파싱, 매칭, 채점, 결과 기록 등 단계별 누적 시간 (비활성 시 거의 비용 없음)
+- 단계 안에서 시작된 단계(http 안의 limiter_wait, retry_backoff 등)는 하위 단계로 따로 집계하여
+  보고서의 비율이 상위 단계 기준으로만 계산되도록 함 (같은 시간이 두 번 더해지지 않도록)
+- stage()로 측정한 단계는 --trace 실행 시 타임라인 구간(tracing.tracer)으로도 기록
+- 실행 구간 표시(mark_phase): 메인 흐름의 구간 전환(load, classify, save 등)을 등록된 리스너에 알림
+  (메모리 벤치마크가 구간별 tracemalloc 최댓값을 잴 때 사용, 리스너가 없으면 아무 일도 하지 않음)
+"""
+
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .tracing import tracer
+
+
+_NULL_CONTEXT = nullcontext()
+_WORKER_SUFFIX = re.compile(r'_\d+$')
+
+
+class StageTimer:
+    """
+    처리 단계별 누적 시간 집계기 (스레드 안전)
+
+    enabled가 False면 stage()는 아무 일도 하지 않는 컨텍스트를 반환한다.
+    같은 스레드에서 진행 중인 단계 안에서 시작된 단계는 (상위 단계 경로, 이름)으로 따로 집계한다.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._totals = {}
+        self._counts = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def stage(self, name: str, parent: Optional[str] = None):
+        """
+        단계 시간 측정 컨텍스트 (타임라인 추적 중이면 구간도 기록)
+
+        Args:
+            name: 단계 이름 (prompt, http, parse, match, evaluate, excel_write 등)
+            parent: 상위 단계 이름 (다른 스레드에서 실행되는 하위 단계용, 기본: 같은 스레드의 진행 중인 단계)
+        """
+        if not self.enabled and not tracer.enabled:
+            return _NULL_CONTEXT
+        return self._measure(name, parent)
+
+    @contextmanager
+    def _measure(self, name: str, parent: Optional[str] = None):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        parents = (parent,) if parent is not None else tuple(stack)
+        stack.append(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            stack.pop()
+            if self.enabled:
+                self.add(name, end - start, parents)
+            if tracer.enabled:
+                tracer.add(name, start, end)
+
+    def add(self, name: str, seconds: float, parents: Tuple[str, ...] = ()):
+        """
+        단계 시간 1건 추가
+
+        Args:
+            name: 단계 이름
+            seconds: 소요 시간 (초)
+            parents: 상위 단계 경로 (바깥쪽부터, 최상위 단계면 빈 튜플)
+        """
+        key = (*parents, name)
+        with self._lock:
+            self._totals[key] = self._totals.get(key, 0.0) + seconds
+            self._counts[key] = self._counts.get(key, 0) + 1
+
+    def reset(self):
+        """집계 초기화"""
+        with self._lock:
+            self._totals.clear()
+            self._counts.clear()
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """
+        단계별 집계 (같은 깊이끼리 누적 시간 내림차순, 하위 단계는 상위 단계 바로 뒤)
+
+        Returns:
+            [{'stage', 'parent', 'depth', 'count', 'total', 'mean'}] 리스트
+            (parent: 상위 단계 경로 'http' / 'a > b', 최상위 단계면 None / depth: 보고서 들여쓰기 깊이, 0이면 최상위)
+        """
+        with self._lock:
+            totals = dict(self._totals)
+            counts = dict(self._counts)
+
+        children = {}
+        for key in totals:
+            # 상위 단계가 측정되지 않았으면(다른 스레드에서 parent를 지정했으나 상위 단계가 없는 경우) 최상위로 표시
+            parent = key[:-1] if key[:-1] in totals else ()
+            children.setdefault(parent, []).append(key)
+
+        entries = []
+
+        def visit(parent, depth):
+            for key in sorted(children.get(parent, ()), key=lambda k: -totals[k]):
+                entries.append({
+                    'stage': key[-1],
+                    'parent': ' > '.join(key[:-1]) or None,
+                    'depth': depth,
+                    'count': counts[key],
+                    'total': totals[key],
+                    'mean': totals[key] / counts[key],
+                })
+                visit(key, depth + 1)
+
+        visit((), 0)
+        return entries
+
+
+# 프로세스 전역 단계 타이머 (--profile 실행 시에만 활성화)
+stage_timer = StageTimer()
+
+
+def stage(name: str, parent: Optional[str] = None):
+    """전역 단계 타이머의 측정 컨텍스트 (비활성 시 비용 없음)"""
+    return stage_timer.stage(name, parent)
+
+
+# 실행 구간 전환 리스너 (기본: 없음)
+_phase_listeners: List[Callable[[str], None]] = []
+
+
+def add_phase_listener(listener: Callable[[str], None]):
+    """
+    실행 구간 전환 리스너 등록
+
+    Args:
+        listener: 새 구간 이름을 받는 함수 (메인 스레드에서 호출됨)
+    """
+    _phase_listeners.append(listener)
+
+
+def remove_phase_listener(listener: Callable[[str], None]):
+    """실행 구간 전환 리스너 해제"""
+    if listener in _phase_listeners:
+        _phase_listeners.remove(listener)
+
+
+def mark_phase(name: str):
+    """
+    실행 구간 전환 알림 (이전 구간은 여기서 끝나고 name 구간이 시작됨)
+
+    Args:
+        name: 새 구간 이름 ('load', 'setup', 'classify', 'save', 'report', 'done')
+    """
+    for listener in list(_phase_listeners):
+        listener(name)
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class SamplingProfiler:
+    """
+    전체 스레드 샘플링 프로파일러
+
+    스레드 이름의 끝 번호(ThreadPoolExecutor-0_3 등)는 제거하여 같은 풀의 작업 스레드를 하나로 합친다.
+    """
+
+    def __init__(self, interval: float = 0.01, max_depth: int = 64):
+        """
+        Args:
+            interval: 샘플링 간격 (초)
+            max_depth: 스택 최대 깊이 (더 깊은 바깥쪽 프레임은 생략)
+        """
+        self.interval = interval
+        self.max_depth = max_depth
+        self.samples = 0
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = None
+        self._start = None
+        self.duration = 0.0
+
+    def _sample(self, own_ident: int):
+        names = {thread.ident: _WORKER_SUFFIX.sub('', thread.name) for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == own_ident:
+                continue
+            labels = []
+            while frame is not None and len(labels) < self.max_depth:
+                labels.append(_frame_label(frame))
+                frame = frame.f_back
+            labels.append(names.get(ident, f"thread-{ident}"))
+            self.stacks[';'.join(reversed(labels))] += 1
+        self.samples += 1
+
+    def _run(self):
+        own_ident = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            self._sample(own_ident)
+
+    def start(self) -> 'SamplingProfiler':
+        """샘플링 시작"""
+        self._start = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name='profiler', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """샘플링 종료"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+        self.duration = time.perf_counter() - self._start
+
+    def top_functions(self, n: int = 30) -> Tuple[List[Tuple[str, int]], List[Tuple[str, int]]]:
+        """
+        함수별 샘플 수 상위 N개
+
+        Args:
+            n: 개수
+
+        Returns:
+            (자체 샘플 상위, 누적 샘플 상위) - 누적은 스택에 한 번이라도 나온 샘플 수
+        """
+        own = Counter()
+        inclusive = Counter()
+        for stack, count in self.stacks.items():
+            frames = stack.split(';')[1:]
+            if not frames:
+                continue
+            own[frames[-1]] += count
+            for label in set(frames):
+                inclusive[label] += count
+        return own.most_common(n), inclusive.most_common(n)
+
+    def thread_totals(self) -> List[Tuple[str, int]]:
+        """스레드(풀)별 샘플 수"""
+        totals = Counter()
+        for stack, count in self.stacks.items():
+            totals[stack.split(';', 1)[0]] += count
+        return totals.most_common()
+
+    def write_folded(self, path: str):
+        """
+        folded stack 파일 저장 (한 줄 = "스레드;바깥 함수;...;안쪽 함수 샘플 수")
+
+        Args:
+            path: 저장 경로
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in sorted(self.stacks.items()):
+                f.write(f"{stack} {count}\n")
+
+
+def format_profile_report(profiler: Optional[SamplingProfiler], stages: List[Dict[str, Any]], top: int = 30) -> str:
+    """
+    프로파일 요약 보고서 (단계별 시간 + 함수별 상위 N개)
+
+    Args:
+        profiler: 샘플링 프로파일러 (None이면 단계별 시간만)
+        stages: StageTimer.summary() 결과
+        top: 함수 개수
+
+    Returns:
+        보고서 문자열
+    """
+    lines = ["# 단계별 소요 시간 (모든 스레드 합계, └: 상위 단계 시간에 포함된 하위 단계 - 비율 합계에서 제외)", ""]
+    # 하위 단계 시간은 상위 단계에 이미 포함되어 있으므로 최상위 단계만 합산
+    stage_total = sum(entry['total'] for entry in stages if not entry.get('depth')) or 1.0
+    lines.append(f"{'단계':<16}{'횟수':>10}{'합계(초)':>12}{'평균(ms)':>12}{'비율':>8}")
+    for entry in stages:
+        depth = entry.get('depth', 0)
+        label = f"{'  ' * (depth - 1)}└ {entry['stage']}" if depth else entry['stage']
+        lines.append(f"{label:<16}{entry['count']:>10,}{entry['total']:>12.2f}"
+                     f"{entry['mean'] * 1000:>12.2f}{entry['total'] / stage_total * 100:>7.1f}%")
+
+    if profiler is not None and profiler.samples:
+        lines += ["", f"# 샘플링: {profiler.samples:,}회 ({profiler.interval * 1000:g}ms 간격, {profiler.duration:.1f}초)",
+                  "", "## 스레드별 샘플"]
+        total = sum(profiler.stacks.values()) or 1
+        for name, count in profiler.thread_totals():
+            lines.append(f"{count:>10,} {count / total * 100:>6.1f}%  {name}")
+
+        own, inclusive = profiler.top_functions(top)
+        lines += ["", f"## 자체 시간 상위 {top} (스택 맨 안쪽 함수)"]
+        for label, count in own:
+            lines.append(f"{count:>10,} {count / total * 100:>6.1f}%  {label}")
+        lines += ["", f"## 누적 시간 상위 {top} (호출한 함수 포함)"]
+        for label, count in inclusive:
+            lines.append(f"{count:>10,} {count / total * 100:>6.1f}%  {label}")
+    return '\n'.join(lines) + '\n'
+
+
+def start_profiling(interval: float = 0.01) -> SamplingProfiler:
+    """
+    단계 타이머 활성화 및 샘플링 프로파일러 시작
+
+    Args:
+        interval: 샘플링 간격 (초)
+
+    Returns:
+        시작된 SamplingProfiler
+    """
+    stage_timer.reset()
+    stage_timer.enabled = True
+    return SamplingProfiler(interval=interval).start()
+
+
+def finish_profiling(profiler: SamplingProfiler, output_base: str, top: int = 30) -> Tuple[str, str]:
+    """
+    프로파일링 종료 후 folded stack과 요약 보고서 저장
+
+    Args:
+        profiler: start_profiling()이 반환한 프로파일러
+        output_base: 저장 경로 접두사 (<접두사>_profile.folded, <접두사>_profile.txt)
+        top: 요약 보고서 함수 개수
+
+    Returns:
+        (folded stack 경로, 요약 보고서 경로)
+    """
+    profiler.stop()
+    stage_timer.enabled = False
+
+    directory = os.path.dirname(output_base)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    folded_path = f"{output_base}_profile.folded"
+    report_path = f"{output_base}_profile.txt"
+    profiler.write_folded(folded_path)
+    with open(report_path, 'w', encoding='utf-8') as f:
+        f.write(format_profile_report(profiler, stage_timer.summary(), top))
+    return folded_path, report_path
@@ -0,0 +1,345 @@
+"""
+LLM 원본 응답 저장소 모듈
+행 번호와 프롬프트 해시별로 LLM 원본 응답을 저장하여, 파싱/매칭/평가를 LLM 호출 없이 다시 수행할 수 있도록 함
+
+저장 형식 (경로 확장자로 선택):
+- .jsonl      : 한 줄 = 한 항목 (사람이 읽기 쉬움)
+- .jsonl.gz   : gzip 압축 JSONL (기록마다 gzip 멤버를 이어 붙임)
+- .sqlite/.db : SQLite (응답은 zlib 압축, 대용량에서 전체를 메모리에 올리지 않음)
+
+JSONL 파일은 열 때 비정상 종료로 잘린 끝부분을 잘라내고 온전한 앞부분 뒤에 이어 기록한다.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+import zlib
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Iterator, Optional
+
+
+# 비정상 종료로 잘린 JSONL/gzip 파일을 읽을 때 발생할 수 있는 예외
+# (gzip 멤버가 중간에 끊긴 뒤 새 멤버가 이어 붙으면 zlib.error가 발생)
+_DAMAGED_TAIL_ERRORS = (EOFError, OSError, zlib.error, json.JSONDecodeError)
+
+
+def prompt_key(provider: str, model: Optional[str], prompt: str) -> str:
+    """
+    프롬프트 해시 (Provider, 모델, 프롬프트의 SHA-256)
+
+    프롬프트에는 질문, 지침, 의도 목록이 모두 포함되므로 셋 중 하나라도 바뀌면 값이 달라짐
+
+    Args:
+        provider: LLM 제공자
+        model: 모델 이름
+        prompt: 프롬프트
+
+    Returns:
+        64자리 16진수 문자열
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{provider}\0{model or ''}\0".encode('utf-8'))
+    digest.update(prompt.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def open_jsonl(path: str, mode: str, compressed: Optional[bool] = None):
+    """
+    JSONL 파일 열기 (.gz 확장자면 gzip)
+
+    Args:
+        path: 파일 경로
+        mode: 텍스트 모드 ('rt', 'at', 'wt')
+        compressed: gzip 여부 (None이면 확장자로 판단, 임시 파일용)
+
+    Returns:
+        파일 객체
+    """
+    if compressed is None:
+        compressed = path.endswith('.gz')
+    if compressed:
+        return gzip.open(path, mode, encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+def load_jsonl(path: str, handle: Callable[[Dict[str, Any]], None], label: str) -> int:
+    """
+    JSONL(.jsonl / .jsonl.gz) 파일의 온전한 항목을 순서대로 읽고, 끝부분이 손상되었으면 복구
+
+    비정상 종료(Ctrl+C, OOM 등)로 마지막 줄이나 gzip 블록이 잘린 파일에 그대로 이어 쓰면
+    새 기록이 손상된 부분 뒤에 붙어 다음 로드가 실패하므로, 손상된 경우 온전한 앞부분만
+    새 파일로 다시 써서 원본을 교체한다. (파일이 없으면 아무것도 하지 않음)
+
+    Args:
+        path: 파일 경로
+        handle: 항목마다 호출할 함수
+        label: 로그에 표시할 파일 종류
+
+    Returns:
+        읽은 항목 수
+    """
+    if not os.path.exists(path):
+        return 0
+
+    count = 0
+    damaged = None
+    with open_jsonl(path, 'rt') as f:
+        try:
+            for line in f:
+                if not line.endswith('\n'):
+                    # 줄바꿈 전에 끊긴 마지막 줄 (JSON으로 읽히더라도 뒤에 이어 쓰면 붙어버림)
+                    damaged = "마지막 줄이 잘림"
+                    break
+                if line.strip():
+                    handle(json.loads(line))
+                count += 1
+        except _DAMAGED_TAIL_ERRORS as e:
+            damaged = e
+
+    if damaged is not None:
+        logging.warning(f"{label}의 손상된 끝부분 제거 ({path}, 온전한 {count}줄 유지): {damaged}")
+        # 온전한 앞부분만 스트리밍으로 다시 써서 원본 교체
+        tmp_path = path + '.tmp'
+        with open_jsonl(path, 'rt') as src, open_jsonl(tmp_path, 'wt', path.endswith('.gz')) as dst:
+            for _, line in zip(range(count), src):
+                dst.write(line)
+        os.replace(tmp_path, path)
+    return count
+
+
+class ResponseStore(ABC):
+    """
+    LLM 원본 응답 저장소 기본 클래스 (스레드 안전)
+
+    항목 형식: {row, prompt_hash, ground_truth, matcher_version, response, usage}
+    키는 (행 번호, 프롬프트 해시)이며, 같은 행에 여러 프롬프트 버전의 응답을 함께 보관한다.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: 저장소 경로
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+        store_dir = os.path.dirname(path)
+        if store_dir:
+            os.makedirs(store_dir, exist_ok=True)
+
+    @abstractmethod
+    def get(self, row: int, prompt_hash: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        저장된 항목 조회
+
+        Args:
+            row: 행 번호
+            prompt_hash: 프롬프트 해시 (None이면 해당 행에 마지막으로 기록된 항목)
+
+        Returns:
+            저장 항목 (없으면 None)
+        """
+
+    @abstractmethod
+    def put(self, entry: Dict[str, Any]):
+        """
+        항목 저장 (같은 행/프롬프트 해시의 기존 항목 대체)
+
+        Args:
+            entry: 저장 항목 (row, prompt_hash 필수)
+        """
+
+    @abstractmethod
+    def iter_latest(self) -> Iterator[Dict[str, Any]]:
+        """행별 마지막 항목을 행 번호 순으로 반환"""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """저장된 행 수"""
+
+    def close(self):
+        """저장소 닫기"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class JsonlResponseStore(ResponseStore):
+    """
+    JSONL(.jsonl / .jsonl.gz) 응답 저장소
+
+    put()마다 한 줄을 추가하고, 같은 키가 여러 번 기록되면 마지막 기록을 사용한다.
+    close() 시 덮어쓴 줄이 많으면 키별 최신 항목만 남도록 파일을 다시 쓴다.
+    """
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self._entries = {}   # (row, prompt_hash) → 항목
+        self._latest = {}    # row → 마지막 prompt_hash
+        self._lines = 0
+
+        if os.path.exists(path):
+            # 손상된 끝부분은 제거되므로 이후 추가 기록은 온전한 파일 뒤에 붙음
+            self._lines = load_jsonl(path, self._index, "응답 저장소")
+            logging.info(f"응답 저장소 로드: {path} ({len(self._latest)}개 행, {len(self._entries)}개 응답)")
+
+        self._file = open_jsonl(path, 'at')
+
+    def _index(self, entry: Dict[str, Any]):
+        self._entries[(entry['row'], entry['prompt_hash'])] = entry
+        self._latest[entry['row']] = entry['prompt_hash']
+
+    def get(self, row: int, prompt_hash: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        if prompt_hash is None:
+            prompt_hash = self._latest.get(row)
+        return self._entries.get((row, prompt_hash))
+
+    def put(self, entry: Dict[str, Any]):
+        line = json.dumps(entry, ensure_ascii=False)
+        with self._lock:
+            self._index(entry)
+            self._file.write(line + '\n')
+            self._file.flush()
+            self._lines += 1
+
+    def iter_latest(self) -> Iterator[Dict[str, Any]]:
+        for row in sorted(self._latest):
+            yield self._entries[(row, self._latest[row])]
+
+    def __len__(self) -> int:
+        return len(self._latest)
+
+    def close(self):
+        """파일 닫기 (덮어쓴 줄이 절반을 넘으면 키별 최신 항목만 남기도록 압축)"""
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.close()
+            if self._lines > 2 * len(self._entries):
+                tmp_path = self.path + '.tmp'
+                with open_jsonl(tmp_path, 'wt', self.path.endswith('.gz')) as f:
+                    # 행별 마지막 항목이 다시 읽을 때도 마지막이 되도록 정렬
+                    for key in sorted(self._entries, key=lambda k: (k[0], k[1] == self._latest[k[0]])):
+                        f.write(json.dumps(self._entries[key], ensure_ascii=False) + '\n')
+                os.replace(tmp_path, self.path)
+                self._lines = len(self._entries)
+
+
+class SqliteResponseStore(ResponseStore):
+    """
+    SQLite(.sqlite / .db) 응답 저장소
+
+    응답 본문은 zlib으로 압축하여 저장하고, 조회 시에만 읽으므로 행 수가 많아도 메모리 사용량이 일정하다.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS responses (
+            row INTEGER NOT NULL,
+            prompt_hash TEXT NOT NULL,
+            ground_truth TEXT,
+            matcher_version TEXT,
+            response BLOB NOT NULL,
+            usage TEXT,
+            seq INTEGER NOT NULL,
+            PRIMARY KEY (row, prompt_hash)
+        )
+    """
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        import sqlite3
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(self._SCHEMA)
+        self._conn.execute('CREATE INDEX IF NOT EXISTS responses_row_seq ON responses (row, seq)')
+        self._conn.commit()
+        self._seq = self._conn.execute('SELECT COALESCE(MAX(seq), 0) FROM responses').fetchone()[0]
+        logging.info(f"응답 저장소 연결: {path} ({len(self)}개 행)")
+
+    @staticmethod
+    def _to_entry(record) -> Dict[str, Any]:
+        row, prompt_hash, ground_truth, matcher_version, response, usage = record
+        return {
+            'row': row,
+            'prompt_hash': prompt_hash,
+            'ground_truth': ground_truth,
+            'matcher_version': matcher_version,
+            'response': zlib.decompress(response).decode('utf-8'),
+            'usage': json.loads(usage) if usage else None,
+        }
+
+    def get(self, row: int, prompt_hash: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        columns = 'row, prompt_hash, ground_truth, matcher_version, response, usage'
+        with self._lock:
+            if prompt_hash is None:
+                record = self._conn.execute(
+                    f'SELECT {columns} FROM responses WHERE row = ? ORDER BY seq DESC LIMIT 1', (row,)
+                ).fetchone()
+            else:
+                record = self._conn.execute(
+                    f'SELECT {columns} FROM responses WHERE row = ? AND prompt_hash = ?', (row, prompt_hash)
+                ).fetchone()
+        return self._to_entry(record) if record else None
+
+    def put(self, entry: Dict[str, Any]):
+        response = zlib.compress(entry['response'].encode('utf-8'))
+        usage = json.dumps(entry['usage'], ensure_ascii=False) if entry.get('usage') else None
+        with self._lock:
+            self._seq += 1
+            self._conn.execute(
+                'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (entry['row'], entry['prompt_hash'], entry.get('ground_truth'),
+                 entry.get('matcher_version'), response, usage, self._seq)
+            )
+            self._conn.commit()
+
+    def iter_latest(self, batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        with self._lock:
+            cursor = self._conn.execute("""
+                SELECT r.row, r.prompt_hash, r.ground_truth, r.matcher_version, r.response, r.usage
+                FROM responses r
+                JOIN (SELECT row, MAX(seq) AS seq FROM responses GROUP BY row) latest
+                  ON r.row = latest.row AND r.seq = latest.seq
+                ORDER BY r.row
+            """)
+        while True:
+            # 배치 단위로 읽어 전체 응답을 한 번에 메모리에 올리지 않음
+            with self._lock:
+                records = cursor.fetchmany(batch_size)
+            if not records:
+                break
+            for record in records:
+                yield self._to_entry(record)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(DISTINCT row) FROM responses').fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def open_response_store(path: str) -> ResponseStore:
+    """
+    경로 확장자에 맞는 응답 저장소 생성
+
+    Args:
+        path: 저장소 경로 (.jsonl / .jsonl.gz / .sqlite / .db)
+
+    Returns:
+        ResponseStore 인스턴스
+    """
+    if path.endswith(('.sqlite', '.sqlite3', '.db')):
+        return SqliteResponseStore(path)
+    if path.endswith(('.jsonl', '.jsonl.gz')):
+        return JsonlResponseStore(path)
+    raise ValueError(f"지원하지 않는 응답 저장소 형식 - {path} (지원: .jsonl, .jsonl.gz, .sqlite, .db)")
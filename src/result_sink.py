@@ -0,0 +1,210 @@
+"""
+JSON 결과 스트리밍 모듈
+분류 결과를 완료 즉시 한 줄씩 JSONL로 기록하고, 종료 시 배열 형식의 result.json을 생성
+"""
+
+import json
+import logging
+import os
+import threading
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional
+
+from .llm_classifier import map_to_hierarchical_domain
+
+
+@lru_cache(maxsize=None)
+def _super_domain(domain: str) -> Optional[str]:
+    """상위 도메인 매핑 (도메인 값별 1회만 계산)"""
+    return map_to_hierarchical_domain(domain)
+
+
+def build_json_record(result: Dict[str, Any], item: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    result.json 레코드 생성 (instruction.md 3.4 형식)
+
+    분류 의견(opinion)은 제외하고 핵심 데이터와 상위 도메인 정보만 포함
+
+    Args:
+        result: 분류 결과 딕셔너리
+        item: 원본 질문 데이터
+
+    Returns:
+        JSON 레코드 딕셔너리
+    """
+    ground_truth = item.get('ground_truth', '')
+    classified_domain = result['classified_domain']
+
+    # 13개 상위 도메인으로 매핑
+    super_domain_gt = _super_domain(ground_truth)
+    super_domain_classified = _super_domain(classified_domain)
+
+    # 상위 도메인 레벨에서의 성공 여부
+    super_domain_success = 'O' if super_domain_gt == super_domain_classified else 'X'
+
+    return {
+        'row': result['row'],
+        'question': item.get('question', ''),
+        'ground_truth': ground_truth,
+        'classified_domain': classified_domain,  # 1순위 도메인 (하위 호환성)
+        'classified_domains': result.get('classified_domains', [classified_domain]),  # 실험19: Top-K
+        'hit_rank': result.get('hit_rank'),  # 실험19: Hit@K 순위
+        'success': result['success'],
+        'opinion_category': result['opinion_category'],
+        'prompt_tokens': result.get('prompt_tokens'),
+        'completion_tokens': result.get('completion_tokens'),
+        'super_domain_ground_truth': super_domain_gt if super_domain_gt else '',
+        'classified_super_domain': super_domain_classified if super_domain_classified else '',
+        'super_domain_success': super_domain_success if (super_domain_gt and super_domain_classified) else ''
+    }
+
+
+def jsonl_path_for(json_path: str) -> str:
+    """result.json 경로에 대응하는 행 단위 JSONL 경로 (result.jsonl)"""
+    base, _ = os.path.splitext(json_path)
+    return base + '.jsonl'
+
+
+class JsonResultSink:
+    """
+    행 단위 JSON 결과 기록기
+
+    write()마다 result.jsonl에 한 줄을 추가하고 flush하므로 프로세스가 중간에 종료되어도
+    완료된 행은 남는다. finalize()는 JSONL 줄을 다시 직렬화하지 않고 행 번호 순으로
+    복사하여 배열 형식의 result.json을 만든다.
+    """
+
+    def __init__(self, json_path: str, append: bool = False):
+        """
+        Args:
+            json_path: 최종 result.json 경로 (JSONL은 같은 이름의 .jsonl)
+            append: 기존 JSONL에 이어서 쓸지 여부
+        """
+        self.json_path = json_path
+        self.jsonl_path = jsonl_path_for(json_path)
+        self.count = 0
+        self._lock = threading.Lock()
+
+        json_dir = os.path.dirname(json_path)
+        if json_dir and not os.path.exists(json_dir):
+            os.makedirs(json_dir)
+            logging.debug(f"JSON 결과 디렉토리 생성: {json_dir}")
+
+        self._file = open(self.jsonl_path, 'a' if append else 'w', encoding='utf-8')
+
+    def write(self, result: Dict[str, Any], item: Dict[str, Any]):
+        """
+        결과 1건 기록
+
+        Args:
+            result: 분류 결과 딕셔너리
+            item: 원본 질문 데이터
+        """
+        line = json.dumps(build_json_record(result, item), ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + '\n')
+            self._file.flush()
+            self.count += 1
+
+    def close(self):
+        """JSONL 파일 닫기"""
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    def finalize(self) -> int:
+        """
+        JSONL을 행 번호 순 배열 형식의 result.json으로 변환
+
+        같은 행이 여러 번 기록된 경우 마지막 기록을 사용
+
+        Returns:
+            result.json에 기록된 항목 수
+        """
+        self.close()
+
+        # 1차: 행 번호별 줄 위치만 수집 (레코드 전체를 메모리에 올리지 않음)
+        offsets = {}
+        with open(self.jsonl_path, 'rb') as f:
+            offset = f.tell()
+            for line in iter(f.readline, b''):
+                if line.strip():
+                    try:
+                        offsets[json.loads(line)['row']] = offset
+                    except (json.JSONDecodeError, KeyError):
+                        logging.warning(f"손상된 JSONL 줄 무시 (offset {offset})")
+                offset = f.tell()
+
+        # 2차: 행 번호 순으로 원본 줄을 그대로 복사
+        tmp_path = self.json_path + '.tmp'
+        with open(self.jsonl_path, 'rb') as src, open(tmp_path, 'wb') as dst:
+            dst.write(b'[\n')
+            for i, row in enumerate(sorted(offsets)):
+                src.seek(offsets[row])
+                dst.write(b'  ' + src.readline().rstrip(b'\r\n'))
+                dst.write(b',\n' if i < len(offsets) - 1 else b'\n')
+            dst.write(b']\n')
+        os.replace(tmp_path, self.json_path)
+
+        return len(offsets)
+
+
+def iter_results(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    결과 파일을 레코드 단위로 읽기 (.jsonl은 스트리밍, .json은 배열 전체 로드)
+
+    비정상 종료로 JSONL 마지막 줄이 잘렸으면 경고 후 건너뜀 (중간 줄이 손상되었으면 오류)
+
+    Args:
+        path: result.json 또는 result.jsonl 경로
+
+    Yields:
+        결과 레코드
+
+    Raises:
+        json.JSONDecodeError: 마지막 줄이 아닌 줄을 읽을 수 없는 경우
+    """
+    if path.endswith('.jsonl'):
+        with open(path, 'r', encoding='utf-8') as f:
+            torn = None
+            for number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                if torn is not None:
+                    raise torn
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    # 뒤에 온전한 줄이 더 있으면 마지막 줄이 아니므로 그때 오류로 처리
+                    torn = e
+                    torn_line = number
+                    continue
+                yield record
+            if torn is not None:
+                logging.warning(f"{path}의 잘린 마지막 줄 무시 ({torn_line}번째 줄): {torn}")
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            yield from json.load(f)
+
+
+def load_results(path: str) -> List[Dict[str, Any]]:
+    """
+    결과 파일 전체 로드 (분석 스크립트용)
+
+    result.json이 없고 result.jsonl만 있으면(비정상 종료 등) JSONL을 읽음
+
+    Args:
+        path: result.json 또는 result.jsonl 경로
+
+    Returns:
+        결과 레코드 리스트 (JSONL은 행별 마지막 기록, 행 번호 순)
+    """
+    if not os.path.exists(path) and path.endswith('.json') and os.path.exists(jsonl_path_for(path)):
+        path = jsonl_path_for(path)
+        logging.info(f"{path}에서 결과를 읽습니다.")
+
+    if path.endswith('.jsonl'):
+        by_row = {record['row']: record for record in iter_results(path)}
+        return [by_row[row] for row in sorted(by_row)]
+    return list(iter_results(path))
@@ -0,0 +1,243 @@
+"""
+층화 추출 모듈
+Ground Truth를 정수 코드 배열로 변환하여 NumPy로 층화 랜덤 샘플링하고,
+재현 가능하도록 시드와 선택된 행 번호를 샘플 매니페스트(JSON)로 저장/재사용
+"""
+
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+MANIFEST_VERSION = 1
+
+
+def encode_ground_truth(questions: Sequence[Dict[str, Any]]) -> Tuple[np.ndarray, List[str]]:
+    """
+    질문별 Ground Truth를 정수 코드 배열로 변환
+
+    Args:
+        questions: 질문 데이터 리스트
+
+    Returns:
+        (질문별 클래스 코드 배열, 코드 → Ground Truth 리스트) 튜플
+    """
+    class_codes = {}
+    codes = np.empty(len(questions), dtype=np.int32)
+    for i, q in enumerate(questions):
+        gt = q.get('ground_truth', 'Unknown')
+        code = class_codes.get(gt)
+        if code is None:
+            code = class_codes[gt] = len(class_codes)
+        codes[i] = code
+    return codes, list(class_codes)
+
+
+def compute_quotas(counts: np.ndarray, limit: int, min_per_class: int = 0) -> np.ndarray:
+    """
+    클래스별 추출 개수 계산 (최대 잔여 방식)
+
+    각 클래스에 min(클래스 크기, min_per_class)를 먼저 배정하고,
+    남은 개수를 클래스별 잔여 크기 비율대로 배분한 뒤 소수점 부분이 큰 순서대로 1개씩 추가
+
+    Args:
+        counts: 클래스별 질문 수 배열
+        limit: 추출할 전체 개수
+        min_per_class: 클래스별 최소 추출 개수 (희귀 클래스 보장용)
+
+    Returns:
+        클래스별 추출 개수 배열
+    """
+    counts = np.asarray(counts, dtype=np.int64)
+    base = np.minimum(counts, max(min_per_class, 0))
+
+    if base.sum() > limit:
+        logging.warning(
+            f"클래스별 최소 개수 합계({int(base.sum())})가 샘플 개수({limit})보다 커서 최소 개수만 추출합니다."
+        )
+        return base
+
+    capacity = counts - base
+    remaining = limit - int(base.sum())
+    if remaining <= 0 or capacity.sum() == 0:
+        return base
+
+    # 1. 잔여 크기 비율대로 정수 배정
+    exact = capacity * (remaining / capacity.sum())
+    quotas = np.floor(exact).astype(np.int64)
+
+    # 2. 남은 개수를 소수점 부분이 큰 순서대로 배분 (동률은 클래스 등장 순서)
+    leftover = remaining - int(quotas.sum())
+    if leftover > 0:
+        order = np.argsort(-(exact - quotas), kind='stable')
+        quotas[order[:leftover]] += 1
+
+    return base + np.minimum(quotas, capacity)
+
+
+def stratified_sample_indices(
+    codes: np.ndarray,
+    limit: int,
+    seed: Optional[int] = None,
+    min_per_class: int = 0
+) -> np.ndarray:
+    """
+    클래스 코드 배열에서 층화 랜덤 샘플링
+
+    전체를 한 번 섞은 뒤 클래스 코드로 안정 정렬하여 클래스별 무작위 순서를 만들고,
+    클래스 내 순위가 할당량 미만인 위치만 선택 (클래스별 반복 없이 배열 연산으로 처리)
+
+    Args:
+        codes: 질문별 클래스 코드 배열
+        limit: 추출할 개수
+        seed: 난수 시드 (같은 시드와 입력이면 같은 결과)
+        min_per_class: 클래스별 최소 추출 개수
+
+    Returns:
+        선택된 질문 인덱스 배열 (섞인 순서)
+    """
+    rng = np.random.default_rng(seed)
+    n = len(codes)
+    if n == 0:
+        return np.empty(0, dtype=np.int64)
+
+    counts = np.bincount(codes)
+    quotas = compute_quotas(counts, limit, min_per_class)
+
+    perm = rng.permutation(n)
+    grouped = perm[np.argsort(codes[perm], kind='stable')]
+
+    # 정렬된 배열에서 각 클래스의 시작 위치 → 클래스 내 순위
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    grouped_codes = codes[grouped]
+    rank = np.arange(n) - starts[grouped_codes]
+
+    selected = grouped[rank < quotas[grouped_codes]]
+    rng.shuffle(selected)
+    return selected
+
+
+def save_manifest(path: str, rows: Sequence[int], meta: Dict[str, Any]):
+    """
+    샘플 매니페스트 저장
+
+    Args:
+        path: 매니페스트 JSON 경로
+        rows: 선택된 행 번호 (처리 순서)
+        meta: 시드, 샘플 개수 등 부가 정보
+    """
+    manifest_dir = os.path.dirname(path)
+    if manifest_dir and not os.path.exists(manifest_dir):
+        os.makedirs(manifest_dir)
+
+    manifest = {'version': MANIFEST_VERSION, **meta, 'rows': [int(r) for r in rows]}
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False)
+
+
+def load_manifest(path: str) -> Dict[str, Any]:
+    """
+    샘플 매니페스트 로드
+
+    Args:
+        path: 매니페스트 JSON 경로
+
+    Returns:
+        매니페스트 딕셔너리 (rows: 행 번호 리스트)
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    if 'rows' not in manifest:
+        raise ValueError(f"샘플 매니페스트 형식 오류 (rows 없음) - {path}")
+    return manifest
+
+
+def select_rows(questions: Sequence[Dict[str, Any]], rows: Sequence[int]) -> List[Dict[str, Any]]:
+    """
+    행 번호 목록 순서대로 질문 선택
+
+    Args:
+        questions: 전체 질문 리스트
+        rows: 선택할 행 번호
+
+    Returns:
+        선택된 질문 리스트 (입력에 없는 행은 제외)
+    """
+    by_row = {q['row']: q for q in questions}
+    selected = [by_row[r] for r in rows if r in by_row]
+    if len(selected) < len(rows):
+        logging.warning(f"매니페스트의 {len(rows) - len(selected)}개 행이 입력에 없어 제외되었습니다.")
+    return selected
+
+
+def sample_questions(
+    questions: List[Dict[str, Any]],
+    limit: Optional[int],
+    seed: Optional[int] = None,
+    min_per_class: int = 0,
+    manifest_path: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    층화 샘플링 또는 매니페스트 재사용으로 처리할 질문 선택
+
+    manifest_path 파일이 있으면 그 행 번호를 그대로 사용하고(limit/seed 무시),
+    없으면 층화 추출 후 결과를 manifest_path에 저장 (limit이 없으면 전체 행을 입력 순서대로 저장)
+
+    Args:
+        questions: 전체 질문 리스트
+        limit: 추출할 개수 (None 또는 0 이하면 전체)
+        seed: 난수 시드 (None이면 새로 생성하여 매니페스트에 기록)
+        min_per_class: 클래스별 최소 추출 개수
+        manifest_path: 샘플 매니페스트 경로
+
+    Returns:
+        선택된 질문 리스트
+    """
+    if manifest_path and os.path.exists(manifest_path):
+        manifest = load_manifest(manifest_path)
+        selected = select_rows(questions, manifest['rows'])
+        logging.info(
+            f"샘플 매니페스트 재사용: {manifest_path} "
+            f"({len(selected)}개, seed={manifest.get('seed')})"
+        )
+        return selected
+
+    if not limit or limit <= 0:
+        if manifest_path:
+            # 개수 제한 없이 매니페스트만 지정한 경우에도 이번 실행의 행 집합을 고정
+            save_manifest(manifest_path, [q['row'] for q in questions], {
+                'seed': None,
+                'limit': None,
+                'min_per_class': min_per_class,
+                'population': len(questions),
+            })
+            logging.info(f"샘플 매니페스트 저장: {manifest_path} (개수 제한 없음, 전체 {len(questions)}개 행)")
+        return questions
+
+    if seed is None:
+        seed = int(np.random.SeedSequence().entropy % (2 ** 32))
+
+    if limit >= len(questions):
+        selected = list(questions)
+    else:
+        codes, classes = encode_ground_truth(questions)
+        indices = stratified_sample_indices(codes, limit, seed=seed, min_per_class=min_per_class)
+        selected = [questions[i] for i in indices]
+    logging.info(
+        f"층화 랜덤 샘플링 적용: {len(questions)}개 중 {len(selected)}개 선택 "
+        f"(도메인 비율 유지, seed={seed})"
+    )
+
+    if manifest_path:
+        save_manifest(manifest_path, [q['row'] for q in selected], {
+            'seed': seed,
+            'limit': limit,
+            'min_per_class': min_per_class,
+            'population': len(questions),
+        })
+        logging.info(f"샘플 매니페스트 저장: {manifest_path}")
+
+    return selected
@@ -0,0 +1,307 @@
+"""
+실행 상태 대시보드 모듈
+장시간 실행의 처리량, 지연, 오류, 비용, 남은 시간을 주기적으로 집계하여 터미널 상태 줄과 상태 파일(JSON)로 출력
+
+- 작업 스레드는 지연 시간만 기록(observe_latency)하고, 결과 집계(record)는 결과 처리 루프 한 스레드에서 수행
+- 화면 갱신과 상태 파일 기록은 별도 리포터 스레드가 interval초마다 수행 (작업 스레드를 기다리게 하지 않음)
+- 처리량은 최근 10초 / 60초 구간과 전체 평균을 함께 표시
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+class RunStatus:
+    """
+    실행 상태 집계기
+
+    완료 시각과 지연 시간은 최근 구간만 보관하므로 메모리 사용량은 실행 길이와 무관하다.
+    """
+
+    def __init__(self, total: Optional[int] = None, windows: Iterable[int] = (10, 60), latency_samples: int = 2000):
+        """
+        Args:
+            total: 전체 건수 (모르면 None)
+            windows: 처리량 집계 구간 (초)
+            latency_samples: p50/p95 계산에 사용할 최근 지연 샘플 수
+        """
+        self.total = total
+        self.windows = tuple(sorted(windows))
+        self.completed = 0
+        self.errors = 0
+        self.cached = 0
+        self.evaluated = 0
+        self.hit1 = 0
+        self.hit_any = 0
+        self._start = time.monotonic()
+        self._done_times = deque()
+        self._latencies = deque(maxlen=latency_samples)
+        self._lock = threading.Lock()
+
+    def observe_latency(self, seconds: float):
+        """질문 1건 처리 시간 기록 (작업 스레드에서 호출)"""
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def record(self, result: Optional[Dict[str, Any]] = None, error: bool = False, cached: bool = False):
+        """
+        완료 1건 집계
+
+        Args:
+            result: 분류 결과 (hit_rank가 있으면 Hit@1 / Hit@K 집계)
+            error: 오류 행 여부
+            cached: 저장된 응답으로 처리(LLM 호출 없음)했는지 여부
+        """
+        now = time.monotonic()
+        with self._lock:
+            self.completed += 1
+            self._done_times.append(now)
+            horizon = now - self.windows[-1]
+            while self._done_times and self._done_times[0] < horizon:
+                self._done_times.popleft()
+            if error:
+                self.errors += 1
+            if cached:
+                self.cached += 1
+            if result is not None and not error and 'hit_rank' in result:
+                hit_rank = result['hit_rank'] or 0
+                self.evaluated += 1
+                self.hit1 += hit_rank == 1
+                self.hit_any += hit_rank > 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        현재 상태
+
+        Returns:
+            상태 딕셔너리 (completed, total, rate, rate_<초>s, latency_p50/p95, error_rate, hit_at_1, eta_seconds 등)
+        """
+        now = time.monotonic()
+        with self._lock:
+            done_times = list(self._done_times)
+            latencies = sorted(self._latencies)
+            completed = self.completed
+            errors = self.errors
+            state = {
+                'completed': completed,
+                'total': self.total,
+                'errors': errors,
+                'cached': self.cached,
+                'hit_at_1': self.hit1 / self.evaluated if self.evaluated else None,
+                'hit_at_k': self.hit_any / self.evaluated if self.evaluated else None,
+            }
+
+        elapsed = now - self._start
+        state['elapsed_seconds'] = round(elapsed, 1)
+        state['rate'] = completed / elapsed if elapsed > 0 else 0.0
+        for window in self.windows:
+            span = min(window, elapsed)
+            recent = sum(1 for t in done_times if t >= now - window)
+            state[f'rate_{window}s'] = recent / span if span > 0 else 0.0
+        state['error_rate'] = errors / completed if completed else 0.0
+        state['cache_hit_rate'] = state['cached'] / completed if completed else 0.0
+        state['latency_p50'] = _percentile(latencies, 50)
+        state['latency_p95'] = _percentile(latencies, 95)
+
+        # 남은 시간은 최근 구간 처리량 기준 (없으면 전체 평균)
+        rate = state[f'rate_{self.windows[-1]}s'] or state['rate']
+        if self.total is not None and rate > 0:
+            state['eta_seconds'] = round(max(0, self.total - completed) / rate, 1)
+        else:
+            state['eta_seconds'] = None
+        return state
+
+
+def _percentile(sorted_values: List[float], percentile: float) -> Optional[float]:
+    """정렬된 값의 백분위수 (nearest-rank, 값이 없으면 None)"""
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, int(round(percentile / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def classifier_status_source(classifier, token_config: Optional[Dict[str, Any]] = None) -> Callable[[], Dict[str, Any]]:
+    """
+    분류기 통계(재시도, 429, 토큰, 비용, 동시 요청 한도)를 상태에 더하는 함수 생성
+
+    Args:
+        classifier: LLM 분류기
+        token_config: 토큰 단가 설정 (price_prompt, price_completion)
+
+    Returns:
+        상태 딕셔너리를 반환하는 함수
+    """
+    from .tokens import estimate_cost
+
+    token_config = token_config or {}
+
+    def source() -> Dict[str, Any]:
+        endpoints = classifier.get_endpoint_statistics()
+        tokens = classifier.get_token_statistics()
+        state = {
+            'retries': sum(e.get('retries', 0) for e in endpoints),
+            'throttled': sum(e.get('throttled', 0) for e in endpoints),
+            'in_flight': sum(e['outstanding'] for e in endpoints),
+            'prompt_tokens': tokens['prompt_tokens'],
+            'completion_tokens': tokens['completion_tokens'],
+            'cost': estimate_cost(tokens['prompt_tokens'], tokens['completion_tokens'],
+                                  token_config.get('price_prompt', 0.0), token_config.get('price_completion', 0.0)),
+        }
+        concurrency = classifier.get_concurrency_statistics()
+        if concurrency:
+            state['concurrency_limit'] = concurrency['limit']
+        return state
+
+    return source
+
+
+def _duration(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+    seconds = int(seconds)
+    hours, rest = divmod(seconds, 3600)
+    return f"{hours}:{rest // 60:02d}:{rest % 60:02d}" if hours else f"{rest // 60:02d}:{rest % 60:02d}"
+
+
+def format_status(state: Dict[str, Any]) -> str:
+    """
+    상태 한 줄 요약 (터미널 상태 줄용)
+
+    Args:
+        state: RunStatus.snapshot() (+ 추가 소스) 결과
+
+    Returns:
+        요약 문자열
+    """
+    total = state.get('total')
+    progress = f"{state['completed']:,}/{total:,} ({state['completed'] / total * 100:.1f}%)" if total else \
+        f"{state['completed']:,}"
+    parts = [
+        progress,
+        f"{state.get('rate_10s', 0.0):.1f}건/초 (60초 {state.get('rate_60s', 0.0):.1f}, 평균 {state['rate']:.1f})",
+    ]
+    if state.get('latency_p95') is not None:
+        parts.append(f"p95 {state['latency_p95']:.2f}초")
+    parts.append(f"오류 {state['errors']} ({state['error_rate'] * 100:.1f}%)")
+    if 'retries' in state:
+        parts.append(f"재시도 {state['retries']} (429: {state['throttled']})")
+    if state.get('cached'):
+        parts.append(f"캐시 {state['cache_hit_rate'] * 100:.0f}%")
+    if state.get('hit_at_1') is not None:
+        parts.append(f"Hit@1 {state['hit_at_1'] * 100:.1f}%")
+    if state.get('cost') is not None:
+        parts.append(f"비용 {state['cost']:,.4f}")
+    parts.append(f"경과 {_duration(state['elapsed_seconds'])}")
+    if total:
+        parts.append(f"남은 시간 {_duration(state.get('eta_seconds'))}")
+    return " | ".join(parts)
+
+
+class StatusReporter:
+    """
+    상태 출력 스레드
+
+    interval초마다 상태를 모아 상태 파일(JSON, 원자적 교체)에 쓰고, 출력 스트림이 터미널이면 상태 줄을 다시 그린다.
+    """
+
+    def __init__(
+        self,
+        status: RunStatus,
+        path: Optional[str] = None,
+        interval: float = 2.0,
+        sources: Iterable[Callable[[], Dict[str, Any]]] = (),
+        stream=None,
+        display: Optional[bool] = None,
+    ):
+        """
+        Args:
+            status: RunStatus
+            path: 상태 파일 경로 (None이면 기록 안 함)
+            interval: 갱신 간격 (초)
+            sources: 상태에 더할 추가 정보 함수 (분류기 통계 등)
+            stream: 상태 줄 출력 스트림 (기본: sys.stderr)
+            display: 상태 줄 출력 여부 (기본: 스트림이 터미널일 때만)
+        """
+        self.status = status
+        self.path = path
+        self.interval = interval
+        self.sources = list(sources)
+        self.stream = stream or sys.stderr
+        self.display = display if display is not None else self.stream.isatty()
+        self._stop = threading.Event()
+        self._thread = None
+
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+    def collect(self, state: str = 'running') -> Dict[str, Any]:
+        """상태와 추가 정보를 모은 딕셔너리"""
+        snapshot = self.status.snapshot()
+        for source in self.sources:
+            try:
+                snapshot.update(source())
+            except Exception:
+                # 통계 수집 실패로 실행을 방해하지 않음
+                pass
+        snapshot['state'] = state
+        snapshot['updated_at'] = datetime.now().isoformat(timespec='seconds')
+        return snapshot
+
+    def refresh(self, state: str = 'running') -> Dict[str, Any]:
+        """
+        상태 파일과 상태 줄을 한 번 갱신
+
+        Args:
+            state: 실행 상태 ('running', 'finished', 'aborted')
+
+        Returns:
+            기록한 상태 딕셔너리
+        """
+        snapshot = self.collect(state)
+        if self.path:
+            temp_path = self.path + '.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, ensure_ascii=False, indent=2)
+            os.replace(temp_path, self.path)
+        if self.display:
+            # 커서를 줄 처음으로 되돌려 두어 이어서 출력되는 로그 줄이 상태 줄을 덮어쓰도록 함
+            end = '\n' if state != 'running' else '\r'
+            self.stream.write('\r\033[K' + format_status(snapshot) + end)
+            self.stream.flush()
+        return snapshot
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.refresh()
+            except Exception:
+                pass
+
+    def start(self) -> 'StatusReporter':
+        """갱신 스레드 시작"""
+        self._thread = threading.Thread(target=self._run, name='status', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, state: str = 'finished') -> Dict[str, Any]:
+        """
+        갱신 스레드 종료 후 최종 상태 기록
+
+        Args:
+            state: 최종 상태 ('finished', 'aborted')
+
+        Returns:
+            최종 상태 딕셔너리
+        """
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+        return self.refresh(state)
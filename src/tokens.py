@@ -0,0 +1,302 @@
+"""
+토큰 집계 모듈
+프롬프트/응답 토큰 수를 API usage 필드로 집계하고, usage가 없거나 실행 전 예측 시에는
+오프라인 토크나이저(기본: 근사 토크나이저)로 추정
+"""
+
+import logging
+import math
+import re
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+
+# 근사 토크나이저 문자 분류 (Qwen/GPT 계열 BPE 토크나이저의 평균적인 분할을 근사)
+_HANGUL = re.compile(r'[가-힣ㄱ-ㆎ]')
+_CJK = re.compile(r'[一-鿿぀-ヿ]')
+_LATIN = re.compile(r'[A-Za-z]+')
+_DIGITS = re.compile(r'\d+')
+_NEWLINES = re.compile(r'\n+')
+_SYMBOLS = re.compile(r'[^\w\s]')
+
+
+class ApproxTokenizer:
+    """
+    의존성 없는 근사 토크나이저
+
+    한글 음절/한자는 글자당 hangul_ratio 토큰, 영문 단어는 4글자당 1토큰, 숫자는 3자리당 1토큰,
+    기호는 1토큰, 연속 줄바꿈은 1토큰으로 계산 (공백은 인접 토큰에 병합된다고 가정)
+    """
+
+    name = 'approx'
+
+    def __init__(self, hangul_ratio: float = 1.0):
+        """
+        Args:
+            hangul_ratio: 한글 음절당 토큰 수 (모델 토크나이저에 맞춰 보정 가능)
+        """
+        self.hangul_ratio = hangul_ratio
+
+    def count(self, text: str) -> int:
+        """
+        텍스트의 토큰 수 추정
+
+        Args:
+            text: 텍스트
+
+        Returns:
+            추정 토큰 수
+        """
+        if not text:
+            return 0
+        tokens = (len(_HANGUL.findall(text)) + len(_CJK.findall(text))) * self.hangul_ratio
+        tokens += sum(math.ceil(len(word) / 4) for word in _LATIN.findall(text))
+        tokens += sum(math.ceil(len(digits) / 3) for digits in _DIGITS.findall(text))
+        tokens += len(_SYMBOLS.findall(text)) + len(_NEWLINES.findall(text))
+        return int(round(tokens))
+
+
+class _EncoderTokenizer:
+    """encode() 메서드를 가진 외부 토크나이저 래퍼 (tiktoken / transformers)"""
+
+    def __init__(self, name: str, encode):
+        self.name = name
+        self._encode = encode
+
+    def count(self, text: str) -> int:
+        return len(self._encode(text)) if text else 0
+
+
+def get_tokenizer(spec: Optional[str] = None):
+    """
+    토크나이저 생성
+
+    Args:
+        spec: 'approx' (기본), 'approx:<한글 음절당 토큰 수>', 'tiktoken:<인코딩 이름>',
+              'hf:<모델 이름 또는 로컬 경로>' (외부 토크나이저는 설치된 경우에만 사용)
+
+    Returns:
+        count(text) 메서드를 가진 토크나이저 (외부 토크나이저 로드 실패 시 근사 토크나이저)
+    """
+    spec = (spec or 'approx').strip()
+    kind, _, arg = spec.partition(':')
+
+    try:
+        if kind == 'approx':
+            return ApproxTokenizer(float(arg)) if arg else ApproxTokenizer()
+        if kind == 'tiktoken':
+            import tiktoken
+            encoding = tiktoken.get_encoding(arg or 'cl100k_base')
+            return _EncoderTokenizer(spec, encoding.encode)
+        if kind == 'hf':
+            from transformers import AutoTokenizer
+            tokenizer = AutoTokenizer.from_pretrained(arg, local_files_only=True)
+            return _EncoderTokenizer(spec, lambda text: tokenizer.encode(text, add_special_tokens=False))
+    except Exception as e:
+        logging.warning(f"토크나이저 로드 실패 ({spec}): {e} - 근사 토크나이저를 사용합니다.")
+        return ApproxTokenizer()
+
+    logging.warning(f"알 수 없는 토크나이저 ({spec}) - 근사 토크나이저를 사용합니다.")
+    return ApproxTokenizer()
+
+
+class TokenAccountant:
+    """
+    요청별 토큰 사용량 집계 (스레드 안전)
+
+    API 응답의 usage(prompt_tokens, completion_tokens)를 우선 사용하고, 없으면 토크나이저로 추정.
+    usage와 추정값이 함께 있는 요청으로 추정 오차(실제/추정 비율)를 기록한다.
+    """
+
+    def __init__(self, tokenizer=None):
+        """
+        Args:
+            tokenizer: 토크나이저 (기본: 근사 토크나이저)
+        """
+        self.tokenizer = tokenizer or ApproxTokenizer()
+        self.calls = 0
+        self.reported_calls = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.max_prompt_tokens = 0
+        self._estimated_prompt_tokens = 0   # usage가 있는 요청의 프롬프트 추정 합계 (오차 계산용)
+        self._reported_prompt_tokens = 0
+        self._lock = threading.Lock()
+
+    def count_usage(
+        self,
+        prompt: str,
+        response: Optional[str],
+        usage: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        요청 1건의 토큰 수 계산 (집계하지 않음)
+
+        Args:
+            prompt: 프롬프트
+            response: 응답 텍스트
+            usage: API usage 필드
+
+        Returns:
+            {'prompt_tokens', 'completion_tokens', 'estimated'} 딕셔너리
+        """
+        if usage and usage.get('prompt_tokens') is not None:
+            return {
+                'prompt_tokens': int(usage['prompt_tokens']),
+                'completion_tokens': int(usage.get('completion_tokens') or 0),
+                'estimated': False
+            }
+        return {
+            'prompt_tokens': self.tokenizer.count(prompt),
+            'completion_tokens': self.tokenizer.count(response or ''),
+            'estimated': True
+        }
+
+    def record(
+        self,
+        prompt: str,
+        response: Optional[str],
+        usage: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        요청 1건의 토큰 수 계산 후 집계
+
+        Args:
+            prompt: 프롬프트
+            response: 응답 텍스트
+            usage: API usage 필드
+
+        Returns:
+            {'prompt_tokens', 'completion_tokens', 'estimated'} 딕셔너리
+        """
+        counts = self.count_usage(prompt, response, usage)
+        estimate = None if counts['estimated'] else self.tokenizer.count(prompt)
+
+        with self._lock:
+            self.calls += 1
+            self.prompt_tokens += counts['prompt_tokens']
+            self.completion_tokens += counts['completion_tokens']
+            self.max_prompt_tokens = max(self.max_prompt_tokens, counts['prompt_tokens'])
+            if estimate is not None:
+                self.reported_calls += 1
+                self._estimated_prompt_tokens += estimate
+                self._reported_prompt_tokens += counts['prompt_tokens']
+        return counts
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        토큰 집계 통계 반환
+
+        Returns:
+            통계 딕셔너리 (estimate_ratio: 실제/추정 프롬프트 토큰 비율, usage가 없으면 None)
+        """
+        with self._lock:
+            calls = self.calls
+            return {
+                'tokenizer': self.tokenizer.name,
+                'calls': calls,
+                'reported_calls': self.reported_calls,
+                'prompt_tokens': self.prompt_tokens,
+                'completion_tokens': self.completion_tokens,
+                'total_tokens': self.prompt_tokens + self.completion_tokens,
+                'avg_prompt_tokens': self.prompt_tokens / calls if calls else 0.0,
+                'avg_completion_tokens': self.completion_tokens / calls if calls else 0.0,
+                'max_prompt_tokens': self.max_prompt_tokens,
+                'estimate_ratio': (self._reported_prompt_tokens / self._estimated_prompt_tokens
+                                   if self._estimated_prompt_tokens else None),
+            }
+
+
+def preflight_estimate(
+    fixed_prompt: str,
+    questions: Iterable[str],
+    tokenizer=None,
+    max_completion_tokens: int = 500,
+    budget: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    실행 전 프롬프트 토큰 예측
+
+    프롬프트는 고정 부분(지침, 의도 목록, 예시) + 질문이므로 고정 부분은 한 번만 세고,
+    질문은 스트림을 한 번 훑으며 모두 세어 정확한 합계와 최대값을 구함 (questions는 이터레이터여도 됨)
+
+    Args:
+        fixed_prompt: 질문을 비운 프롬프트
+        questions: 질문 텍스트
+        tokenizer: 토크나이저 (기본: 근사 토크나이저)
+        max_completion_tokens: 요청당 최대 응답 토큰 (max_tokens)
+        budget: 요청당 프롬프트 토큰 예산 (지정 시 예산을 넘는 질문 수를 셈)
+
+    Returns:
+        예측 딕셔너리 (fixed_tokens, avg/max_prompt_tokens, total_prompt_tokens, max_total_tokens,
+        over_budget_questions 등)
+    """
+    tokenizer = tokenizer or ApproxTokenizer()
+    fixed_tokens = tokenizer.count(fixed_prompt)
+    question_budget = budget - fixed_tokens if budget else None
+
+    # 전체를 리스트로 만들지 않고 질문별 토큰 수만 누적
+    count = 0
+    question_total = 0
+    max_question = 0
+    over_budget = 0
+    for question in questions:
+        tokens = tokenizer.count(question)
+        count += 1
+        question_total += tokens
+        if tokens > max_question:
+            max_question = tokens
+        if question_budget is not None and tokens > question_budget:
+            over_budget += 1
+
+    avg_question = question_total / count if count else 0.0
+    total_prompt = fixed_tokens * count + question_total
+
+    return {
+        'tokenizer': tokenizer.name,
+        'questions': count,
+        'fixed_tokens': fixed_tokens,
+        'avg_question_tokens': avg_question,
+        'avg_prompt_tokens': fixed_tokens + avg_question,
+        'max_prompt_tokens': fixed_tokens + max_question,
+        'over_budget_questions': over_budget if budget else None,
+        'total_prompt_tokens': total_prompt,
+        'max_total_tokens': total_prompt + max_completion_tokens * count,
+    }
+
+
+def check_prompt_budget(estimate: Dict[str, Any], budget: Optional[int]) -> List[str]:
+    """
+    프롬프트 토큰 예산 초과 여부 확인
+
+    Args:
+        estimate: preflight_estimate 결과
+        budget: 요청당 프롬프트 토큰 예산 (None 또는 0이면 확인하지 않음)
+
+    Returns:
+        경고 메시지 리스트 (초과하지 않으면 빈 리스트)
+    """
+    if not budget:
+        return []
+    warnings = []
+    if estimate['fixed_tokens'] > budget:
+        warnings.append(
+            f"고정 프롬프트(지침 + 의도 목록)만으로 {estimate['fixed_tokens']} 토큰으로 예산 {budget} 토큰을 초과합니다."
+        )
+    elif estimate['max_prompt_tokens'] > budget:
+        over_budget = estimate.get('over_budget_questions')
+        count = f" (예산 초과 질문 {over_budget:,}개)" if over_budget else ""
+        warnings.append(
+            f"가장 긴 질문의 프롬프트가 {estimate['max_prompt_tokens']:.0f} 토큰으로 예산 {budget} 토큰을 초과합니다.{count}"
+        )
+    return warnings
+
+
+def estimate_cost(prompt_tokens: float, completion_tokens: float,
+                  price_prompt: float, price_completion: float) -> Optional[float]:
+    """
+    토큰 비용 계산 (1K 토큰당 단가, 단가 미설정 시 None)
+    """
+    if not price_prompt and not price_completion:
+        return None
+    return prompt_tokens / 1000 * price_prompt + completion_tokens / 1000 * price_completion
@@ -0,0 +1,196 @@
+"""
+실행 타임라인 추적 모듈
+질문별 처리 과정(대기열, 동시 요청 한도 대기, HTTP, 재시도 백오프, 대기, 파싱 등)을 스레드별 구간으로 기록하고
+Chrome trace-event JSON으로 저장 (chrome://tracing, Perfetto UI에서 열기)
+
+- 스레드 안의 구간은 완료 이벤트(ph: X)로, 실행기 대기열에 머문 시간은 스레드와 겹치므로 비동기 이벤트(ph: b/e)로 기록
+- --trace 실행 시에만 활성화되며, 비활성 상태의 span()은 아무 일도 하지 않는 컨텍스트를 반환
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict, Optional, Tuple
+
+
+_NULL_CONTEXT = nullcontext()
+
+
+class TraceRecorder:
+    """
+    구간 기록기 (스레드 안전)
+
+    이벤트는 (종류, 이름, 분류, 시작, 끝, 스레드 ID, 인자) 튜플로 보관하고 저장할 때만 JSON으로 변환한다.
+    """
+
+    def __init__(self, max_events: int = 2000000):
+        """
+        Args:
+            max_events: 최대 이벤트 수 (넘으면 이후 이벤트는 버리고 개수만 셈)
+        """
+        self.enabled = False
+        self.max_events = max_events
+        self.dropped = 0
+        self._events = []
+        self._thread_names = {}
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def reset(self):
+        """기록 초기화 (시간 기준점도 현재로 이동)"""
+        with self._lock:
+            self._events = []
+            self._thread_names = {}
+            self.dropped = 0
+            self._origin = time.perf_counter()
+
+    def _append(self, event: tuple, thread: Optional[threading.Thread] = None):
+        with self._lock:
+            if len(self._events) >= self.max_events:
+                self.dropped += 1
+                return
+            self._events.append(event)
+            if thread is not None:
+                self._thread_names[thread.ident] = thread.name
+
+    def add(self, name: str, start: float, end: float, category: str = 'stage', args: Optional[Dict[str, Any]] = None):
+        """
+        현재 스레드에 완료 구간 추가
+
+        Args:
+            name: 구간 이름
+            start: 시작 시각 (time.perf_counter)
+            end: 종료 시각 (time.perf_counter)
+            category: 분류
+            args: 구간 인자 (행 번호 등)
+        """
+        thread = threading.current_thread()
+        self._append(('X', name, category, start, end, thread.ident, args), thread)
+
+    def add_async(self, name: str, key: Any, start: float, end: float, category: str = 'queue',
+                  args: Optional[Dict[str, Any]] = None):
+        """
+        스레드와 무관한 비동기 구간 추가 (실행기 대기열 대기 등, 구간끼리 겹쳐도 됨)
+
+        Args:
+            name: 구간 이름
+            key: 구간 식별자 (행 번호 등)
+            start: 시작 시각 (time.perf_counter)
+            end: 종료 시각 (time.perf_counter)
+            category: 분류
+            args: 구간 인자
+        """
+        self._append(('A', name, category, start, end, key, args))
+
+    def span(self, name: str, category: str = 'stage', **args):
+        """
+        구간 측정 컨텍스트 (비활성 시 비용 없음)
+
+        Args:
+            name: 구간 이름
+            category: 분류
+            **args: 구간 인자
+        """
+        if not self.enabled:
+            return _NULL_CONTEXT
+        return self._measure(name, category, args or None)
+
+    @contextmanager
+    def _measure(self, name: str, category: str, args: Optional[Dict[str, Any]]):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, start, time.perf_counter(), category, args)
+
+    def to_chrome(self) -> Dict[str, Any]:
+        """
+        Chrome trace-event 형식 변환
+
+        Returns:
+            {'traceEvents': [...], 'displayTimeUnit': 'ms', 'otherData': {...}}
+        """
+        with self._lock:
+            events = list(self._events)
+            names = dict(self._thread_names)
+            origin = self._origin
+            dropped = self.dropped
+
+        pid = os.getpid()
+        trace_events = [{'ph': 'M', 'name': 'process_name', 'pid': pid, 'args': {'name': 'domain-classifier'}}]
+        for tid, name in names.items():
+            trace_events.append({'ph': 'M', 'name': 'thread_name', 'pid': pid, 'tid': tid, 'args': {'name': name}})
+
+        for kind, name, category, start, end, key, args in events:
+            ts = round((start - origin) * 1e6, 1)
+            if kind == 'X':
+                event = {'ph': 'X', 'name': name, 'cat': category, 'pid': pid, 'tid': key,
+                         'ts': ts, 'dur': round((end - start) * 1e6, 1)}
+                if args:
+                    event['args'] = args
+                trace_events.append(event)
+            else:
+                begin = {'ph': 'b', 'name': name, 'cat': category, 'pid': pid, 'id': str(key), 'ts': ts}
+                if args:
+                    begin['args'] = args
+                trace_events.append(begin)
+                trace_events.append({'ph': 'e', 'name': name, 'cat': category, 'pid': pid, 'id': str(key),
+                                     'ts': round((end - origin) * 1e6, 1)})
+
+        return {
+            'traceEvents': trace_events,
+            'displayTimeUnit': 'ms',
+            'otherData': {'events': len(events), 'dropped_events': dropped},
+        }
+
+    def save(self, path: str) -> int:
+        """
+        Chrome trace JSON 저장
+
+        Args:
+            path: 저장 경로
+
+        Returns:
+            저장한 이벤트 수
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        trace = self.to_chrome()
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(trace, f, ensure_ascii=False, separators=(',', ':'))
+        return trace['otherData']['events']
+
+
+# 프로세스 전역 추적기 (--trace 실행 시에만 활성화)
+tracer = TraceRecorder()
+
+
+def start_tracing(max_events: Optional[int] = None):
+    """
+    전역 추적기 활성화
+
+    Args:
+        max_events: 최대 이벤트 수 (기본: 현재 설정 유지)
+    """
+    if max_events:
+        tracer.max_events = max_events
+    tracer.reset()
+    tracer.enabled = True
+
+
+def finish_tracing(path: str) -> Tuple[int, int]:
+    """
+    추적 종료 후 Chrome trace JSON 저장
+
+    Args:
+        path: 저장 경로
+
+    Returns:
+        (저장한 이벤트 수, 버린 이벤트 수)
+    """
+    tracer.enabled = False
+    count = tracer.save(path)
+    return count, tracer.dropped
@@ -0,0 +1,100 @@
+"""
+적응형 동시 요청 한도 테스트 (지연 기울기에 따른 한도 증가/감소, 오류 시 감소, 유휴 상태, 슬롯 대기)
+
+Usage:
+    python -m pytest -q tests
+    python -m unittest discover -s tests
+"""
+
+import os
+import sys
+import threading
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.concurrency import AdaptiveConcurrencyLimiter  # noqa: E402
+
+
+def _round(limiter, latency, failed=False):
+    """현재 한도만큼 요청을 동시에 보내고 모두 끝난 것으로 처리"""
+    slots = limiter.limit
+    for _ in range(slots):
+        limiter.acquire()
+    for _ in range(slots):
+        limiter.release(latency, failed=failed)
+
+
+class AdaptiveConcurrencyLimiterTest(unittest.TestCase):
+
+    def test_limit_grows_while_latency_is_flat(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=32)
+        for _ in range(20):
+            _round(limiter, 0.1)
+        self.assertGreater(limiter.limit, 4)
+        self.assertLessEqual(limiter.limit, 32)
+        self.assertEqual(limiter.get_statistics()['failures'], 0)
+
+    def test_limit_is_capped_at_max(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=8)
+        for _ in range(100):
+            _round(limiter, 0.1)
+        self.assertEqual(limiter.limit, 8)
+
+    def test_limit_shrinks_when_latency_rises(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=32)
+        for _ in range(30):
+            _round(limiter, 0.1)
+        grown = limiter.limit
+
+        # 기준 지연(0.1초)의 허용 배율(1.5)을 크게 넘는 지연 → 기울기 0.5로 줄어듦
+        for _ in range(30):
+            _round(limiter, 1.0)
+        self.assertLess(limiter.limit, grown)
+        self.assertAlmostEqual(limiter.get_statistics()['baseline_latency'], 0.1)
+
+    def test_idle_requests_do_not_grow_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=10, max_limit=32)
+        for _ in range(50):
+            limiter.acquire()
+            limiter.release(0.1)
+        self.assertEqual(limiter.limit, 10)
+
+    def test_error_backs_off_multiplicatively(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=10, min_limit=2, backoff=0.5)
+        limiter.acquire()
+        limiter.release(0.1, failed=True)
+        self.assertEqual(limiter.limit, 5)
+
+        for _ in range(10):
+            limiter.acquire()
+            limiter.release(0.1, failed=True)
+        self.assertEqual(limiter.limit, 2)
+
+        stats = limiter.get_statistics()
+        self.assertEqual(stats['failures'], 11)
+        self.assertEqual(stats['lowest_limit'], 2)
+        self.assertEqual(limiter.get_history()[1]['reason'], 'error')
+
+    def test_acquire_waits_for_free_slot(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+        limiter.acquire()
+
+        acquired = threading.Event()
+
+        def waiter():
+            limiter.acquire()
+            acquired.set()
+
+        thread = threading.Thread(target=waiter, daemon=True)
+        thread.start()
+        self.assertFalse(acquired.wait(0.2))
+
+        limiter.release(0.1)
+        self.assertTrue(acquired.wait(5))
+        thread.join(5)
+        self.assertEqual(limiter.get_statistics()['max_in_flight'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
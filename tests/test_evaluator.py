@@ -0,0 +1,70 @@
+"""
+Evaluator 동시성 테스트 (여러 작업 스레드에서 evaluate_ids 호출 시 행별 값 정렬 유지)
+
+Usage:
+    python -m pytest -q tests
+    python -m unittest discover -s tests
+"""
+
+import os
+import sys
+import threading
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.evaluator import Evaluator  # noqa: E402
+
+THREADS = 8
+ROWS_PER_THREAD = 20000
+# 짝수 ID는 정답, 홀수 ID는 정답 ID를 OFFSET만큼 밀어서 오답으로 만듦
+OFFSET = 10 ** 7
+
+
+class EvaluatorConcurrencyTest(unittest.TestCase):
+
+    def setUp(self):
+        self._switch_interval = sys.getswitchinterval()
+        # 스레드 전환을 자주 일으켜 배열 간 어긋남이 드러나도록 함
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        sys.setswitchinterval(self._switch_interval)
+
+    def test_columns_stay_aligned(self):
+        evaluator = Evaluator()
+        barrier = threading.Barrier(THREADS)
+
+        def worker(index):
+            barrier.wait()
+            base = index * ROWS_PER_THREAD
+            for classified_id in range(base, base + ROWS_PER_THREAD):
+                ground_truth_id = classified_id if classified_id % 2 == 0 else classified_id + OFFSET
+                evaluator.evaluate_ids(classified_id, ground_truth_id)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        total = THREADS * ROWS_PER_THREAD
+        self.assertEqual(evaluator.total_count, total)
+        self.assertEqual(evaluator.success_count, total // 2)
+        self.assertEqual(evaluator.fail_count, total // 2)
+        self.assertEqual(len(evaluator._classified_ids), total)
+        self.assertEqual(len(evaluator._ground_truth_ids), total)
+        self.assertEqual(len(evaluator._success_flags), total)
+
+        misaligned = 0
+        for classified_id, ground_truth_id, ok in zip(
+            evaluator._classified_ids, evaluator._ground_truth_ids, evaluator._success_flags
+        ):
+            expected = classified_id if classified_id % 2 == 0 else classified_id + OFFSET
+            if ground_truth_id != expected or bool(ok) != (classified_id % 2 == 0):
+                misaligned += 1
+        self.assertEqual(misaligned, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
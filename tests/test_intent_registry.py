@@ -0,0 +1,72 @@
+"""
+의도 레지스트리 테스트 (카탈로그에 없는 이름으로 채점해도 레지스트리가 커지지 않는지, 이름 비교 정규화)
+
+Usage:
+    python -m pytest -q tests
+    python -m unittest discover -s tests
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.evaluator import Evaluator  # noqa: E402
+from src.intent_registry import MATCH_NONE, IntentRegistry, ResultRecord  # noqa: E402
+
+CATALOGUE = ['주소 변경', '대출 금리 문의', '카드 분실']
+
+
+class IntentRegistryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = IntentRegistry(CATALOGUE)
+
+    def test_unknown_names_are_not_registered(self):
+        for i in range(1000):
+            codes = self.registry.encode([f'미분류-환각 의도 {i}', '카드 분실'])
+            self.registry.hit_rank(f'자유 입력 정답 {i}', codes)
+        self.assertEqual(len(self.registry), len(CATALOGUE))
+        self.assertIsNone(self.registry.lookup('미분류-환각 의도 0'))
+
+    def test_code_keeps_raw_name_for_unknown(self):
+        self.assertEqual(self.registry.code(' 카드 분실 '), 2)
+        self.assertEqual(self.registry.code(' 없는 의도 '), '없는 의도')
+        self.assertEqual(self.registry.decode(self.registry.encode(['주소 변경', '없는 의도'])),
+                         ['주소 변경', '없는 의도'])
+
+    def test_hit_rank_ignores_case_and_whitespace(self):
+        codes = self.registry.encode(['주소 변경', 'Card Lost', '카드 분실'])
+        self.assertEqual(self.registry.hit_rank(' 카드 분실', codes), 3)
+        self.assertEqual(self.registry.hit_rank('card lost ', codes), 2)
+        self.assertEqual(self.registry.hit_rank('대출 금리 문의', codes), 0)
+
+    def test_result_record_restores_unmatched_names(self):
+        codes = self.registry.encode(['미분류-환각', '주소 변경'])
+        matches = (('환각', MATCH_NONE, 0.12), (0, 0, 1.0))
+        record = ResultRecord(self.registry, 7, codes, 0, '이유', '오분류', matches)
+
+        self.assertEqual(record['classified_domain'], '미분류-환각')
+        self.assertEqual(record['classified_domains'], ['미분류-환각', '주소 변경'])
+        self.assertIn('환각 (No Match: 0.12)', record['opinion'])
+        self.assertEqual(len(self.registry), len(CATALOGUE))
+
+
+class EvaluatorUnknownNamesTest(unittest.TestCase):
+
+    def test_unknown_names_kept_per_row(self):
+        registry = IntentRegistry(CATALOGUE)
+        evaluator = Evaluator(registry)
+        self.assertEqual(evaluator.evaluate('미분류-환각', '자유 입력 정답'), 'X')
+        self.assertEqual(evaluator.evaluate('카드 분실', '카드 분실'), 'O')
+        self.assertEqual(evaluator.evaluate('Free Text', 'free text'), 'O')
+
+        self.assertEqual(len(registry), len(CATALOGUE))
+        self.assertEqual(evaluator.get_confusion_info()['cases'],
+                         [{'classified': '미분류-환각', 'ground_truth': '자유 입력 정답', 'result': 'X'}])
+        self.assertEqual([r['classified'] for r in evaluator.results], ['미분류-환각', '카드 분실', 'Free Text'])
+
+
+if __name__ == '__main__':
+    unittest.main()
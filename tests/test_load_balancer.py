@@ -0,0 +1,120 @@
+"""
+엔드포인트 풀 테스트 (연속 실패 시 제외, 반복 제외 시 기간 2배 증가, 모두 제외 시 fail-open, 재시도 불가 상태 코드)
+
+네트워크 요청 없이 acquire()/release()만 호출하며, 시간은 고정된 값으로 바꿔 검사
+
+Usage:
+    python -m pytest -q tests
+    python -m unittest discover -s tests
+"""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.load_balancer import EndpointPool, is_non_retryable  # noqa: E402
+
+URLS = ['http://a.invalid/v1', 'http://b.invalid/v1']
+
+
+class EndpointPoolTest(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 1000.0
+        patcher = mock.patch('src.load_balancer.time')
+        self.addCleanup(patcher.stop)
+        patcher.start().monotonic.side_effect = lambda: self.now
+
+        self.pool = EndpointPool(URLS, max_failures=2, eject_seconds=30.0)
+        self.addCleanup(self.pool.close)
+        self.a, self.b = self.pool.endpoints
+
+    def _fail(self, endpoint, times):
+        for _ in range(times):
+            endpoint.outstanding += 1
+            self.pool.release(endpoint, 1.0, success=False)
+
+    def test_least_outstanding_spreads_requests(self):
+        first = self.pool.acquire()
+        second = self.pool.acquire()
+        self.assertIsNot(first, second)
+        self.assertEqual((self.a.outstanding, self.b.outstanding), (1, 1))
+
+        self.pool.release(first, 0.5, success=True)
+        self.assertEqual(first.outstanding, 0)
+        self.assertEqual(first.ewma_latency, 0.5)
+
+    def test_consecutive_failures_eject_endpoint(self):
+        self._fail(self.a, 1)
+        self.assertTrue(self.a.is_available(self.now))
+
+        self._fail(self.a, 1)
+        self.assertFalse(self.a.is_available(self.now))
+        self.assertEqual(self.a.ejected_until, self.now + 30.0)
+        for _ in range(5):
+            endpoint = self.pool.acquire()
+            self.assertIs(endpoint, self.b)
+            self.pool.release(endpoint, 0.1, success=True)
+
+        # 제외 기간이 지나면 다시 후보가 됨
+        self.now += 30.0
+        self.assertTrue(self.pool.get_statistics()[0]['available'])
+
+    def test_success_resets_failure_streak(self):
+        self._fail(self.a, 1)
+        self.a.outstanding += 1
+        self.pool.release(self.a, 0.1, success=True)
+        self._fail(self.a, 1)
+        self.assertTrue(self.a.is_available(self.now))
+        self.assertEqual(self.a.ejections, 0)
+
+    def test_repeated_ejection_doubles_duration_up_to_eight_times(self):
+        durations = []
+        for _ in range(5):
+            self._fail(self.a, 2)
+            durations.append(self.a.ejected_until - self.now)
+            self.now = self.a.ejected_until
+        self.assertEqual(durations, [30.0, 60.0, 120.0, 240.0, 240.0])
+        self.assertEqual(self.a.ejections, 5)
+
+    def test_all_ejected_fails_open_to_earliest_return(self):
+        self._fail(self.a, 2)
+        self.now += 10.0
+        self._fail(self.b, 2)
+
+        endpoint = self.pool.acquire()
+        self.assertIs(endpoint, self.a)
+
+    def test_exclude_all_returns_none(self):
+        self.assertIsNone(self.pool.acquire(exclude=[self.a, self.b]))
+        self.assertIs(self.pool.acquire(exclude=[self.a]), self.b)
+
+    def test_failover_lowers_per_endpoint_retries(self):
+        self.assertEqual(self.a.max_retries, 2)
+        self.assertEqual(self.a.backoff_factor, 0.5)
+
+        single = EndpointPool(URLS[:1], max_retries=10)
+        self.addCleanup(single.close)
+        self.assertEqual(single.endpoints[0].max_retries, 10)
+
+    def test_unknown_strategy_rejected(self):
+        with self.assertRaises(ValueError):
+            EndpointPool(URLS, strategy='round_robin')
+
+
+class NonRetryableStatusTest(unittest.TestCase):
+
+    def test_client_errors_are_not_retried_elsewhere(self):
+        for status in (400, 401, 403, 404, 413, 422):
+            self.assertTrue(is_non_retryable(status), status)
+
+    def test_timeouts_throttling_and_server_errors_are_retryable(self):
+        for status in (200, 408, 429, 500, 502, 503, 504):
+            self.assertFalse(is_non_retryable(status), status)
+
+
+if __name__ == '__main__':
+    unittest.main()
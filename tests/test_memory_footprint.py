@@ -0,0 +1,43 @@
+"""
+메모리 사용량 회귀 테스트 (benchmarks/memory_footprint.py를 기준값과 비교)
+
+기준값(benchmarks/memory_baseline.json)과 같은 행 수로 전체 파이프라인을 실행하여,
+10,000행당 메모리가 허용 범위를 넘게 늘어난 구간이 없는지(종료 코드 0) 확인
+기준값과 Python/라이브러리 버전이 다르면 스크립트가 비교를 건너뛰므로 테스트도 건너뜀
+실행에 수십 초가 걸리므로 SKIP_SLOW_TESTS=1이면 건너뜀
+
+Usage:
+    python -m pytest -q tests
+    SKIP_SLOW_TESTS=1 python -m pytest -q tests
+"""
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(ROOT, 'benchmarks', 'memory_footprint.py')
+BASELINE = os.path.join(ROOT, 'benchmarks', 'memory_baseline.json')
+
+
+@unittest.skipIf(os.getenv('SKIP_SLOW_TESTS'), "SKIP_SLOW_TESTS 설정됨")
+class MemoryFootprintTest(unittest.TestCase):
+
+    def test_no_regression_against_baseline(self):
+        with open(BASELINE, 'r', encoding='utf-8') as f:
+            rows = json.load(f)['rows']
+
+        proc = subprocess.run(
+            [sys.executable, SCRIPT, '-n', str(rows), '--baseline', BASELINE],
+            cwd=ROOT, capture_output=True, text=True, timeout=600
+        )
+        self.assertEqual(proc.returncode, 0, msg=proc.stdout[-4000:] + proc.stderr[-4000:])
+        if "측정 환경이 달라 비교를 건너뜁니다" in proc.stdout:
+            self.skipTest(proc.stdout[proc.stdout.index("기준값과 측정 환경"):])
+        self.assertIn("기준값 대비 회귀 없음", proc.stdout)
+
+
+if __name__ == '__main__':
+    unittest.main()
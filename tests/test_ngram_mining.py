@@ -0,0 +1,81 @@
+"""
+Space-Saving 카운터 테스트 (항목 수가 상한 이하일 때 정확한 빈도, 축출 후 메모리 상한과 과대 추정 범위)
+
+Usage:
+    python -m pytest -q tests
+    python -m unittest discover -s tests
+"""
+
+import os
+import random
+import sys
+import unittest
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.ngram_mining import SpaceSavingCounter  # noqa: E402
+
+
+class SpaceSavingCounterTest(unittest.TestCase):
+
+    def test_exact_when_distinct_items_fit(self):
+        items = ['대출'] * 5 + ['금리'] * 3 + ['카드'] * 3 + ['예금']
+        counter = SpaceSavingCounter(capacity=2)
+        counter.update(items)
+
+        self.assertEqual(counter.total, len(items))
+        self.assertEqual(counter.most_common(), [('대출', 5), ('금리', 3), ('카드', 3), ('예금', 1)])
+        self.assertEqual(counter.most_common(2), [('대출', 5), ('금리', 3)])
+        self.assertEqual(counter['없음'], 0)
+        self.assertTrue(all(counter.error(item) == 0 for item in set(items)))
+
+    def test_add_with_count(self):
+        counter = SpaceSavingCounter(capacity=4)
+        counter.add('대출', 3)
+        counter.add('대출', 2)
+        self.assertEqual(counter['대출'], 5)
+        self.assertEqual(counter.total, 5)
+
+    def test_pruning_keeps_memory_bounded_and_overestimates_within_error(self):
+        rng = random.Random(42)
+        heavy = ['대출', '금리', '카드']
+        stream = heavy * 200 + [f'희귀{i}' for i in range(300)] * 2
+        rng.shuffle(stream)
+
+        counter = SpaceSavingCounter(capacity=10)
+        for item in stream:
+            counter.add(item)
+            self.assertLessEqual(len(counter), 2 * counter.capacity)
+
+        truth = Counter(stream)
+        self.assertEqual(counter.total, len(stream))
+        for item, estimate in counter.most_common():
+            # 추정 빈도는 실제 이상이고, 실제 + 오차 이하
+            self.assertGreaterEqual(estimate, truth[item], item)
+            self.assertLessEqual(estimate - counter.error(item), truth[item], item)
+
+        # 빈도가 높은 항목은 축출되지 않고 상위에 남음
+        self.assertEqual({item for item, _ in counter.most_common(3)}, set(heavy))
+
+    def test_items_added_after_pruning_start_from_floor(self):
+        counter = SpaceSavingCounter(capacity=1)
+        counter.add('a', 5)
+        counter.add('b', 3)
+        counter.add('c', 1)    # 3개 > 2 × capacity → 'a'만 남고 floor = 3
+
+        self.assertEqual(len(counter), 1)
+        self.assertEqual(counter['a'], 5)
+        self.assertEqual(counter.error('a'), 0)
+
+        counter.add('d')
+        self.assertEqual(counter['d'], 4)
+        self.assertEqual(counter.error('d'), 3)
+
+    def test_capacity_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            SpaceSavingCounter(capacity=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
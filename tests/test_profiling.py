@@ -0,0 +1,71 @@
+"""
+단계 타이머 테스트 (중첩된 단계를 하위 단계로 집계하고, 보고서 비율을 최상위 단계로만 계산하는지)
+
+Usage:
+    python -m pytest -q tests
+    python -m unittest discover -s tests
+"""
+
+import os
+import sys
+import threading
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.profiling import StageTimer, format_profile_report  # noqa: E402
+
+
+class StageTimerNestingTest(unittest.TestCase):
+
+    def setUp(self):
+        self.timer = StageTimer()
+        self.timer.enabled = True
+
+    def test_nested_stage_recorded_under_parent(self):
+        with self.timer.stage('http'):
+            with self.timer.stage('limiter_wait'):
+                pass
+        with self.timer.stage('parse'):
+            pass
+
+        entries = {(e['parent'], e['stage']): e for e in self.timer.summary()}
+        self.assertEqual(set(entries), {(None, 'http'), ('http', 'limiter_wait'), (None, 'parse')})
+        self.assertEqual(entries[('http', 'limiter_wait')]['depth'], 1)
+        self.assertEqual(entries[(None, 'http')]['depth'], 0)
+
+    def test_explicit_parent_from_other_thread(self):
+        def worker():
+            with self.timer.stage('retry_backoff', parent='http'):
+                pass
+
+        with self.timer.stage('http'):
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+
+        stages = [(e['stage'], e['depth']) for e in self.timer.summary()]
+        self.assertEqual(stages, [('http', 0), ('retry_backoff', 1)])
+
+    def test_report_ratio_uses_top_level_stages_only(self):
+        self.timer.add('http', 8.0)
+        self.timer.add('limiter_wait', 3.0, ('http',))
+        self.timer.add('retry_backoff', 1.0, ('http',))
+        self.timer.add('parse', 2.0)
+
+        report = format_profile_report(None, self.timer.summary())
+        # 행 형식: [└] 단계 횟수 합계 평균 비율%
+        ratios = {line.split()[-5]: float(line.split()[-1].rstrip('%'))
+                  for line in report.splitlines() if line.endswith('%')}
+        self.assertEqual(ratios['http'], 80.0)
+        self.assertEqual(ratios['parse'], 20.0)
+        self.assertEqual(ratios['limiter_wait'], 30.0)
+        self.assertIn('└ limiter_wait', report)
+
+        # 하위 단계가 상위 단계 바로 뒤에 나옴
+        order = [entry['stage'] for entry in self.timer.summary()]
+        self.assertEqual(order, ['http', 'limiter_wait', 'retry_backoff', 'parse'])
+
+
+if __name__ == '__main__':
+    unittest.main()
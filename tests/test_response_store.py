@@ -0,0 +1,80 @@
+"""
+JSONL 응답 저장소 복구 테스트 (비정상 종료로 끝부분이 잘린 파일에 이어 쓴 뒤 다시 열기)
+
+Usage:
+    python -m pytest -q tests
+    python -m unittest discover -s tests
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.response_store import JsonlResponseStore  # noqa: E402
+
+
+def _entry(row):
+    return {'row': row, 'prompt_hash': 'h', 'response': f'응답 {row}' * 20}
+
+
+class JsonlResponseStoreRecoveryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.workdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+    def _crashed_copy(self, path, rows):
+        """close() 없이 종료된 상태의 파일 (flush까지만 된 파일을 복사)"""
+        store = JsonlResponseStore(path)
+        for row in rows:
+            store.put(_entry(row))
+        crashed = path + '.crashed'
+        shutil.copyfile(path, crashed)
+        store.close()
+        os.replace(crashed, path)
+
+    def _assert_survives_two_crashes(self, name):
+        path = os.path.join(self.workdir, name)
+        self._crashed_copy(path, range(0, 30))
+        self._crashed_copy(path, range(30, 60))
+
+        store = JsonlResponseStore(path)
+        store.put(_entry(60))
+        store.close()
+
+        store = JsonlResponseStore(path)
+        self.assertEqual(len(store), 61)
+        self.assertEqual(store.get(59)['response'], _entry(59)['response'])
+        store.close()
+
+    def test_gzip_append_after_crash(self):
+        self._assert_survives_two_crashes('responses.jsonl.gz')
+
+    def test_plain_append_after_crash(self):
+        self._assert_survives_two_crashes('responses.jsonl')
+
+    def test_truncated_last_line_is_dropped(self):
+        path = os.path.join(self.workdir, 'responses.jsonl')
+        store = JsonlResponseStore(path)
+        store.put(_entry(0))
+        store.close()
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write('{"row": 1, "prompt_ha')
+
+        store = JsonlResponseStore(path)
+        store.put(_entry(2))
+        store.close()
+
+        store = JsonlResponseStore(path)
+        self.assertEqual(sorted(entry['row'] for entry in store.iter_latest()), [0, 2])
+        store.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
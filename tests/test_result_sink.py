@@ -0,0 +1,63 @@
+"""
+JSON 결과 읽기 테스트 (비정상 종료로 마지막 줄이 잘린 result.jsonl 로드)
+
+Usage:
+    python -m pytest -q tests
+    python -m unittest discover -s tests
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.result_sink import JsonResultSink, load_results  # noqa: E402
+
+
+def _result(row):
+    return {'row': row, 'classified_domain': '대출', 'success': 'O', 'opinion_category': ''}
+
+
+def _item(row):
+    return {'row': row, 'question': f'질문 {row}', 'ground_truth': '대출'}
+
+
+class LoadResultsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.workdir = tempfile.mkdtemp()
+        self.json_path = os.path.join(self.workdir, 'result.json')
+        sink = JsonResultSink(self.json_path)
+        for row in (3, 1, 2):
+            sink.write(_result(row), _item(row))
+        sink.close()
+        self.jsonl_path = sink.jsonl_path
+
+    def tearDown(self):
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+    def _append(self, text):
+        with open(self.jsonl_path, 'a', encoding='utf-8') as f:
+            f.write(text)
+
+    def test_torn_last_line_is_skipped(self):
+        self._append(json.dumps({'row': 4, 'question': '잘린 질문'}, ensure_ascii=False)[:15])
+
+        # result.json이 없으면 result.jsonl로 대체
+        with self.assertLogs(level='WARNING'):
+            records = load_results(self.json_path)
+        self.assertEqual([r['row'] for r in records], [1, 2, 3])
+        self.assertEqual(records[0]['question'], '질문 1')
+
+    def test_damaged_middle_line_raises(self):
+        self._append('{"row": 4, "que\n' + json.dumps({'row': 5}) + '\n')
+        with self.assertRaises(json.JSONDecodeError):
+            load_results(self.jsonl_path)
+
+
+if __name__ == '__main__':
+    unittest.main()
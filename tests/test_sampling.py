@@ -0,0 +1,107 @@
+"""
+층화 추출 테스트 (클래스 비율 유지, 최소 개수 보장, 같은 시드면 같은 결과, 최대 잔여 방식 할당, 샘플 매니페스트)
+
+Usage:
+    python -m pytest -q tests
+    python -m unittest discover -s tests
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.sampling import compute_quotas, load_manifest, sample_questions, stratified_sample_indices  # noqa: E402
+
+
+def _codes(*sizes):
+    """클래스 크기대로 섞인 클래스 코드 배열"""
+    codes = np.repeat(np.arange(len(sizes), dtype=np.int32), sizes)
+    return np.random.default_rng(0).permutation(codes)
+
+
+class StratifiedSampleIndicesTest(unittest.TestCase):
+
+    def test_keeps_class_proportions(self):
+        codes = _codes(60, 30, 10)
+        selected = stratified_sample_indices(codes, 10, seed=1)
+
+        self.assertEqual(len(selected), 10)
+        self.assertEqual(len(set(selected.tolist())), 10)
+        self.assertEqual(np.bincount(codes[selected], minlength=3).tolist(), [6, 3, 1])
+
+    def test_same_seed_same_sample(self):
+        codes = _codes(500, 300, 200)
+        first = stratified_sample_indices(codes, 100, seed=7)
+        second = stratified_sample_indices(codes, 100, seed=7)
+        other = stratified_sample_indices(codes, 100, seed=8)
+
+        np.testing.assert_array_equal(first, second)
+        self.assertNotEqual(first.tolist(), other.tolist())
+        self.assertEqual(np.bincount(codes[other]).tolist(), np.bincount(codes[first]).tolist())
+
+    def test_min_per_class_keeps_rare_class(self):
+        codes = _codes(98, 2)
+        self.assertEqual(np.bincount(codes[stratified_sample_indices(codes, 10, seed=3)], minlength=2)[1], 0)
+
+        selected = stratified_sample_indices(codes, 10, seed=3, min_per_class=2)
+        self.assertEqual(np.bincount(codes[selected], minlength=2).tolist(), [8, 2])
+
+    def test_limit_larger_than_population_selects_all(self):
+        codes = _codes(3, 2)
+        selected = stratified_sample_indices(codes, 100, seed=0)
+        self.assertEqual(sorted(selected.tolist()), list(range(5)))
+
+    def test_empty_input(self):
+        self.assertEqual(len(stratified_sample_indices(np.empty(0, dtype=np.int32), 10, seed=0)), 0)
+
+
+class ComputeQuotasTest(unittest.TestCase):
+
+    def test_largest_remainder_breaks_ties_in_class_order(self):
+        self.assertEqual(compute_quotas(np.array([5, 5, 5]), 4).tolist(), [2, 1, 1])
+
+    def test_quota_never_exceeds_class_size(self):
+        quotas = compute_quotas(np.array([1, 100]), 50, min_per_class=5)
+        self.assertEqual(quotas.tolist(), [1, 49])
+
+    def test_minimums_over_limit_return_minimums_only(self):
+        with self.assertLogs(level='WARNING'):
+            quotas = compute_quotas(np.array([10, 10, 10]), 4, min_per_class=2)
+        self.assertEqual(quotas.tolist(), [2, 2, 2])
+
+
+class SampleManifestTest(unittest.TestCase):
+
+    def setUp(self):
+        self.workdir = tempfile.mkdtemp()
+        self.manifest_path = os.path.join(self.workdir, 'sample.json')
+        self.questions = [{'row': row, 'ground_truth': 'A' if row % 3 else 'B'} for row in range(2, 32)]
+
+    def tearDown(self):
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+    def test_manifest_without_limit_saves_all_rows(self):
+        selected = sample_questions(self.questions, None, manifest_path=self.manifest_path)
+        self.assertEqual(selected, self.questions)
+        self.assertEqual(load_manifest(self.manifest_path)['rows'], list(range(2, 32)))
+
+        # 입력에 행이 추가되어도 저장된 행만 재사용
+        grown = self.questions + [{'row': 40, 'ground_truth': 'A'}]
+        reused = sample_questions(grown, None, manifest_path=self.manifest_path)
+        self.assertEqual([q['row'] for q in reused], list(range(2, 32)))
+
+    def test_manifest_reused_with_same_rows(self):
+        first = sample_questions(self.questions, 10, seed=5, manifest_path=self.manifest_path)
+        second = sample_questions(self.questions, 20, seed=6, manifest_path=self.manifest_path)
+        self.assertEqual([q['row'] for q in first], [q['row'] for q in second])
+        self.assertEqual(load_manifest(self.manifest_path)['seed'], 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
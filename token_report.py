@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+프롬프트 토큰 예측 / 예산 확인 실행 파일
+
+LLM을 호출하지 않고 현재 micro_intents.json 기준 프롬프트 크기를 토크나이저로 계산합니다.
+실험 설정 파일을 지정하면 변형별로 비교하며, 예산(--budget 또는 PROMPT_TOKEN_BUDGET)을 초과하면 종료 코드 1을 반환합니다.
+
+Usage:
+    python token_report.py [옵션]
+
+Options:
+    -i, --input PATH         질문 길이 추정에 사용할 입력 파일 (기본: input/input.xlsx, 없으면 고정 부분만 계산)
+    -c, --config PATH        실험 설정 파일 (변형별 프롬프트 비교)
+    -b, --budget NUMBER      요청당 프롬프트 토큰 예산 (기본: PROMPT_TOKEN_BUDGET)
+    -t, --tokenizer SPEC     토크나이저 (approx / tiktoken:<인코딩> / hf:<모델 경로>, 기본: TOKENIZER)
+
+Examples:
+    python token_report.py -b 4000                    # 의도 목록 수정 후 예산 확인
+    python token_report.py -c experiments/ab.json     # 변형별 프롬프트 크기 비교
+"""
+
+import sys
+import os
+import argparse
+import logging
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from main import setup_logging, load_config
+
+
+def parse_arguments(argv=None):
+    """
+    명령행 인자 파싱
+
+    Args:
+        argv: 인자 리스트 (기본: sys.argv[1:])
+
+    Returns:
+        args 객체 (input, config, budget, tokenizer)
+    """
+    parser = argparse.ArgumentParser(
+        description='프롬프트 토큰 예측 / 예산 확인',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('-i', '--input', default='input/input.xlsx',
+                        help='질문 길이 추정용 입력 파일 (기본: input/input.xlsx)')
+    parser.add_argument('-c', '--config', default=None, help='실험 설정 파일 (변형별 비교)')
+    parser.add_argument('-b', '--budget', type=int, default=None,
+                        help='요청당 프롬프트 토큰 예산 (기본: PROMPT_TOKEN_BUDGET)')
+    parser.add_argument('-t', '--tokenizer', default=None,
+                        help='토크나이저 (기본: TOKENIZER 환경 변수 또는 approx)')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """
+    토큰 예측 실행
+
+    Args:
+        argv: 명령행 인자 리스트 (기본: sys.argv[1:])
+    """
+    args = parse_arguments(argv)
+    setup_logging()
+
+    from src.experiment import Variant, load_variants
+    from src.io_backends import load_input_questions
+    from src.llm_classifier import LLMClassifier, MAX_COMPLETION_TOKENS
+    from src.tokens import get_tokenizer, preflight_estimate, check_prompt_budget
+
+    config = load_config()
+    budget = args.budget if args.budget is not None else config['tokens']['prompt_budget']
+    tokenizer = get_tokenizer(args.tokenizer or config['llm_config'].get('tokenizer'))
+
+    # 분류기는 프롬프트 생성에만 사용 (LLM 호출 없음)
+    classifier = LLMClassifier(
+        provider=config['llm_provider'],
+        config=config['llm_config'],
+        domains=config['domains'],
+        timeout=config['llm_timeout']
+    )
+    classifier.close()
+
+    variants = load_variants(args.config) if args.config else [Variant('default')]
+
+    questions = []
+    if os.path.exists(args.input):
+        questions = [item['question'] for item in load_input_questions(args.input, 'all')]
+    else:
+        logging.warning(f"입력 파일이 없어 고정 프롬프트만 계산합니다 - {args.input}")
+
+    logging.info("=" * 70)
+    logging.info(f"프롬프트 토큰 예측 (토크나이저: {tokenizer.name}, 의도 {len(classifier.micro_intents_data)}개, "
+                 f"질문 {len(questions)}개, 예산 {budget or '없음'})")
+    logging.info("=" * 70)
+    logging.info(f"{'변형':<20} {'고정':>8} {'평균':>8} {'최대':>8} {'총 프롬프트':>14} {'응답 포함 최대':>16}")
+
+    over_budget = False
+    for variant in variants:
+        estimate = preflight_estimate(
+            variant.build_prompt(classifier, ""), questions,
+            tokenizer=tokenizer, max_completion_tokens=MAX_COMPLETION_TOKENS, budget=budget
+        )
+        logging.info(f"{variant.name:<20} {estimate['fixed_tokens']:>8} {estimate['avg_prompt_tokens']:>8.0f} "
+                     f"{estimate['max_prompt_tokens']:>8.0f} {estimate['total_prompt_tokens']:>14,} "
+                     f"{estimate['max_total_tokens']:>16,}")
+        for warning in check_prompt_budget(estimate, budget):
+            over_budget = True
+            logging.warning(f"  [{variant.name}] {warning}")
+
+    logging.info("=" * 70)
+    if over_budget:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
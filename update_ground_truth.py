@@ -1,6 +1,7 @@
+import argparse
 import os
 import sys
-import pandas as pd
+import time
 from dotenv import load_dotenv
 import logging
 from datetime import datetime
@@ -9,6 +10,8 @@ from datetime import datetime
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from src.llm_classifier import LLMClassifier
+from src.profiling import stage, start_profiling, finish_profiling
+from src.status import RunStatus, StatusReporter, classifier_status_source
 
 # 로깅 설정
 logging.basicConfig(
@@ -34,8 +37,33 @@ def load_config():
         'domains': [] # 사용 안함
     }
 
-def main():
+def parse_arguments(argv=None):
+    """
+    명령행 인자 파싱
+
+    Args:
+        argv: 인자 리스트 (기본: sys.argv[1:])
+
+    Returns:
+        args 객체 (profile, profile_interval)
+    """
+    from main import add_profile_arguments
+
+    parser = argparse.ArgumentParser(description='Ground Truth 업데이트 (input/input.xlsx 전수 재분류)')
+    add_profile_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_arguments(argv)
+
+    # pandas는 실행 시점에 import (CLI 시작 시간 단축)
+    import pandas as pd
+
     print("=== Ground Truth 업데이트 시작 ===")
+
+    # 프로파일링 (파일 로드부터 저장까지)
+    profiler = start_profiling(args.profile_interval) if args.profile else None
     
     # 1. Config 로드 & 분류기 초기화
     config = load_config()
@@ -49,7 +77,8 @@ def main():
     # 2. 엑셀 파일 로드
     input_file = 'input/input.xlsx'
     try:
-        df = pd.read_excel(input_file)
+        with stage('excel_read'):
+            df = pd.read_excel(input_file)
         print(f"파일 로드 완료: {len(df)}건")
     except Exception as e:
         print(f"파일 로드 실패: {e}")
@@ -59,28 +88,51 @@ def main():
     results = []
     
     total_count = len(df)
-    for index, row in df.iterrows():
-        question = row['Question']
-        
-        # 분류 실행
-        domain, opinion, opinion_category = classifier.classify(question)
-        
-        # 결과 저장
-        results.append(domain)
-        
-        # 진행상황 로그
-        if (index + 1) % 10 == 0:
-            print(f"진행 중: {index + 1}/{total_count} ({(index + 1)/total_count*100:.1f}%)")
+
+    # 실행 상태 (터미널이면 상태 줄 표시, 상태 파일은 항상 기록)
+    status = RunStatus(total=total_count)
+    reporter = StatusReporter(
+        status, path='result/ground_truth_status.json', sources=[classifier_status_source(classifier)]
+    ).start()
+
+    try:
+        for index, row in df.iterrows():
+            question = row['Question']
+
+            # 분류 실행
+            start = time.perf_counter()
+            domain, opinion, opinion_category = classifier.classify(question)
+            status.observe_latency(time.perf_counter() - start)
+            status.record(error=not domain or domain[0] is None)
+
+            # 결과 저장
+            results.append(domain)
+
+            # 진행상황 로그 (상태 줄을 표시하지 않을 때만)
+            if not reporter.display and (index + 1) % 10 == 0:
+                print(f"진행 중: {index + 1}/{total_count} ({(index + 1)/total_count*100:.1f}%)")
+    except BaseException:
+        # 예외/Ctrl+C로 중단되어도 상태 줄을 정리하고 상태 파일에 중단 상태를 남김
+        reporter.stop('aborted')
+        classifier.close()
+        raise
+
+    reporter.stop()
 
     # 4. 데이터프레임 업데이트
     df['도메인 Ground Truth'] = results
     
     # 5. 저장
     output_file = 'input/input_new_gt.xlsx'
-    df.to_excel(output_file, index=False)
+    with stage('excel_write'):
+        df.to_excel(output_file, index=False)
     print(f"저장 완료: {output_file}")
     
     classifier.close()
 
+    if profiler:
+        folded_path, report_path = finish_profiling(profiler, os.path.splitext(output_file)[0])
+        print(f"프로파일 저장: {report_path} (flamegraph용 folded stack: {folded_path})")
+
 if __name__ == "__main__":
     main()